@@ -0,0 +1,18 @@
+"""
+Eth platform with memory mapped receive rings
+
+Like the eth platform, but receives on each interface through a TPACKET_V3
+ring for kernel timestamps and batched receive.
+"""
+
+import eth
+import oftest.dataplane
+
+def platform_config_update(config):
+    """
+    Update configuration for the eth-tpacket platform
+
+    @param config The configuration dictionary to use/update
+    """
+    eth.platform_config_update(config)
+    config['dataplane'] = { 'portclass': oftest.dataplane.DataPlanePortTpacket }
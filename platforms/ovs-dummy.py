@@ -4,24 +4,38 @@ Dummy platform
 This platform uses Open vSwitch dummy interfaces.
 """
 
+import errno
 import logging
 import os
-import select
 import socket
 import struct
 import sys
 import time
+from collections import deque
 from threading import Thread
 from threading import Lock
+from oftest.ofutils import RecvBuffer
+from oftest.ofutils import SendQueue
 
 RCV_TIMEOUT = 10000
 RUN_DIR = os.environ.get("OVS_RUNDIR", "/var/run/openvswitch")
 
+# Each frame on the stream is preceded by its length
+FrameHeader = struct.Struct(">H")
+
+def frame_len(buf, offset):
+    return FrameHeader.size + FrameHeader.unpack_from(buf, offset)[0]
+
 class DataPlanePortOVSDummy:
     """
     Class defining a port monitoring object that uses Unix domain
     sockets for ports, intended for connecting to Open vSwitch "dummy"
     netdevs.
+
+    Received data is read in large chunks and split into frames by a
+    RecvBuffer, so recv_batch() returns every complete frame after a single
+    read. Frames to send wait in a SendQueue when the socket is full and
+    are written together by the next send.
     """
 
     def __init__(self, interface_name, port_number, max_pkts=1024):
@@ -34,8 +48,10 @@ class DataPlanePortOVSDummy:
         self.interface_name = interface_name
         self.max_pkts = max_pkts
         self.port_number = port_number
-        self.txq = []
-        self.rxbuf = ""
+        self.txq = SendQueue(max_pkts)
+        self.rxbuf = RecvBuffer()
+        self.pending = deque()
+        self.closed = False
         logname = "dp-" + interface_name
         self.logger = logging.getLogger(logname)
         try:
@@ -68,50 +84,55 @@ class DataPlanePortOVSDummy:
         """
         return self.socket.fileno()
 
+    def recv_batch(self):
+        """
+        Receive every complete frame available without blocking.
+        @retval List of (packet data, timestamp)
+        """
+        pkts = list(self.pending)
+        self.pending.clear()
+        try:
+            count = self.rxbuf.recv_into(self.socket)
+        except socket.error as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                self.logger.warning("Error on receive: %s", e)
+            return pkts
+        if count == 0:
+            if not self.closed:
+                self.logger.warning("Connection closed")
+                self.closed = True
+            return pkts
+        rcvtime = time.time()
+        for frame in self.rxbuf.frames(FrameHeader.size, frame_len):
+            pkts.append((frame[FrameHeader.size:].tobytes(), rcvtime))
+        if pkts:
+            self.logger.debug("%d pkts in at %f on port %d",
+                              len(pkts), rcvtime, self.port_number)
+        return pkts
+
     def recv(self):
-        while True:
-            rout, wout, eout = select.select([self.socket], [], [], 0)
-            if not rout:
-                return
-
-            if len(self.rxbuf) < 2:
-                n = 2 - len(self.rxbuf)
-            else:
-                frame_len = struct.unpack('>h', self.rxbuf[:2])[0]
-                n = (2 + frame_len) - len(self.rxbuf)
-
-            data = self.socket.recv(n)
-            self.rxbuf += data
-            if len(data) == n and len(self.rxbuf) > 2:
-                rcvtime = time.time()
-                packet = self.rxbuf[2:]
-                self.logger.debug("Pkt len " + str(len(packet)) +
-                         " in at " + str(rcvtime) + " on port " +
-                         str(self.port_number))
-                self.rxbuf = ""
-                return (packet, rcvtime)
+        """
+        Receive a packet from this port.
+        @retval (packet data, timestamp), or (None, None) if no complete
+        packet is ready
+        """
+        if not self.pending:
+            self.pending.extend(self.recv_batch())
+        if not self.pending:
+            return (None, None)
+        return self.pending.popleft()
 
     def send(self, packet):
-        if len(self.txq) < self.max_pkts:
-            self.txq.append(struct.pack('>h', len(packet)) + packet)
+        if self.txq.append(FrameHeader.pack(len(packet)) + packet):
             retval = len(packet)
         else:
             retval = 0
-        self.__run_tx()
+        try:
+            self.txq.flush(self.socket)
+        except socket.error as e:
+            self.logger.warning("Error on send: %s", e)
         return retval
 
-    def __run_tx(self):
-        while self.txq:
-            rout, wout, eout = select.select([], [self.socket], [], 0)
-            if not wout:
-                return
-
-            retval = self.socket.send(self.txq[0])
-            if retval > 0:
-                self.txq[0] = self.txq[0][retval:]
-                if len(self.txq[0]) == 0:
-                    self.txq = self.txq[1:]
-        
     def down(self):
         pass
 
@@ -31,6 +31,15 @@ def pad_to(alignment, length):
     """
     return "\x00" * ((length + alignment - 1)/alignment*alignment - length)
 
+# Cache of struct.Struct objects by format string
+_struct_cache = {}
+
+def _struct(fmt):
+    st = _struct_cache.get(fmt)
+    if st is None:
+        st = _struct_cache[fmt] = struct.Struct(fmt)
+    return st
+
 class OFReader(object):
     """
     Cursor over a read-only buffer
@@ -41,7 +50,8 @@ class OFReader(object):
     fields sequentially and is intended to be used recursively by the
     parsers of child objects which will implicitly update the offset.
 
-    buf: buffer object
+    buf: buffer object (a string, or a memoryview to parse in place
+         without copying the whole message first)
     start: initial position in the buffer
     length: number of bytes after start
     offset: distance from start
@@ -56,7 +66,12 @@ class OFReader(object):
         self.offset = 0
 
     def read(self, fmt):
-        st = struct.Struct(fmt)
+        return self.read_struct(_struct(fmt))
+
+    def read_struct(self, st):
+        """
+        Read the fields of a precompiled struct.Struct
+        """
         if self.offset + st.size > self.length:
             raise loxi.ProtocolError("Buffer too short")
         result = st.unpack_from(self.buf, self.start+self.offset)
@@ -65,12 +80,15 @@ class OFReader(object):
 
     def read_all(self):
         s = self.buf[(self.start+self.offset):(self.start+self.length)]
+        if isinstance(s, memoryview):
+            # Parsed objects must not alias the caller's buffer
+            s = s.tobytes()
         assert(len(s) == self.length - self.offset)
         self.offset = self.length
         return s
 
     def peek(self, fmt, offset=0):
-        st = struct.Struct(fmt)
+        st = _struct(fmt)
         if self.offset + offset + st.size > self.length:
             raise loxi.ProtocolError("Buffer too short")
         result = st.unpack_from(self.buf, self.start + self.offset + offset)
@@ -15,6 +15,19 @@ import common
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_6xL = struct.Struct("!6xL")
+_st_B3x = struct.Struct("!B3x")
+_st_H = struct.Struct("!H")
+_st_H2x = struct.Struct("!H2x")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+_st_LH2x4x = struct.Struct("!LH2x4x")
+_st_LL = struct.Struct("!LL")
+_st_LL4x = struct.Struct("!LL4x")
+_st_LLL = struct.Struct("!LLL")
+_st_LLLLB3x = struct.Struct("!LLLLB3x")
+
 class action(loxi.OFObject):
     subtypes = {}
 
@@ -28,7 +41,7 @@ class action(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -82,9 +95,9 @@ class experimenter(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_L.pack(self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -140,11 +153,9 @@ class bsn(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
+        packed.append(_st_LL4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -197,10 +208,9 @@ class bsn_checksum(bsn):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_LL.pack(self.experimenter, self.subtype))
         packed.append(util.pack_checksum_128(self.checksum))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -209,14 +219,12 @@ class bsn_checksum(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_checksum()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        (_experimenter, _subtype) = reader.read_struct(_st_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
@@ -260,14 +268,9 @@ class bsn_mirror(bsn):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dest_port))
-        packed.append(struct.pack("!L", self.vlan_tag))
-        packed.append(struct.pack("!B", self.copy_stage))
-        packed.append('\x00' * 3)
+        packed.append(_st_LLLLB3x.pack(self.experimenter, self.subtype, self.dest_port, self.vlan_tag, self.copy_stage))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -275,19 +278,13 @@ class bsn_mirror(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_mirror()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        (_experimenter, _subtype, obj.dest_port, obj.vlan_tag, obj.copy_stage) = reader.read_struct(_st_LLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.dest_port = reader.read("!L")[0]
-        obj.vlan_tag = reader.read("!L")[0]
-        obj.copy_stage = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -329,11 +326,9 @@ class bsn_set_tunnel_dst(bsn):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dst))
+        packed.append(_st_LLL.pack(self.experimenter, self.subtype, self.dst))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -341,16 +336,13 @@ class bsn_set_tunnel_dst(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_set_tunnel_dst()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        (_experimenter, _subtype, obj.dst) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.dst = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -386,11 +378,10 @@ class enqueue(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(util.pack_port_no(self.port))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_6xL.pack(self.queue_id))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -398,14 +389,12 @@ class enqueue(action):
     @staticmethod
     def unpack(reader):
         obj = enqueue()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 11)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.port = util.unpack_port_no(reader)
-        reader.skip(6)
-        obj.queue_id = reader.read("!L")[0]
+        obj.queue_id = reader.read_struct(_st_6xL)[0]
         return obj
 
     def __eq__(self, other):
@@ -444,12 +433,9 @@ class nicira(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_st_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -499,12 +485,9 @@ class nicira_dec_ttl(nicira):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_st_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -512,17 +495,13 @@ class nicira_dec_ttl(nicira):
     @staticmethod
     def unpack(reader):
         obj = nicira_dec_ttl()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        (_experimenter, _subtype) = reader.read_struct(_st_LH2x4x)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == 18)
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -555,10 +534,10 @@ class output(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(util.pack_port_no(self.port))
-        packed.append(struct.pack("!H", self.max_len))
+        packed.append(_st_H.pack(self.max_len))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -566,13 +545,12 @@ class output(action):
     @staticmethod
     def unpack(reader):
         obj = output()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.port = util.unpack_port_no(reader)
-        obj.max_len = reader.read("!H")[0]
+        obj.max_len = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -608,7 +586,7 @@ class set_dl_dst(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(struct.pack("!6B", *self.dl_addr))
         packed.append('\x00' * 6)
@@ -619,9 +597,8 @@ class set_dl_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_dl_dst()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -657,7 +634,7 @@ class set_dl_src(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(struct.pack("!6B", *self.dl_addr))
         packed.append('\x00' * 6)
@@ -668,9 +645,8 @@ class set_dl_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_dl_src()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -706,9 +682,9 @@ class set_nw_dst(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.nw_addr))
+        packed.append(_st_L.pack(self.nw_addr))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -716,12 +692,11 @@ class set_nw_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_dst()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 7)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.nw_addr = reader.read("!L")[0]
+        obj.nw_addr = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -753,9 +728,9 @@ class set_nw_src(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.nw_addr))
+        packed.append(_st_L.pack(self.nw_addr))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -763,12 +738,11 @@ class set_nw_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_src()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 6)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.nw_addr = reader.read("!L")[0]
+        obj.nw_addr = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -800,10 +774,9 @@ class set_nw_tos(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_tos))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.nw_tos))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -811,13 +784,11 @@ class set_nw_tos(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_tos()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 8)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.nw_tos = reader.read("!B")[0]
-        reader.skip(3)
+        obj.nw_tos = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -849,10 +820,9 @@ class set_tp_dst(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.tp_port))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -860,13 +830,11 @@ class set_tp_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_tp_dst()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 10)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.tp_port = reader.read("!H")[0]
-        reader.skip(2)
+        obj.tp_port = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -898,10 +866,9 @@ class set_tp_src(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.tp_port))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -909,13 +876,11 @@ class set_tp_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_tp_src()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 9)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.tp_port = reader.read("!H")[0]
-        reader.skip(2)
+        obj.tp_port = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -947,10 +912,9 @@ class set_vlan_pcp(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.vlan_pcp))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -958,13 +922,11 @@ class set_vlan_pcp(action):
     @staticmethod
     def unpack(reader):
         obj = set_vlan_pcp()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.vlan_pcp = reader.read("!B")[0]
-        reader.skip(3)
+        obj.vlan_pcp = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -996,10 +958,9 @@ class set_vlan_vid(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.vlan_vid))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1007,13 +968,11 @@ class set_vlan_vid(action):
     @staticmethod
     def unpack(reader):
         obj = set_vlan_vid()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.vlan_vid = reader.read("!H")[0]
-        reader.skip(2)
+        obj.vlan_vid = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1041,7 +1000,7 @@ class strip_vlan(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -1051,9 +1010,8 @@ class strip_vlan(action):
     @staticmethod
     def unpack(reader):
         obj = strip_vlan()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -15,6 +15,29 @@ import common
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_16sLLLLLL = struct.Struct("!16sLLLLLL")
+_st_2x16sLL = struct.Struct("!2x16sLL")
+_st_2xLQQQ = struct.Struct("!2xLQQQ")
+_st_4xH6x = struct.Struct("!4xH6x")
+_st_6xQQQQQQQQQQQQ = struct.Struct("!6xQQQQQQQQQQQQ")
+_st_B1x = struct.Struct("!B1x")
+_st_B3x = struct.Struct("!B3x")
+_st_B3x32s = struct.Struct("!B3x32s")
+_st_H = struct.Struct("!H")
+_st_HB1xHBB2xLLHH = struct.Struct("!HB1xHBB2xLLHH")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+_st_LH = struct.Struct("!LH")
+_st_LHHHH = struct.Struct("!LHHHH")
+_st_LHHHH16s = struct.Struct("!LHHHH16s")
+_st_LL = struct.Struct("!LL")
+_st_LLBB2xLL = struct.Struct("!LLBB2xLL")
+_st_LLBB2xLL16s = struct.Struct("!LLBB2xLL16s")
+_st_LLHHH6xQQQ = struct.Struct("!LLHHH6xQQQ")
+_st_LLLLLL = struct.Struct("!LLLLLL")
+_st_LLQQ = struct.Struct("!LLQQ")
+
 class bsn_interface(loxi.OFObject):
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
@@ -39,10 +62,7 @@ class bsn_interface(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
+        packed.append(_st_2x16sLL.pack(self.name, self.ipv4_addr, self.ipv4_netmask))
         return ''.join(packed)
 
     @staticmethod
@@ -51,8 +71,7 @@ class bsn_interface(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        (obj.ipv4_addr, obj.ipv4_netmask) = reader.read_struct(_st_LL)
         return obj
 
     def __eq__(self, other):
@@ -96,7 +115,7 @@ class bsn_vport(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -186,21 +205,14 @@ class bsn_vport_l2gre(bsn_vport):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.flags))
+        packed.append(_st_L.pack(self.flags))
         packed.append(util.pack_port_no(self.port_no))
         packed.append(util.pack_port_no(self.loopback_port_no))
         packed.append(struct.pack("!6B", *self.local_mac))
         packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
-        packed.append(struct.pack("!16s", self.if_name))
+        packed.append(_st_LLBB2xLL16s.pack(self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit, self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -208,23 +220,16 @@ class bsn_vport_l2gre(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.flags = reader.read("!L")[0]
+        obj.flags = reader.read_struct(_st_L)[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.loopback_port_no = util.unpack_port_no(reader)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
+        (obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit) = reader.read_struct(_st_LLBB2xLL)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -321,14 +326,9 @@ class bsn_vport_q_in_q(bsn_vport):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
-        packed.append(struct.pack("!16s", self.if_name))
+        packed.append(_st_LHHHH16s.pack(self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id, self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -336,16 +336,11 @@ class bsn_vport_q_in_q(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
+        (obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id) = reader.read_struct(_st_LHHHH)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -438,18 +433,9 @@ class flow_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
+        packed.append(_st_B1x.pack(self.table_id))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_LLHHH6xQQQ.pack(self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.cookie, self.packet_count, self.byte_count))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -458,21 +444,12 @@ class flow_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = flow_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
+        obj.table_id = reader.read_struct(_st_B1x)[0]
         obj.match = common.match.unpack(reader)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        reader.skip(6)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.cookie, obj.packet_count, obj.byte_count) = reader.read_struct(_st_LLHHH6xQQQ)
         obj.actions = loxi.generic_util.unpack_list(reader, action.action.unpack)
         return obj
 
@@ -595,17 +572,7 @@ class match_v1(loxi.OFObject):
         packed.append(util.pack_port_no(self.in_port))
         packed.append(struct.pack("!6B", *self.eth_src))
         packed.append(struct.pack("!6B", *self.eth_dst))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.eth_type))
-        packed.append(struct.pack("!B", self.ip_dscp))
-        packed.append(struct.pack("!B", self.ip_proto))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.ipv4_src))
-        packed.append(struct.pack("!L", self.ipv4_dst))
-        packed.append(struct.pack("!H", self.tcp_src))
-        packed.append(struct.pack("!H", self.tcp_dst))
+        packed.append(_st_HB1xHBB2xLLHH.pack(self.vlan_vid, self.vlan_pcp, self.eth_type, self.ip_dscp, self.ip_proto, self.ipv4_src, self.ipv4_dst, self.tcp_src, self.tcp_dst))
         return ''.join(packed)
 
     @staticmethod
@@ -615,17 +582,7 @@ class match_v1(loxi.OFObject):
         obj.in_port = util.unpack_port_no(reader)
         obj.eth_src = list(reader.read('!6B'))
         obj.eth_dst = list(reader.read('!6B'))
-        obj.vlan_vid = reader.read("!H")[0]
-        obj.vlan_pcp = reader.read("!B")[0]
-        reader.skip(1)
-        obj.eth_type = reader.read("!H")[0]
-        obj.ip_dscp = reader.read("!B")[0]
-        obj.ip_proto = reader.read("!B")[0]
-        reader.skip(2)
-        obj.ipv4_src = reader.read("!L")[0]
-        obj.ipv4_dst = reader.read("!L")[0]
-        obj.tcp_src = reader.read("!H")[0]
-        obj.tcp_dst = reader.read("!H")[0]
+        (obj.vlan_vid, obj.vlan_pcp, obj.eth_type, obj.ip_dscp, obj.ip_proto, obj.ipv4_src, obj.ipv4_dst, obj.tcp_src, obj.tcp_dst) = reader.read_struct(_st_HB1xHBB2xLLHH)
         return obj
 
     def __eq__(self, other):
@@ -707,7 +664,7 @@ class packet_queue(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_L.pack(self.queue_id))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 2)
         packed.append(loxi.generic_util.pack_list(self.properties))
@@ -718,8 +675,7 @@ class packet_queue(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = packet_queue()
-        obj.queue_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        (obj.queue_id, _len) = reader.read_struct(_st_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
         reader.skip(2)
@@ -791,13 +747,7 @@ class port_desc(loxi.OFObject):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
+        packed.append(_st_16sLLLLLL.pack(self.name, self.config, self.state, self.curr, self.advertised, self.supported, self.peer))
         return ''.join(packed)
 
     @staticmethod
@@ -806,12 +756,7 @@ class port_desc(loxi.OFObject):
         obj.port_no = util.unpack_port_no(reader)
         obj.hw_addr = list(reader.read('!6B'))
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
+        (obj.config, obj.state, obj.curr, obj.advertised, obj.supported, obj.peer) = reader.read_struct(_st_LLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -922,38 +867,14 @@ class port_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
+        packed.append(_st_6xQQQQQQQQQQQQ.pack(self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(6)
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        (obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors, obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions) = reader.read_struct(_st_6xQQQQQQQQQQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1033,7 +954,7 @@ class queue_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -1081,11 +1002,9 @@ class queue_prop_min_rate(queue_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_st_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1093,14 +1012,11 @@ class queue_prop_min_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        reader.skip(4)
-        obj.rate = reader.read("!H")[0]
-        reader.skip(6)
+        obj.rate = reader.read_struct(_st_4xH6x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1148,22 +1064,14 @@ class queue_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
+        packed.append(_st_2xLQQQ.pack(self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(2)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
+        (obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors) = reader.read_struct(_st_2xLQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1233,27 +1141,18 @@ class table_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!32s", self.name))
+        packed.append(_st_B3x32s.pack(self.table_id, self.name))
         packed.append(util.pack_wc_bmap(self.wildcards))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
+        packed.append(_st_LLQQ.pack(self.max_entries, self.active_count, self.lookup_count, self.matched_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
+        obj.table_id = reader.read_struct(_st_B3x)[0]
         obj.name = reader.read("!32s")[0].rstrip("\x00")
         obj.wildcards = util.unpack_wc_bmap(reader)
-        obj.max_entries = reader.read("!L")[0]
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        (obj.max_entries, obj.active_count, obj.lookup_count, obj.matched_count) = reader.read_struct(_st_LLQQ)
         return obj
 
     def __eq__(self, other):
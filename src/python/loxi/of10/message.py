@@ -15,6 +15,40 @@ import common
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_2xL = struct.Struct("!2xL")
+_st_B = struct.Struct("!B")
+_st_B1x = struct.Struct("!B1x")
+_st_B3x = struct.Struct("!B3x")
+_st_BB = struct.Struct("!BB")
+_st_BBH = struct.Struct("!BBH")
+_st_H = struct.Struct("!H")
+_st_HHHL = struct.Struct("!HHHL")
+_st_L = struct.Struct("!L")
+_st_LB3xL = struct.Struct("!LB3xL")
+_st_LB7x = struct.Struct("!LB7x")
+_st_LH = struct.Struct("!LH")
+_st_LHH = struct.Struct("!LHH")
+_st_LHH256s256s256s32s256s = struct.Struct("!LHH256s256s256s32s256s")
+_st_LHH4xLL = struct.Struct("!LHH4xLL")
+_st_LHHL = struct.Struct("!LHHL")
+_st_LHHQQL4x = struct.Struct("!LHHQQL4x")
+_st_LL = struct.Struct("!LL")
+_st_LLH = struct.Struct("!LLH")
+_st_LLL = struct.Struct("!LLL")
+_st_LLL4x = struct.Struct("!LLL4x")
+_st_LLLB1xH4x = struct.Struct("!LLLB1xH4x")
+_st_LLLB1xHHHQ = struct.Struct("!LLLB1xHHHQ")
+_st_LLLB1xHL = struct.Struct("!LLLB1xHL")
+_st_LLLB3x = struct.Struct("!LLLB3x")
+_st_LLLB3xL = struct.Struct("!LLLB3xL")
+_st_LLLB7x = struct.Struct("!LLLB7x")
+_st_LLLL = struct.Struct("!LLLL")
+_st_LLLLL = struct.Struct("!LLLLL")
+_st_LQLB3xLL = struct.Struct("!LQLB3xLL")
+_st_Q = struct.Struct("!Q")
+_st_QHB1xLLH2xQQ = struct.Struct("!QHB1xLLH2xQQ")
+
 class message(loxi.OFObject):
     subtypes = {}
 
@@ -33,12 +67,11 @@ class message(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -101,14 +134,11 @@ class stats_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -186,38 +216,23 @@ class aggregate_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHHQQL4x.pack(self.xid, self.stats_type, self.flags, self.packet_count, self.byte_count, self.flow_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.packet_count, obj.byte_count, obj.flow_count) = reader.read_struct(_st_LHHQQL4x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.flow_count = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -279,14 +294,11 @@ class stats_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -364,37 +376,28 @@ class aggregate_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
+        packed.append(_st_B1x.pack(self.table_id))
         packed.append(util.pack_port_no(self.out_port))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
         obj.match = common.match.unpack(reader)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
+        obj.table_id = reader.read_struct(_st_B1x)[0]
         obj.out_port = util.unpack_port_no(reader)
         return obj
 
@@ -453,13 +456,11 @@ class error_msg(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LH.pack(self.xid, self.err_type))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -524,31 +525,24 @@ class bad_action_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_action_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 2)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -602,31 +596,24 @@ class bad_request_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_request_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 1)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -671,25 +658,22 @@ class barrier_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -725,25 +709,22 @@ class barrier_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -789,14 +770,12 @@ class experimenter(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL.pack(self.xid, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -864,14 +843,11 @@ class bsn_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -935,33 +911,24 @@ class bsn_bw_clear_data_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 22)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1003,30 +970,23 @@ class bsn_bw_clear_data_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 21)
         return obj
 
@@ -1069,33 +1029,24 @@ class bsn_bw_enable_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 20)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1137,30 +1088,23 @@ class bsn_bw_enable_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 19)
         return obj
 
@@ -1207,35 +1151,24 @@ class bsn_bw_enable_set_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.enable, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable, obj.status) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 23)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1285,33 +1218,24 @@ class bsn_bw_enable_set_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enable))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 18)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1357,31 +1281,24 @@ class bsn_get_interfaces_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.interfaces))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.interfaces = loxi.generic_util.unpack_list(reader, common.bsn_interface.unpack)
         return obj
@@ -1425,30 +1342,23 @@ class bsn_get_interfaces_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -1495,37 +1405,24 @@ class bsn_get_ip_mask_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3xL.pack(self.xid, self.experimenter, self.subtype, self.index, self.mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_ip_mask_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.index, obj.mask) = reader.read_struct(_st_LLLB3xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.index = reader.read("!B")[0]
-        reader.skip(3)
-        obj.mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1575,35 +1472,24 @@ class bsn_get_ip_mask_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 7)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB7x.pack(self.xid, self.experimenter, self.subtype, self.index))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_ip_mask_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.index) = reader.read_struct(_st_LLLB7x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.index = reader.read("!B")[0]
-        reader.skip(7)
         return obj
 
     def __eq__(self, other):
@@ -1653,39 +1539,24 @@ class bsn_get_l2_table_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB1xH4x.pack(self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_l2_table_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority) = reader.read_struct(_st_LLLB1xH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -1731,30 +1602,23 @@ class bsn_get_l2_table_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_l2_table_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         return obj
 
@@ -1797,35 +1661,24 @@ class bsn_get_mirroring_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -1871,35 +1724,24 @@ class bsn_get_mirroring_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -1949,39 +1791,24 @@ class bsn_hybrid_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.hybrid_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.hybrid_version))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB1xH4x.pack(self.xid, self.experimenter, self.subtype, self.hybrid_enable, self.hybrid_version))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_hybrid_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.hybrid_enable, obj.hybrid_version) = reader.read_struct(_st_LLLB1xH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 28)
-        obj.hybrid_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.hybrid_version = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -2027,30 +1854,23 @@ class bsn_hybrid_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_hybrid_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 27)
         return obj
 
@@ -2101,37 +1921,28 @@ class bsn_pdu_rx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 34)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -2197,40 +2008,29 @@ class bsn_pdu_rx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.timeout_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.timeout_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.timeout_ms) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 33)
-        obj.timeout_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
+        obj.slot_num = reader.read_struct(_st_B3x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -2293,35 +2093,28 @@ class bsn_pdu_rx_timeout(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_timeout()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 35)
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -2379,37 +2172,28 @@ class bsn_pdu_tx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 32)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -2475,40 +2259,29 @@ class bsn_pdu_tx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.tx_interval_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.tx_interval_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.tx_interval_ms) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 31)
-        obj.tx_interval_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
+        obj.slot_num = reader.read_struct(_st_B3x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -2571,37 +2344,24 @@ class bsn_set_ip_mask(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3xL.pack(self.xid, self.experimenter, self.subtype, self.index, self.mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_ip_mask()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.index, obj.mask) = reader.read_struct(_st_LLLB3xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 0)
-        obj.index = reader.read("!B")[0]
-        reader.skip(3)
-        obj.mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2659,39 +2419,24 @@ class bsn_set_l2_table_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB1xHL.pack(self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_l2_table_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority, obj.status) = reader.read_struct(_st_LLLB1xHL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 24)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2749,39 +2494,24 @@ class bsn_set_l2_table_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB1xH4x.pack(self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_l2_table_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority) = reader.read_struct(_st_LLLB1xH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -2831,35 +2561,24 @@ class bsn_set_mirroring(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_mirroring()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -2905,33 +2624,24 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 25)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2993,43 +2703,24 @@ class bsn_set_pktin_suppression_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB1xHHHQ.pack(self.xid, self.experimenter, self.subtype, self.enabled, self.idle_timeout, self.hard_timeout, self.priority, self.cookie))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.cookie) = reader.read_struct(_st_LLLB1xHHHQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.cookie = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -3095,34 +2786,25 @@ class bsn_shell_command(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.service))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.service))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_command()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.service) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
-        obj.service = reader.read("!L")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -3173,31 +2855,24 @@ class bsn_shell_output(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_output()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         obj.data = str(reader.read_all())
         return obj
@@ -3245,33 +2920,24 @@ class bsn_shell_status(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_status()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3326,16 +2992,12 @@ class experimenter_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHHL.pack(self.xid, self.stats_type, self.flags, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -3415,17 +3077,11 @@ class bsn_stats_reply(experimenter_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -3506,16 +3162,12 @@ class experimenter_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHHL.pack(self.xid, self.stats_type, self.flags, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -3595,17 +3247,11 @@ class bsn_stats_request(experimenter_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -3681,35 +3327,24 @@ class bsn_virtual_port_create_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.status, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status, obj.vport_no) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.status = reader.read("!L")[0]
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3759,31 +3394,24 @@ class bsn_virtual_port_create_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.vport.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.vport = common.bsn_vport.unpack(reader)
         return obj
@@ -3831,33 +3459,24 @@ class bsn_virtual_port_remove_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 26)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3903,33 +3522,24 @@ class bsn_virtual_port_remove_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.vport_no) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 17)
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3994,35 +3604,23 @@ class desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!256s", self.mfr_desc))
-        packed.append(struct.pack("!256s", self.hw_desc))
-        packed.append(struct.pack("!256s", self.sw_desc))
-        packed.append(struct.pack("!32s", self.serial_num))
-        packed.append(struct.pack("!256s", self.dp_desc))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH256s256s256s32s256s.pack(self.xid, self.stats_type, self.flags, self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
         obj.mfr_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.hw_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.sw_desc = reader.read("!256s")[0].rstrip("\x00")
@@ -4092,30 +3690,23 @@ class desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4159,26 +3750,23 @@ class echo_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -4223,26 +3811,23 @@ class echo_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -4307,38 +3892,23 @@ class features_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.datapath_id))
-        packed.append(struct.pack("!L", self.n_buffers))
-        packed.append(struct.pack("!B", self.n_tables))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.actions))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQLB3xLL.pack(self.xid, self.datapath_id, self.n_buffers, self.n_tables, self.capabilities, self.actions))
         packed.append(loxi.generic_util.pack_list(self.ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.datapath_id = reader.read("!Q")[0]
-        obj.n_buffers = reader.read("!L")[0]
-        obj.n_tables = reader.read("!B")[0]
-        reader.skip(3)
-        obj.capabilities = reader.read("!L")[0]
-        obj.actions = reader.read("!L")[0]
+        (obj.xid, obj.datapath_id, obj.n_buffers, obj.n_tables, obj.capabilities, obj.actions) = reader.read_struct(_st_LQLB3xLL)
         obj.ports = loxi.generic_util.unpack_list(reader, common.port_desc.unpack)
         return obj
 
@@ -4399,25 +3969,22 @@ class features_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -4495,22 +4062,18 @@ class flow_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_Q.pack(self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_H.pack(self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -4648,45 +4211,36 @@ class flow_add(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_Q.pack(self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_H.pack(self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.match = common.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
+        obj.cookie = reader.read_struct(_st_Q)[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 0)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
+        obj.flags = reader.read_struct(_st_H)[0]
         obj.actions = loxi.generic_util.unpack_list(reader, action.action.unpack)
         return obj
 
@@ -4796,45 +4350,36 @@ class flow_delete(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_Q.pack(self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_H.pack(self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.match = common.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
+        obj.cookie = reader.read_struct(_st_Q)[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 3)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
+        obj.flags = reader.read_struct(_st_H)[0]
         obj.actions = loxi.generic_util.unpack_list(reader, action.action.unpack)
         return obj
 
@@ -4944,45 +4489,36 @@ class flow_delete_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_Q.pack(self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_H.pack(self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete_strict()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.match = common.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
+        obj.cookie = reader.read_struct(_st_Q)[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 4)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
+        obj.flags = reader.read_struct(_st_H)[0]
         obj.actions = loxi.generic_util.unpack_list(reader, action.action.unpack)
         return obj
 
@@ -5064,31 +4600,24 @@ class flow_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 3)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -5170,45 +4699,36 @@ class flow_modify(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_Q.pack(self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_H.pack(self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.match = common.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
+        obj.cookie = reader.read_struct(_st_Q)[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
+        obj.flags = reader.read_struct(_st_H)[0]
         obj.actions = loxi.generic_util.unpack_list(reader, action.action.unpack)
         return obj
 
@@ -5318,45 +4838,36 @@ class flow_modify_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_Q.pack(self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_H.pack(self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify_strict()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.match = common.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
+        obj.cookie = reader.read_struct(_st_Q)[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 2)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
+        obj.flags = reader.read_struct(_st_H)[0]
         obj.actions = loxi.generic_util.unpack_list(reader, action.action.unpack)
         return obj
 
@@ -5465,47 +4976,26 @@ class flow_removed(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_QHB1xLLH2xQQ.pack(self.cookie, self.priority, self.reason, self.duration_sec, self.duration_nsec, self.idle_timeout, self.packet_count, self.byte_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.match = common.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        reader.skip(2)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.cookie, obj.priority, obj.reason, obj.duration_sec, obj.duration_nsec, obj.idle_timeout, obj.packet_count, obj.byte_count) = reader.read_struct(_st_QHB1xLLH2xQQ)
         return obj
 
     def __eq__(self, other):
@@ -5586,31 +5076,24 @@ class flow_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, common.flow_stats_entry.unpack)
         return obj
 
@@ -5672,37 +5155,28 @@ class flow_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
+        packed.append(_st_B1x.pack(self.table_id))
         packed.append(util.pack_port_no(self.out_port))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
         obj.match = common.match.unpack(reader)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
+        obj.table_id = reader.read_struct(_st_B1x)[0]
         obj.out_port = util.unpack_port_no(reader)
         return obj
 
@@ -5763,29 +5237,22 @@ class get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        (obj.xid, obj.flags, obj.miss_send_len) = reader.read_struct(_st_LHH)
         return obj
 
     def __eq__(self, other):
@@ -5829,25 +5296,22 @@ class get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -5883,25 +5347,22 @@ class hello(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -5946,31 +5407,24 @@ class hello_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 0)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6022,14 +5476,11 @@ class nicira_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -6093,33 +5544,24 @@ class nicira_controller_role_reply(nicira_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.role))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.role))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = nicira_controller_role_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.role) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.role = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6165,33 +5607,24 @@ class nicira_controller_role_request(nicira_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.role))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.role))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = nicira_controller_role_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.role) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
-        obj.role = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6251,36 +5684,27 @@ class packet_in(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(struct.pack("!H", self.total_len))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLH.pack(self.xid, self.buffer_id, self.total_len))
         packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 1)
+        packed.append(_st_B1x.pack(self.reason))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_in()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.total_len = reader.read("!H")[0]
+        (obj.xid, obj.buffer_id, obj.total_len) = reader.read_struct(_st_LLH)
         obj.in_port = util.unpack_port_no(reader)
-        obj.reason = reader.read("!B")[0]
-        reader.skip(1)
+        obj.reason = reader.read_struct(_st_B1x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6353,34 +5777,29 @@ class packet_out(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL.pack(self.xid, self.buffer_id))
         packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 6
+        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 4
         packed.append(loxi.generic_util.pack_list(self.actions))
-        packed[6] = struct.pack("!H", len(packed[-1]))
+        packed[4] = struct.pack("!H", len(packed[-1]))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_out()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.xid, obj.buffer_id) = reader.read_struct(_st_LL)
         obj.in_port = util.unpack_port_no(reader)
-        _actions_len = reader.read("!H")[0]
+        _actions_len = reader.read_struct(_st_H)[0]
         obj.actions = loxi.generic_util.unpack_list(reader.slice(_actions_len), action.action.unpack)
         obj.data = str(reader.read_all())
         return obj
@@ -6454,37 +5873,28 @@ class port_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port_no))
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.mask))
-        packed.append(struct.pack("!L", self.advertise))
-        packed.append('\x00' * 4)
+        packed.append(_st_LLL4x.pack(self.config, self.mask, self.advertise))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.hw_addr = list(reader.read('!6B'))
-        obj.config = reader.read("!L")[0]
-        obj.mask = reader.read("!L")[0]
-        obj.advertise = reader.read("!L")[0]
-        reader.skip(4)
+        (obj.config, obj.mask, obj.advertise) = reader.read_struct(_st_LLL4x)
         return obj
 
     def __eq__(self, other):
@@ -6549,31 +5959,24 @@ class port_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 4)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6627,31 +6030,24 @@ class port_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, common.port_stats_entry.unpack)
         return obj
 
@@ -6705,32 +6101,25 @@ class port_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
         packed.append('\x00' * 6)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(6)
         return obj
@@ -6784,30 +6173,23 @@ class port_status(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LB7x.pack(self.xid, self.reason))
         packed.append(self.desc.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_status()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        (obj.xid, obj.reason) = reader.read_struct(_st_LB7x)
         obj.desc = common.port_desc.unpack(reader)
         return obj
 
@@ -6860,28 +6242,25 @@ class queue_get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port))
         packed.append('\x00' * 6)
         packed.append(loxi.generic_util.pack_list(self.queues))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port = util.unpack_port_no(reader)
         reader.skip(6)
         obj.queues = loxi.generic_util.unpack_list(reader, common.packet_queue.unpack)
@@ -6932,27 +6311,24 @@ class queue_get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port))
         packed.append('\x00' * 2)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port = util.unpack_port_no(reader)
         reader.skip(2)
         return obj
@@ -7003,31 +6379,24 @@ class queue_op_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_op_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 5)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -7081,31 +6450,24 @@ class queue_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, common.queue_stats_entry.unpack)
         return obj
 
@@ -7163,36 +6525,27 @@ class queue_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_2xL.pack(self.queue_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(2)
-        obj.queue_id = reader.read("!L")[0]
+        obj.queue_id = reader.read_struct(_st_2xL)[0]
         return obj
 
     def __eq__(self, other):
@@ -7248,29 +6601,22 @@ class set_config(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = set_config()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        (obj.xid, obj.flags, obj.miss_send_len) = reader.read_struct(_st_LHH)
         return obj
 
     def __eq__(self, other):
@@ -7322,31 +6668,22 @@ class table_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.config))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LB3xL.pack(self.xid, self.table_id, self.config))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.config = reader.read("!L")[0]
+        (obj.xid, obj.table_id, obj.config) = reader.read_struct(_st_LB3xL)
         return obj
 
     def __eq__(self, other):
@@ -7399,31 +6736,24 @@ class table_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_stats_entry.unpack)
         return obj
 
@@ -7473,30 +6803,23 @@ class table_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -16,6 +16,19 @@ import common
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_B3x = struct.Struct("!B3x")
+_st_H = struct.Struct("!H")
+_st_H2x = struct.Struct("!H2x")
+_st_H6x = struct.Struct("!H6x")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+_st_LH2x4x = struct.Struct("!LH2x4x")
+_st_LL = struct.Struct("!LL")
+_st_LL4x = struct.Struct("!LL4x")
+_st_LLL = struct.Struct("!LLL")
+_st_LLLLB3x = struct.Struct("!LLLLB3x")
+
 class action(loxi.OFObject):
     subtypes = {}
 
@@ -29,7 +42,7 @@ class action(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -83,9 +96,9 @@ class experimenter(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_L.pack(self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -141,11 +154,9 @@ class bsn(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
+        packed.append(_st_LL4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -198,10 +209,9 @@ class bsn_checksum(bsn):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_LL.pack(self.experimenter, self.subtype))
         packed.append(util.pack_checksum_128(self.checksum))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -210,14 +220,12 @@ class bsn_checksum(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_checksum()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        (_experimenter, _subtype) = reader.read_struct(_st_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
@@ -261,14 +269,9 @@ class bsn_mirror(bsn):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dest_port))
-        packed.append(struct.pack("!L", self.vlan_tag))
-        packed.append(struct.pack("!B", self.copy_stage))
-        packed.append('\x00' * 3)
+        packed.append(_st_LLLLB3x.pack(self.experimenter, self.subtype, self.dest_port, self.vlan_tag, self.copy_stage))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -276,19 +279,13 @@ class bsn_mirror(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_mirror()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        (_experimenter, _subtype, obj.dest_port, obj.vlan_tag, obj.copy_stage) = reader.read_struct(_st_LLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.dest_port = reader.read("!L")[0]
-        obj.vlan_tag = reader.read("!L")[0]
-        obj.copy_stage = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -330,11 +327,9 @@ class bsn_set_tunnel_dst(bsn):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dst))
+        packed.append(_st_LLL.pack(self.experimenter, self.subtype, self.dst))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -342,16 +337,13 @@ class bsn_set_tunnel_dst(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_set_tunnel_dst()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        (_experimenter, _subtype, obj.dst) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.dst = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -379,7 +371,7 @@ class copy_ttl_in(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -389,9 +381,8 @@ class copy_ttl_in(action):
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_in()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 12)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -419,7 +410,7 @@ class copy_ttl_out(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -429,9 +420,8 @@ class copy_ttl_out(action):
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_out()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 11)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -459,7 +449,7 @@ class dec_mpls_ttl(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -469,9 +459,8 @@ class dec_mpls_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = dec_mpls_ttl()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 16)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -499,7 +488,7 @@ class dec_nw_ttl(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -509,9 +498,8 @@ class dec_nw_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = dec_nw_ttl()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 24)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -543,9 +531,9 @@ class group(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_L.pack(self.group_id))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -553,12 +541,11 @@ class group(action):
     @staticmethod
     def unpack(reader):
         obj = group()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 22)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.group_id = reader.read("!L")[0]
+        obj.group_id = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -593,12 +580,9 @@ class nicira(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_st_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -648,12 +632,9 @@ class nicira_dec_ttl(nicira):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_st_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -661,17 +642,13 @@ class nicira_dec_ttl(nicira):
     @staticmethod
     def unpack(reader):
         obj = nicira_dec_ttl()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        (_experimenter, _subtype) = reader.read_struct(_st_LH2x4x)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == 18)
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -704,11 +681,10 @@ class output(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(util.pack_port_no(self.port))
-        packed.append(struct.pack("!H", self.max_len))
-        packed.append('\x00' * 6)
+        packed.append(_st_H6x.pack(self.max_len))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -716,14 +692,12 @@ class output(action):
     @staticmethod
     def unpack(reader):
         obj = output()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.port = util.unpack_port_no(reader)
-        obj.max_len = reader.read("!H")[0]
-        reader.skip(6)
+        obj.max_len = reader.read_struct(_st_H6x)[0]
         return obj
 
     def __eq__(self, other):
@@ -759,10 +733,9 @@ class pop_mpls(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -770,13 +743,11 @@ class pop_mpls(action):
     @staticmethod
     def unpack(reader):
         obj = pop_mpls()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 20)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.ethertype = reader.read("!H")[0]
-        reader.skip(2)
+        obj.ethertype = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -804,7 +775,7 @@ class pop_vlan(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -814,9 +785,8 @@ class pop_vlan(action):
     @staticmethod
     def unpack(reader):
         obj = pop_vlan()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 18)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -848,10 +818,9 @@ class push_mpls(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -859,13 +828,11 @@ class push_mpls(action):
     @staticmethod
     def unpack(reader):
         obj = push_mpls()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 19)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.ethertype = reader.read("!H")[0]
-        reader.skip(2)
+        obj.ethertype = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -897,10 +864,9 @@ class push_vlan(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -908,13 +874,11 @@ class push_vlan(action):
     @staticmethod
     def unpack(reader):
         obj = push_vlan()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 17)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.ethertype = reader.read("!H")[0]
-        reader.skip(2)
+        obj.ethertype = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -946,7 +910,7 @@ class set_dl_dst(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(struct.pack("!6B", *self.dl_addr))
         packed.append('\x00' * 6)
@@ -957,9 +921,8 @@ class set_dl_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_dl_dst()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -995,7 +958,7 @@ class set_dl_src(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(struct.pack("!6B", *self.dl_addr))
         packed.append('\x00' * 6)
@@ -1006,9 +969,8 @@ class set_dl_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_dl_src()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -1044,9 +1006,9 @@ class set_mpls_label(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.mpls_label))
+        packed.append(_st_L.pack(self.mpls_label))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1054,12 +1016,11 @@ class set_mpls_label(action):
     @staticmethod
     def unpack(reader):
         obj = set_mpls_label()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 13)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.mpls_label = reader.read("!L")[0]
+        obj.mpls_label = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1091,10 +1052,9 @@ class set_mpls_tc(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.mpls_tc))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.mpls_tc))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1102,13 +1062,11 @@ class set_mpls_tc(action):
     @staticmethod
     def unpack(reader):
         obj = set_mpls_tc()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 14)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.mpls_tc = reader.read("!B")[0]
-        reader.skip(3)
+        obj.mpls_tc = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1140,10 +1098,9 @@ class set_mpls_ttl(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.mpls_ttl))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.mpls_ttl))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1151,13 +1108,11 @@ class set_mpls_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = set_mpls_ttl()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 15)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.mpls_ttl = reader.read("!B")[0]
-        reader.skip(3)
+        obj.mpls_ttl = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1189,9 +1144,9 @@ class set_nw_dst(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.nw_addr))
+        packed.append(_st_L.pack(self.nw_addr))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1199,12 +1154,11 @@ class set_nw_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_dst()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 6)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.nw_addr = reader.read("!L")[0]
+        obj.nw_addr = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1236,10 +1190,9 @@ class set_nw_ecn(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_ecn))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.nw_ecn))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1247,13 +1200,11 @@ class set_nw_ecn(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_ecn()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 8)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.nw_ecn = reader.read("!B")[0]
-        reader.skip(3)
+        obj.nw_ecn = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1285,9 +1236,9 @@ class set_nw_src(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.nw_addr))
+        packed.append(_st_L.pack(self.nw_addr))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1295,12 +1246,11 @@ class set_nw_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_src()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.nw_addr = reader.read("!L")[0]
+        obj.nw_addr = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1332,10 +1282,9 @@ class set_nw_tos(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_tos))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.nw_tos))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1343,13 +1292,11 @@ class set_nw_tos(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_tos()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 7)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.nw_tos = reader.read("!B")[0]
-        reader.skip(3)
+        obj.nw_tos = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1381,10 +1328,9 @@ class set_nw_ttl(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_ttl))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.nw_ttl))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1392,13 +1338,11 @@ class set_nw_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_ttl()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 23)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.nw_ttl = reader.read("!B")[0]
-        reader.skip(3)
+        obj.nw_ttl = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1430,9 +1374,9 @@ class set_queue(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_L.pack(self.queue_id))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1440,12 +1384,11 @@ class set_queue(action):
     @staticmethod
     def unpack(reader):
         obj = set_queue()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 21)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.queue_id = reader.read("!L")[0]
+        obj.queue_id = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1477,10 +1420,9 @@ class set_tp_dst(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.tp_port))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1488,13 +1430,11 @@ class set_tp_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_tp_dst()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 10)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.tp_port = reader.read("!H")[0]
-        reader.skip(2)
+        obj.tp_port = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1526,10 +1466,9 @@ class set_tp_src(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.tp_port))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1537,13 +1476,11 @@ class set_tp_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_tp_src()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 9)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.tp_port = reader.read("!H")[0]
-        reader.skip(2)
+        obj.tp_port = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1575,10 +1512,9 @@ class set_vlan_pcp(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.vlan_pcp))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1586,13 +1522,11 @@ class set_vlan_pcp(action):
     @staticmethod
     def unpack(reader):
         obj = set_vlan_pcp()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.vlan_pcp = reader.read("!B")[0]
-        reader.skip(3)
+        obj.vlan_pcp = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1624,10 +1558,9 @@ class set_vlan_vid(action):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.vlan_vid))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1635,13 +1568,11 @@ class set_vlan_vid(action):
     @staticmethod
     def unpack(reader):
         obj = set_vlan_vid()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.vlan_vid = reader.read("!H")[0]
-        reader.skip(2)
+        obj.vlan_vid = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -16,6 +16,32 @@ import common
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_2x16sLL = struct.Struct("!2x16sLL")
+_st_2x16sLLLLLLLL = struct.Struct("!2x16sLLLLLLLL")
+_st_2xLL4xQQ = struct.Struct("!2xLL4xQQ")
+_st_4xH6x = struct.Struct("!4xH6x")
+_st_4xQQQQQQQQQQQQ = struct.Struct("!4xQQQQQQQQQQQQ")
+_st_B1xL = struct.Struct("!B1xL")
+_st_B1xLLHHH6xQQQ = struct.Struct("!B1xLLHHH6xQQQ")
+_st_B7x = struct.Struct("!B7x")
+_st_B7x32s = struct.Struct("!B7x32s")
+_st_H = struct.Struct("!H")
+_st_HB1xHBBLLLLHHLB3xQQ = struct.Struct("!HB1xHBBLLLLHHLB3xQQ")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+_st_L4x = struct.Struct("!L4x")
+_st_LH = struct.Struct("!LH")
+_st_LHHHH = struct.Struct("!LHHHH")
+_st_LHHHH16s = struct.Struct("!LHHHH16s")
+_st_LL = struct.Struct("!LL")
+_st_LLBB2xLL = struct.Struct("!LLBB2xLL")
+_st_LLBB2xLL16s = struct.Struct("!LLBB2xLL16s")
+_st_LLLLLLLL = struct.Struct("!LLLLLLLL")
+_st_LLLLLLQQ = struct.Struct("!LLLLLLQQ")
+_st_LQQQ = struct.Struct("!LQQQ")
+_st_QQ = struct.Struct("!QQ")
+
 class bsn_interface(loxi.OFObject):
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
@@ -40,10 +66,7 @@ class bsn_interface(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
+        packed.append(_st_2x16sLL.pack(self.name, self.ipv4_addr, self.ipv4_netmask))
         return ''.join(packed)
 
     @staticmethod
@@ -52,8 +75,7 @@ class bsn_interface(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        (obj.ipv4_addr, obj.ipv4_netmask) = reader.read_struct(_st_LL)
         return obj
 
     def __eq__(self, other):
@@ -97,7 +119,7 @@ class bsn_vport(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -187,21 +209,14 @@ class bsn_vport_l2gre(bsn_vport):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.flags))
+        packed.append(_st_L.pack(self.flags))
         packed.append(util.pack_port_no(self.port_no))
         packed.append(util.pack_port_no(self.loopback_port_no))
         packed.append(struct.pack("!6B", *self.local_mac))
         packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
-        packed.append(struct.pack("!16s", self.if_name))
+        packed.append(_st_LLBB2xLL16s.pack(self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit, self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -209,23 +224,16 @@ class bsn_vport_l2gre(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.flags = reader.read("!L")[0]
+        obj.flags = reader.read_struct(_st_L)[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.loopback_port_no = util.unpack_port_no(reader)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
+        (obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit) = reader.read_struct(_st_LLBB2xLL)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -322,14 +330,9 @@ class bsn_vport_q_in_q(bsn_vport):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
-        packed.append(struct.pack("!16s", self.if_name))
+        packed.append(_st_LHHHH16s.pack(self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id, self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -337,16 +340,11 @@ class bsn_vport_q_in_q(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
+        (obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id) = reader.read_struct(_st_LHHHH)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -411,10 +409,9 @@ class bucket(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 0
-        packed.append(struct.pack("!H", self.weight))
+        packed.append(_st_H.pack(self.weight))
         packed.append(util.pack_port_no(self.watch_port))
-        packed.append(struct.pack("!L", self.watch_group))
-        packed.append('\x00' * 4)
+        packed.append(_st_L4x.pack(self.watch_group))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -423,13 +420,12 @@ class bucket(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bucket()
-        _len = reader.read("!H")[0]
+        _len = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 2)
-        obj.weight = reader.read("!H")[0]
+        obj.weight = reader.read_struct(_st_H)[0]
         obj.watch_port = util.unpack_port_no(reader)
-        obj.watch_group = reader.read("!L")[0]
-        reader.skip(4)
+        obj.watch_group = reader.read_struct(_st_L4x)[0]
         obj.actions = loxi.generic_util.unpack_list(reader, action.action.unpack)
         return obj
 
@@ -476,15 +472,13 @@ class bucket_counter(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_QQ.pack(self.packet_count, self.byte_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bucket_counter()
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.packet_count, obj.byte_count) = reader.read_struct(_st_QQ)
         return obj
 
     def __eq__(self, other):
@@ -559,17 +553,7 @@ class flow_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_B1xLLHHH6xQQQ.pack(self.table_id, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.cookie, self.packet_count, self.byte_count))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
@@ -579,20 +563,10 @@ class flow_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = flow_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        reader.skip(6)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.table_id, obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.cookie, obj.packet_count, obj.byte_count) = reader.read_struct(_st_B1xLLHHH6xQQQ)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -673,9 +647,7 @@ class group_desc_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_B1xL.pack(self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -684,12 +656,10 @@ class group_desc_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        (obj.group_type, obj.group_id) = reader.read_struct(_st_B1xL)
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -745,12 +715,7 @@ class group_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(struct.pack("!L", self.ref_count))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_2xLL4xQQ.pack(self.group_id, self.ref_count, self.packet_count, self.byte_count))
         packed.append(loxi.generic_util.pack_list(self.bucket_stats))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -759,15 +724,10 @@ class group_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = group_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        reader.skip(2)
-        obj.group_id = reader.read("!L")[0]
-        obj.ref_count = reader.read("!L")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.group_id, obj.ref_count, obj.packet_count, obj.byte_count) = reader.read_struct(_st_2xLL4xQQ)
         obj.bucket_stats = loxi.generic_util.unpack_list(reader, common.bucket_counter.unpack)
         return obj
 
@@ -895,7 +855,7 @@ class match_v2(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(util.pack_port_no(self.in_port))
         packed.append(util.pack_wc_bmap(self.wildcards))
@@ -903,23 +863,7 @@ class match_v2(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.eth_src_mask))
         packed.append(struct.pack("!6B", *self.eth_dst))
         packed.append(struct.pack("!6B", *self.eth_dst_mask))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.eth_type))
-        packed.append(struct.pack("!B", self.ip_dscp))
-        packed.append(struct.pack("!B", self.ip_proto))
-        packed.append(struct.pack("!L", self.ipv4_src))
-        packed.append(struct.pack("!L", self.ipv4_src_mask))
-        packed.append(struct.pack("!L", self.ipv4_dst))
-        packed.append(struct.pack("!L", self.ipv4_dst_mask))
-        packed.append(struct.pack("!H", self.tcp_src))
-        packed.append(struct.pack("!H", self.tcp_dst))
-        packed.append(struct.pack("!L", self.mpls_label))
-        packed.append(struct.pack("!B", self.mpls_tc))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!Q", self.metadata))
-        packed.append(struct.pack("!Q", self.metadata_mask))
+        packed.append(_st_HB1xHBBLLLLHHLB3xQQ.pack(self.vlan_vid, self.vlan_pcp, self.eth_type, self.ip_dscp, self.ip_proto, self.ipv4_src, self.ipv4_src_mask, self.ipv4_dst, self.ipv4_dst_mask, self.tcp_src, self.tcp_dst, self.mpls_label, self.mpls_tc, self.metadata, self.metadata_mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -927,9 +871,8 @@ class match_v2(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = match_v2()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.in_port = util.unpack_port_no(reader)
@@ -938,23 +881,7 @@ class match_v2(loxi.OFObject):
         obj.eth_src_mask = list(reader.read('!6B'))
         obj.eth_dst = list(reader.read('!6B'))
         obj.eth_dst_mask = list(reader.read('!6B'))
-        obj.vlan_vid = reader.read("!H")[0]
-        obj.vlan_pcp = reader.read("!B")[0]
-        reader.skip(1)
-        obj.eth_type = reader.read("!H")[0]
-        obj.ip_dscp = reader.read("!B")[0]
-        obj.ip_proto = reader.read("!B")[0]
-        obj.ipv4_src = reader.read("!L")[0]
-        obj.ipv4_src_mask = reader.read("!L")[0]
-        obj.ipv4_dst = reader.read("!L")[0]
-        obj.ipv4_dst_mask = reader.read("!L")[0]
-        obj.tcp_src = reader.read("!H")[0]
-        obj.tcp_dst = reader.read("!H")[0]
-        obj.mpls_label = reader.read("!L")[0]
-        obj.mpls_tc = reader.read("!B")[0]
-        reader.skip(3)
-        obj.metadata = reader.read("!Q")[0]
-        obj.metadata_mask = reader.read("!Q")[0]
+        (obj.vlan_vid, obj.vlan_pcp, obj.eth_type, obj.ip_dscp, obj.ip_proto, obj.ipv4_src, obj.ipv4_src_mask, obj.ipv4_dst, obj.ipv4_dst_mask, obj.tcp_src, obj.tcp_dst, obj.mpls_label, obj.mpls_tc, obj.metadata, obj.metadata_mask) = reader.read_struct(_st_HB1xHBBLLLLHHLB3xQQ)
         return obj
 
     def __eq__(self, other):
@@ -1068,7 +995,7 @@ class packet_queue(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_L.pack(self.queue_id))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 2)
         packed.append(loxi.generic_util.pack_list(self.properties))
@@ -1079,8 +1006,7 @@ class packet_queue(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = packet_queue()
-        obj.queue_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        (obj.queue_id, _len) = reader.read_struct(_st_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
         reader.skip(2)
@@ -1161,16 +1087,7 @@ class port_desc(loxi.OFObject):
         packed.append(util.pack_port_no(self.port_no))
         packed.append('\x00' * 4)
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        packed.append(struct.pack("!L", self.curr_speed))
-        packed.append(struct.pack("!L", self.max_speed))
+        packed.append(_st_2x16sLLLLLLLL.pack(self.name, self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed))
         return ''.join(packed)
 
     @staticmethod
@@ -1181,14 +1098,7 @@ class port_desc(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
-        obj.curr_speed = reader.read("!L")[0]
-        obj.max_speed = reader.read("!L")[0]
+        (obj.config, obj.state, obj.curr, obj.advertised, obj.supported, obj.peer, obj.curr_speed, obj.max_speed) = reader.read_struct(_st_LLLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -1307,38 +1217,14 @@ class port_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
+        packed.append(_st_4xQQQQQQQQQQQQ.pack(self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        (obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors, obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions) = reader.read_struct(_st_4xQQQQQQQQQQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1418,7 +1304,7 @@ class queue_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -1466,11 +1352,9 @@ class queue_prop_min_rate(queue_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_st_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1478,14 +1362,11 @@ class queue_prop_min_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        reader.skip(4)
-        obj.rate = reader.read("!H")[0]
-        reader.skip(6)
+        obj.rate = reader.read_struct(_st_4xH6x)[0]
         return obj
 
     def __eq__(self, other):
@@ -1533,20 +1414,14 @@ class queue_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
+        packed.append(_st_LQQQ.pack(self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
+        (obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors) = reader.read_struct(_st_LQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1636,37 +1511,20 @@ class table_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 7)
-        packed.append(struct.pack("!32s", self.name))
+        packed.append(_st_B7x32s.pack(self.table_id, self.name))
         packed.append(util.pack_wc_bmap(self.wildcards))
         packed.append(util.pack_match_bmap(self.match))
-        packed.append(struct.pack("!L", self.instructions))
-        packed.append(struct.pack("!L", self.write_actions))
-        packed.append(struct.pack("!L", self.apply_actions))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
+        packed.append(_st_LLLLLLQQ.pack(self.instructions, self.write_actions, self.apply_actions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(7)
+        obj.table_id = reader.read_struct(_st_B7x)[0]
         obj.name = reader.read("!32s")[0].rstrip("\x00")
         obj.wildcards = util.unpack_wc_bmap(reader)
         obj.match = util.unpack_match_bmap(reader)
-        obj.instructions = reader.read("!L")[0]
-        obj.write_actions = reader.read("!L")[0]
-        obj.apply_actions = reader.read("!L")[0]
-        obj.config = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        (obj.instructions, obj.write_actions, obj.apply_actions, obj.config, obj.max_entries, obj.active_count, obj.lookup_count, obj.matched_count) = reader.read_struct(_st_LLLLLLQQ)
         return obj
 
     def __eq__(self, other):
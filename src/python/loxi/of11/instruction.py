@@ -16,6 +16,13 @@ import common
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_4xQQ = struct.Struct("!4xQQ")
+_st_B3x = struct.Struct("!B3x")
+_st_H = struct.Struct("!H")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+
 class instruction(loxi.OFObject):
     subtypes = {}
 
@@ -29,7 +36,7 @@ class instruction(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -77,7 +84,7 @@ class apply_actions(instruction):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         packed.append(loxi.generic_util.pack_list(self.actions))
@@ -88,9 +95,8 @@ class apply_actions(instruction):
     @staticmethod
     def unpack(reader):
         obj = apply_actions()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -122,7 +128,7 @@ class clear_actions(instruction):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -132,9 +138,8 @@ class clear_actions(instruction):
     @staticmethod
     def unpack(reader):
         obj = clear_actions()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -172,9 +177,9 @@ class experimenter(instruction):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_L.pack(self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -227,10 +232,9 @@ class goto_table(instruction):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.table_id))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -238,13 +242,11 @@ class goto_table(instruction):
     @staticmethod
     def unpack(reader):
         obj = goto_table()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
+        obj.table_id = reader.read_struct(_st_B3x)[0]
         return obj
 
     def __eq__(self, other):
@@ -276,7 +278,7 @@ class write_actions(instruction):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         packed.append(loxi.generic_util.pack_list(self.actions))
@@ -287,9 +289,8 @@ class write_actions(instruction):
     @staticmethod
     def unpack(reader):
         obj = write_actions()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -329,11 +330,9 @@ class write_metadata(instruction):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.metadata))
-        packed.append(struct.pack("!Q", self.metadata_mask))
+        packed.append(_st_4xQQ.pack(self.metadata, self.metadata_mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -341,14 +340,11 @@ class write_metadata(instruction):
     @staticmethod
     def unpack(reader):
         obj = write_metadata()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        reader.skip(4)
-        obj.metadata = reader.read("!Q")[0]
-        obj.metadata_mask = reader.read("!Q")[0]
+        (obj.metadata, obj.metadata_mask) = reader.read_struct(_st_4xQQ)
         return obj
 
     def __eq__(self, other):
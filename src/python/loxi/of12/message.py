@@ -17,6 +17,42 @@ import common
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_2xLLL4x = struct.Struct("!2xLLL4x")
+_st_B = struct.Struct("!B")
+_st_B3x = struct.Struct("!B3x")
+_st_BB = struct.Struct("!BB")
+_st_BBH = struct.Struct("!BBH")
+_st_H6x = struct.Struct("!H6x")
+_st_HHHL = struct.Struct("!HHHL")
+_st_L = struct.Struct("!L")
+_st_L4xQQ = struct.Struct("!L4xQQ")
+_st_LB3xL = struct.Struct("!LB3xL")
+_st_LB7x = struct.Struct("!LB7x")
+_st_LH = struct.Struct("!LH")
+_st_LH2x = struct.Struct("!LH2x")
+_st_LHB1xL = struct.Struct("!LHB1xL")
+_st_LHH = struct.Struct("!LHH")
+_st_LHH4x = struct.Struct("!LHH4x")
+_st_LHH4x256s256s256s32s256s = struct.Struct("!LHH4x256s256s256s32s256s")
+_st_LHH4xB3x = struct.Struct("!LHH4xB3x")
+_st_LHH4xL4x = struct.Struct("!LHH4xL4x")
+_st_LHH4xLL = struct.Struct("!LHH4xLL")
+_st_LHH4xLLLLLLLLLL = struct.Struct("!LHH4xLLLLLLLLLL")
+_st_LHH4xQQL4x = struct.Struct("!LHH4xQQL4x")
+_st_LHHL = struct.Struct("!LHHL")
+_st_LL = struct.Struct("!LL")
+_st_LL4xQ = struct.Struct("!LL4xQ")
+_st_LLHBB = struct.Struct("!LLHBB")
+_st_LLL = struct.Struct("!LLL")
+_st_LLLB1xHHHQ = struct.Struct("!LLLB1xHHHQ")
+_st_LLLB3x = struct.Struct("!LLLB3x")
+_st_LLLL = struct.Struct("!LLLL")
+_st_LLLLL = struct.Struct("!LLLLL")
+_st_LQHBBLLHHQQ = struct.Struct("!LQHBBLLHHQQ")
+_st_LQLB3xLL = struct.Struct("!LQLB3xLL")
+_st_LQQB = struct.Struct("!LQQB")
+
 class message(loxi.OFObject):
     subtypes = {}
 
@@ -35,12 +71,11 @@ class message(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -103,15 +138,11 @@ class stats_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -190,40 +221,23 @@ class aggregate_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xQQL4x.pack(self.xid, self.stats_type, self.flags, self.packet_count, self.byte_count, self.flow_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.packet_count, obj.byte_count, obj.flow_count) = reader.read_struct(_st_LHH4xQQL4x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.flow_count = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -285,15 +299,11 @@ class stats_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -384,47 +394,28 @@ class aggregate_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xB3x.pack(self.xid, self.stats_type, self.flags, self.table_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
+        packed.append(_st_L4xQQ.pack(self.out_group, self.cookie, self.cookie_mask))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.table_id) = reader.read_struct(_st_LHH4xB3x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
+        (obj.out_group, obj.cookie, obj.cookie_mask) = reader.read_struct(_st_L4xQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -495,13 +486,11 @@ class error_msg(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LH.pack(self.xid, self.err_type))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -566,31 +555,24 @@ class bad_action_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_action_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 2)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -644,31 +626,24 @@ class bad_instruction_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_instruction_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 3)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -722,31 +697,24 @@ class bad_match_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_match_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 4)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -800,31 +768,24 @@ class bad_request_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_request_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 1)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -869,25 +830,22 @@ class barrier_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -923,25 +881,22 @@ class barrier_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -991,15 +946,12 @@ class experimenter(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -1072,14 +1024,11 @@ class bsn_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -1143,33 +1092,24 @@ class bsn_bw_clear_data_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 22)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1211,30 +1151,23 @@ class bsn_bw_clear_data_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 21)
         return obj
 
@@ -1277,33 +1210,24 @@ class bsn_bw_enable_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 20)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1345,30 +1269,23 @@ class bsn_bw_enable_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 19)
         return obj
 
@@ -1415,35 +1332,24 @@ class bsn_bw_enable_set_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.enable, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable, obj.status) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 23)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1493,33 +1399,24 @@ class bsn_bw_enable_set_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enable))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 18)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1565,31 +1462,24 @@ class bsn_get_interfaces_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.interfaces))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.interfaces = loxi.generic_util.unpack_list(reader, common.bsn_interface.unpack)
         return obj
@@ -1633,30 +1523,23 @@ class bsn_get_interfaces_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -1699,35 +1582,24 @@ class bsn_get_mirroring_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -1773,35 +1645,24 @@ class bsn_get_mirroring_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -1855,37 +1716,28 @@ class bsn_pdu_rx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 34)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -1951,40 +1803,29 @@ class bsn_pdu_rx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.timeout_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.timeout_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.timeout_ms) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 33)
-        obj.timeout_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
+        obj.slot_num = reader.read_struct(_st_B3x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -2047,35 +1888,28 @@ class bsn_pdu_rx_timeout(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_timeout()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 35)
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -2133,37 +1967,28 @@ class bsn_pdu_tx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 32)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -2229,40 +2054,29 @@ class bsn_pdu_tx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.tx_interval_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.tx_interval_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.tx_interval_ms) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 31)
-        obj.tx_interval_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
+        obj.slot_num = reader.read_struct(_st_B3x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -2321,35 +2135,24 @@ class bsn_set_mirroring(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_mirroring()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -2395,33 +2198,24 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 25)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2483,43 +2277,24 @@ class bsn_set_pktin_suppression_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB1xHHHQ.pack(self.xid, self.experimenter, self.subtype, self.enabled, self.idle_timeout, self.hard_timeout, self.priority, self.cookie))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.cookie) = reader.read_struct(_st_LLLB1xHHHQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.cookie = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -2594,18 +2369,12 @@ class experimenter_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2691,17 +2460,11 @@ class bsn_stats_reply(experimenter_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2786,18 +2549,12 @@ class experimenter_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2883,17 +2640,11 @@ class bsn_stats_request(experimenter_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2969,35 +2720,24 @@ class bsn_virtual_port_create_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.status, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status, obj.vport_no) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.status = reader.read("!L")[0]
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3047,31 +2787,24 @@ class bsn_virtual_port_create_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.vport.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.vport = common.bsn_vport.unpack(reader)
         return obj
@@ -3119,33 +2852,24 @@ class bsn_virtual_port_remove_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 26)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3191,33 +2915,24 @@ class bsn_virtual_port_remove_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.vport_no) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 17)
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3282,37 +2997,23 @@ class desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!256s", self.mfr_desc))
-        packed.append(struct.pack("!256s", self.hw_desc))
-        packed.append(struct.pack("!256s", self.sw_desc))
-        packed.append(struct.pack("!32s", self.serial_num))
-        packed.append(struct.pack("!256s", self.dp_desc))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x256s256s256s32s256s.pack(self.xid, self.stats_type, self.flags, self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.mfr_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.hw_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.sw_desc = reader.read("!256s")[0].rstrip("\x00")
@@ -3382,32 +3083,23 @@ class desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -3451,26 +3143,23 @@ class echo_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -3515,26 +3204,23 @@ class echo_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -3588,33 +3274,24 @@ class experimenter_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHHL.pack(self.xid, self.err_type, self.subtype, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = experimenter_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.subtype, obj.experimenter) = reader.read_struct(_st_LHHL)
         assert(_err_type == 65535)
-        obj.subtype = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -3687,38 +3364,23 @@ class features_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.datapath_id))
-        packed.append(struct.pack("!L", self.n_buffers))
-        packed.append(struct.pack("!B", self.n_tables))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.reserved))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQLB3xLL.pack(self.xid, self.datapath_id, self.n_buffers, self.n_tables, self.capabilities, self.reserved))
         packed.append(loxi.generic_util.pack_list(self.ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.datapath_id = reader.read("!Q")[0]
-        obj.n_buffers = reader.read("!L")[0]
-        obj.n_tables = reader.read("!B")[0]
-        reader.skip(3)
-        obj.capabilities = reader.read("!L")[0]
-        obj.reserved = reader.read("!L")[0]
+        (obj.xid, obj.datapath_id, obj.n_buffers, obj.n_tables, obj.capabilities, obj.reserved) = reader.read_struct(_st_LQLB3xLL)
         obj.ports = loxi.generic_util.unpack_list(reader, common.port_desc.unpack)
         return obj
 
@@ -3779,25 +3441,22 @@ class features_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -3887,26 +3546,17 @@ class flow_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -4072,52 +3722,33 @@ class flow_add(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 0)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -4252,52 +3883,33 @@ class flow_delete(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 3)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -4432,52 +4044,33 @@ class flow_delete_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete_strict()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 4)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -4572,31 +4165,24 @@ class flow_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 5)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -4690,52 +4276,33 @@ class flow_modify(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -4870,52 +4437,33 @@ class flow_modify_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify_strict()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 2)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -5045,46 +4593,23 @@ class flow_removed(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQHBBLLHHQQ.pack(self.xid, self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.xid, obj.cookie, obj.priority, obj.reason, obj.table_id, obj.duration_sec, obj.duration_nsec, obj.idle_timeout, obj.hard_timeout, obj.packet_count, obj.byte_count) = reader.read_struct(_st_LQHBBLLHHQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -5174,33 +4699,24 @@ class flow_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.flow_stats_entry.unpack)
         return obj
 
@@ -5274,47 +4790,28 @@ class flow_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xB3x.pack(self.xid, self.stats_type, self.flags, self.table_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
+        packed.append(_st_L4xQQ.pack(self.out_group, self.cookie, self.cookie_mask))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.table_id) = reader.read_struct(_st_LHH4xB3x)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
+        (obj.out_group, obj.cookie, obj.cookie_mask) = reader.read_struct(_st_L4xQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -5387,29 +4884,22 @@ class get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        (obj.xid, obj.flags, obj.miss_send_len) = reader.read_struct(_st_LHH)
         return obj
 
     def __eq__(self, other):
@@ -5453,25 +4943,22 @@ class get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -5525,17 +5012,12 @@ class group_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -5620,35 +5102,24 @@ class group_add(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 0)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -5710,35 +5181,24 @@ class group_delete(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -5796,33 +5256,24 @@ class group_desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.group_desc_stats_entry.unpack)
         return obj
 
@@ -5872,32 +5323,23 @@ class group_desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -5982,52 +5424,23 @@ class group_features_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.max_groups_all))
-        packed.append(struct.pack("!L", self.max_groups_select))
-        packed.append(struct.pack("!L", self.max_groups_indirect))
-        packed.append(struct.pack("!L", self.max_groups_ff))
-        packed.append(struct.pack("!L", self.actions_all))
-        packed.append(struct.pack("!L", self.actions_select))
-        packed.append(struct.pack("!L", self.actions_indirect))
-        packed.append(struct.pack("!L", self.actions_ff))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLLLLLLLLL.pack(self.xid, self.stats_type, self.flags, self.types, self.capabilities, self.max_groups_all, self.max_groups_select, self.max_groups_indirect, self.max_groups_ff, self.actions_all, self.actions_select, self.actions_indirect, self.actions_ff))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.types, obj.capabilities, obj.max_groups_all, obj.max_groups_select, obj.max_groups_indirect, obj.max_groups_ff, obj.actions_all, obj.actions_select, obj.actions_indirect, obj.actions_ff) = reader.read_struct(_st_LHH4xLLLLLLLLLL)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_groups_all = reader.read("!L")[0]
-        obj.max_groups_select = reader.read("!L")[0]
-        obj.max_groups_indirect = reader.read("!L")[0]
-        obj.max_groups_ff = reader.read("!L")[0]
-        obj.actions_all = reader.read("!L")[0]
-        obj.actions_select = reader.read("!L")[0]
-        obj.actions_indirect = reader.read("!L")[0]
-        obj.actions_ff = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6112,32 +5525,23 @@ class group_features_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -6186,31 +5590,24 @@ class group_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 6)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6268,35 +5665,24 @@ class group_modify(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_modify()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 1)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -6354,33 +5740,24 @@ class group_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.group_stats_entry.unpack)
         return obj
 
@@ -6434,36 +5811,23 @@ class group_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xL4x.pack(self.xid, self.stats_type, self.flags, self.group_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.group_id) = reader.read_struct(_st_LHH4xL4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.group_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -6507,25 +5871,22 @@ class hello(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -6570,31 +5931,24 @@ class hello_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 0)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6646,14 +6000,11 @@ class nicira_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -6735,36 +6086,25 @@ class packet_in(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(struct.pack("!H", self.total_len))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLHBB.pack(self.xid, self.buffer_id, self.total_len, self.reason, self.table_id))
         packed.append(self.match.pack())
         packed.append('\x00' * 2)
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_in()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.total_len = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.buffer_id, obj.total_len, obj.reason, obj.table_id) = reader.read_struct(_st_LLHBB)
         obj.match = common.match.unpack(reader)
         reader.skip(2)
         obj.data = str(reader.read_all())
@@ -6843,36 +6183,30 @@ class packet_out(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL.pack(self.xid, self.buffer_id))
         packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 6
+        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 4
         packed.append('\x00' * 6)
         packed.append(loxi.generic_util.pack_list(self.actions))
-        packed[6] = struct.pack("!H", len(packed[-1]))
+        packed[4] = struct.pack("!H", len(packed[-1]))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_out()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.xid, obj.buffer_id) = reader.read_struct(_st_LL)
         obj.in_port = util.unpack_port_no(reader)
-        _actions_len = reader.read("!H")[0]
-        reader.skip(6)
+        _actions_len = reader.read_struct(_st_H6x)[0]
         obj.actions = loxi.generic_util.unpack_list(reader.slice(_actions_len), action.action.unpack)
         obj.data = str(reader.read_all())
         return obj
@@ -6946,41 +6280,30 @@ class port_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port_no))
         packed.append('\x00' * 4)
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.mask))
-        packed.append(struct.pack("!L", self.advertise))
-        packed.append('\x00' * 4)
+        packed.append(_st_2xLLL4x.pack(self.config, self.mask, self.advertise))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(4)
         obj.hw_addr = list(reader.read('!6B'))
-        reader.skip(2)
-        obj.config = reader.read("!L")[0]
-        obj.mask = reader.read("!L")[0]
-        obj.advertise = reader.read("!L")[0]
-        reader.skip(4)
+        (obj.config, obj.mask, obj.advertise) = reader.read_struct(_st_2xLLL4x)
         return obj
 
     def __eq__(self, other):
@@ -7045,31 +6368,24 @@ class port_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 7)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -7123,33 +6439,24 @@ class port_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.port_stats_entry.unpack)
         return obj
 
@@ -7203,34 +6510,25 @@ class port_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(4)
         return obj
@@ -7284,30 +6582,23 @@ class port_status(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LB7x.pack(self.xid, self.reason))
         packed.append(self.desc.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_status()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        (obj.xid, obj.reason) = reader.read_struct(_st_LB7x)
         obj.desc = common.port_desc.unpack(reader)
         return obj
 
@@ -7360,28 +6651,25 @@ class queue_get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port))
         packed.append('\x00' * 4)
         packed.append(loxi.generic_util.pack_list(self.queues))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 23)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port = util.unpack_port_no(reader)
         reader.skip(4)
         obj.queues = loxi.generic_util.unpack_list(reader, common.packet_queue.unpack)
@@ -7432,27 +6720,24 @@ class queue_get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port))
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port = util.unpack_port_no(reader)
         reader.skip(4)
         return obj
@@ -7503,31 +6788,24 @@ class queue_op_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_op_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 9)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -7581,33 +6859,24 @@ class queue_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.queue_stats_entry.unpack)
         return obj
 
@@ -7665,36 +6934,27 @@ class queue_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_L.pack(self.queue_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
+        obj.queue_id = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -7750,31 +7010,22 @@ class role_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL4xQ.pack(self.xid, self.role, self.generation_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        (obj.xid, obj.role, obj.generation_id) = reader.read_struct(_st_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -7826,31 +7077,22 @@ class role_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL4xQ.pack(self.xid, self.role, self.generation_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        (obj.xid, obj.role, obj.generation_id) = reader.read_struct(_st_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -7903,31 +7145,24 @@ class role_request_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_request_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 11)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -7980,29 +7215,22 @@ class set_config(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = set_config()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        (obj.xid, obj.flags, obj.miss_send_len) = reader.read_struct(_st_LHH)
         return obj
 
     def __eq__(self, other):
@@ -8055,31 +7283,24 @@ class switch_config_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = switch_config_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 10)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -8132,31 +7353,22 @@ class table_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.config))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LB3xL.pack(self.xid, self.table_id, self.config))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.config = reader.read("!L")[0]
+        (obj.xid, obj.table_id, obj.config) = reader.read_struct(_st_LB3xL)
         return obj
 
     def __eq__(self, other):
@@ -8209,31 +7421,24 @@ class table_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 8)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -8287,33 +7492,24 @@ class table_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_stats_entry.unpack)
         return obj
 
@@ -8363,32 +7559,23 @@ class table_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 3)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -17,6 +17,19 @@ import common
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_L = struct.Struct("!L")
+_st_L16s = struct.Struct("!L16s")
+_st_L16s16s = struct.Struct("!L16s16s")
+_st_LB = struct.Struct("!LB")
+_st_LBB = struct.Struct("!LBB")
+_st_LH = struct.Struct("!LH")
+_st_LHH = struct.Struct("!LHH")
+_st_LL = struct.Struct("!LL")
+_st_LLL = struct.Struct("!LLL")
+_st_LQ = struct.Struct("!LQ")
+_st_LQQ = struct.Struct("!LQQ")
+
 class oxm(loxi.OFObject):
     subtypes = {}
 
@@ -30,7 +43,7 @@ class oxm(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         return ''.join(packed)
 
     @staticmethod
@@ -70,16 +83,14 @@ class arp_op(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147494402)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -115,18 +126,14 @@ class arp_op_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147494660)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -162,14 +169,14 @@ class arp_sha(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_sha()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147495942)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -207,7 +214,7 @@ class arp_sha_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -215,7 +222,7 @@ class arp_sha_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = arp_sha_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496204)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -254,16 +261,14 @@ class arp_spa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147494916)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -299,18 +304,14 @@ class arp_spa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147495176)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -346,14 +347,14 @@ class arp_tha(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tha()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496454)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -391,7 +392,7 @@ class arp_tha_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -399,7 +400,7 @@ class arp_tha_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = arp_tha_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496716)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -438,16 +439,14 @@ class arp_tpa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147495428)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -483,18 +482,14 @@ class arp_tpa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147495688)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -530,16 +525,14 @@ class bsn_egr_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 200196)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -575,18 +568,14 @@ class bsn_egr_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 200456)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -622,16 +611,14 @@ class bsn_global_vrf_allowed(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_global_vrf_allowed()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 198145)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -667,18 +654,14 @@ class bsn_global_vrf_allowed_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_global_vrf_allowed_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 198402)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -714,14 +697,14 @@ class bsn_in_ports_128(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_bitmap_128(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_in_ports_128()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 196624)
         obj.value = util.unpack_bitmap_128(reader)
         return obj
@@ -759,7 +742,7 @@ class bsn_in_ports_128_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_bitmap_128(self.value))
         packed.append(util.pack_bitmap_128(self.value_mask))
         return ''.join(packed)
@@ -767,7 +750,7 @@ class bsn_in_ports_128_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = bsn_in_ports_128_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 196896)
         obj.value = util.unpack_bitmap_128(reader)
         obj.value_mask = util.unpack_bitmap_128(reader)
@@ -806,16 +789,14 @@ class bsn_l2_cache_hit(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l2_cache_hit()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 205825)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -851,18 +832,14 @@ class bsn_l2_cache_hit_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l2_cache_hit_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 206082)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -898,16 +875,14 @@ class bsn_l3_dst_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_dst_class_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 199684)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -943,18 +918,14 @@ class bsn_l3_dst_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_dst_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 199944)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -990,16 +961,14 @@ class bsn_l3_interface_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 198660)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1035,18 +1004,14 @@ class bsn_l3_interface_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 198920)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1082,16 +1047,14 @@ class bsn_l3_src_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 199172)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1127,18 +1090,14 @@ class bsn_l3_src_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 199432)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1174,16 +1133,14 @@ class bsn_lag_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 197124)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1219,18 +1176,14 @@ class bsn_lag_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 197384)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1266,16 +1219,14 @@ class bsn_tcp_flags(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 204802)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1311,18 +1262,14 @@ class bsn_tcp_flags_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 205060)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1358,16 +1305,14 @@ class bsn_udf0(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 200708)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1403,18 +1348,14 @@ class bsn_udf0_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 200968)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1450,16 +1391,14 @@ class bsn_udf1(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 201220)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1495,18 +1434,14 @@ class bsn_udf1_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 201480)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1542,16 +1477,14 @@ class bsn_udf2(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 201732)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1587,18 +1520,14 @@ class bsn_udf2_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 201992)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1634,16 +1563,14 @@ class bsn_udf3(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 202244)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1679,18 +1606,14 @@ class bsn_udf3_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 202504)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1726,16 +1649,14 @@ class bsn_udf4(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 202756)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1771,18 +1692,14 @@ class bsn_udf4_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 203016)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1818,16 +1735,14 @@ class bsn_udf5(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 203268)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1863,18 +1778,14 @@ class bsn_udf5_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 203528)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1910,16 +1821,14 @@ class bsn_udf6(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 203780)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1955,18 +1864,14 @@ class bsn_udf6_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 204040)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2002,16 +1907,14 @@ class bsn_udf7(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 204292)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2047,18 +1950,14 @@ class bsn_udf7_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 204552)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2094,16 +1993,14 @@ class bsn_vlan_xlate_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 205316)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2139,18 +2036,14 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 205576)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2186,16 +2079,14 @@ class bsn_vrf(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 197636)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2231,18 +2122,14 @@ class bsn_vrf_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 197896)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2278,14 +2165,14 @@ class eth_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485190)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -2323,7 +2210,7 @@ class eth_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -2331,7 +2218,7 @@ class eth_dst_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = eth_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485452)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -2370,14 +2257,14 @@ class eth_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_src()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485702)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -2415,7 +2302,7 @@ class eth_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -2423,7 +2310,7 @@ class eth_src_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = eth_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485964)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -2462,16 +2349,14 @@ class eth_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147486210)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2507,18 +2392,14 @@ class eth_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147486468)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2554,16 +2435,14 @@ class icmpv4_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147493889)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2599,18 +2478,14 @@ class icmpv4_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147494146)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2646,16 +2521,14 @@ class icmpv4_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147493377)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2691,18 +2564,14 @@ class icmpv4_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147493634)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2738,16 +2607,14 @@ class icmpv6_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147499009)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2783,18 +2650,14 @@ class icmpv6_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147499266)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2830,16 +2693,14 @@ class icmpv6_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147498497)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2875,18 +2736,14 @@ class icmpv6_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147498754)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2922,14 +2779,14 @@ class in_phy_port(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = in_phy_port()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147484164)
         obj.value = util.unpack_port_no(reader)
         return obj
@@ -2967,7 +2824,7 @@ class in_phy_port_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         packed.append(util.pack_port_no(self.value_mask))
         return ''.join(packed)
@@ -2975,7 +2832,7 @@ class in_phy_port_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = in_phy_port_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147484424)
         obj.value = util.unpack_port_no(reader)
         obj.value_mask = util.unpack_port_no(reader)
@@ -3014,14 +2871,14 @@ class in_port(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = in_port()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147483652)
         obj.value = util.unpack_port_no(reader)
         return obj
@@ -3059,7 +2916,7 @@ class in_port_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         packed.append(util.pack_port_no(self.value_mask))
         return ''.join(packed)
@@ -3067,7 +2924,7 @@ class in_port_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = in_port_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147483912)
         obj.value = util.unpack_port_no(reader)
         obj.value_mask = util.unpack_port_no(reader)
@@ -3106,16 +2963,14 @@ class ip_dscp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147487745)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3151,18 +3006,14 @@ class ip_dscp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147488002)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3198,16 +3049,14 @@ class ip_ecn(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147488257)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3243,18 +3092,14 @@ class ip_ecn_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147488514)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3290,16 +3135,14 @@ class ip_proto(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147488769)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3335,18 +3178,14 @@ class ip_proto_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147489026)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3382,16 +3221,14 @@ class ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147489796)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3427,18 +3264,14 @@ class ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147490056)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3474,16 +3307,14 @@ class ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147489284)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3519,18 +3350,14 @@ class ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147489544)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3566,14 +3393,13 @@ class ipv6_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497488)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -3611,15 +3437,13 @@ class ipv6_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497760)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -3658,16 +3482,14 @@ class ipv6_flabel(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147497988)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3703,18 +3525,14 @@ class ipv6_flabel_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147498248)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3750,14 +3568,14 @@ class ipv6_nd_sll(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_sll()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500038)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -3795,7 +3613,7 @@ class ipv6_nd_sll_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -3803,7 +3621,7 @@ class ipv6_nd_sll_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_sll_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500300)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -3842,14 +3660,13 @@ class ipv6_nd_target(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_target()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147499536)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -3887,15 +3704,13 @@ class ipv6_nd_target_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_target_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147499808)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -3934,14 +3749,14 @@ class ipv6_nd_tll(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_tll()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500550)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -3979,7 +3794,7 @@ class ipv6_nd_tll_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -3987,7 +3802,7 @@ class ipv6_nd_tll_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_tll_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500812)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -4026,14 +3841,13 @@ class ipv6_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_src()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496976)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -4071,15 +3885,13 @@ class ipv6_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497248)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -4118,16 +3930,14 @@ class metadata(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_LQ.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LQ)
         assert(_type_len == 2147484680)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4163,18 +3973,14 @@ class metadata_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
+        packed.append(_st_LQQ.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LQQ)
         assert(_type_len == 2147484944)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4210,16 +4016,14 @@ class mpls_label(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147501060)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4255,18 +4059,14 @@ class mpls_label_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147501320)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4302,16 +4102,14 @@ class mpls_tc(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147501569)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4347,18 +4145,14 @@ class mpls_tc_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147501826)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4394,16 +4188,14 @@ class sctp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147492866)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4439,18 +4231,14 @@ class sctp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147493124)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4486,16 +4274,14 @@ class sctp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147492354)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4531,18 +4317,14 @@ class sctp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147492612)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4578,16 +4360,14 @@ class tcp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147490818)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4623,18 +4403,14 @@ class tcp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147491076)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4670,16 +4446,14 @@ class tcp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147490306)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4715,18 +4489,14 @@ class tcp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147490564)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4762,16 +4532,14 @@ class tunnel_ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 81924)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4807,18 +4575,14 @@ class tunnel_ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 82184)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4854,16 +4618,14 @@ class tunnel_ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 81412)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4899,18 +4661,14 @@ class tunnel_ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 81672)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4946,16 +4704,14 @@ class udp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147491842)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4991,18 +4747,14 @@ class udp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147492100)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5038,16 +4790,14 @@ class udp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147491330)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5083,18 +4833,14 @@ class udp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147491588)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5130,16 +4876,14 @@ class vlan_pcp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147487233)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5175,18 +4919,14 @@ class vlan_pcp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147487490)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5222,16 +4962,14 @@ class vlan_vid(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147486722)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5267,18 +5005,14 @@ class vlan_vid_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147486980)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -21,6 +21,13 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_B = struct.Struct("!B")
+_st_H = struct.Struct("!H")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+_st_Q = struct.Struct("!Q")
+
 class bsn_tlv(loxi.OFObject):
     subtypes = {}
 
@@ -34,7 +41,7 @@ class bsn_tlv(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -80,9 +87,9 @@ class actor_key(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -90,12 +97,11 @@ class actor_key(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_key()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 44)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -127,9 +133,9 @@ class actor_port_num(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -137,12 +143,11 @@ class actor_port_num(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_port_num()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 43)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -174,9 +179,9 @@ class actor_port_priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -184,12 +189,11 @@ class actor_port_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_port_priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 42)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -221,9 +225,9 @@ class actor_state(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -231,12 +235,11 @@ class actor_state(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_state()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 53)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -268,7 +271,7 @@ class actor_system_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -278,9 +281,8 @@ class actor_system_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_system_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 41)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -315,9 +317,9 @@ class actor_system_priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -325,12 +327,11 @@ class actor_system_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_system_priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 40)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -362,9 +363,9 @@ class broadcast_query_timeout(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -372,12 +373,11 @@ class broadcast_query_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = broadcast_query_timeout()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -409,7 +409,7 @@ class bucket(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.value))
         length = sum([len(x) for x in packed])
@@ -419,9 +419,8 @@ class bucket(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = bucket()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 64)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
@@ -456,7 +455,7 @@ class circuit_id(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(self.value)
         length = sum([len(x) for x in packed])
@@ -466,9 +465,8 @@ class circuit_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = circuit_id()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -503,9 +501,9 @@ class convergence_status(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -513,12 +511,11 @@ class convergence_status(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = convergence_status()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 45)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -550,9 +547,9 @@ class crc_enabled(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -560,12 +557,11 @@ class crc_enabled(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = crc_enabled()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -597,7 +593,7 @@ class data(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(self.value)
         length = sum([len(x) for x in packed])
@@ -607,9 +603,8 @@ class data(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = data()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 55)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -644,7 +639,7 @@ class eth_dst(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -654,9 +649,8 @@ class eth_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = eth_dst()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 33)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -691,7 +685,7 @@ class eth_src(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -701,9 +695,8 @@ class eth_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = eth_src()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 32)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -738,9 +731,9 @@ class external_gateway_ip(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -748,12 +741,11 @@ class external_gateway_ip(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_gateway_ip()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 26)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -785,7 +777,7 @@ class external_gateway_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -795,9 +787,8 @@ class external_gateway_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_gateway_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 29)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -832,9 +823,9 @@ class external_ip(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -842,12 +833,11 @@ class external_ip(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_ip()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 23)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -879,7 +869,7 @@ class external_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -889,9 +879,8 @@ class external_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -926,9 +915,9 @@ class external_netmask(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -936,12 +925,11 @@ class external_netmask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_netmask()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -973,9 +961,9 @@ class header_size(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -983,12 +971,11 @@ class header_size(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = header_size()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 31)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1016,7 +1003,7 @@ class idle_notification(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -1025,9 +1012,8 @@ class idle_notification(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_notification()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1058,9 +1044,9 @@ class idle_time(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1068,12 +1054,11 @@ class idle_time(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_time()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -1105,9 +1090,9 @@ class idle_timeout(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1115,12 +1100,11 @@ class idle_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_timeout()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1152,7 +1136,7 @@ class internal_gateway_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -1162,9 +1146,8 @@ class internal_gateway_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = internal_gateway_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 28)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1199,7 +1182,7 @@ class internal_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -1209,9 +1192,8 @@ class internal_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = internal_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 27)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1246,9 +1228,9 @@ class interval(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1256,12 +1238,11 @@ class interval(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = interval()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 58)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1293,9 +1274,9 @@ class ipv4(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1303,12 +1284,11 @@ class ipv4(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1340,9 +1320,9 @@ class ipv4_dst(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1350,12 +1330,11 @@ class ipv4_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 35)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1387,9 +1366,9 @@ class ipv4_netmask(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1397,12 +1376,11 @@ class ipv4_netmask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_netmask()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 60)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1434,9 +1412,9 @@ class ipv4_src(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1444,12 +1422,11 @@ class ipv4_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 34)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1481,7 +1458,7 @@ class mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -1491,9 +1468,8 @@ class mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1528,7 +1504,7 @@ class mac_mask(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -1538,9 +1514,8 @@ class mac_mask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mac_mask()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 56)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1575,9 +1550,9 @@ class miss_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1585,12 +1560,11 @@ class miss_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = miss_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -1622,9 +1596,9 @@ class mpls_control_word(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1632,12 +1606,11 @@ class mpls_control_word(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_control_word()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 62)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -1669,9 +1642,9 @@ class mpls_label(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1679,12 +1652,11 @@ class mpls_label(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 61)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1716,9 +1688,9 @@ class mpls_sequenced(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1726,12 +1698,11 @@ class mpls_sequenced(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_sequenced()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 63)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -1763,7 +1734,7 @@ class name(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(self.value)
         length = sum([len(x) for x in packed])
@@ -1773,9 +1744,8 @@ class name(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = name()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 52)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -1810,9 +1780,9 @@ class partner_key(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1820,12 +1790,11 @@ class partner_key(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_key()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 51)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -1857,9 +1826,9 @@ class partner_port_num(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1867,12 +1836,11 @@ class partner_port_num(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_port_num()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 50)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -1904,9 +1872,9 @@ class partner_port_priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1914,12 +1882,11 @@ class partner_port_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_port_priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 49)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -1951,9 +1918,9 @@ class partner_state(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1961,12 +1928,11 @@ class partner_state(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_state()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 54)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -1998,7 +1964,7 @@ class partner_system_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -2008,9 +1974,8 @@ class partner_system_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_system_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 48)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -2045,9 +2010,9 @@ class partner_system_priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2055,12 +2020,11 @@ class partner_system_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_system_priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 47)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2092,7 +2056,7 @@ class port(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(util.pack_port_no(self.value))
         length = sum([len(x) for x in packed])
@@ -2102,9 +2066,8 @@ class port(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = port()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = util.unpack_port_no(reader)
@@ -2139,9 +2102,9 @@ class priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2149,12 +2112,11 @@ class priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 57)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2186,9 +2148,9 @@ class queue_id(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2196,12 +2158,11 @@ class queue_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = queue_id()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2233,9 +2194,9 @@ class queue_weight(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2243,12 +2204,11 @@ class queue_weight(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = queue_weight()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2284,9 +2244,9 @@ class reference(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.table_id))
+        packed.append(_st_H.pack(self.table_id))
         packed.append(loxi.generic_util.pack_list(self.key))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -2295,12 +2255,11 @@ class reference(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = reference()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 59)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.table_id = reader.read("!H")[0]
+        obj.table_id = reader.read_struct(_st_H)[0]
         obj.key = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -2337,9 +2296,9 @@ class reply_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2347,12 +2306,11 @@ class reply_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = reply_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2384,9 +2342,9 @@ class request_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2394,12 +2352,11 @@ class request_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = request_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2431,9 +2388,9 @@ class rx_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2441,12 +2398,11 @@ class rx_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = rx_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2478,9 +2434,9 @@ class sampling_rate(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2488,12 +2444,11 @@ class sampling_rate(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = sampling_rate()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 30)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2525,9 +2480,9 @@ class sub_agent_id(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2535,12 +2490,11 @@ class sub_agent_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = sub_agent_id()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 38)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2572,9 +2526,9 @@ class tx_bytes(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2582,12 +2536,11 @@ class tx_bytes(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = tx_bytes()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 39)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2619,9 +2572,9 @@ class tx_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2629,12 +2582,11 @@ class tx_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = tx_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2666,9 +2618,9 @@ class udf_anchor(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2676,12 +2628,11 @@ class udf_anchor(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_anchor()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2713,9 +2664,9 @@ class udf_id(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2723,12 +2674,11 @@ class udf_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_id()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2760,9 +2710,9 @@ class udf_length(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2770,12 +2720,11 @@ class udf_length(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_length()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2807,9 +2756,9 @@ class udf_offset(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2817,12 +2766,11 @@ class udf_offset(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_offset()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2854,9 +2802,9 @@ class udp_dst(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2864,12 +2812,11 @@ class udp_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 37)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2901,9 +2848,9 @@ class udp_src(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2911,12 +2858,11 @@ class udp_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 36)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2948,9 +2894,9 @@ class unicast_query_timeout(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2958,12 +2904,11 @@ class unicast_query_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = unicast_query_timeout()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2995,9 +2940,9 @@ class vlan_vid(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -3005,12 +2950,11 @@ class vlan_vid(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -3042,9 +2986,9 @@ class vrf(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -3052,12 +2996,11 @@ class vrf(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = vrf()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
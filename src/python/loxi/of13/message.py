@@ -21,6 +21,64 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_2xLLL4x = struct.Struct("!2xLLL4x")
+_st_B = struct.Struct("!B")
+_st_B3x = struct.Struct("!B3x")
+_st_BB = struct.Struct("!BB")
+_st_BBH = struct.Struct("!BBH")
+_st_H = struct.Struct("!H")
+_st_H6x = struct.Struct("!H6x")
+_st_HHH = struct.Struct("!HHH")
+_st_HHHH = struct.Struct("!HHHH")
+_st_HHHL = struct.Struct("!HHHL")
+_st_L = struct.Struct("!L")
+_st_L4xQQ = struct.Struct("!L4xQQ")
+_st_LB3xL = struct.Struct("!LB3xL")
+_st_LB7x = struct.Struct("!LB7x")
+_st_LH = struct.Struct("!LH")
+_st_LH2x = struct.Struct("!LH2x")
+_st_LHB1xL = struct.Struct("!LHB1xL")
+_st_LHH = struct.Struct("!LHH")
+_st_LHH4x = struct.Struct("!LHH4x")
+_st_LHH4x256s256s256s32s256s = struct.Struct("!LHH4x256s256s256s32s256s")
+_st_LHH4xB3x = struct.Struct("!LHH4xB3x")
+_st_LHH4xL4x = struct.Struct("!LHH4xL4x")
+_st_LHH4xLL = struct.Struct("!LHH4xLL")
+_st_LHH4xLL256s256s = struct.Struct("!LHH4xLL256s256s")
+_st_LHH4xLL64s = struct.Struct("!LHH4xLL64s")
+_st_LHH4xLLB = struct.Struct("!LHH4xLLB")
+_st_LHH4xLLH = struct.Struct("!LHH4xLLH")
+_st_LHH4xLLH2x = struct.Struct("!LHH4xLLH2x")
+_st_LHH4xLLL = struct.Struct("!LHH4xLLL")
+_st_LHH4xLLLLLLLLLL = struct.Struct("!LHH4xLLLLLLLLLL")
+_st_LHH4xQQL4x = struct.Struct("!LHH4xQQL4x")
+_st_LHHL = struct.Struct("!LHHL")
+_st_LL = struct.Struct("!LL")
+_st_LL4xQ = struct.Struct("!LL4xQ")
+_st_LLHBBQ = struct.Struct("!LLHBBQ")
+_st_LLL = struct.Struct("!LLL")
+_st_LLL1xB2xL = struct.Struct("!LLL1xB2xL")
+_st_LLL256s = struct.Struct("!LLL256s")
+_st_LLLB = struct.Struct("!LLLB")
+_st_LLLB1xHHHQ = struct.Struct("!LLLB1xHHHQ")
+_st_LLLB3x = struct.Struct("!LLLB3x")
+_st_LLLH = struct.Struct("!LLLH")
+_st_LLLH2x = struct.Struct("!LLLH2x")
+_st_LLLH2xL = struct.Struct("!LLLH2xL")
+_st_LLLH2xLL = struct.Struct("!LLLH2xLL")
+_st_LLLHH = struct.Struct("!LLLHH")
+_st_LLLL = struct.Struct("!LLLL")
+_st_LLLLB3xQ = struct.Struct("!LLLLB3xQ")
+_st_LLLLL = struct.Struct("!LLLLL")
+_st_LLLLLL = struct.Struct("!LLLLLL")
+_st_LLLLLLL = struct.Struct("!LLLLLLL")
+_st_LLLQ = struct.Struct("!LLLQ")
+_st_LLLQHB5x = struct.Struct("!LLLQHB5x")
+_st_LQHBBLLHHQQ = struct.Struct("!LQHBBLLHHQQ")
+_st_LQLBB2xLL = struct.Struct("!LQLBB2xLL")
+_st_LQQB = struct.Struct("!LQQB")
+
 class message(loxi.OFObject):
     subtypes = {}
 
@@ -39,12 +97,11 @@ class message(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -107,15 +164,11 @@ class stats_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -194,40 +247,23 @@ class aggregate_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xQQL4x.pack(self.xid, self.stats_type, self.flags, self.packet_count, self.byte_count, self.flow_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.packet_count, obj.byte_count, obj.flow_count) = reader.read_struct(_st_LHH4xQQL4x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.flow_count = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -289,15 +325,11 @@ class stats_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -388,47 +420,28 @@ class aggregate_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xB3x.pack(self.xid, self.stats_type, self.flags, self.table_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
+        packed.append(_st_L4xQQ.pack(self.out_group, self.cookie, self.cookie_mask))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.table_id) = reader.read_struct(_st_LHH4xB3x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
+        (obj.out_group, obj.cookie, obj.cookie_mask) = reader.read_struct(_st_L4xQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -517,37 +530,22 @@ class async_get_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.packet_in_mask_equal_master))
-        packed.append(struct.pack("!L", self.packet_in_mask_slave))
-        packed.append(struct.pack("!L", self.port_status_mask_equal_master))
-        packed.append(struct.pack("!L", self.port_status_mask_slave))
-        packed.append(struct.pack("!L", self.flow_removed_mask_equal_master))
-        packed.append(struct.pack("!L", self.flow_removed_mask_slave))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLLLL.pack(self.xid, self.packet_in_mask_equal_master, self.packet_in_mask_slave, self.port_status_mask_equal_master, self.port_status_mask_slave, self.flow_removed_mask_equal_master, self.flow_removed_mask_slave))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = async_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 27)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.packet_in_mask_equal_master = reader.read("!L")[0]
-        obj.packet_in_mask_slave = reader.read("!L")[0]
-        obj.port_status_mask_equal_master = reader.read("!L")[0]
-        obj.port_status_mask_slave = reader.read("!L")[0]
-        obj.flow_removed_mask_equal_master = reader.read("!L")[0]
-        obj.flow_removed_mask_slave = reader.read("!L")[0]
+        (obj.xid, obj.packet_in_mask_equal_master, obj.packet_in_mask_slave, obj.port_status_mask_equal_master, obj.port_status_mask_slave, obj.flow_removed_mask_equal_master, obj.flow_removed_mask_slave) = reader.read_struct(_st_LLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -631,39 +629,25 @@ class async_get_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         """
-        packed.append(struct.pack("!L", self.packet_in_mask_equal_master))
-        packed.append(struct.pack("!L", self.packet_in_mask_slave))
-        packed.append(struct.pack("!L", self.port_status_mask_equal_master))
-        packed.append(struct.pack("!L", self.port_status_mask_slave))
-        packed.append(struct.pack("!L", self.flow_removed_mask_equal_master))
-        packed.append(struct.pack("!L", self.flow_removed_mask_slave))
+        packed.append(_st_LLLLLL.pack(self.packet_in_mask_equal_master, self.packet_in_mask_slave, self.port_status_mask_equal_master, self.port_status_mask_slave, self.flow_removed_mask_equal_master, self.flow_removed_mask_slave))
         """
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = async_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 26)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.packet_in_mask_equal_master = reader.read("!L")[0]
-        obj.packet_in_mask_slave = reader.read("!L")[0]
-        obj.port_status_mask_equal_master = reader.read("!L")[0]
-        obj.port_status_mask_slave = reader.read("!L")[0]
-        obj.flow_removed_mask_equal_master = reader.read("!L")[0]
-        obj.flow_removed_mask_slave = reader.read("!L")[0]
+        (obj.xid, obj.packet_in_mask_equal_master, obj.packet_in_mask_slave, obj.port_status_mask_equal_master, obj.port_status_mask_slave, obj.flow_removed_mask_equal_master, obj.flow_removed_mask_slave) = reader.read_struct(_st_LLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -747,37 +731,22 @@ class async_set(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.packet_in_mask_equal_master))
-        packed.append(struct.pack("!L", self.packet_in_mask_slave))
-        packed.append(struct.pack("!L", self.port_status_mask_equal_master))
-        packed.append(struct.pack("!L", self.port_status_mask_slave))
-        packed.append(struct.pack("!L", self.flow_removed_mask_equal_master))
-        packed.append(struct.pack("!L", self.flow_removed_mask_slave))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLLLL.pack(self.xid, self.packet_in_mask_equal_master, self.packet_in_mask_slave, self.port_status_mask_equal_master, self.port_status_mask_slave, self.flow_removed_mask_equal_master, self.flow_removed_mask_slave))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = async_set()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 28)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.packet_in_mask_equal_master = reader.read("!L")[0]
-        obj.packet_in_mask_slave = reader.read("!L")[0]
-        obj.port_status_mask_equal_master = reader.read("!L")[0]
-        obj.port_status_mask_slave = reader.read("!L")[0]
-        obj.flow_removed_mask_equal_master = reader.read("!L")[0]
-        obj.flow_removed_mask_slave = reader.read("!L")[0]
+        (obj.xid, obj.packet_in_mask_equal_master, obj.packet_in_mask_slave, obj.port_status_mask_equal_master, obj.port_status_mask_slave, obj.flow_removed_mask_equal_master, obj.flow_removed_mask_slave) = reader.read_struct(_st_LLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -843,13 +812,11 @@ class error_msg(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LH.pack(self.xid, self.err_type))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -914,31 +881,24 @@ class bad_action_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_action_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 2)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -992,31 +952,24 @@ class bad_instruction_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_instruction_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 3)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -1070,31 +1023,24 @@ class bad_match_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_match_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 4)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -1148,31 +1094,24 @@ class bad_request_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_request_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 1)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -1217,25 +1156,22 @@ class barrier_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1275,27 +1211,24 @@ class barrier_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
         if self.length is not None:
             length=self.length
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1345,15 +1278,12 @@ class experimenter(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -1426,14 +1356,11 @@ class bsn_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -1501,37 +1428,24 @@ class bsn_arp_idle(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.ipv4_addr))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH2xL.pack(self.xid, self.experimenter, self.subtype, self.vlan_vid, self.ipv4_addr))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_arp_idle()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.vlan_vid, obj.ipv4_addr) = reader.read_struct(_st_LLLH2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 60)
-        obj.vlan_vid = reader.read("!H")[0]
-        reader.skip(2)
-        obj.ipv4_addr = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1581,33 +1495,24 @@ class bsn_bw_clear_data_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 22)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1649,30 +1554,23 @@ class bsn_bw_clear_data_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 21)
         return obj
 
@@ -1715,33 +1613,24 @@ class bsn_bw_enable_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 20)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1783,30 +1672,23 @@ class bsn_bw_enable_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 19)
         return obj
 
@@ -1853,35 +1735,24 @@ class bsn_bw_enable_set_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.enable, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable, obj.status) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 23)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1931,33 +1802,24 @@ class bsn_bw_enable_set_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enable))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 18)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2003,31 +1865,24 @@ class bsn_controller_connections_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.connections))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connections_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 57)
         obj.connections = loxi.generic_util.unpack_list(reader, common.bsn_controller_connection.unpack)
         return obj
@@ -2071,30 +1926,23 @@ class bsn_controller_connections_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connections_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 56)
         return obj
 
@@ -2146,17 +1994,11 @@ class experimenter_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2237,17 +2079,11 @@ class bsn_stats_reply(experimenter_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2324,38 +2160,25 @@ class bsn_debug_counter_desc_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_debug_counter_desc_stats_entry.unpack)
         return obj
@@ -2416,17 +2239,11 @@ class experimenter_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2507,17 +2324,11 @@ class bsn_stats_request(experimenter_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2590,37 +2401,24 @@ class bsn_debug_counter_desc_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         return obj
 
@@ -2672,38 +2470,25 @@ class bsn_debug_counter_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_debug_counter_stats_entry.unpack)
         return obj
@@ -2756,37 +2541,24 @@ class bsn_debug_counter_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         return obj
 
@@ -2838,38 +2610,25 @@ class bsn_flow_checksum_bucket_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_flow_checksum_bucket_stats_entry.unpack)
         return obj
@@ -2926,40 +2685,25 @@ class bsn_flow_checksum_bucket_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLB.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LHH4xLLB)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
-        obj.table_id = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3021,40 +2765,25 @@ class bsn_flow_idle(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 5)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLQHB5x.pack(self.xid, self.experimenter, self.subtype, self.cookie, self.priority, self.table_id))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.cookie, obj.priority, obj.table_id) = reader.read_struct(_st_LLLQHB5x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 40)
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(5)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -3113,33 +2842,24 @@ class bsn_flow_idle_enable_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 39)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3181,30 +2901,23 @@ class bsn_flow_idle_enable_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 38)
         return obj
 
@@ -3251,35 +2964,24 @@ class bsn_flow_idle_enable_set_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.enable, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_set_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable, obj.status) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 37)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3329,33 +3031,24 @@ class bsn_flow_idle_enable_set_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enable))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_set_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 36)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3406,38 +3099,25 @@ class bsn_generic_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_generic_stats_entry.unpack)
         return obj
@@ -3498,39 +3178,25 @@ class bsn_generic_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!64s", self.name))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL64s.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.name))
         packed.append(loxi.generic_util.pack_list(self.tlvs))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
         obj.name = reader.read("!64s")[0].rstrip("\x00")
         obj.tlvs = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
@@ -3592,38 +3258,25 @@ class bsn_gentable_bucket_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_bucket_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_bucket_stats_entry.unpack)
         return obj
@@ -3680,40 +3333,25 @@ class bsn_gentable_bucket_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLH.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_bucket_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LHH4xLLH)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.table_id = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3771,39 +3409,24 @@ class bsn_gentable_clear_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.deleted_count))
-        packed.append(struct.pack("!L", self.error_count))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH2xLL.pack(self.xid, self.experimenter, self.subtype, self.table_id, self.deleted_count, self.error_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_clear_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id, obj.deleted_count, obj.error_count) = reader.read_struct(_st_LLLH2xLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 49)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.deleted_count = reader.read("!L")[0]
-        obj.error_count = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3865,37 +3488,26 @@ class bsn_gentable_clear_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH2x.pack(self.xid, self.experimenter, self.subtype, self.table_id))
         packed.append(util.pack_checksum_128(self.checksum))
         packed.append(util.pack_checksum_128(self.checksum_mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_clear_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LLLH2x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 48)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -3956,38 +3568,25 @@ class bsn_gentable_desc_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_desc_stats_entry.unpack)
         return obj
@@ -4040,37 +3639,24 @@ class bsn_gentable_desc_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         return obj
 
@@ -4129,39 +3715,29 @@ class bsn_gentable_entry_add(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 7
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH.pack(self.xid, self.experimenter, self.subtype, self.table_id))
+        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 3
         packed.append(util.pack_checksum_128(self.checksum))
         packed.append(loxi.generic_util.pack_list(self.key))
-        packed[7] = struct.pack("!H", len(packed[-1]))
+        packed[3] = struct.pack("!H", len(packed[-1]))
         packed.append(loxi.generic_util.pack_list(self.value))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id, _key_length) = reader.read_struct(_st_LLLHH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 46)
-        obj.table_id = reader.read("!H")[0]
-        _key_length = reader.read("!H")[0]
         obj.checksum = util.unpack_checksum_128(reader)
         obj.key = loxi.generic_util.unpack_list(reader.slice(_key_length), bsn_tlv.bsn_tlv.unpack)
         obj.value = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
@@ -4226,34 +3802,25 @@ class bsn_gentable_entry_delete(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH.pack(self.xid, self.experimenter, self.subtype, self.table_id))
         packed.append(loxi.generic_util.pack_list(self.key))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LLLH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 47)
-        obj.table_id = reader.read("!H")[0]
         obj.key = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -4309,38 +3876,25 @@ class bsn_gentable_entry_desc_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_entry_desc_stats_entry.unpack)
         return obj
@@ -4405,44 +3959,27 @@ class bsn_gentable_entry_desc_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLH2x.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id))
         packed.append(util.pack_checksum_128(self.checksum))
         packed.append(util.pack_checksum_128(self.checksum_mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LHH4xLLH2x)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -4507,38 +4044,25 @@ class bsn_gentable_entry_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_entry_stats_entry.unpack)
         return obj
@@ -4603,44 +4127,27 @@ class bsn_gentable_entry_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLH2x.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id))
         packed.append(util.pack_checksum_128(self.checksum))
         packed.append(util.pack_checksum_128(self.checksum_mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LHH4xLLH2x)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -4704,37 +4211,24 @@ class bsn_gentable_set_buckets_size(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.buckets_size))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH2xL.pack(self.xid, self.experimenter, self.subtype, self.table_id, self.buckets_size))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_set_buckets_size()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id, obj.buckets_size) = reader.read_struct(_st_LLLH2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 50)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.buckets_size = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4789,38 +4283,25 @@ class bsn_gentable_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_stats_entry.unpack)
         return obj
@@ -4873,37 +4354,24 @@ class bsn_gentable_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         return obj
 
@@ -4950,31 +4418,24 @@ class bsn_get_interfaces_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.interfaces))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.interfaces = loxi.generic_util.unpack_list(reader, common.bsn_interface.unpack)
         return obj
@@ -5018,30 +4479,23 @@ class bsn_get_interfaces_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -5084,35 +4538,24 @@ class bsn_get_mirroring_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -5158,35 +4601,24 @@ class bsn_get_mirroring_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -5232,31 +4664,23 @@ class bsn_get_switch_pipeline_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.pipeline))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL256s.pack(self.xid, self.experimenter, self.subtype, self.pipeline))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_switch_pipeline_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 52)
         obj.pipeline = reader.read("!256s")[0].rstrip("\x00")
         return obj
@@ -5300,30 +4724,23 @@ class bsn_get_switch_pipeline_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_switch_pipeline_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 51)
         return obj
 
@@ -5375,39 +4792,24 @@ class bsn_image_desc_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.image_checksum))
-        packed.append(struct.pack("!256s", self.startup_config_checksum))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL256s256s.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.image_checksum, self.startup_config_checksum))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_image_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
         obj.image_checksum = reader.read("!256s")[0].rstrip("\x00")
         obj.startup_config_checksum = reader.read("!256s")[0].rstrip("\x00")
@@ -5465,37 +4867,24 @@ class bsn_image_desc_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_image_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
         return obj
 
@@ -5586,57 +4975,36 @@ class bsn_lacp_convergence_notif(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.convergence_status))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.convergence_status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
+        packed.append(_st_H.pack(self.actor_sys_priority))
         packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        packed.append(struct.pack("!H", self.partner_sys_priority))
+        packed.append(_st_HHHH.pack(self.actor_port_priority, self.actor_port_num, self.actor_key, self.partner_sys_priority))
         packed.append(struct.pack("!6B", *self.partner_sys_mac))
-        packed.append(struct.pack("!H", self.partner_port_priority))
-        packed.append(struct.pack("!H", self.partner_port_num))
-        packed.append(struct.pack("!H", self.partner_key))
+        packed.append(_st_HHH.pack(self.partner_port_priority, self.partner_port_num, self.partner_key))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_convergence_notif()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.convergence_status) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 43)
-        obj.convergence_status = reader.read("!B")[0]
-        reader.skip(3)
         obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
+        obj.actor_sys_priority = reader.read_struct(_st_H)[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
-        obj.partner_sys_priority = reader.read("!H")[0]
+        (obj.actor_port_priority, obj.actor_port_num, obj.actor_key, obj.partner_sys_priority) = reader.read_struct(_st_HHHH)
         obj.partner_sys_mac = list(reader.read('!6B'))
-        obj.partner_port_priority = reader.read("!H")[0]
-        obj.partner_port_num = reader.read("!H")[0]
-        obj.partner_key = reader.read("!H")[0]
+        (obj.partner_port_priority, obj.partner_port_num, obj.partner_key) = reader.read_struct(_st_HHH)
         return obj
 
     def __eq__(self, other):
@@ -5731,38 +5099,25 @@ class bsn_lacp_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
-        assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
+        assert(_stats_type == 65535)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_lacp_stats_entry.unpack)
         return obj
@@ -5815,37 +5170,24 @@ class bsn_lacp_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         return obj
 
@@ -5896,34 +5238,25 @@ class bsn_log(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.loglevel))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB.pack(self.xid, self.experimenter, self.subtype, self.loglevel))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_log()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.loglevel) = reader.read_struct(_st_LLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 63)
-        obj.loglevel = reader.read("!B")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -5982,37 +5315,28 @@ class bsn_pdu_rx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 34)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -6078,40 +5402,29 @@ class bsn_pdu_rx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.timeout_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.timeout_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.timeout_ms) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 33)
-        obj.timeout_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
+        obj.slot_num = reader.read_struct(_st_B3x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6174,35 +5487,28 @@ class bsn_pdu_rx_timeout(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_timeout()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 35)
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -6260,37 +5566,28 @@ class bsn_pdu_tx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 32)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -6356,40 +5653,29 @@ class bsn_pdu_tx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.tx_interval_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.tx_interval_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.tx_interval_ms) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 31)
-        obj.tx_interval_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
+        obj.slot_num = reader.read_struct(_st_B3x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6453,38 +5739,25 @@ class bsn_port_counter_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_port_counter_stats_entry.unpack)
         return obj
@@ -6541,38 +5814,25 @@ class bsn_port_counter_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(util.pack_port_no(self.port_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
         obj.port_no = util.unpack_port_no(reader)
         return obj
@@ -6632,39 +5892,24 @@ class bsn_role_status(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLB3xQ.pack(self.xid, self.experimenter, self.subtype, self.role, self.reason, self.generation_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_role_status()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.role, obj.reason, obj.generation_id) = reader.read_struct(_st_LLLLB3xQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 55)
-        obj.role = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(3)
-        obj.generation_id = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -6722,35 +5967,24 @@ class bsn_set_aux_cxns_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.num_aux))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.num_aux, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_aux_cxns_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.num_aux, obj.status) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 59)
-        obj.num_aux = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6800,33 +6034,24 @@ class bsn_set_aux_cxns_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.num_aux))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.num_aux))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_aux_cxns_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.num_aux) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 58)
-        obj.num_aux = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6876,34 +6101,25 @@ class bsn_set_lacp_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_lacp_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 42)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
         return obj
 
@@ -6978,47 +6194,32 @@ class bsn_set_lacp_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
+        packed.append(_st_H.pack(self.actor_sys_priority))
         packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
+        packed.append(_st_HHH.pack(self.actor_port_priority, self.actor_port_num, self.actor_key))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_lacp_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 41)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(3)
         obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
+        obj.actor_sys_priority = reader.read_struct(_st_H)[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
+        (obj.actor_port_priority, obj.actor_port_num, obj.actor_key) = reader.read_struct(_st_HHH)
         return obj
 
     def __eq__(self, other):
@@ -7088,35 +6289,24 @@ class bsn_set_mirroring(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_mirroring()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -7162,33 +6352,24 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 25)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7250,43 +6431,24 @@ class bsn_set_pktin_suppression_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB1xHHHQ.pack(self.xid, self.experimenter, self.subtype, self.enabled, self.idle_timeout, self.hard_timeout, self.priority, self.cookie))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.cookie) = reader.read_struct(_st_LLLB1xHHHQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.cookie = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -7348,33 +6510,24 @@ class bsn_set_switch_pipeline_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_switch_pipeline_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 54)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7420,31 +6573,23 @@ class bsn_set_switch_pipeline_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.pipeline))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL256s.pack(self.xid, self.experimenter, self.subtype, self.pipeline))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_switch_pipeline_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 53)
         obj.pipeline = reader.read("!256s")[0].rstrip("\x00")
         return obj
@@ -7497,38 +6642,25 @@ class bsn_switch_pipeline_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_switch_pipeline_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_switch_pipeline_stats_entry.unpack)
         return obj
@@ -7581,37 +6713,24 @@ class bsn_switch_pipeline_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_switch_pipeline_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         return obj
 
@@ -7660,41 +6779,28 @@ class bsn_table_checksum_stats_reply(bsn_stats_reply):
         else:
             self.entries = []
         return
-
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+
+    def pack(self):
+        packed = []
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_table_checksum_stats_entry.unpack)
         return obj
@@ -7747,37 +6853,24 @@ class bsn_table_checksum_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         return obj
 
@@ -7828,39 +6921,24 @@ class bsn_table_set_buckets_size(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.buckets_size))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL1xB2xL.pack(self.xid, self.experimenter, self.subtype, self.table_id, self.buckets_size))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_set_buckets_size()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id, obj.buckets_size) = reader.read_struct(_st_LLL1xB2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 61)
-        reader.skip(1)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.buckets_size = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7910,33 +6988,24 @@ class bsn_time_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!Q", self.time_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLQ.pack(self.xid, self.experimenter, self.subtype, self.time_ms))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_time_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.time_ms) = reader.read_struct(_st_LLLQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 45)
-        obj.time_ms = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -7978,30 +7047,23 @@ class bsn_time_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_time_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 44)
         return obj
 
@@ -8048,35 +7110,24 @@ class bsn_virtual_port_create_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.status, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status, obj.vport_no) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.status = reader.read("!L")[0]
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8126,31 +7177,24 @@ class bsn_virtual_port_create_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.vport.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.vport = common.bsn_vport.unpack(reader)
         return obj
@@ -8198,33 +7242,24 @@ class bsn_virtual_port_remove_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 26)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8270,33 +7305,24 @@ class bsn_virtual_port_remove_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.vport_no) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 17)
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8347,38 +7373,25 @@ class bsn_vlan_counter_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_vlan_counter_stats_entry.unpack)
         return obj
@@ -8435,40 +7448,25 @@ class bsn_vlan_counter_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.vlan_vid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLH.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.vlan_vid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.vlan_vid) = reader.read_struct(_st_LHH4xLLH)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
-        obj.vlan_vid = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -8523,38 +7521,25 @@ class bsn_vrf_counter_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_vrf_counter_stats_entry.unpack)
         return obj
@@ -8611,40 +7596,25 @@ class bsn_vrf_counter_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vrf))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.vrf))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.vrf) = reader.read_struct(_st_LHH4xLLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
-        obj.vrf = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8713,37 +7683,23 @@ class desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!256s", self.mfr_desc))
-        packed.append(struct.pack("!256s", self.hw_desc))
-        packed.append(struct.pack("!256s", self.sw_desc))
-        packed.append(struct.pack("!32s", self.serial_num))
-        packed.append(struct.pack("!256s", self.dp_desc))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x256s256s256s32s256s.pack(self.xid, self.stats_type, self.flags, self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.mfr_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.hw_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.sw_desc = reader.read("!256s")[0].rstrip("\x00")
@@ -8813,32 +7769,23 @@ class desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -8882,26 +7829,23 @@ class echo_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -8946,26 +7890,23 @@ class echo_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -9019,33 +7960,24 @@ class experimenter_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHHL.pack(self.xid, self.err_type, self.subtype, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = experimenter_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.subtype, obj.experimenter) = reader.read_struct(_st_LHHL)
         assert(_err_type == 65535)
-        obj.subtype = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -9118,39 +8050,22 @@ class features_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.datapath_id))
-        packed.append(struct.pack("!L", self.n_buffers))
-        packed.append(struct.pack("!B", self.n_tables))
-        packed.append(struct.pack("!B", self.auxiliary_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.reserved))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQLBB2xLL.pack(self.xid, self.datapath_id, self.n_buffers, self.n_tables, self.auxiliary_id, self.capabilities, self.reserved))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.datapath_id = reader.read("!Q")[0]
-        obj.n_buffers = reader.read("!L")[0]
-        obj.n_tables = reader.read("!B")[0]
-        obj.auxiliary_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.capabilities = reader.read("!L")[0]
-        obj.reserved = reader.read("!L")[0]
+        (obj.xid, obj.datapath_id, obj.n_buffers, obj.n_tables, obj.auxiliary_id, obj.capabilities, obj.reserved) = reader.read_struct(_st_LQLBB2xLL)
         return obj
 
     def __eq__(self, other):
@@ -9210,25 +8125,22 @@ class features_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -9318,26 +8230,17 @@ class flow_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -9502,53 +8405,34 @@ class flow_add(flow_mod):
         return
 
     def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed = []
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 0)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -9683,52 +8567,33 @@ class flow_delete(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 3)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -9863,52 +8728,33 @@ class flow_delete_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete_strict()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 4)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -10003,31 +8849,24 @@ class flow_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 5)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -10121,52 +8960,33 @@ class flow_modify(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -10301,52 +9121,33 @@ class flow_modify_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify_strict()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 2)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.out_group, obj.flags) = reader.read_struct(_st_LH2x)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -10476,46 +9277,23 @@ class flow_removed(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQHBBLLHHQQ.pack(self.xid, self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.xid, obj.cookie, obj.priority, obj.reason, obj.table_id, obj.duration_sec, obj.duration_nsec, obj.idle_timeout, obj.hard_timeout, obj.packet_count, obj.byte_count) = reader.read_struct(_st_LQHBBLLHHQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -10605,33 +9383,24 @@ class flow_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.flow_stats_entry.unpack)
         return obj
 
@@ -10705,47 +9474,28 @@ class flow_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xB3x.pack(self.xid, self.stats_type, self.flags, self.table_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
+        packed.append(_st_L4xQQ.pack(self.out_group, self.cookie, self.cookie_mask))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.table_id) = reader.read_struct(_st_LHH4xB3x)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
+        (obj.out_group, obj.cookie, obj.cookie_mask) = reader.read_struct(_st_L4xQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -10818,29 +9568,22 @@ class get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        (obj.xid, obj.flags, obj.miss_send_len) = reader.read_struct(_st_LHH)
         return obj
 
     def __eq__(self, other):
@@ -10884,25 +9627,22 @@ class get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -10956,17 +9696,12 @@ class group_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -11051,35 +9786,24 @@ class group_add(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 0)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -11141,35 +9865,24 @@ class group_delete(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -11227,33 +9940,24 @@ class group_desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.group_desc_stats_entry.unpack)
         return obj
 
@@ -11303,32 +10007,23 @@ class group_desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -11413,52 +10108,23 @@ class group_features_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.max_groups_all))
-        packed.append(struct.pack("!L", self.max_groups_select))
-        packed.append(struct.pack("!L", self.max_groups_indirect))
-        packed.append(struct.pack("!L", self.max_groups_ff))
-        packed.append(struct.pack("!L", self.actions_all))
-        packed.append(struct.pack("!L", self.actions_select))
-        packed.append(struct.pack("!L", self.actions_indirect))
-        packed.append(struct.pack("!L", self.actions_ff))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLLLLLLLLL.pack(self.xid, self.stats_type, self.flags, self.types, self.capabilities, self.max_groups_all, self.max_groups_select, self.max_groups_indirect, self.max_groups_ff, self.actions_all, self.actions_select, self.actions_indirect, self.actions_ff))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.types, obj.capabilities, obj.max_groups_all, obj.max_groups_select, obj.max_groups_indirect, obj.max_groups_ff, obj.actions_all, obj.actions_select, obj.actions_indirect, obj.actions_ff) = reader.read_struct(_st_LHH4xLLLLLLLLLL)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_groups_all = reader.read("!L")[0]
-        obj.max_groups_select = reader.read("!L")[0]
-        obj.max_groups_indirect = reader.read("!L")[0]
-        obj.max_groups_ff = reader.read("!L")[0]
-        obj.actions_all = reader.read("!L")[0]
-        obj.actions_select = reader.read("!L")[0]
-        obj.actions_indirect = reader.read("!L")[0]
-        obj.actions_ff = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -11543,32 +10209,23 @@ class group_features_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -11617,31 +10274,24 @@ class group_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 6)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -11699,35 +10349,24 @@ class group_modify(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_modify()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 1)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -11785,33 +10424,24 @@ class group_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.group_stats_entry.unpack)
         return obj
 
@@ -11865,36 +10495,23 @@ class group_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xL4x.pack(self.xid, self.stats_type, self.flags, self.group_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.group_id) = reader.read_struct(_st_LHH4xL4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.group_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -11942,26 +10559,23 @@ class hello(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(loxi.generic_util.pack_list(self.elements))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.elements = loxi.generic_util.unpack_list(reader, common.hello_elem.unpack)
         return obj
 
@@ -12011,31 +10625,24 @@ class hello_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 0)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -12089,33 +10696,24 @@ class meter_config_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_config_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 10)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, meter_band.meter_band.unpack)
         return obj
 
@@ -12169,36 +10767,23 @@ class meter_config_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xL4x.pack(self.xid, self.stats_type, self.flags, self.meter_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_config_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.meter_id) = reader.read_struct(_st_LHH4xL4x)
         assert(_stats_type == 10)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.meter_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12251,33 +10836,24 @@ class meter_features_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(self.features.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_features_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 11)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.features = common.meter_features.unpack(reader)
         return obj
 
@@ -12327,32 +10903,23 @@ class meter_features_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_features_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 11)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12408,32 +10975,23 @@ class meter_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.meter_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHHL.pack(self.xid, self.command, self.flags, self.meter_id))
         packed.append(loxi.generic_util.pack_list(self.meters))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 29)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.command = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.meter_id = reader.read("!L")[0]
+        (obj.xid, obj.command, obj.flags, obj.meter_id) = reader.read_struct(_st_LHHL)
         obj.meters = loxi.generic_util.unpack_list(reader, meter_band.meter_band.unpack)
         return obj
 
@@ -12495,31 +11053,24 @@ class meter_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 12)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -12573,33 +11124,24 @@ class meter_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 9)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.meter_stats.unpack)
         return obj
 
@@ -12653,36 +11195,23 @@ class meter_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xL4x.pack(self.xid, self.stats_type, self.flags, self.meter_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.meter_id) = reader.read_struct(_st_LHH4xL4x)
         assert(_stats_type == 9)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.meter_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12733,14 +11262,11 @@ class nicira_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -12826,38 +11352,25 @@ class packet_in(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(struct.pack("!H", self.total_len))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLHBBQ.pack(self.xid, self.buffer_id, self.total_len, self.reason, self.table_id, self.cookie))
         packed.append(self.match.pack())
         packed.append('\x00' * 2)
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_in()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.total_len = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.cookie = reader.read("!Q")[0]
+        (obj.xid, obj.buffer_id, obj.total_len, obj.reason, obj.table_id, obj.cookie) = reader.read_struct(_st_LLHBBQ)
         obj.match = common.match.unpack(reader)
         reader.skip(2)
         obj.data = str(reader.read_all())
@@ -12940,36 +11453,30 @@ class packet_out(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL.pack(self.xid, self.buffer_id))
         packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 6
+        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 4
         packed.append('\x00' * 6)
         packed.append(loxi.generic_util.pack_list(self.actions))
-        packed[6] = struct.pack("!H", len(packed[-1]))
+        packed[4] = struct.pack("!H", len(packed[-1]))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_out()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.xid, obj.buffer_id) = reader.read_struct(_st_LL)
         obj.in_port = util.unpack_port_no(reader)
-        _actions_len = reader.read("!H")[0]
-        reader.skip(6)
+        _actions_len = reader.read_struct(_st_H6x)[0]
         obj.actions = loxi.generic_util.unpack_list(reader.slice(_actions_len), action.action.unpack)
         obj.data = str(reader.read_all())
         return obj
@@ -13032,33 +11539,24 @@ class port_desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 13)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.port_desc.unpack)
         return obj
 
@@ -13103,37 +11601,28 @@ class port_desc_stats_request(stats_request):
         if flags != None:
             self.flags = flags
         else:
-            self.flags = 0
-        return
-
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+            self.flags = 0
+        return
+
+    def pack(self):
+        packed = []
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 13)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -13193,41 +11682,30 @@ class port_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port_no))
         packed.append('\x00' * 4)
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.mask))
-        packed.append(struct.pack("!L", self.advertise))
-        packed.append('\x00' * 4)
+        packed.append(_st_2xLLL4x.pack(self.config, self.mask, self.advertise))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(4)
         obj.hw_addr = list(reader.read('!6B'))
-        reader.skip(2)
-        obj.config = reader.read("!L")[0]
-        obj.mask = reader.read("!L")[0]
-        obj.advertise = reader.read("!L")[0]
-        reader.skip(4)
+        (obj.config, obj.mask, obj.advertise) = reader.read_struct(_st_2xLLL4x)
         return obj
 
     def __eq__(self, other):
@@ -13292,31 +11770,24 @@ class port_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 7)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -13370,33 +11841,24 @@ class port_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.port_stats_entry.unpack)
         return obj
 
@@ -13476,18 +11938,13 @@ class port_stats_request(stats_request):
     @staticmethod
     def unpack(reader):
         obj = port_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(4)
         return obj
@@ -13541,30 +11998,23 @@ class port_status(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LB7x.pack(self.xid, self.reason))
         packed.append(self.desc.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_status()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        (obj.xid, obj.reason) = reader.read_struct(_st_LB7x)
         obj.desc = common.port_desc.unpack(reader)
         return obj
 
@@ -13617,28 +12067,25 @@ class queue_get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port))
         packed.append('\x00' * 4)
         packed.append(loxi.generic_util.pack_list(self.queues))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 23)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port = util.unpack_port_no(reader)
         reader.skip(4)
         obj.queues = loxi.generic_util.unpack_list(reader, common.packet_queue.unpack)
@@ -13689,27 +12136,24 @@ class queue_get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port))
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port = util.unpack_port_no(reader)
         reader.skip(4)
         return obj
@@ -13760,31 +12204,24 @@ class queue_op_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_op_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 9)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -13838,33 +12275,24 @@ class queue_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.queue_stats_entry.unpack)
         return obj
 
@@ -13922,36 +12350,27 @@ class queue_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_L.pack(self.queue_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
+        obj.queue_id = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -14007,31 +12426,22 @@ class role_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL4xQ.pack(self.xid, self.role, self.generation_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        (obj.xid, obj.role, obj.generation_id) = reader.read_struct(_st_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -14083,31 +12493,22 @@ class role_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL4xQ.pack(self.xid, self.role, self.generation_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        (obj.xid, obj.role, obj.generation_id) = reader.read_struct(_st_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -14160,31 +12561,24 @@ class role_request_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_request_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 11)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -14257,16 +12651,12 @@ class set_config(message):
     @staticmethod
     def unpack(reader):
         obj = set_config()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        (obj.xid, obj.flags, obj.miss_send_len) = reader.read_struct(_st_LHH)
         return obj
 
     def __eq__(self, other):
@@ -14319,31 +12709,24 @@ class switch_config_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = switch_config_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 10)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -14397,31 +12780,24 @@ class table_features_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 13)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -14475,33 +12851,24 @@ class table_features_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 12)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_features.unpack)
         return obj
 
@@ -14555,33 +12922,24 @@ class table_features_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 12)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_features.unpack)
         return obj
 
@@ -14634,31 +12992,22 @@ class table_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.config))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LB3xL.pack(self.xid, self.table_id, self.config))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.config = reader.read("!L")[0]
+        (obj.xid, obj.table_id, obj.config) = reader.read_struct(_st_LB3xL)
         return obj
 
     def __eq__(self, other):
@@ -14711,31 +13060,24 @@ class table_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 8)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -14789,33 +13131,24 @@ class table_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_stats_entry.unpack)
         return obj
 
@@ -14865,32 +13198,23 @@ class table_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
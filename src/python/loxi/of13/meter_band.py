@@ -21,6 +21,13 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_H = struct.Struct("!H")
+_st_HH = struct.Struct("!HH")
+_st_LL4x = struct.Struct("!LL4x")
+_st_LLB3x = struct.Struct("!LLB3x")
+_st_LLL = struct.Struct("!LLL")
+
 class meter_band(loxi.OFObject):
     subtypes = {}
 
@@ -34,7 +41,7 @@ class meter_band(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -84,11 +91,9 @@ class drop(meter_band):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append('\x00' * 4)
+        packed.append(_st_LL4x.pack(self.rate, self.burst_size))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -96,14 +101,11 @@ class drop(meter_band):
     @staticmethod
     def unpack(reader):
         obj = drop()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        reader.skip(4)
+        (obj.rate, obj.burst_size) = reader.read_struct(_st_LL4x)
         return obj
 
     def __eq__(self, other):
@@ -147,12 +149,9 @@ class dscp_remark(meter_band):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append(struct.pack("!B", self.prec_level))
-        packed.append('\x00' * 3)
+        packed.append(_st_LLB3x.pack(self.rate, self.burst_size, self.prec_level))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -160,15 +159,11 @@ class dscp_remark(meter_band):
     @staticmethod
     def unpack(reader):
         obj = dscp_remark()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        obj.prec_level = reader.read("!B")[0]
-        reader.skip(3)
+        (obj.rate, obj.burst_size, obj.prec_level) = reader.read_struct(_st_LLB3x)
         return obj
 
     def __eq__(self, other):
@@ -216,11 +211,9 @@ class experimenter(meter_band):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_LLL.pack(self.rate, self.burst_size, self.experimenter))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -228,14 +221,11 @@ class experimenter(meter_band):
     @staticmethod
     def unpack(reader):
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        obj.experimenter = reader.read("!L")[0]
+        (obj.rate, obj.burst_size, obj.experimenter) = reader.read_struct(_st_LLL)
         return obj
 
     def __eq__(self, other):
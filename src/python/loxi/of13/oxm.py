@@ -21,6 +21,19 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_L = struct.Struct("!L")
+_st_L16s = struct.Struct("!L16s")
+_st_L16s16s = struct.Struct("!L16s16s")
+_st_LB = struct.Struct("!LB")
+_st_LBB = struct.Struct("!LBB")
+_st_LH = struct.Struct("!LH")
+_st_LHH = struct.Struct("!LHH")
+_st_LL = struct.Struct("!LL")
+_st_LLL = struct.Struct("!LLL")
+_st_LQ = struct.Struct("!LQ")
+_st_LQQ = struct.Struct("!LQQ")
+
 class oxm(loxi.OFObject):
     subtypes = {}
 
@@ -34,7 +47,7 @@ class oxm(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         return ''.join(packed)
 
     @staticmethod
@@ -74,16 +87,14 @@ class arp_op(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147494402)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -119,18 +130,14 @@ class arp_op_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147494660)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -166,14 +173,14 @@ class arp_sha(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_sha()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147495942)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -211,7 +218,7 @@ class arp_sha_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -219,7 +226,7 @@ class arp_sha_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = arp_sha_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496204)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -258,16 +265,14 @@ class arp_spa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147494916)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -303,18 +308,14 @@ class arp_spa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147495176)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -350,14 +351,14 @@ class arp_tha(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tha()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496454)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -395,7 +396,7 @@ class arp_tha_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -403,7 +404,7 @@ class arp_tha_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = arp_tha_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496716)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -442,16 +443,14 @@ class arp_tpa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147495428)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -487,18 +486,14 @@ class arp_tpa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147495688)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -534,16 +529,14 @@ class bsn_egr_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 200196)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -579,18 +572,14 @@ class bsn_egr_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 200456)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -626,16 +615,14 @@ class bsn_global_vrf_allowed(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_global_vrf_allowed()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 198145)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -671,18 +658,14 @@ class bsn_global_vrf_allowed_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_global_vrf_allowed_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 198402)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -718,14 +701,14 @@ class bsn_in_ports_128(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_bitmap_128(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_in_ports_128()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 196624)
         obj.value = util.unpack_bitmap_128(reader)
         return obj
@@ -763,7 +746,7 @@ class bsn_in_ports_128_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_bitmap_128(self.value))
         packed.append(util.pack_bitmap_128(self.value_mask))
         return ''.join(packed)
@@ -771,7 +754,7 @@ class bsn_in_ports_128_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = bsn_in_ports_128_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 196896)
         obj.value = util.unpack_bitmap_128(reader)
         obj.value_mask = util.unpack_bitmap_128(reader)
@@ -810,16 +793,14 @@ class bsn_l2_cache_hit(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l2_cache_hit()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 205825)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -855,18 +836,14 @@ class bsn_l2_cache_hit_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l2_cache_hit_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 206082)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -902,16 +879,14 @@ class bsn_l3_dst_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_dst_class_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 199684)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -947,18 +922,14 @@ class bsn_l3_dst_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_dst_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 199944)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -994,16 +965,14 @@ class bsn_l3_interface_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 198660)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1039,18 +1008,14 @@ class bsn_l3_interface_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 198920)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1086,16 +1051,14 @@ class bsn_l3_src_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 199172)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1131,18 +1094,14 @@ class bsn_l3_src_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 199432)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1178,16 +1137,14 @@ class bsn_lag_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 197124)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1223,18 +1180,14 @@ class bsn_lag_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 197384)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1270,16 +1223,14 @@ class bsn_tcp_flags(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 204802)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1315,18 +1266,14 @@ class bsn_tcp_flags_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 205060)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1362,16 +1309,14 @@ class bsn_udf0(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 200708)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1407,18 +1352,14 @@ class bsn_udf0_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 200968)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1454,16 +1395,14 @@ class bsn_udf1(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 201220)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1499,18 +1438,14 @@ class bsn_udf1_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 201480)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1546,16 +1481,14 @@ class bsn_udf2(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 201732)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1591,18 +1524,14 @@ class bsn_udf2_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 201992)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1638,16 +1567,14 @@ class bsn_udf3(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 202244)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1683,18 +1610,14 @@ class bsn_udf3_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 202504)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1730,16 +1653,14 @@ class bsn_udf4(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 202756)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1775,18 +1696,14 @@ class bsn_udf4_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 203016)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1822,16 +1739,14 @@ class bsn_udf5(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 203268)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1867,18 +1782,14 @@ class bsn_udf5_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 203528)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1914,16 +1825,14 @@ class bsn_udf6(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 203780)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1959,18 +1868,14 @@ class bsn_udf6_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 204040)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2006,16 +1911,14 @@ class bsn_udf7(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 204292)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2051,18 +1954,14 @@ class bsn_udf7_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 204552)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2098,16 +1997,14 @@ class bsn_vlan_xlate_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 205316)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2143,18 +2040,14 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 205576)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2190,16 +2083,14 @@ class bsn_vrf(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 197636)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2235,18 +2126,14 @@ class bsn_vrf_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 197896)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2282,14 +2169,14 @@ class eth_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485190)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -2327,7 +2214,7 @@ class eth_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -2335,7 +2222,7 @@ class eth_dst_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = eth_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485452)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -2374,14 +2261,14 @@ class eth_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_src()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485702)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -2419,7 +2306,7 @@ class eth_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -2427,7 +2314,7 @@ class eth_src_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = eth_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485964)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -2466,16 +2353,14 @@ class eth_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147486210)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2511,18 +2396,14 @@ class eth_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147486468)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2558,16 +2439,14 @@ class icmpv4_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147493889)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2603,18 +2482,14 @@ class icmpv4_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147494146)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2650,16 +2525,14 @@ class icmpv4_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147493377)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2695,18 +2568,14 @@ class icmpv4_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147493634)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2742,16 +2611,14 @@ class icmpv6_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147499009)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2787,18 +2654,14 @@ class icmpv6_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147499266)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2834,16 +2697,14 @@ class icmpv6_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147498497)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2879,18 +2740,14 @@ class icmpv6_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147498754)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2926,14 +2783,14 @@ class in_phy_port(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = in_phy_port()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147484164)
         obj.value = util.unpack_port_no(reader)
         return obj
@@ -2971,7 +2828,7 @@ class in_phy_port_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         packed.append(util.pack_port_no(self.value_mask))
         return ''.join(packed)
@@ -2979,7 +2836,7 @@ class in_phy_port_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = in_phy_port_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147484424)
         obj.value = util.unpack_port_no(reader)
         obj.value_mask = util.unpack_port_no(reader)
@@ -3026,14 +2883,14 @@ class in_port(oxm):
             self.type_len= self.type_len - 4 + self.length
         else:
             self.type_len= self.type_len
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = in_port()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147483652)
         obj.value = util.unpack_port_no(reader)
         return obj
@@ -3071,7 +2928,7 @@ class in_port_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         packed.append(util.pack_port_no(self.value_mask))
         return ''.join(packed)
@@ -3079,7 +2936,7 @@ class in_port_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = in_port_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147483912)
         obj.value = util.unpack_port_no(reader)
         obj.value_mask = util.unpack_port_no(reader)
@@ -3118,16 +2975,14 @@ class ip_dscp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147487745)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3163,18 +3018,14 @@ class ip_dscp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147488002)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3210,16 +3061,14 @@ class ip_ecn(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147488257)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3255,18 +3104,14 @@ class ip_ecn_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147488514)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3302,16 +3147,14 @@ class ip_proto(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147488769)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3347,18 +3190,14 @@ class ip_proto_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147489026)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3394,16 +3233,14 @@ class ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147489796)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3439,18 +3276,14 @@ class ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147490056)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3486,16 +3319,14 @@ class ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147489284)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3531,18 +3362,14 @@ class ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147489544)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3578,14 +3405,13 @@ class ipv6_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497488)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -3623,15 +3449,13 @@ class ipv6_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497760)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -3670,16 +3494,14 @@ class ipv6_exthdr(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_exthdr()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147503618)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3715,18 +3537,14 @@ class ipv6_exthdr_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_exthdr_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147503876)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3762,16 +3580,14 @@ class ipv6_flabel(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147497988)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3807,18 +3623,14 @@ class ipv6_flabel_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147498248)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3854,14 +3666,14 @@ class ipv6_nd_sll(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_sll()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500038)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -3899,7 +3711,7 @@ class ipv6_nd_sll_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -3907,7 +3719,7 @@ class ipv6_nd_sll_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_sll_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500300)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -3946,14 +3758,13 @@ class ipv6_nd_target(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_target()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147499536)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -3991,15 +3802,13 @@ class ipv6_nd_target_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_target_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147499808)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -4038,14 +3847,14 @@ class ipv6_nd_tll(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_tll()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500550)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -4083,7 +3892,7 @@ class ipv6_nd_tll_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -4091,7 +3900,7 @@ class ipv6_nd_tll_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_tll_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500812)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -4130,14 +3939,13 @@ class ipv6_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_src()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496976)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -4175,15 +3983,13 @@ class ipv6_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497248)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -4222,16 +4028,14 @@ class metadata(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_LQ.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LQ)
         assert(_type_len == 2147484680)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4267,18 +4071,14 @@ class metadata_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
+        packed.append(_st_LQQ.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LQQ)
         assert(_type_len == 2147484944)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4314,16 +4114,14 @@ class mpls_bos(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_bos()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147502081)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4359,18 +4157,14 @@ class mpls_bos_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_bos_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147502338)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4406,16 +4200,14 @@ class mpls_label(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147501060)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4451,18 +4243,14 @@ class mpls_label_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147501320)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4498,16 +4286,14 @@ class mpls_tc(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147501569)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4543,18 +4329,14 @@ class mpls_tc_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147501826)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4590,16 +4372,14 @@ class sctp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147492866)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4635,18 +4415,14 @@ class sctp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147493124)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4682,16 +4458,14 @@ class sctp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147492354)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4727,18 +4501,14 @@ class sctp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147492612)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4774,16 +4544,14 @@ class tcp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147490818)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4819,18 +4587,14 @@ class tcp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147491076)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4866,16 +4630,14 @@ class tcp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147490306)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4911,18 +4673,14 @@ class tcp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147490564)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4958,16 +4716,14 @@ class tunnel_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_LQ.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LQ)
         assert(_type_len == 2147503112)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -5003,18 +4759,14 @@ class tunnel_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
+        packed.append(_st_LQQ.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LQQ)
         assert(_type_len == 2147503376)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -5050,16 +4802,14 @@ class tunnel_ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 81924)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5095,18 +4845,14 @@ class tunnel_ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 82184)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5142,16 +4888,14 @@ class tunnel_ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 81412)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5187,18 +4931,14 @@ class tunnel_ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 81672)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5234,16 +4974,14 @@ class udp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147491842)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5279,18 +5017,14 @@ class udp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147492100)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5326,16 +5060,14 @@ class udp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147491330)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5371,18 +5103,14 @@ class udp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147491588)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5418,16 +5146,14 @@ class vlan_pcp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147487233)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5463,18 +5189,14 @@ class vlan_pcp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147487490)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5510,16 +5232,14 @@ class vlan_vid(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147486722)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5555,18 +5275,14 @@ class vlan_vid_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147486980)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -30,6 +30,11 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_H = struct.Struct("!H")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+
 class async_config_prop(loxi.OFObject):
     subtypes = {}
 
@@ -43,7 +48,7 @@ class async_config_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -85,7 +90,7 @@ class experimenter_master(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -94,9 +99,8 @@ class experimenter_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = experimenter_master()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -123,7 +127,7 @@ class experimenter_slave(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -132,9 +136,8 @@ class experimenter_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = experimenter_slave()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 65534)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -165,9 +168,9 @@ class flow_removed_master(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -175,12 +178,11 @@ class flow_removed_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = flow_removed_master()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -212,9 +214,9 @@ class flow_removed_slave(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -222,12 +224,11 @@ class flow_removed_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = flow_removed_slave()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -259,9 +260,9 @@ class packet_in_master(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -269,12 +270,11 @@ class packet_in_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = packet_in_master()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -306,9 +306,9 @@ class packet_in_slave(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -316,12 +316,11 @@ class packet_in_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = packet_in_slave()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -353,9 +352,9 @@ class port_status_master(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -363,12 +362,11 @@ class port_status_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = port_status_master()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -400,9 +398,9 @@ class port_status_slave(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -410,12 +408,11 @@ class port_status_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = port_status_slave()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -447,9 +444,9 @@ class requestforward_master(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -457,12 +454,11 @@ class requestforward_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = requestforward_master()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -494,9 +490,9 @@ class requestforward_slave(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -504,12 +500,11 @@ class requestforward_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = requestforward_slave()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -541,9 +536,9 @@ class role_status_master(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -551,12 +546,11 @@ class role_status_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = role_status_master()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -588,9 +582,9 @@ class role_status_slave(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -598,12 +592,11 @@ class role_status_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = role_status_slave()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -635,9 +628,9 @@ class table_status_master(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -645,12 +638,11 @@ class table_status_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = table_status_master()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -682,9 +674,9 @@ class table_status_slave(async_config_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_L.pack(self.mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -692,12 +684,11 @@ class table_status_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = table_status_slave()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.mask = reader.read("!L")[0]
+        obj.mask = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -30,6 +30,13 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_B = struct.Struct("!B")
+_st_H = struct.Struct("!H")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+_st_Q = struct.Struct("!Q")
+
 class bsn_tlv(loxi.OFObject):
     subtypes = {}
 
@@ -43,7 +50,7 @@ class bsn_tlv(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -89,9 +96,9 @@ class actor_key(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -99,12 +106,11 @@ class actor_key(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_key()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 44)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -136,9 +142,9 @@ class actor_port_num(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -146,12 +152,11 @@ class actor_port_num(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_port_num()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 43)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -183,9 +188,9 @@ class actor_port_priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -193,12 +198,11 @@ class actor_port_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_port_priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 42)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -230,9 +234,9 @@ class actor_state(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -240,12 +244,11 @@ class actor_state(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_state()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 53)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -277,7 +280,7 @@ class actor_system_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -287,9 +290,8 @@ class actor_system_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_system_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 41)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -324,9 +326,9 @@ class actor_system_priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -334,12 +336,11 @@ class actor_system_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_system_priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 40)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -371,9 +372,9 @@ class broadcast_query_timeout(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -381,12 +382,11 @@ class broadcast_query_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = broadcast_query_timeout()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -418,7 +418,7 @@ class bucket(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.value))
         length = sum([len(x) for x in packed])
@@ -428,9 +428,8 @@ class bucket(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = bucket()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 64)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
@@ -465,7 +464,7 @@ class circuit_id(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(self.value)
         length = sum([len(x) for x in packed])
@@ -475,9 +474,8 @@ class circuit_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = circuit_id()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -512,9 +510,9 @@ class convergence_status(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -522,12 +520,11 @@ class convergence_status(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = convergence_status()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 45)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -559,9 +556,9 @@ class crc_enabled(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -569,12 +566,11 @@ class crc_enabled(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = crc_enabled()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -606,7 +602,7 @@ class data(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(self.value)
         length = sum([len(x) for x in packed])
@@ -616,9 +612,8 @@ class data(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = data()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 55)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -653,7 +648,7 @@ class eth_dst(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -663,9 +658,8 @@ class eth_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = eth_dst()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 33)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -700,7 +694,7 @@ class eth_src(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -710,9 +704,8 @@ class eth_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = eth_src()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 32)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -747,9 +740,9 @@ class external_gateway_ip(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -757,12 +750,11 @@ class external_gateway_ip(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_gateway_ip()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 26)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -794,7 +786,7 @@ class external_gateway_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -804,9 +796,8 @@ class external_gateway_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_gateway_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 29)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -841,9 +832,9 @@ class external_ip(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -851,12 +842,11 @@ class external_ip(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_ip()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 23)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -888,7 +878,7 @@ class external_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -898,9 +888,8 @@ class external_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -935,9 +924,9 @@ class external_netmask(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -945,12 +934,11 @@ class external_netmask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_netmask()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -982,9 +970,9 @@ class header_size(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -992,12 +980,11 @@ class header_size(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = header_size()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 31)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1025,7 +1012,7 @@ class idle_notification(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -1034,9 +1021,8 @@ class idle_notification(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_notification()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1067,9 +1053,9 @@ class idle_time(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1077,12 +1063,11 @@ class idle_time(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_time()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -1114,9 +1099,9 @@ class idle_timeout(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1124,12 +1109,11 @@ class idle_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_timeout()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1161,7 +1145,7 @@ class internal_gateway_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -1171,9 +1155,8 @@ class internal_gateway_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = internal_gateway_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 28)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1208,7 +1191,7 @@ class internal_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -1218,9 +1201,8 @@ class internal_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = internal_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 27)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1255,9 +1237,9 @@ class interval(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1265,12 +1247,11 @@ class interval(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = interval()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 58)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1302,9 +1283,9 @@ class ipv4(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1312,12 +1293,11 @@ class ipv4(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1349,9 +1329,9 @@ class ipv4_dst(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1359,12 +1339,11 @@ class ipv4_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 35)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1396,9 +1375,9 @@ class ipv4_netmask(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1406,12 +1385,11 @@ class ipv4_netmask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_netmask()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 60)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1443,9 +1421,9 @@ class ipv4_src(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1453,12 +1431,11 @@ class ipv4_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 34)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1490,7 +1467,7 @@ class mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -1500,9 +1477,8 @@ class mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1537,7 +1513,7 @@ class mac_mask(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -1547,9 +1523,8 @@ class mac_mask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mac_mask()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 56)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1584,9 +1559,9 @@ class miss_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1594,12 +1569,11 @@ class miss_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = miss_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -1631,9 +1605,9 @@ class mpls_control_word(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1641,12 +1615,11 @@ class mpls_control_word(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_control_word()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 62)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -1678,9 +1651,9 @@ class mpls_label(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1688,12 +1661,11 @@ class mpls_label(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 61)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1725,9 +1697,9 @@ class mpls_sequenced(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1735,12 +1707,11 @@ class mpls_sequenced(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_sequenced()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 63)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -1772,7 +1743,7 @@ class name(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(self.value)
         length = sum([len(x) for x in packed])
@@ -1782,9 +1753,8 @@ class name(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = name()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 52)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -1819,9 +1789,9 @@ class partner_key(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1829,12 +1799,11 @@ class partner_key(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_key()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 51)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -1866,9 +1835,9 @@ class partner_port_num(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1876,12 +1845,11 @@ class partner_port_num(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_port_num()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 50)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -1913,9 +1881,9 @@ class partner_port_priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1923,12 +1891,11 @@ class partner_port_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_port_priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 49)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -1960,9 +1927,9 @@ class partner_state(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1970,12 +1937,11 @@ class partner_state(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_state()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 54)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -2007,7 +1973,7 @@ class partner_system_mac(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!6B", *self.value))
         length = sum([len(x) for x in packed])
@@ -2017,9 +1983,8 @@ class partner_system_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_system_mac()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 48)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -2054,9 +2019,9 @@ class partner_system_priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2064,12 +2029,11 @@ class partner_system_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_system_priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 47)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2101,7 +2065,7 @@ class port(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(util.pack_port_no(self.value))
         length = sum([len(x) for x in packed])
@@ -2111,9 +2075,8 @@ class port(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = port()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = util.unpack_port_no(reader)
@@ -2148,9 +2111,9 @@ class priority(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2158,12 +2121,11 @@ class priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = priority()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 57)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2195,9 +2157,9 @@ class queue_id(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2205,12 +2167,11 @@ class queue_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = queue_id()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2242,9 +2203,9 @@ class queue_weight(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2252,12 +2213,11 @@ class queue_weight(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = queue_weight()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2293,9 +2253,9 @@ class reference(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.table_id))
+        packed.append(_st_H.pack(self.table_id))
         packed.append(loxi.generic_util.pack_list(self.key))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -2304,12 +2264,11 @@ class reference(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = reference()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 59)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.table_id = reader.read("!H")[0]
+        obj.table_id = reader.read_struct(_st_H)[0]
         obj.key = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -2346,9 +2305,9 @@ class reply_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2356,12 +2315,11 @@ class reply_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = reply_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2393,9 +2351,9 @@ class request_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2403,12 +2361,11 @@ class request_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = request_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2440,9 +2397,9 @@ class rx_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2450,12 +2407,11 @@ class rx_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = rx_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2487,9 +2443,9 @@ class sampling_rate(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2497,12 +2453,11 @@ class sampling_rate(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = sampling_rate()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 30)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2534,9 +2489,9 @@ class sub_agent_id(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2544,12 +2499,11 @@ class sub_agent_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = sub_agent_id()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 38)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -2581,9 +2535,9 @@ class tx_bytes(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2591,12 +2545,11 @@ class tx_bytes(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = tx_bytes()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 39)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2628,9 +2581,9 @@ class tx_packets(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2638,12 +2591,11 @@ class tx_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = tx_packets()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -2675,9 +2627,9 @@ class udf_anchor(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2685,12 +2637,11 @@ class udf_anchor(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_anchor()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2722,9 +2673,9 @@ class udf_id(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2732,12 +2683,11 @@ class udf_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_id()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2769,9 +2719,9 @@ class udf_length(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2779,12 +2729,11 @@ class udf_length(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_length()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2816,9 +2765,9 @@ class udf_offset(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2826,12 +2775,11 @@ class udf_offset(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_offset()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2863,9 +2811,9 @@ class udp_dst(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2873,12 +2821,11 @@ class udp_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 37)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2910,9 +2857,9 @@ class udp_src(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2920,12 +2867,11 @@ class udp_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 36)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -2957,9 +2903,9 @@ class unicast_query_timeout(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2967,12 +2913,11 @@ class unicast_query_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = unicast_query_timeout()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -3004,9 +2949,9 @@ class vlan_vid(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_H.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -3014,12 +2959,11 @@ class vlan_vid(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!H")[0]
+        obj.value = reader.read_struct(_st_H)[0]
         return obj
 
     def __eq__(self, other):
@@ -3051,9 +2995,9 @@ class vrf(bsn_tlv):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -3061,12 +3005,11 @@ class vrf(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = vrf()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
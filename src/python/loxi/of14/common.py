@@ -30,6 +30,50 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_256s = struct.Struct("!256s")
+_st_2x16sLL = struct.Struct("!2x16sLL")
+_st_2xL = struct.Struct("!2xL")
+_st_2xLL4xQQLL = struct.Struct("!2xLL4xQQLL")
+_st_4xH6x = struct.Struct("!4xH6x")
+_st_4xL4x = struct.Struct("!4xL4x")
+_st_6xLQQLL = struct.Struct("!6xLQQLL")
+_st_B = struct.Struct("!B")
+_st_B1xL = struct.Struct("!B1xL")
+_st_B1xLLHHHHH2xQQQ = struct.Struct("!B1xLLHHHHH2xQQQ")
+_st_B3xLQQ = struct.Struct("!B3xLQQ")
+_st_B5x = struct.Struct("!B5x")
+_st_B5x32sQQLL = struct.Struct("!B5x32sQQLL")
+_st_BB2xL = struct.Struct("!BB2xL")
+_st_BB2xL256s = struct.Struct("!BB2xL256s")
+_st_BBB1x = struct.Struct("!BBB1x")
+_st_BQ = struct.Struct("!BQ")
+_st_H = struct.Struct("!H")
+_st_H2xL = struct.Struct("!H2xL")
+_st_H32sLL4x = struct.Struct("!H32sLL4x")
+_st_H4x = struct.Struct("!H4x")
+_st_HH = struct.Struct("!HH")
+_st_HHH2x = struct.Struct("!HHH2x")
+_st_HHHB1xH = struct.Struct("!HHHB1xH")
+_st_HL = struct.Struct("!HL")
+_st_L = struct.Struct("!L")
+_st_L4x = struct.Struct("!L4x")
+_st_LH = struct.Struct("!LH")
+_st_LHHHH = struct.Struct("!LHHHH")
+_st_LHHHH16s = struct.Struct("!LHHHH16s")
+_st_LL = struct.Struct("!LL")
+_st_LL4x = struct.Struct("!LL4x")
+_st_LLBB2xLL = struct.Struct("!LLBB2xLL")
+_st_LLBB2xLL16s = struct.Struct("!LLBB2xLL16s")
+_st_LLH = struct.Struct("!LLH")
+_st_LLLBB2x = struct.Struct("!LLLBB2x")
+_st_LLQQQQQQQQ = struct.Struct("!LLQQQQQQQQ")
+_st_LQQQLL = struct.Struct("!LQQQLL")
+_st_Q = struct.Struct("!Q")
+_st_Q64s256s = struct.Struct("!Q64s256s")
+_st_QQ = struct.Struct("!QQ")
+_st_QQLL = struct.Struct("!QQLL")
+
 class bsn_controller_connection(loxi.OFObject):
 
     def __init__(self, state=None, auxiliary_id=None, role=None, uri=None):
@@ -53,20 +97,13 @@ class bsn_controller_connection(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.state))
-        packed.append(struct.pack("!B", self.auxiliary_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!256s", self.uri))
+        packed.append(_st_BB2xL256s.pack(self.state, self.auxiliary_id, self.role, self.uri))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connection()
-        obj.state = reader.read("!B")[0]
-        obj.auxiliary_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.role = reader.read("!L")[0]
+        (obj.state, obj.auxiliary_id, obj.role) = reader.read_struct(_st_BB2xL)
         obj.uri = reader.read("!256s")[0].rstrip("\x00")
         return obj
 
@@ -117,15 +154,13 @@ class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.counter_id))
-        packed.append(struct.pack("!64s", self.name))
-        packed.append(struct.pack("!256s", self.description))
+        packed.append(_st_Q64s256s.pack(self.counter_id, self.name, self.description))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_entry()
-        obj.counter_id = reader.read("!Q")[0]
+        obj.counter_id = reader.read_struct(_st_Q)[0]
         obj.name = reader.read("!64s")[0].rstrip("\x00")
         obj.description = reader.read("!256s")[0].rstrip("\x00")
         return obj
@@ -169,15 +204,13 @@ class bsn_debug_counter_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.counter_id))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_QQ.pack(self.counter_id, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_entry()
-        obj.counter_id = reader.read("!Q")[0]
-        obj.value = reader.read("!Q")[0]
+        (obj.counter_id, obj.value) = reader.read_struct(_st_QQ)
         return obj
 
     def __eq__(self, other):
@@ -211,13 +244,13 @@ class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.checksum))
+        packed.append(_st_Q.pack(self.checksum))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_entry()
-        obj.checksum = reader.read("!Q")[0]
+        obj.checksum = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -256,7 +289,7 @@ class bsn_generic_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
         obj.tlvs = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
@@ -338,11 +371,7 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(struct.pack("!32s", self.name))
-        packed.append(struct.pack("!L", self.buckets_size))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append('\x00' * 4)
+        packed.append(_st_H32sLL4x.pack(self.table_id, self.name, self.buckets_size, self.max_entries))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
         return ''.join(packed)
@@ -350,14 +379,12 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!H")[0]
+        obj.table_id = reader.read_struct(_st_H)[0]
         obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.buckets_size = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
-        reader.skip(4)
+        (obj.buckets_size, obj.max_entries) = reader.read_struct(_st_LL4x)
         return obj
 
     def __eq__(self, other):
@@ -420,10 +447,10 @@ class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        _key_length = reader.read("!H")[0]
+        _key_length = reader.read_struct(_st_H)[0]
         obj.checksum = util.unpack_checksum_128(reader)
         obj.key = loxi.generic_util.unpack_list(reader.slice(_key_length), bsn_tlv.bsn_tlv.unpack)
         obj.value = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
@@ -480,10 +507,10 @@ class bsn_gentable_entry_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        _key_length = reader.read("!H")[0]
+        _key_length = reader.read_struct(_st_H)[0]
         obj.key = loxi.generic_util.unpack_list(reader.slice(_key_length), bsn_tlv.bsn_tlv.unpack)
         obj.stats = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
         return obj
@@ -527,18 +554,14 @@ class bsn_gentable_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.entry_count))
+        packed.append(_st_H2xL.pack(self.table_id, self.entry_count))
         packed.append(util.pack_checksum_128(self.checksum))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_entry()
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.entry_count = reader.read("!L")[0]
+        (obj.table_id, obj.entry_count) = reader.read_struct(_st_H2xL)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
 
@@ -590,10 +613,7 @@ class bsn_interface(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
+        packed.append(_st_2x16sLL.pack(self.name, self.ipv4_addr, self.ipv4_netmask))
         return ''.join(packed)
 
     @staticmethod
@@ -602,8 +622,7 @@ class bsn_interface(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        (obj.ipv4_addr, obj.ipv4_netmask) = reader.read_struct(_st_LL)
         return obj
 
     def __eq__(self, other):
@@ -690,38 +709,22 @@ class bsn_lacp_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
+        packed.append(_st_H.pack(self.actor_sys_priority))
         packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        packed.append(struct.pack("!B", self.convergence_status))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.partner_sys_priority))
+        packed.append(_st_HHHB1xH.pack(self.actor_port_priority, self.actor_port_num, self.actor_key, self.convergence_status, self.partner_sys_priority))
         packed.append(struct.pack("!6B", *self.partner_sys_mac))
-        packed.append(struct.pack("!H", self.partner_port_priority))
-        packed.append(struct.pack("!H", self.partner_port_num))
-        packed.append(struct.pack("!H", self.partner_key))
-        packed.append('\x00' * 2)
+        packed.append(_st_HHH2x.pack(self.partner_port_priority, self.partner_port_num, self.partner_key))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
+        obj.actor_sys_priority = reader.read_struct(_st_H)[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
-        obj.convergence_status = reader.read("!B")[0]
-        reader.skip(1)
-        obj.partner_sys_priority = reader.read("!H")[0]
+        (obj.actor_port_priority, obj.actor_port_num, obj.actor_key, obj.convergence_status, obj.partner_sys_priority) = reader.read_struct(_st_HHHB1xH)
         obj.partner_sys_mac = list(reader.read('!6B'))
-        obj.partner_port_priority = reader.read("!H")[0]
-        obj.partner_port_num = reader.read("!H")[0]
-        obj.partner_key = reader.read("!H")[0]
-        reader.skip(2)
+        (obj.partner_port_priority, obj.partner_port_num, obj.partner_key) = reader.read_struct(_st_HHH2x)
         return obj
 
     def __eq__(self, other):
@@ -810,7 +813,7 @@ class bsn_port_counter_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
         reader.skip(2)
@@ -849,7 +852,7 @@ class bsn_switch_pipeline_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!256s", self.pipeline))
+        packed.append(_st_256s.pack(self.pipeline))
         return ''.join(packed)
 
     @staticmethod
@@ -889,15 +892,13 @@ class bsn_table_checksum_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!Q", self.checksum))
+        packed.append(_st_BQ.pack(self.table_id, self.checksum))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        obj.checksum = reader.read("!Q")[0]
+        (obj.table_id, obj.checksum) = reader.read_struct(_st_BQ)
         return obj
 
     def __eq__(self, other):
@@ -933,7 +934,7 @@ class bsn_vport(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -983,8 +984,7 @@ class bsn_vlan_counter_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 4)
+        packed.append(_st_H4x.pack(self.vlan_vid))
         packed.append(loxi.generic_util.pack_list(self.values))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -993,11 +993,10 @@ class bsn_vlan_counter_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.vlan_vid = reader.read("!H")[0]
-        reader.skip(4)
+        obj.vlan_vid = reader.read_struct(_st_H4x)[0]
         obj.values = loxi.generic_util.unpack_list(reader, common.uint64.unpack)
         return obj
 
@@ -1077,21 +1076,14 @@ class bsn_vport_l2gre(bsn_vport):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.flags))
+        packed.append(_st_L.pack(self.flags))
         packed.append(util.pack_port_no(self.port_no))
         packed.append(util.pack_port_no(self.loopback_port_no))
         packed.append(struct.pack("!6B", *self.local_mac))
         packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
-        packed.append(struct.pack("!16s", self.if_name))
+        packed.append(_st_LLBB2xLL16s.pack(self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit, self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1099,23 +1091,16 @@ class bsn_vport_l2gre(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.flags = reader.read("!L")[0]
+        obj.flags = reader.read_struct(_st_L)[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.loopback_port_no = util.unpack_port_no(reader)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
+        (obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit) = reader.read_struct(_st_LLBB2xLL)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -1212,14 +1197,9 @@ class bsn_vport_q_in_q(bsn_vport):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
-        packed.append(struct.pack("!16s", self.if_name))
+        packed.append(_st_LHHHH16s.pack(self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id, self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1227,16 +1207,11 @@ class bsn_vport_q_in_q(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
+        (obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id) = reader.read_struct(_st_LHHHH)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -1293,8 +1268,7 @@ class bsn_vrf_counter_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vrf))
+        packed.append(_st_2xL.pack(self.vrf))
         packed.append(loxi.generic_util.pack_list(self.values))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1303,11 +1277,10 @@ class bsn_vrf_counter_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        reader.skip(2)
-        obj.vrf = reader.read("!L")[0]
+        obj.vrf = reader.read_struct(_st_2xL)[0]
         obj.values = loxi.generic_util.unpack_list(reader, common.uint64.unpack)
         return obj
 
@@ -1355,10 +1328,9 @@ class bucket(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 0
-        packed.append(struct.pack("!H", self.weight))
+        packed.append(_st_H.pack(self.weight))
         packed.append(util.pack_port_no(self.watch_port))
-        packed.append(struct.pack("!L", self.watch_group))
-        packed.append('\x00' * 4)
+        packed.append(_st_L4x.pack(self.watch_group))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1367,13 +1339,12 @@ class bucket(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = bucket()
-        _len = reader.read("!H")[0]
+        _len = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 2)
-        obj.weight = reader.read("!H")[0]
+        obj.weight = reader.read_struct(_st_H)[0]
         obj.watch_port = util.unpack_port_no(reader)
-        obj.watch_group = reader.read("!L")[0]
-        reader.skip(4)
+        obj.watch_group = reader.read_struct(_st_L4x)[0]
         obj.actions = loxi.generic_util.unpack_list(reader, action.action.unpack)
         return obj
 
@@ -1420,15 +1391,13 @@ class bucket_counter(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_QQ.pack(self.packet_count, self.byte_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bucket_counter()
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.packet_count, obj.byte_count) = reader.read_struct(_st_QQ)
         return obj
 
     def __eq__(self, other):
@@ -1511,19 +1480,7 @@ class flow_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_B1xLLHHHHH2xQQQ.pack(self.table_id, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.flags, self.importance, self.cookie, self.packet_count, self.byte_count))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
@@ -1533,22 +1490,10 @@ class flow_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = flow_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
-        reader.skip(2)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.table_id, obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.flags, obj.importance, obj.cookie, obj.packet_count, obj.byte_count) = reader.read_struct(_st_B1xLLHHHHH2xQQQ)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -1637,9 +1582,7 @@ class group_desc_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_B1xL.pack(self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1648,12 +1591,10 @@ class group_desc_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        (obj.group_type, obj.group_id) = reader.read_struct(_st_B1xL)
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -1717,14 +1658,7 @@ class group_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(struct.pack("!L", self.ref_count))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
+        packed.append(_st_2xLL4xQQLL.pack(self.group_id, self.ref_count, self.packet_count, self.byte_count, self.duration_sec, self.duration_nsec))
         packed.append(loxi.generic_util.pack_list(self.bucket_stats))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1733,17 +1667,10 @@ class group_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = group_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        reader.skip(2)
-        obj.group_id = reader.read("!L")[0]
-        obj.ref_count = reader.read("!L")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        (obj.group_id, obj.ref_count, obj.packet_count, obj.byte_count, obj.duration_sec, obj.duration_nsec) = reader.read_struct(_st_2xLL4xQQLL)
         obj.bucket_stats = loxi.generic_util.unpack_list(reader, common.bucket_counter.unpack)
         return obj
 
@@ -1800,7 +1727,7 @@ class hello_elem(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -1846,7 +1773,7 @@ class hello_elem_versionbitmap(hello_elem):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.bitmaps))
         length = sum([len(x) for x in packed])
@@ -1856,9 +1783,8 @@ class hello_elem_versionbitmap(hello_elem):
     @staticmethod
     def unpack(reader):
         obj = hello_elem_versionbitmap()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.bitmaps = loxi.generic_util.unpack_list(reader, common.uint32.unpack)
@@ -1893,7 +1819,7 @@ class match_v3(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.oxm_list))
         length = sum([len(x) for x in packed])
@@ -1904,9 +1830,8 @@ class match_v3(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = match_v3()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_list = loxi.generic_util.unpack_list(reader, oxm.oxm.unpack)
@@ -1944,15 +1869,13 @@ class meter_band_stats(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.packet_band_count))
-        packed.append(struct.pack("!Q", self.byte_band_count))
+        packed.append(_st_QQ.pack(self.packet_band_count, self.byte_band_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_band_stats()
-        obj.packet_band_count = reader.read("!Q")[0]
-        obj.byte_band_count = reader.read("!Q")[0]
+        (obj.packet_band_count, obj.byte_band_count) = reader.read_struct(_st_QQ)
         return obj
 
     def __eq__(self, other):
@@ -1995,8 +1918,7 @@ class meter_config(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.meter_id))
+        packed.append(_st_HL.pack(self.flags, self.meter_id))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -2005,11 +1927,10 @@ class meter_config(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = meter_config()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.flags = reader.read("!H")[0]
-        obj.meter_id = reader.read("!L")[0]
+        (obj.flags, obj.meter_id) = reader.read_struct(_st_HL)
         obj.entries = loxi.generic_util.unpack_list(reader, meter_band.meter_band.unpack)
         return obj
 
@@ -2064,23 +1985,13 @@ class meter_features(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.max_meter))
-        packed.append(struct.pack("!L", self.band_types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!B", self.max_bands))
-        packed.append(struct.pack("!B", self.max_color))
-        packed.append('\x00' * 2)
+        packed.append(_st_LLLBB2x.pack(self.max_meter, self.band_types, self.capabilities, self.max_bands, self.max_color))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_features()
-        obj.max_meter = reader.read("!L")[0]
-        obj.band_types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_bands = reader.read("!B")[0]
-        obj.max_color = reader.read("!B")[0]
-        reader.skip(2)
+        (obj.max_meter, obj.band_types, obj.capabilities, obj.max_bands, obj.max_color) = reader.read_struct(_st_LLLBB2x)
         return obj
 
     def __eq__(self, other):
@@ -2150,14 +2061,9 @@ class meter_stats(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.meter_id))
+        packed.append(_st_L.pack(self.meter_id))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append(struct.pack("!Q", self.packet_in_count))
-        packed.append(struct.pack("!Q", self.byte_in_count))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
+        packed.append(_st_6xLQQLL.pack(self.flow_count, self.packet_in_count, self.byte_in_count, self.duration_sec, self.duration_nsec))
         packed.append(loxi.generic_util.pack_list(self.band_stats))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -2166,16 +2072,10 @@ class meter_stats(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = meter_stats()
-        obj.meter_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        (obj.meter_id, _len) = reader.read_struct(_st_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
-        reader.skip(6)
-        obj.flow_count = reader.read("!L")[0]
-        obj.packet_in_count = reader.read("!Q")[0]
-        obj.byte_in_count = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        (obj.flow_count, obj.packet_in_count, obj.byte_in_count, obj.duration_sec, obj.duration_nsec) = reader.read_struct(_st_6xLQQLL)
         obj.band_stats = loxi.generic_util.unpack_list(reader, common.meter_band_stats.unpack)
         return obj
 
@@ -2238,7 +2138,7 @@ class packet_queue(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_L.pack(self.queue_id))
         packed.append(util.pack_port_no(self.port))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 2
         packed.append('\x00' * 6)
@@ -2250,9 +2150,9 @@ class packet_queue(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = packet_queue()
-        obj.queue_id = reader.read("!L")[0]
+        obj.queue_id = reader.read_struct(_st_L)[0]
         obj.port = util.unpack_port_no(reader)
-        _len = reader.read("!H")[0]
+        _len = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 10)
         reader.skip(6)
@@ -2318,10 +2218,7 @@ class port_desc(loxi.OFObject):
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append('\x00' * 2)
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
+        packed.append(_st_2x16sLL.pack(self.name, self.config, self.state))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -2331,15 +2228,14 @@ class port_desc(loxi.OFObject):
     def unpack(reader):
         obj = port_desc()
         obj.port_no = util.unpack_port_no(reader)
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 6)
         reader.skip(2)
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
+        (obj.config, obj.state) = reader.read_struct(_st_LL)
         obj.properties = loxi.generic_util.unpack_list(reader, port_desc_prop.port_desc_prop.unpack)
         return obj
 
@@ -2437,16 +2333,7 @@ class port_stats_entry(loxi.OFObject):
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
         packed.append('\x00' * 2)
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
+        packed.append(_st_LLQQQQQQQQ.pack(self.duration_sec, self.duration_nsec, self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -2455,21 +2342,12 @@ class port_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
         reader.skip(2)
         obj.port_no = util.unpack_port_no(reader)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
+        (obj.duration_sec, obj.duration_nsec, obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors) = reader.read_struct(_st_LLQQQQQQQQ)
         obj.properties = loxi.generic_util.unpack_list(reader, port_stats_prop.port_stats_prop.unpack)
         return obj
 
@@ -2552,21 +2430,18 @@ class queue_desc(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_st_LL.pack(self.port_no, self.queue_id))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append('\x00' * 6)
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_desc()
-        obj.port_no = reader.read("!L")[0]
-        obj.queue_id = reader.read("!L")[0]
-        _length = reader.read("!H")[0]
+        (obj.port_no, obj.queue_id, _length) = reader.read_struct(_st_LLH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 10)
         reader.skip(6)
@@ -2610,7 +2485,7 @@ class queue_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
@@ -2664,11 +2539,9 @@ class queue_prop_experimenter(queue_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append('\x00' * 4)
+        packed.append(_st_4xL4x.pack(self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -2723,11 +2596,9 @@ class queue_prop_max_rate(queue_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_st_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2735,14 +2606,11 @@ class queue_prop_max_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_max_rate()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        reader.skip(4)
-        obj.rate = reader.read("!H")[0]
-        reader.skip(6)
+        obj.rate = reader.read_struct(_st_4xH6x)[0]
         return obj
 
     def __eq__(self, other):
@@ -2774,11 +2642,9 @@ class queue_prop_min_rate(queue_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_st_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2786,14 +2652,11 @@ class queue_prop_min_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        (_type, _len) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        reader.skip(4)
-        obj.rate = reader.read("!H")[0]
-        reader.skip(6)
+        obj.rate = reader.read_struct(_st_4xH6x)[0]
         return obj
 
     def __eq__(self, other):
@@ -2855,12 +2718,7 @@ class queue_stats_entry(loxi.OFObject):
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
         packed.append('\x00' * 6)
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
+        packed.append(_st_LQQQLL.pack(self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors, self.duration_sec, self.duration_nsec))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -2869,17 +2727,12 @@ class queue_stats_entry(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
         reader.skip(6)
         obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        (obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors, obj.duration_sec, obj.duration_nsec) = reader.read_struct(_st_LQQQLL)
         obj.properties = loxi.generic_util.unpack_list(reader, queue_stats_prop.queue_stats_prop.unpack)
         return obj
 
@@ -2943,9 +2796,7 @@ class table_desc(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.config))
+        packed.append(_st_B1xL.pack(self.table_id, self.config))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2953,12 +2804,10 @@ class table_desc(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = table_desc()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.config = reader.read("!L")[0]
+        (obj.table_id, obj.config) = reader.read_struct(_st_B1xL)
         return obj
 
     def __eq__(self, other):
@@ -2994,7 +2843,7 @@ class table_feature_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -3040,7 +2889,7 @@ class table_feature_prop_apply_actions(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.action_ids))
         length = sum([len(x) for x in packed])
@@ -3050,9 +2899,8 @@ class table_feature_prop_apply_actions(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_actions()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, action_id.action_id.unpack)
@@ -3087,7 +2935,7 @@ class table_feature_prop_apply_actions_miss(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.action_ids))
         length = sum([len(x) for x in packed])
@@ -3097,9 +2945,8 @@ class table_feature_prop_apply_actions_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_actions_miss()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, action_id.action_id.unpack)
@@ -3134,7 +2981,7 @@ class table_feature_prop_apply_setfield(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.oxm_ids))
         length = sum([len(x) for x in packed])
@@ -3144,9 +2991,8 @@ class table_feature_prop_apply_setfield(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_setfield()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, common.uint32.unpack)
@@ -3181,7 +3027,7 @@ class table_feature_prop_apply_setfield_miss(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.oxm_ids))
         length = sum([len(x) for x in packed])
@@ -3191,9 +3037,8 @@ class table_feature_prop_apply_setfield_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_setfield_miss()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, common.uint32.unpack)
@@ -3238,10 +3083,9 @@ class table_feature_prop_experimenter(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_LL.pack(self.experimenter, self.subtype))
         packed.append(self.experimenter_data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -3309,10 +3153,9 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_LL.pack(self.experimenter, self.subtype))
         packed.append(self.experimenter_data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -3370,7 +3213,7 @@ class table_feature_prop_instructions(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.instruction_ids))
         length = sum([len(x) for x in packed])
@@ -3380,9 +3223,8 @@ class table_feature_prop_instructions(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_instructions()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.instruction_ids = loxi.generic_util.unpack_list(reader, instruction_id.instruction_id.unpack)
@@ -3417,7 +3259,7 @@ class table_feature_prop_instructions_miss(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.instruction_ids))
         length = sum([len(x) for x in packed])
@@ -3427,9 +3269,8 @@ class table_feature_prop_instructions_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_instructions_miss()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.instruction_ids = loxi.generic_util.unpack_list(reader, instruction_id.instruction_id.unpack)
@@ -3464,7 +3305,7 @@ class table_feature_prop_match(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.oxm_ids))
         length = sum([len(x) for x in packed])
@@ -3474,9 +3315,8 @@ class table_feature_prop_match(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_match()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, common.uint32.unpack)
@@ -3511,7 +3351,7 @@ class table_feature_prop_next_tables(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.next_table_ids))
         length = sum([len(x) for x in packed])
@@ -3521,9 +3361,8 @@ class table_feature_prop_next_tables(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_next_tables()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.next_table_ids = loxi.generic_util.unpack_list(reader, common.uint8.unpack)
@@ -3558,7 +3397,7 @@ class table_feature_prop_next_tables_miss(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.next_table_ids))
         length = sum([len(x) for x in packed])
@@ -3568,9 +3407,8 @@ class table_feature_prop_next_tables_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_next_tables_miss()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.next_table_ids = loxi.generic_util.unpack_list(reader, common.uint8.unpack)
@@ -3605,7 +3443,7 @@ class table_feature_prop_table_sync_from(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.table_ids))
         length = sum([len(x) for x in packed])
@@ -3615,9 +3453,8 @@ class table_feature_prop_table_sync_from(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_table_sync_from()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.table_ids = loxi.generic_util.unpack_list(reader, common.uint8.unpack)
@@ -3652,7 +3489,7 @@ class table_feature_prop_wildcards(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.oxm_ids))
         length = sum([len(x) for x in packed])
@@ -3662,9 +3499,8 @@ class table_feature_prop_wildcards(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_wildcards()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, common.uint32.unpack)
@@ -3699,7 +3535,7 @@ class table_feature_prop_write_actions(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.action_ids))
         length = sum([len(x) for x in packed])
@@ -3709,9 +3545,8 @@ class table_feature_prop_write_actions(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_actions()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, action_id.action_id.unpack)
@@ -3746,7 +3581,7 @@ class table_feature_prop_write_actions_miss(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.action_ids))
         length = sum([len(x) for x in packed])
@@ -3756,9 +3591,8 @@ class table_feature_prop_write_actions_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_actions_miss()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, action_id.action_id.unpack)
@@ -3793,7 +3627,7 @@ class table_feature_prop_write_setfield(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.oxm_ids))
         length = sum([len(x) for x in packed])
@@ -3803,9 +3637,8 @@ class table_feature_prop_write_setfield(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_setfield()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, common.uint32.unpack)
@@ -3840,7 +3673,7 @@ class table_feature_prop_write_setfield_miss(table_feature_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(loxi.generic_util.pack_list(self.oxm_ids))
         length = sum([len(x) for x in packed])
@@ -3850,9 +3683,8 @@ class table_feature_prop_write_setfield_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_setfield_miss()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, common.uint32.unpack)
@@ -3911,13 +3743,7 @@ class table_features(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 5)
-        packed.append(struct.pack("!32s", self.name))
-        packed.append(struct.pack("!Q", self.metadata_match))
-        packed.append(struct.pack("!Q", self.metadata_write))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.max_entries))
+        packed.append(_st_B5x32sQQLL.pack(self.table_id, self.name, self.metadata_match, self.metadata_write, self.config, self.max_entries))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -3926,16 +3752,12 @@ class table_features(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = table_features()
-        _length = reader.read("!H")[0]
+        _length = reader.read_struct(_st_H)[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(5)
+        obj.table_id = reader.read_struct(_st_B5x)[0]
         obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.metadata_match = reader.read("!Q")[0]
-        obj.metadata_write = reader.read("!Q")[0]
-        obj.config = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
+        (obj.metadata_match, obj.metadata_write, obj.config, obj.max_entries) = reader.read_struct(_st_QQLL)
         obj.properties = loxi.generic_util.unpack_list(reader, common.table_feature_prop.unpack)
         return obj
 
@@ -3991,9 +3813,9 @@ class table_mod_prop_eviction(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.flags))
+        packed.append(_st_L.pack(self.flags))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -4001,12 +3823,11 @@ class table_mod_prop_eviction(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = table_mod_prop_eviction()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.flags = reader.read("!L")[0]
+        obj.flags = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -4043,10 +3864,9 @@ class table_mod_prop_experimenter(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_st_LL.pack(self.experimenter, self.exp_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -4105,12 +3925,9 @@ class table_mod_prop_vacancy(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.vacancy_down))
-        packed.append(struct.pack("!B", self.vacancy_up))
-        packed.append(struct.pack("!B", self.vacancy))
-        packed.append('\x00' * 1)
+        packed.append(_st_BBB1x.pack(self.vacancy_down, self.vacancy_up, self.vacancy))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -4118,15 +3935,11 @@ class table_mod_prop_vacancy(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = table_mod_prop_vacancy()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.vacancy_down = reader.read("!B")[0]
-        obj.vacancy_up = reader.read("!B")[0]
-        obj.vacancy = reader.read("!B")[0]
-        reader.skip(1)
+        (obj.vacancy_down, obj.vacancy_up, obj.vacancy) = reader.read_struct(_st_BBB1x)
         return obj
 
     def __eq__(self, other):
@@ -4176,21 +3989,13 @@ class table_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
+        packed.append(_st_B3xLQQ.pack(self.table_id, self.active_count, self.lookup_count, self.matched_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        (obj.table_id, obj.active_count, obj.lookup_count, obj.matched_count) = reader.read_struct(_st_B3xLQQ)
         return obj
 
     def __eq__(self, other):
@@ -4232,13 +4037,13 @@ class uint32(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_L.pack(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = uint32()
-        obj.value = reader.read("!L")[0]
+        obj.value = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -4268,13 +4073,13 @@ class uint64(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_Q.pack(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = uint64()
-        obj.value = reader.read("!Q")[0]
+        obj.value = reader.read_struct(_st_Q)[0]
         return obj
 
     def __eq__(self, other):
@@ -4304,13 +4109,13 @@ class uint8(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_B.pack(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = uint8()
-        obj.value = reader.read("!B")[0]
+        obj.value = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
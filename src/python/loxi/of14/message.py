@@ -30,6 +30,65 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_2xLL = struct.Struct("!2xLL")
+_st_B = struct.Struct("!B")
+_st_B3x = struct.Struct("!B3x")
+_st_BB = struct.Struct("!BB")
+_st_BBH = struct.Struct("!BBH")
+_st_H = struct.Struct("!H")
+_st_H6x = struct.Struct("!H6x")
+_st_HHH = struct.Struct("!HHH")
+_st_HHHH = struct.Struct("!HHHH")
+_st_HHHL = struct.Struct("!HHHL")
+_st_L = struct.Struct("!L")
+_st_L4xQQ = struct.Struct("!L4xQQ")
+_st_LB3xL = struct.Struct("!LB3xL")
+_st_LB7x = struct.Struct("!LB7x")
+_st_LH = struct.Struct("!LH")
+_st_LH2x = struct.Struct("!LH2x")
+_st_LHB1xL = struct.Struct("!LHB1xL")
+_st_LHH = struct.Struct("!LHH")
+_st_LHH4x = struct.Struct("!LHH4x")
+_st_LHH4x256s256s256s32s256s = struct.Struct("!LHH4x256s256s256s32s256s")
+_st_LHH4xB3x = struct.Struct("!LHH4xB3x")
+_st_LHH4xL4x = struct.Struct("!LHH4xL4x")
+_st_LHH4xLL = struct.Struct("!LHH4xLL")
+_st_LHH4xLL256s256s = struct.Struct("!LHH4xLL256s256s")
+_st_LHH4xLL64s = struct.Struct("!LHH4xLL64s")
+_st_LHH4xLLB = struct.Struct("!LHH4xLLB")
+_st_LHH4xLLH = struct.Struct("!LHH4xLLH")
+_st_LHH4xLLH2x = struct.Struct("!LHH4xLLH2x")
+_st_LHH4xLLL = struct.Struct("!LHH4xLLL")
+_st_LHH4xLLLLLLLLLL = struct.Struct("!LHH4xLLLLLLLLLL")
+_st_LHH4xQQL4x = struct.Struct("!LHH4xQQL4x")
+_st_LHHL = struct.Struct("!LHHL")
+_st_LL = struct.Struct("!LL")
+_st_LL2xH = struct.Struct("!LL2xH")
+_st_LL4xQ = struct.Struct("!LL4xQ")
+_st_LLB3xQ = struct.Struct("!LLB3xQ")
+_st_LLB7x = struct.Struct("!LLB7x")
+_st_LLHBBQ = struct.Struct("!LLHBBQ")
+_st_LLHH = struct.Struct("!LLHH")
+_st_LLL = struct.Struct("!LLL")
+_st_LLL1xB2xL = struct.Struct("!LLL1xB2xL")
+_st_LLL256s = struct.Struct("!LLL256s")
+_st_LLLB = struct.Struct("!LLLB")
+_st_LLLB1xHHHQ = struct.Struct("!LLLB1xHHHQ")
+_st_LLLB3x = struct.Struct("!LLLB3x")
+_st_LLLH = struct.Struct("!LLLH")
+_st_LLLH2x = struct.Struct("!LLLH2x")
+_st_LLLH2xL = struct.Struct("!LLLH2xL")
+_st_LLLH2xLL = struct.Struct("!LLLH2xLL")
+_st_LLLHH = struct.Struct("!LLLHH")
+_st_LLLL = struct.Struct("!LLLL")
+_st_LLLLL = struct.Struct("!LLLLL")
+_st_LLLQ = struct.Struct("!LLLQ")
+_st_LLLQHB5x = struct.Struct("!LLLQHB5x")
+_st_LQHBBLLHHQQ = struct.Struct("!LQHBBLLHHQQ")
+_st_LQLBB2xLL = struct.Struct("!LQLBB2xLL")
+_st_LQQB = struct.Struct("!LQQB")
+
 class message(loxi.OFObject):
     subtypes = {}
 
@@ -48,12 +107,11 @@ class message(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -116,15 +174,11 @@ class stats_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -203,40 +257,23 @@ class aggregate_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xQQL4x.pack(self.xid, self.stats_type, self.flags, self.packet_count, self.byte_count, self.flow_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.packet_count, obj.byte_count, obj.flow_count) = reader.read_struct(_st_LHH4xQQL4x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.flow_count = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -298,15 +335,11 @@ class stats_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -397,47 +430,28 @@ class aggregate_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xB3x.pack(self.xid, self.stats_type, self.flags, self.table_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
+        packed.append(_st_L4xQQ.pack(self.out_group, self.cookie, self.cookie_mask))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.table_id) = reader.read_struct(_st_LHH4xB3x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
+        (obj.out_group, obj.cookie, obj.cookie_mask) = reader.read_struct(_st_L4xQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -508,13 +522,11 @@ class error_msg(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LH.pack(self.xid, self.err_type))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -579,31 +591,24 @@ class async_config_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = async_config_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 15)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -652,26 +657,23 @@ class async_get_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = async_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 27)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.properties = loxi.generic_util.unpack_list(reader, async_config_prop.async_config_prop.unpack)
         return obj
 
@@ -716,26 +718,23 @@ class async_get_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = async_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 26)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.properties = loxi.generic_util.unpack_list(reader, async_config_prop.async_config_prop.unpack)
         return obj
 
@@ -780,26 +779,23 @@ class async_set(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = async_set()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 28)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.properties = loxi.generic_util.unpack_list(reader, async_config_prop.async_config_prop.unpack)
         return obj
 
@@ -849,31 +845,24 @@ class bad_action_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_action_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 2)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -927,31 +916,24 @@ class bad_instruction_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_instruction_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 3)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -1005,31 +987,24 @@ class bad_match_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_match_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 4)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -1083,31 +1058,24 @@ class bad_property_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_property_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 14)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -1161,31 +1129,24 @@ class bad_request_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_request_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 1)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -1230,25 +1191,22 @@ class barrier_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1284,25 +1242,22 @@ class barrier_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -1352,15 +1307,12 @@ class experimenter(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -1433,14 +1385,11 @@ class bsn_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -1508,37 +1457,24 @@ class bsn_arp_idle(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.ipv4_addr))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH2xL.pack(self.xid, self.experimenter, self.subtype, self.vlan_vid, self.ipv4_addr))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_arp_idle()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.vlan_vid, obj.ipv4_addr) = reader.read_struct(_st_LLLH2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 60)
-        obj.vlan_vid = reader.read("!H")[0]
-        reader.skip(2)
-        obj.ipv4_addr = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1588,33 +1524,24 @@ class bsn_bw_clear_data_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 22)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1656,30 +1583,23 @@ class bsn_bw_clear_data_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 21)
         return obj
 
@@ -1722,33 +1642,24 @@ class bsn_bw_enable_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 20)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1790,30 +1701,23 @@ class bsn_bw_enable_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 19)
         return obj
 
@@ -1860,35 +1764,24 @@ class bsn_bw_enable_set_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.enable, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable, obj.status) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 23)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1938,33 +1831,24 @@ class bsn_bw_enable_set_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enable))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 18)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2010,31 +1894,24 @@ class bsn_controller_connections_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.connections))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connections_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 57)
         obj.connections = loxi.generic_util.unpack_list(reader, common.bsn_controller_connection.unpack)
         return obj
@@ -2078,30 +1955,23 @@ class bsn_controller_connections_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connections_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 56)
         return obj
 
@@ -2153,17 +2023,11 @@ class experimenter_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2244,17 +2108,11 @@ class bsn_stats_reply(experimenter_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2331,38 +2189,25 @@ class bsn_debug_counter_desc_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_debug_counter_desc_stats_entry.unpack)
         return obj
@@ -2423,17 +2268,11 @@ class experimenter_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2514,17 +2353,11 @@ class bsn_stats_request(experimenter_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -2597,37 +2430,24 @@ class bsn_debug_counter_desc_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         return obj
 
@@ -2679,38 +2499,25 @@ class bsn_debug_counter_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_debug_counter_stats_entry.unpack)
         return obj
@@ -2763,37 +2570,24 @@ class bsn_debug_counter_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         return obj
 
@@ -2845,38 +2639,25 @@ class bsn_flow_checksum_bucket_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_flow_checksum_bucket_stats_entry.unpack)
         return obj
@@ -2933,40 +2714,25 @@ class bsn_flow_checksum_bucket_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLB.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LHH4xLLB)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
-        obj.table_id = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3028,40 +2794,25 @@ class bsn_flow_idle(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 5)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLQHB5x.pack(self.xid, self.experimenter, self.subtype, self.cookie, self.priority, self.table_id))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.cookie, obj.priority, obj.table_id) = reader.read_struct(_st_LLLQHB5x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 40)
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(5)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -3120,33 +2871,24 @@ class bsn_flow_idle_enable_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_get_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 39)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3188,30 +2930,23 @@ class bsn_flow_idle_enable_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_get_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 38)
         return obj
 
@@ -3258,35 +2993,24 @@ class bsn_flow_idle_enable_set_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.enable, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_set_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable, obj.status) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 37)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3336,33 +3060,24 @@ class bsn_flow_idle_enable_set_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enable))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_set_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enable) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 36)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3413,38 +3128,25 @@ class bsn_generic_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_generic_stats_entry.unpack)
         return obj
@@ -3505,39 +3207,25 @@ class bsn_generic_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!64s", self.name))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL64s.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.name))
         packed.append(loxi.generic_util.pack_list(self.tlvs))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
         obj.name = reader.read("!64s")[0].rstrip("\x00")
         obj.tlvs = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
@@ -3599,38 +3287,25 @@ class bsn_gentable_bucket_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_bucket_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_bucket_stats_entry.unpack)
         return obj
@@ -3687,40 +3362,25 @@ class bsn_gentable_bucket_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLH.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_bucket_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LHH4xLLH)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.table_id = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3778,39 +3438,24 @@ class bsn_gentable_clear_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.deleted_count))
-        packed.append(struct.pack("!L", self.error_count))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH2xLL.pack(self.xid, self.experimenter, self.subtype, self.table_id, self.deleted_count, self.error_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_clear_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id, obj.deleted_count, obj.error_count) = reader.read_struct(_st_LLLH2xLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 49)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.deleted_count = reader.read("!L")[0]
-        obj.error_count = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3872,37 +3517,26 @@ class bsn_gentable_clear_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH2x.pack(self.xid, self.experimenter, self.subtype, self.table_id))
         packed.append(util.pack_checksum_128(self.checksum))
         packed.append(util.pack_checksum_128(self.checksum_mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_clear_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LLLH2x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 48)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -3963,38 +3597,25 @@ class bsn_gentable_desc_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_desc_stats_entry.unpack)
         return obj
@@ -4047,37 +3668,24 @@ class bsn_gentable_desc_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         return obj
 
@@ -4136,39 +3744,29 @@ class bsn_gentable_entry_add(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 7
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH.pack(self.xid, self.experimenter, self.subtype, self.table_id))
+        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 3
         packed.append(util.pack_checksum_128(self.checksum))
         packed.append(loxi.generic_util.pack_list(self.key))
-        packed[7] = struct.pack("!H", len(packed[-1]))
+        packed[3] = struct.pack("!H", len(packed[-1]))
         packed.append(loxi.generic_util.pack_list(self.value))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id, _key_length) = reader.read_struct(_st_LLLHH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 46)
-        obj.table_id = reader.read("!H")[0]
-        _key_length = reader.read("!H")[0]
         obj.checksum = util.unpack_checksum_128(reader)
         obj.key = loxi.generic_util.unpack_list(reader.slice(_key_length), bsn_tlv.bsn_tlv.unpack)
         obj.value = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
@@ -4233,34 +3831,25 @@ class bsn_gentable_entry_delete(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH.pack(self.xid, self.experimenter, self.subtype, self.table_id))
         packed.append(loxi.generic_util.pack_list(self.key))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LLLH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 47)
-        obj.table_id = reader.read("!H")[0]
         obj.key = loxi.generic_util.unpack_list(reader, bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -4316,38 +3905,25 @@ class bsn_gentable_entry_desc_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_entry_desc_stats_entry.unpack)
         return obj
@@ -4412,44 +3988,27 @@ class bsn_gentable_entry_desc_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLH2x.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id))
         packed.append(util.pack_checksum_128(self.checksum))
         packed.append(util.pack_checksum_128(self.checksum_mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LHH4xLLH2x)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -4514,38 +4073,25 @@ class bsn_gentable_entry_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_entry_stats_entry.unpack)
         return obj
@@ -4610,44 +4156,27 @@ class bsn_gentable_entry_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLH2x.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id))
         packed.append(util.pack_checksum_128(self.checksum))
         packed.append(util.pack_checksum_128(self.checksum_mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id) = reader.read_struct(_st_LHH4xLLH2x)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -4711,37 +4240,24 @@ class bsn_gentable_set_buckets_size(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.buckets_size))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLH2xL.pack(self.xid, self.experimenter, self.subtype, self.table_id, self.buckets_size))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_set_buckets_size()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id, obj.buckets_size) = reader.read_struct(_st_LLLH2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 50)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.buckets_size = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4796,38 +4312,25 @@ class bsn_gentable_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_gentable_stats_entry.unpack)
         return obj
@@ -4880,37 +4383,24 @@ class bsn_gentable_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         return obj
 
@@ -4957,31 +4447,24 @@ class bsn_get_interfaces_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.interfaces))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.interfaces = loxi.generic_util.unpack_list(reader, common.bsn_interface.unpack)
         return obj
@@ -5025,30 +4508,23 @@ class bsn_get_interfaces_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -5091,35 +4567,24 @@ class bsn_get_mirroring_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -5165,35 +4630,24 @@ class bsn_get_mirroring_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -5239,31 +4693,23 @@ class bsn_get_switch_pipeline_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.pipeline))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL256s.pack(self.xid, self.experimenter, self.subtype, self.pipeline))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_switch_pipeline_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 52)
         obj.pipeline = reader.read("!256s")[0].rstrip("\x00")
         return obj
@@ -5307,30 +4753,23 @@ class bsn_get_switch_pipeline_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_switch_pipeline_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 51)
         return obj
 
@@ -5382,39 +4821,24 @@ class bsn_image_desc_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.image_checksum))
-        packed.append(struct.pack("!256s", self.startup_config_checksum))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL256s256s.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.image_checksum, self.startup_config_checksum))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_image_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
         obj.image_checksum = reader.read("!256s")[0].rstrip("\x00")
         obj.startup_config_checksum = reader.read("!256s")[0].rstrip("\x00")
@@ -5472,37 +4896,24 @@ class bsn_image_desc_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_image_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
         return obj
 
@@ -5593,57 +5004,36 @@ class bsn_lacp_convergence_notif(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.convergence_status))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.convergence_status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
+        packed.append(_st_H.pack(self.actor_sys_priority))
         packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        packed.append(struct.pack("!H", self.partner_sys_priority))
+        packed.append(_st_HHHH.pack(self.actor_port_priority, self.actor_port_num, self.actor_key, self.partner_sys_priority))
         packed.append(struct.pack("!6B", *self.partner_sys_mac))
-        packed.append(struct.pack("!H", self.partner_port_priority))
-        packed.append(struct.pack("!H", self.partner_port_num))
-        packed.append(struct.pack("!H", self.partner_key))
+        packed.append(_st_HHH.pack(self.partner_port_priority, self.partner_port_num, self.partner_key))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_convergence_notif()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.convergence_status) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 43)
-        obj.convergence_status = reader.read("!B")[0]
-        reader.skip(3)
         obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
+        obj.actor_sys_priority = reader.read_struct(_st_H)[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
-        obj.partner_sys_priority = reader.read("!H")[0]
+        (obj.actor_port_priority, obj.actor_port_num, obj.actor_key, obj.partner_sys_priority) = reader.read_struct(_st_HHHH)
         obj.partner_sys_mac = list(reader.read('!6B'))
-        obj.partner_port_priority = reader.read("!H")[0]
-        obj.partner_port_num = reader.read("!H")[0]
-        obj.partner_key = reader.read("!H")[0]
+        (obj.partner_port_priority, obj.partner_port_num, obj.partner_key) = reader.read_struct(_st_HHH)
         return obj
 
     def __eq__(self, other):
@@ -5738,38 +5128,25 @@ class bsn_lacp_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_lacp_stats_entry.unpack)
         return obj
@@ -5822,37 +5199,24 @@ class bsn_lacp_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         return obj
 
@@ -5903,34 +5267,25 @@ class bsn_log(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.loglevel))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB.pack(self.xid, self.experimenter, self.subtype, self.loglevel))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_log()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.loglevel) = reader.read_struct(_st_LLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 63)
-        obj.loglevel = reader.read("!B")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -5989,37 +5344,28 @@ class bsn_pdu_rx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 34)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -6085,40 +5431,29 @@ class bsn_pdu_rx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.timeout_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.timeout_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.timeout_ms) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 33)
-        obj.timeout_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
+        obj.slot_num = reader.read_struct(_st_B3x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6181,35 +5516,28 @@ class bsn_pdu_rx_timeout(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_timeout()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 35)
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -6267,37 +5595,28 @@ class bsn_pdu_tx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
+        packed.append(_st_B.pack(self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 32)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
+        obj.slot_num = reader.read_struct(_st_B)[0]
         return obj
 
     def __eq__(self, other):
@@ -6363,40 +5682,29 @@ class bsn_pdu_tx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.tx_interval_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.tx_interval_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_st_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.tx_interval_ms) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 31)
-        obj.tx_interval_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
+        obj.slot_num = reader.read_struct(_st_B3x)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6460,38 +5768,25 @@ class bsn_port_counter_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_port_counter_stats_entry.unpack)
         return obj
@@ -6548,38 +5843,25 @@ class bsn_port_counter_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(util.pack_port_no(self.port_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
         obj.port_no = util.unpack_port_no(reader)
         return obj
@@ -6635,35 +5917,24 @@ class bsn_set_aux_cxns_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.num_aux))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.num_aux, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_aux_cxns_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.num_aux, obj.status) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 59)
-        obj.num_aux = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6713,33 +5984,24 @@ class bsn_set_aux_cxns_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.num_aux))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.num_aux))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_aux_cxns_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.num_aux) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 58)
-        obj.num_aux = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6789,34 +6051,25 @@ class bsn_set_lacp_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_lacp_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 42)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
         return obj
 
@@ -6891,47 +6144,32 @@ class bsn_set_lacp_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
+        packed.append(_st_H.pack(self.actor_sys_priority))
         packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
+        packed.append(_st_HHH.pack(self.actor_port_priority, self.actor_port_num, self.actor_key))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_lacp_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 41)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(3)
         obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
+        obj.actor_sys_priority = reader.read_struct(_st_H)[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
+        (obj.actor_port_priority, obj.actor_port_num, obj.actor_key) = reader.read_struct(_st_HHH)
         return obj
 
     def __eq__(self, other):
@@ -7001,35 +6239,24 @@ class bsn_set_mirroring(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_mirroring()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.report_mirror_ports) = reader.read_struct(_st_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -7075,33 +6302,24 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 25)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7163,43 +6381,24 @@ class bsn_set_pktin_suppression_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLB1xHHHQ.pack(self.xid, self.experimenter, self.subtype, self.enabled, self.idle_timeout, self.hard_timeout, self.priority, self.cookie))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.enabled, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.cookie) = reader.read_struct(_st_LLLB1xHHHQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.cookie = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -7261,33 +6460,24 @@ class bsn_set_switch_pipeline_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_switch_pipeline_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 54)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7333,31 +6523,23 @@ class bsn_set_switch_pipeline_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.pipeline))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL256s.pack(self.xid, self.experimenter, self.subtype, self.pipeline))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_switch_pipeline_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 53)
         obj.pipeline = reader.read("!256s")[0].rstrip("\x00")
         return obj
@@ -7410,38 +6592,25 @@ class bsn_switch_pipeline_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_switch_pipeline_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_switch_pipeline_stats_entry.unpack)
         return obj
@@ -7494,37 +6663,24 @@ class bsn_switch_pipeline_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_switch_pipeline_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         return obj
 
@@ -7576,38 +6732,25 @@ class bsn_table_checksum_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_table_checksum_stats_entry.unpack)
         return obj
@@ -7660,37 +6803,24 @@ class bsn_table_checksum_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         return obj
 
@@ -7741,39 +6871,24 @@ class bsn_table_set_buckets_size(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.buckets_size))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL1xB2xL.pack(self.xid, self.experimenter, self.subtype, self.table_id, self.buckets_size))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_set_buckets_size()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.table_id, obj.buckets_size) = reader.read_struct(_st_LLL1xB2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 61)
-        reader.skip(1)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.buckets_size = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7823,33 +6938,24 @@ class bsn_time_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!Q", self.time_ms))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLQ.pack(self.xid, self.experimenter, self.subtype, self.time_ms))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_time_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.time_ms) = reader.read_struct(_st_LLLQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 45)
-        obj.time_ms = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -7891,30 +6997,23 @@ class bsn_time_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_time_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 44)
         return obj
 
@@ -7961,35 +7060,24 @@ class bsn_virtual_port_create_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.status, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status, obj.vport_no) = reader.read_struct(_st_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.status = reader.read("!L")[0]
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8039,31 +7127,24 @@ class bsn_virtual_port_create_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.vport.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype) = reader.read_struct(_st_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.vport = common.bsn_vport.unpack(reader)
         return obj
@@ -8111,33 +7192,24 @@ class bsn_virtual_port_remove_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.status) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 26)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8183,33 +7255,24 @@ class bsn_virtual_port_remove_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLLL.pack(self.xid, self.experimenter, self.subtype, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        (obj.xid, _experimenter, _subtype, obj.vport_no) = reader.read_struct(_st_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 17)
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8260,38 +7323,25 @@ class bsn_vlan_counter_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_vlan_counter_stats_entry.unpack)
         return obj
@@ -8348,40 +7398,25 @@ class bsn_vlan_counter_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.vlan_vid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLH.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.vlan_vid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.vlan_vid) = reader.read_struct(_st_LHH4xLLH)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
-        obj.vlan_vid = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -8436,38 +7471,25 @@ class bsn_vrf_counter_stats_reply(bsn_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype) = reader.read_struct(_st_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.entries = loxi.generic_util.unpack_list(reader, common.bsn_vrf_counter_stats_entry.unpack)
         return obj
@@ -8524,40 +7546,25 @@ class bsn_vrf_counter_stats_request(bsn_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vrf))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.vrf))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.vrf) = reader.read_struct(_st_LHH4xLLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
-        obj.vrf = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8613,32 +7620,23 @@ class bundle_add_msg(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.bundle_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL2xH.pack(self.xid, self.bundle_id, self.flags))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bundle_add_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 34)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.bundle_id = reader.read("!L")[0]
-        reader.skip(2)
-        obj.flags = reader.read("!H")[0]
+        (obj.xid, obj.bundle_id, obj.flags) = reader.read_struct(_st_LL2xH)
         obj.data = str(reader.read_all())
         return obj
 
@@ -8703,32 +7701,23 @@ class bundle_ctrl_msg(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.bundle_id))
-        packed.append(struct.pack("!H", self.bundle_ctrl_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLHH.pack(self.xid, self.bundle_id, self.bundle_ctrl_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bundle_ctrl_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 33)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.bundle_id = reader.read("!L")[0]
-        obj.bundle_ctrl_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
+        (obj.xid, obj.bundle_id, obj.bundle_ctrl_type, obj.flags) = reader.read_struct(_st_LLHH)
         obj.properties = loxi.generic_util.unpack_list(reader, bundle_prop.bundle_prop.unpack)
         return obj
 
@@ -8790,31 +7779,24 @@ class bundle_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bundle_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 17)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -8884,37 +7866,23 @@ class desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!256s", self.mfr_desc))
-        packed.append(struct.pack("!256s", self.hw_desc))
-        packed.append(struct.pack("!256s", self.sw_desc))
-        packed.append(struct.pack("!32s", self.serial_num))
-        packed.append(struct.pack("!256s", self.dp_desc))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x256s256s256s32s256s.pack(self.xid, self.stats_type, self.flags, self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.mfr_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.hw_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.sw_desc = reader.read("!256s")[0].rstrip("\x00")
@@ -8984,32 +7952,23 @@ class desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -9053,26 +8012,23 @@ class echo_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -9117,26 +8073,23 @@ class echo_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -9190,33 +8143,24 @@ class experimenter_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHHL.pack(self.xid, self.err_type, self.subtype, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = experimenter_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.subtype, obj.experimenter) = reader.read_struct(_st_LHHL)
         assert(_err_type == 65535)
-        obj.subtype = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -9289,39 +8233,22 @@ class features_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.datapath_id))
-        packed.append(struct.pack("!L", self.n_buffers))
-        packed.append(struct.pack("!B", self.n_tables))
-        packed.append(struct.pack("!B", self.auxiliary_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.reserved))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQLBB2xLL.pack(self.xid, self.datapath_id, self.n_buffers, self.n_tables, self.auxiliary_id, self.capabilities, self.reserved))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.datapath_id = reader.read("!Q")[0]
-        obj.n_buffers = reader.read("!L")[0]
-        obj.n_tables = reader.read("!B")[0]
-        obj.auxiliary_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.capabilities = reader.read("!L")[0]
-        obj.reserved = reader.read("!L")[0]
+        (obj.xid, obj.datapath_id, obj.n_buffers, obj.n_tables, obj.auxiliary_id, obj.capabilities, obj.reserved) = reader.read_struct(_st_LQLBB2xLL)
         return obj
 
     def __eq__(self, other):
@@ -9381,25 +8308,22 @@ class features_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -9489,26 +8413,17 @@ class flow_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
+        packed.append(_st_LH2x.pack(self.out_group, self.flags))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -9678,52 +8593,33 @@ class flow_add(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
+        packed.append(_st_LHH.pack(self.out_group, self.flags, self.importance))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 0)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
+        (obj.out_group, obj.flags, obj.importance) = reader.read_struct(_st_LHH)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -9866,52 +8762,33 @@ class flow_delete(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
+        packed.append(_st_LHH.pack(self.out_group, self.flags, self.importance))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 3)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
+        (obj.out_group, obj.flags, obj.importance) = reader.read_struct(_st_LHH)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -10054,52 +8931,33 @@ class flow_delete_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
+        packed.append(_st_LHH.pack(self.out_group, self.flags, self.importance))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete_strict()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 4)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
+        (obj.out_group, obj.flags, obj.importance) = reader.read_struct(_st_LHH)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -10198,31 +9056,24 @@ class flow_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 5)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -10320,52 +9171,33 @@ class flow_modify(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
+        packed.append(_st_LHH.pack(self.out_group, self.flags, self.importance))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
+        (obj.out_group, obj.flags, obj.importance) = reader.read_struct(_st_LHH)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -10508,52 +9340,33 @@ class flow_modify_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQQB.pack(self.xid, self.cookie, self.cookie_mask, self.table_id))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
+        packed.append(_st_LHH.pack(self.out_group, self.flags, self.importance))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify_strict()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
+        (obj.xid, obj.cookie, obj.cookie_mask, obj.table_id) = reader.read_struct(_st_LQQB)
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 2)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id) = reader.read_struct(_st_HHHL)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
+        (obj.out_group, obj.flags, obj.importance) = reader.read_struct(_st_LHH)
         obj.match = common.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, instruction.instruction.unpack)
         return obj
@@ -10652,31 +9465,24 @@ class flow_monitor_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_monitor_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 16)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -10765,46 +9571,23 @@ class flow_removed(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LQHBBLLHHQQ.pack(self.xid, self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        (obj.xid, obj.cookie, obj.priority, obj.reason, obj.table_id, obj.duration_sec, obj.duration_nsec, obj.idle_timeout, obj.hard_timeout, obj.packet_count, obj.byte_count) = reader.read_struct(_st_LQHBBLLHHQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -10894,33 +9677,24 @@ class flow_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.flow_stats_entry.unpack)
         return obj
 
@@ -10994,47 +9768,28 @@ class flow_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xB3x.pack(self.xid, self.stats_type, self.flags, self.table_id))
         packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
+        packed.append(_st_L4xQQ.pack(self.out_group, self.cookie, self.cookie_mask))
         packed.append(self.match.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.table_id) = reader.read_struct(_st_LHH4xB3x)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
         obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
+        (obj.out_group, obj.cookie, obj.cookie_mask) = reader.read_struct(_st_L4xQQ)
         obj.match = common.match.unpack(reader)
         return obj
 
@@ -11107,29 +9862,22 @@ class get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        (obj.xid, obj.flags, obj.miss_send_len) = reader.read_struct(_st_LHH)
         return obj
 
     def __eq__(self, other):
@@ -11173,25 +9921,22 @@ class get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -11245,17 +9990,12 @@ class group_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -11340,35 +10080,24 @@ class group_add(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_add()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 0)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -11430,35 +10159,24 @@ class group_delete(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_delete()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -11516,33 +10234,24 @@ class group_desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.group_desc_stats_entry.unpack)
         return obj
 
@@ -11592,32 +10301,23 @@ class group_desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -11702,52 +10402,23 @@ class group_features_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.max_groups_all))
-        packed.append(struct.pack("!L", self.max_groups_select))
-        packed.append(struct.pack("!L", self.max_groups_indirect))
-        packed.append(struct.pack("!L", self.max_groups_ff))
-        packed.append(struct.pack("!L", self.actions_all))
-        packed.append(struct.pack("!L", self.actions_select))
-        packed.append(struct.pack("!L", self.actions_indirect))
-        packed.append(struct.pack("!L", self.actions_ff))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xLLLLLLLLLL.pack(self.xid, self.stats_type, self.flags, self.types, self.capabilities, self.max_groups_all, self.max_groups_select, self.max_groups_indirect, self.max_groups_ff, self.actions_all, self.actions_select, self.actions_indirect, self.actions_ff))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.types, obj.capabilities, obj.max_groups_all, obj.max_groups_select, obj.max_groups_indirect, obj.max_groups_ff, obj.actions_all, obj.actions_select, obj.actions_indirect, obj.actions_ff) = reader.read_struct(_st_LHH4xLLLLLLLLLL)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_groups_all = reader.read("!L")[0]
-        obj.max_groups_select = reader.read("!L")[0]
-        obj.max_groups_indirect = reader.read("!L")[0]
-        obj.max_groups_ff = reader.read("!L")[0]
-        obj.actions_all = reader.read("!L")[0]
-        obj.actions_select = reader.read("!L")[0]
-        obj.actions_indirect = reader.read("!L")[0]
-        obj.actions_ff = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -11832,32 +10503,23 @@ class group_features_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -11906,31 +10568,24 @@ class group_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 6)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -11988,35 +10643,24 @@ class group_modify(group_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHB1xL.pack(self.xid, self.command, self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_modify()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        (obj.xid, _command, obj.group_type, obj.group_id) = reader.read_struct(_st_LHB1xL)
         assert(_command == 1)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, common.bucket.unpack)
         return obj
 
@@ -12074,33 +10718,24 @@ class group_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.group_stats_entry.unpack)
         return obj
 
@@ -12154,36 +10789,23 @@ class group_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xL4x.pack(self.xid, self.stats_type, self.flags, self.group_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.group_id) = reader.read_struct(_st_LHH4xL4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.group_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12231,26 +10853,23 @@ class hello(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(loxi.generic_util.pack_list(self.elements))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.elements = loxi.generic_util.unpack_list(reader, common.hello_elem.unpack)
         return obj
 
@@ -12300,31 +10919,24 @@ class hello_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 0)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -12378,33 +10990,24 @@ class meter_config_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_config_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 10)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, meter_band.meter_band.unpack)
         return obj
 
@@ -12458,36 +11061,23 @@ class meter_config_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xL4x.pack(self.xid, self.stats_type, self.flags, self.meter_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_config_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.meter_id) = reader.read_struct(_st_LHH4xL4x)
         assert(_stats_type == 10)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.meter_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12540,33 +11130,24 @@ class meter_features_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(self.features.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_features_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 11)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.features = common.meter_features.unpack(reader)
         return obj
 
@@ -12616,32 +11197,23 @@ class meter_features_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_features_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 11)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12697,32 +11269,23 @@ class meter_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.meter_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHHL.pack(self.xid, self.command, self.flags, self.meter_id))
         packed.append(loxi.generic_util.pack_list(self.bands))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 29)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.command = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.meter_id = reader.read("!L")[0]
+        (obj.xid, obj.command, obj.flags, obj.meter_id) = reader.read_struct(_st_LHHL)
         obj.bands = loxi.generic_util.unpack_list(reader, meter_band.meter_band.unpack)
         return obj
 
@@ -12784,31 +11347,24 @@ class meter_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 12)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -12862,33 +11418,24 @@ class meter_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 9)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.meter_stats.unpack)
         return obj
 
@@ -12942,36 +11489,23 @@ class meter_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4xL4x.pack(self.xid, self.stats_type, self.flags, self.meter_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags, obj.meter_id) = reader.read_struct(_st_LHH4xL4x)
         assert(_stats_type == 9)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.meter_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -13022,14 +11556,11 @@ class nicira_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -13115,38 +11646,25 @@ class packet_in(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(struct.pack("!H", self.total_len))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLHBBQ.pack(self.xid, self.buffer_id, self.total_len, self.reason, self.table_id, self.cookie))
         packed.append(self.match.pack())
         packed.append('\x00' * 2)
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_in()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.total_len = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.cookie = reader.read("!Q")[0]
+        (obj.xid, obj.buffer_id, obj.total_len, obj.reason, obj.table_id, obj.cookie) = reader.read_struct(_st_LLHBBQ)
         obj.match = common.match.unpack(reader)
         reader.skip(2)
         obj.data = str(reader.read_all())
@@ -13229,36 +11747,30 @@ class packet_out(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL.pack(self.xid, self.buffer_id))
         packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 6
+        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 4
         packed.append('\x00' * 6)
         packed.append(loxi.generic_util.pack_list(self.actions))
-        packed[6] = struct.pack("!H", len(packed[-1]))
+        packed[4] = struct.pack("!H", len(packed[-1]))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_out()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        (obj.xid, obj.buffer_id) = reader.read_struct(_st_LL)
         obj.in_port = util.unpack_port_no(reader)
-        _actions_len = reader.read("!H")[0]
-        reader.skip(6)
+        _actions_len = reader.read_struct(_st_H6x)[0]
         obj.actions = loxi.generic_util.unpack_list(reader.slice(_actions_len), action.action.unpack)
         obj.data = str(reader.read_all())
         return obj
@@ -13321,33 +11833,24 @@ class port_desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 13)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.port_desc.unpack)
         return obj
 
@@ -13397,32 +11900,23 @@ class port_desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 13)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -13482,38 +11976,31 @@ class port_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_L.pack(self.xid))
         packed.append(util.pack_port_no(self.port_no))
         packed.append('\x00' * 4)
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_st_2xLL.pack(self.config, self.mask))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
+        obj.xid = reader.read_struct(_st_L)[0]
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(4)
         obj.hw_addr = list(reader.read('!6B'))
-        reader.skip(2)
-        obj.config = reader.read("!L")[0]
-        obj.mask = reader.read("!L")[0]
+        (obj.config, obj.mask) = reader.read_struct(_st_2xLL)
         obj.properties = loxi.generic_util.unpack_list(reader, port_mod_prop.port_mod_prop.unpack)
         return obj
 
@@ -13579,31 +12066,24 @@ class port_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 7)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -13657,33 +12137,24 @@ class port_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.port_stats_entry.unpack)
         return obj
 
@@ -13737,34 +12208,25 @@ class port_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
         packed.append('\x00' * 4)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(4)
         return obj
@@ -13818,30 +12280,23 @@ class port_status(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LB7x.pack(self.xid, self.reason))
         packed.append(self.desc.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_status()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        (obj.xid, obj.reason) = reader.read_struct(_st_LB7x)
         obj.desc = common.port_desc.unpack(reader)
         return obj
 
@@ -13895,33 +12350,24 @@ class queue_desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 15)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.queue_desc.unpack)
         return obj
 
@@ -13971,32 +12417,23 @@ class queue_desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 15)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -14045,31 +12482,24 @@ class queue_op_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_op_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 9)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -14123,33 +12553,24 @@ class queue_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.queue_stats_entry.unpack)
         return obj
 
@@ -14207,36 +12628,27 @@ class queue_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_st_L.pack(self.queue_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
+        obj.queue_id = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -14292,28 +12704,23 @@ class requestforward(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL.pack(self.xid, self.role))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = requestforward()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 32)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
+        (obj.xid, obj.role) = reader.read_struct(_st_LL)
         obj.data = str(reader.read_all())
         return obj
 
@@ -14366,31 +12773,22 @@ class role_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL4xQ.pack(self.xid, self.role, self.generation_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        (obj.xid, obj.role, obj.generation_id) = reader.read_struct(_st_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -14442,31 +12840,22 @@ class role_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LL4xQ.pack(self.xid, self.role, self.generation_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        (obj.xid, obj.role, obj.generation_id) = reader.read_struct(_st_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -14519,31 +12908,24 @@ class role_request_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_request_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 11)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -14604,34 +12986,23 @@ class role_status(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLB3xQ.pack(self.xid, self.role, self.reason, self.generation_id))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = role_status()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 30)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(3)
-        obj.generation_id = reader.read("!Q")[0]
+        (obj.xid, obj.role, obj.reason, obj.generation_id) = reader.read_struct(_st_LLB3xQ)
         obj.properties = loxi.generic_util.unpack_list(reader, role_prop.role_prop.unpack)
         return obj
 
@@ -14692,29 +13063,22 @@ class set_config(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = set_config()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        (obj.xid, obj.flags, obj.miss_send_len) = reader.read_struct(_st_LHH)
         return obj
 
     def __eq__(self, other):
@@ -14767,31 +13131,24 @@ class switch_config_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = switch_config_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 10)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -14845,33 +13202,24 @@ class table_desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 14)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_desc.unpack)
         return obj
 
@@ -14921,32 +13269,23 @@ class table_desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_desc_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 14)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -14995,31 +13334,24 @@ class table_features_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 13)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -15073,33 +13405,24 @@ class table_features_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 12)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_features.unpack)
         return obj
 
@@ -15153,33 +13476,24 @@ class table_features_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 12)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_features.unpack)
         return obj
 
@@ -15236,32 +13550,23 @@ class table_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.config))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LB3xL.pack(self.xid, self.table_id, self.config))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.config = reader.read("!L")[0]
+        (obj.xid, obj.table_id, obj.config) = reader.read_struct(_st_LB3xL)
         obj.properties = loxi.generic_util.unpack_list(reader, table_mod_prop.table_mod_prop.unpack)
         return obj
 
@@ -15319,31 +13624,24 @@ class table_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        (obj.xid, _err_type, obj.code) = reader.read_struct(_st_LHH)
         assert(_err_type == 8)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -15397,33 +13695,24 @@ class table_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_reply()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, common.table_stats_entry.unpack)
         return obj
 
@@ -15473,32 +13762,23 @@ class table_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LHH4x.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_request()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        (obj.xid, _stats_type, obj.flags) = reader.read_struct(_st_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -15550,32 +13830,23 @@ class table_status(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
+        packed.append(_st_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_st_LLB7x.pack(self.xid, self.role, self.reason))
         packed.append(self.table.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_status()
-        _version = reader.read("!B")[0]
+        (_version, _type, _length) = reader.read_struct(_st_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 31)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        (obj.xid, obj.role, obj.reason) = reader.read_struct(_st_LLB7x)
         obj.table = common.table_desc.unpack(reader)
         return obj
 
@@ -30,6 +30,19 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_L = struct.Struct("!L")
+_st_L16s = struct.Struct("!L16s")
+_st_L16s16s = struct.Struct("!L16s16s")
+_st_LB = struct.Struct("!LB")
+_st_LBB = struct.Struct("!LBB")
+_st_LH = struct.Struct("!LH")
+_st_LHH = struct.Struct("!LHH")
+_st_LL = struct.Struct("!LL")
+_st_LLL = struct.Struct("!LLL")
+_st_LQ = struct.Struct("!LQ")
+_st_LQQ = struct.Struct("!LQQ")
+
 class oxm(loxi.OFObject):
     subtypes = {}
 
@@ -43,7 +56,7 @@ class oxm(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         return ''.join(packed)
 
     @staticmethod
@@ -83,16 +96,14 @@ class arp_op(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147494402)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -128,18 +139,14 @@ class arp_op_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147494660)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -175,14 +182,14 @@ class arp_sha(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_sha()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147495942)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -220,7 +227,7 @@ class arp_sha_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -228,7 +235,7 @@ class arp_sha_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = arp_sha_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496204)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -267,16 +274,14 @@ class arp_spa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147494916)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -312,18 +317,14 @@ class arp_spa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147495176)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -359,14 +360,14 @@ class arp_tha(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tha()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496454)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -404,7 +405,7 @@ class arp_tha_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -412,7 +413,7 @@ class arp_tha_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = arp_tha_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496716)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -451,16 +452,14 @@ class arp_tpa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147495428)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -496,18 +495,14 @@ class arp_tpa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147495688)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -543,16 +538,14 @@ class bsn_egr_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 200196)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -588,18 +581,14 @@ class bsn_egr_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 200456)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -635,14 +624,14 @@ class bsn_in_ports_128(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_bitmap_128(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_in_ports_128()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 196624)
         obj.value = util.unpack_bitmap_128(reader)
         return obj
@@ -680,7 +669,7 @@ class bsn_in_ports_128_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_bitmap_128(self.value))
         packed.append(util.pack_bitmap_128(self.value_mask))
         return ''.join(packed)
@@ -688,7 +677,7 @@ class bsn_in_ports_128_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = bsn_in_ports_128_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 196896)
         obj.value = util.unpack_bitmap_128(reader)
         obj.value_mask = util.unpack_bitmap_128(reader)
@@ -727,16 +716,14 @@ class bsn_l3_interface_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 198660)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -772,18 +759,14 @@ class bsn_l3_interface_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 198920)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -819,16 +802,14 @@ class bsn_l3_src_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 199172)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -864,18 +845,14 @@ class bsn_l3_src_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 199432)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -911,16 +888,14 @@ class bsn_lag_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 197124)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -956,18 +931,14 @@ class bsn_lag_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 197384)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1003,16 +974,14 @@ class bsn_tcp_flags(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 204802)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1048,18 +1017,14 @@ class bsn_tcp_flags_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 205060)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1095,16 +1060,14 @@ class bsn_udf0(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 200708)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1140,18 +1103,14 @@ class bsn_udf0_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 200968)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1187,16 +1146,14 @@ class bsn_udf1(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 201220)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1232,18 +1189,14 @@ class bsn_udf1_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 201480)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1279,16 +1232,14 @@ class bsn_udf2(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 201732)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1324,18 +1275,14 @@ class bsn_udf2_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 201992)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1371,16 +1318,14 @@ class bsn_udf3(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 202244)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1416,18 +1361,14 @@ class bsn_udf3_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 202504)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1463,16 +1404,14 @@ class bsn_udf4(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 202756)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1508,18 +1447,14 @@ class bsn_udf4_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 203016)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1555,16 +1490,14 @@ class bsn_udf5(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 203268)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1600,18 +1533,14 @@ class bsn_udf5_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 203528)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1647,16 +1576,14 @@ class bsn_udf6(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 203780)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1692,18 +1619,14 @@ class bsn_udf6_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 204040)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1739,16 +1662,14 @@ class bsn_udf7(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 204292)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1784,18 +1705,14 @@ class bsn_udf7_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 204552)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1831,16 +1748,14 @@ class bsn_vlan_xlate_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 205316)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1876,18 +1791,14 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 205576)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1923,16 +1834,14 @@ class bsn_vrf(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 197636)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1968,18 +1877,14 @@ class bsn_vrf_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 197896)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2015,14 +1920,14 @@ class eth_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485190)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -2060,7 +1965,7 @@ class eth_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -2068,7 +1973,7 @@ class eth_dst_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = eth_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485452)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -2107,14 +2012,14 @@ class eth_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_src()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485702)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -2152,7 +2057,7 @@ class eth_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -2160,7 +2065,7 @@ class eth_src_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = eth_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147485964)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -2199,16 +2104,14 @@ class eth_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147486210)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2244,18 +2147,14 @@ class eth_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147486468)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2291,16 +2190,14 @@ class icmpv4_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147493889)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2336,18 +2233,14 @@ class icmpv4_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147494146)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2383,16 +2276,14 @@ class icmpv4_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147493377)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2428,18 +2319,14 @@ class icmpv4_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147493634)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2475,16 +2362,14 @@ class icmpv6_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147499009)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2520,18 +2405,14 @@ class icmpv6_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147499266)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2567,16 +2448,14 @@ class icmpv6_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147498497)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2612,18 +2491,14 @@ class icmpv6_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147498754)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2659,14 +2534,14 @@ class in_phy_port(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = in_phy_port()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147484164)
         obj.value = util.unpack_port_no(reader)
         return obj
@@ -2704,7 +2579,7 @@ class in_phy_port_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         packed.append(util.pack_port_no(self.value_mask))
         return ''.join(packed)
@@ -2712,7 +2587,7 @@ class in_phy_port_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = in_phy_port_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147484424)
         obj.value = util.unpack_port_no(reader)
         obj.value_mask = util.unpack_port_no(reader)
@@ -2751,14 +2626,14 @@ class in_port(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = in_port()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147483652)
         obj.value = util.unpack_port_no(reader)
         return obj
@@ -2796,7 +2671,7 @@ class in_port_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(util.pack_port_no(self.value))
         packed.append(util.pack_port_no(self.value_mask))
         return ''.join(packed)
@@ -2804,7 +2679,7 @@ class in_port_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = in_port_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147483912)
         obj.value = util.unpack_port_no(reader)
         obj.value_mask = util.unpack_port_no(reader)
@@ -2843,16 +2718,14 @@ class ip_dscp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147487745)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2888,18 +2761,14 @@ class ip_dscp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147488002)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2935,16 +2804,14 @@ class ip_ecn(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147488257)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2980,18 +2847,14 @@ class ip_ecn_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147488514)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3027,16 +2890,14 @@ class ip_proto(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147488769)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3072,18 +2933,14 @@ class ip_proto_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147489026)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3119,16 +2976,14 @@ class ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147489796)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3164,18 +3019,14 @@ class ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147490056)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3211,16 +3062,14 @@ class ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147489284)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3256,18 +3105,14 @@ class ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147489544)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3303,14 +3148,13 @@ class ipv6_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497488)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -3348,15 +3192,13 @@ class ipv6_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497760)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -3395,16 +3237,14 @@ class ipv6_exthdr(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_exthdr()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147503618)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3440,18 +3280,14 @@ class ipv6_exthdr_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_exthdr_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147503876)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3487,16 +3323,14 @@ class ipv6_flabel(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147497988)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3532,18 +3366,14 @@ class ipv6_flabel_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147498248)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3579,14 +3409,14 @@ class ipv6_nd_sll(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_sll()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500038)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -3624,7 +3454,7 @@ class ipv6_nd_sll_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -3632,7 +3462,7 @@ class ipv6_nd_sll_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_sll_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500300)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -3671,14 +3501,13 @@ class ipv6_nd_target(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_target()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147499536)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -3716,15 +3545,13 @@ class ipv6_nd_target_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_target_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147499808)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -3763,14 +3590,14 @@ class ipv6_nd_tll(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_tll()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500550)
         obj.value = list(reader.read('!6B'))
         return obj
@@ -3808,7 +3635,7 @@ class ipv6_nd_tll_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
+        packed.append(_st_L.pack(self.type_len))
         packed.append(struct.pack("!6B", *self.value))
         packed.append(struct.pack("!6B", *self.value_mask))
         return ''.join(packed)
@@ -3816,7 +3643,7 @@ class ipv6_nd_tll_masked(oxm):
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_tll_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147500812)
         obj.value = list(reader.read('!6B'))
         obj.value_mask = list(reader.read('!6B'))
@@ -3855,14 +3682,13 @@ class ipv6_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
+        packed.append(_st_L16s.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_src()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147496976)
         obj.value = reader.read('!16s')[0]
         return obj
@@ -3900,15 +3726,13 @@ class ipv6_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
+        packed.append(_st_L16s16s.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len = reader.read_struct(_st_L)[0]
         assert(_type_len == 2147497248)
         obj.value = reader.read('!16s')[0]
         obj.value_mask = reader.read('!16s')[0]
@@ -3947,16 +3771,14 @@ class metadata(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_LQ.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LQ)
         assert(_type_len == 2147484680)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -3992,18 +3814,14 @@ class metadata_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
+        packed.append(_st_LQQ.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LQQ)
         assert(_type_len == 2147484944)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4039,16 +3857,14 @@ class mpls_bos(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_bos()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147502081)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4084,18 +3900,14 @@ class mpls_bos_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_bos_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147502338)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4131,16 +3943,14 @@ class mpls_label(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 2147501060)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4176,18 +3986,14 @@ class mpls_label_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 2147501320)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4223,16 +4029,14 @@ class mpls_tc(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147501569)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4268,18 +4072,14 @@ class mpls_tc_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147501826)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4315,16 +4115,14 @@ class pbb_uca(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = pbb_uca()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147504641)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4360,18 +4158,14 @@ class pbb_uca_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = pbb_uca_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147504898)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4407,16 +4201,14 @@ class sctp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147492866)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4452,18 +4244,14 @@ class sctp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147493124)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4499,16 +4287,14 @@ class sctp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147492354)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4544,18 +4330,14 @@ class sctp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147492612)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4591,16 +4373,14 @@ class tcp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147490818)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4636,18 +4416,14 @@ class tcp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147491076)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4683,16 +4459,14 @@ class tcp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147490306)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4728,18 +4502,14 @@ class tcp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147490564)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4775,16 +4545,14 @@ class tunnel_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_st_LQ.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_id()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LQ)
         assert(_type_len == 2147503112)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4820,18 +4588,14 @@ class tunnel_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
+        packed.append(_st_LQQ.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_id_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LQQ)
         assert(_type_len == 2147503376)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4867,16 +4631,14 @@ class tunnel_ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 81924)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4912,18 +4674,14 @@ class tunnel_ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 82184)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4959,16 +4717,14 @@ class tunnel_ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_st_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LL)
         assert(_type_len == 81412)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5004,18 +4760,14 @@ class tunnel_ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_st_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LLL)
         assert(_type_len == 81672)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5051,16 +4803,14 @@ class udp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147491842)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5096,18 +4846,14 @@ class udp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147492100)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5143,16 +4889,14 @@ class udp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147491330)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5188,18 +4932,14 @@ class udp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147491588)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5235,16 +4975,14 @@ class vlan_pcp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_st_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LB)
         assert(_type_len == 2147487233)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5280,18 +5018,14 @@ class vlan_pcp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_st_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LBB)
         assert(_type_len == 2147487490)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5327,16 +5061,14 @@ class vlan_vid(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_st_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value) = reader.read_struct(_st_LH)
         assert(_type_len == 2147486722)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5372,18 +5104,14 @@ class vlan_vid_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_st_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid_masked()
-        _type_len = reader.read("!L")[0]
+        (_type_len, obj.value, obj.value_mask) = reader.read_struct(_st_LHH)
         assert(_type_len == 2147486980)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
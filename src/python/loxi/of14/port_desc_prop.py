@@ -30,6 +30,13 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_4xLLLLLL = struct.Struct("!4xLLLLLL")
+_st_4xLLLLLLLLL = struct.Struct("!4xLLLLLLLLL")
+_st_H = struct.Struct("!H")
+_st_HH = struct.Struct("!HH")
+_st_LL = struct.Struct("!LL")
+
 class port_desc_prop(loxi.OFObject):
     subtypes = {}
 
@@ -43,7 +50,7 @@ class port_desc_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -109,15 +116,9 @@ class ethernet(port_desc_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        packed.append(struct.pack("!L", self.curr_speed))
-        packed.append(struct.pack("!L", self.max_speed))
+        packed.append(_st_4xLLLLLL.pack(self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -125,18 +126,11 @@ class ethernet(port_desc_prop):
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        reader.skip(4)
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
-        obj.curr_speed = reader.read("!L")[0]
-        obj.max_speed = reader.read("!L")[0]
+        (obj.curr, obj.advertised, obj.supported, obj.peer, obj.curr_speed, obj.max_speed) = reader.read_struct(_st_4xLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -194,10 +188,9 @@ class experimenter(port_desc_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_st_LL.pack(self.experimenter, self.exp_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -281,18 +274,9 @@ class optical(port_desc_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.tx_min_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_max_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_grid_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_min_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_max_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_grid_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_pwr_min))
-        packed.append(struct.pack("!L", self.tx_pwr_max))
+        packed.append(_st_4xLLLLLLLLL.pack(self.supported, self.tx_min_freq_lmda, self.tx_max_freq_lmda, self.tx_grid_freq_lmda, self.rx_min_freq_lmda, self.rx_max_freq_lmda, self.rx_grid_freq_lmda, self.tx_pwr_min, self.tx_pwr_max))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -300,21 +284,11 @@ class optical(port_desc_prop):
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        reader.skip(4)
-        obj.supported = reader.read("!L")[0]
-        obj.tx_min_freq_lmda = reader.read("!L")[0]
-        obj.tx_max_freq_lmda = reader.read("!L")[0]
-        obj.tx_grid_freq_lmda = reader.read("!L")[0]
-        obj.rx_min_freq_lmda = reader.read("!L")[0]
-        obj.rx_max_freq_lmda = reader.read("!L")[0]
-        obj.rx_grid_freq_lmda = reader.read("!L")[0]
-        obj.tx_pwr_min = reader.read("!L")[0]
-        obj.tx_pwr_max = reader.read("!L")[0]
+        (obj.supported, obj.tx_min_freq_lmda, obj.tx_max_freq_lmda, obj.tx_grid_freq_lmda, obj.rx_min_freq_lmda, obj.rx_max_freq_lmda, obj.rx_grid_freq_lmda, obj.tx_pwr_min, obj.tx_pwr_max) = reader.read_struct(_st_4xLLLLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -30,6 +30,13 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_H = struct.Struct("!H")
+_st_HH = struct.Struct("!HH")
+_st_L = struct.Struct("!L")
+_st_LL = struct.Struct("!LL")
+_st_LLLLL = struct.Struct("!LLLLL")
+
 class port_mod_prop(loxi.OFObject):
     subtypes = {}
 
@@ -43,7 +50,7 @@ class port_mod_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -89,9 +96,9 @@ class ethernet(port_mod_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.advertise))
+        packed.append(_st_L.pack(self.advertise))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -99,12 +106,11 @@ class ethernet(port_mod_prop):
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.advertise = reader.read("!L")[0]
+        obj.advertise = reader.read_struct(_st_L)[0]
         return obj
 
     def __eq__(self, other):
@@ -142,10 +148,9 @@ class experimenter(port_mod_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_st_LL.pack(self.experimenter, self.exp_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -213,13 +218,9 @@ class optical(port_mod_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.configure))
-        packed.append(struct.pack("!L", self.freq_ldma))
-        packed.append(struct.pack("!L", self.fl_offset))
-        packed.append(struct.pack("!L", self.grid_span))
-        packed.append(struct.pack("!L", self.tx_pwr))
+        packed.append(_st_LLLLL.pack(self.configure, self.freq_ldma, self.fl_offset, self.grid_span, self.tx_pwr))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -227,16 +228,11 @@ class optical(port_mod_prop):
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.configure = reader.read("!L")[0]
-        obj.freq_ldma = reader.read("!L")[0]
-        obj.fl_offset = reader.read("!L")[0]
-        obj.grid_span = reader.read("!L")[0]
-        obj.tx_pwr = reader.read("!L")[0]
+        (obj.configure, obj.freq_ldma, obj.fl_offset, obj.grid_span, obj.tx_pwr) = reader.read_struct(_st_LLLLL)
         return obj
 
     def __eq__(self, other):
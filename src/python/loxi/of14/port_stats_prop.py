@@ -30,6 +30,13 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_4xLLLLLLLHHHH = struct.Struct("!4xLLLLLLLHHHH")
+_st_4xQQQQ = struct.Struct("!4xQQQQ")
+_st_H = struct.Struct("!H")
+_st_HH = struct.Struct("!HH")
+_st_LL = struct.Struct("!LL")
+
 class port_stats_prop(loxi.OFObject):
     subtypes = {}
 
@@ -43,7 +50,7 @@ class port_stats_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -101,13 +108,9 @@ class ethernet(port_stats_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
+        packed.append(_st_4xQQQQ.pack(self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -115,16 +118,11 @@ class ethernet(port_stats_prop):
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        reader.skip(4)
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        (obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions) = reader.read_struct(_st_4xQQQQ)
         return obj
 
     def __eq__(self, other):
@@ -178,10 +176,9 @@ class experimenter(port_stats_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_st_LL.pack(self.experimenter, self.exp_type))
         packed.append(self.experimenter_data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -279,20 +276,9 @@ class optical(port_stats_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.flags))
-        packed.append(struct.pack("!L", self.tx_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_offset))
-        packed.append(struct.pack("!L", self.tx_grid_span))
-        packed.append(struct.pack("!L", self.rx_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_offset))
-        packed.append(struct.pack("!L", self.rx_grid_span))
-        packed.append(struct.pack("!H", self.tx_pwr))
-        packed.append(struct.pack("!H", self.rx_pwr))
-        packed.append(struct.pack("!H", self.bias_current))
-        packed.append(struct.pack("!H", self.temperature))
+        packed.append(_st_4xLLLLLLLHHHH.pack(self.flags, self.tx_freq_lmda, self.tx_offset, self.tx_grid_span, self.rx_freq_lmda, self.rx_offset, self.rx_grid_span, self.tx_pwr, self.rx_pwr, self.bias_current, self.temperature))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -300,23 +286,11 @@ class optical(port_stats_prop):
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        reader.skip(4)
-        obj.flags = reader.read("!L")[0]
-        obj.tx_freq_lmda = reader.read("!L")[0]
-        obj.tx_offset = reader.read("!L")[0]
-        obj.tx_grid_span = reader.read("!L")[0]
-        obj.rx_freq_lmda = reader.read("!L")[0]
-        obj.rx_offset = reader.read("!L")[0]
-        obj.rx_grid_span = reader.read("!L")[0]
-        obj.tx_pwr = reader.read("!H")[0]
-        obj.rx_pwr = reader.read("!H")[0]
-        obj.bias_current = reader.read("!H")[0]
-        obj.temperature = reader.read("!H")[0]
+        (obj.flags, obj.tx_freq_lmda, obj.tx_offset, obj.tx_grid_span, obj.rx_freq_lmda, obj.rx_offset, obj.rx_grid_span, obj.tx_pwr, obj.rx_pwr, obj.bias_current, obj.temperature) = reader.read_struct(_st_4xLLLLLLLHHHH)
         return obj
 
     def __eq__(self, other):
@@ -30,6 +30,12 @@ import action_id
 import util
 import loxi.generic_util
 
+# Precompiled struct codecs (see tools/loxi-struct-codecs.py)
+_st_H = struct.Struct("!H")
+_st_H2x = struct.Struct("!H2x")
+_st_HH = struct.Struct("!HH")
+_st_LL = struct.Struct("!LL")
+
 class queue_desc_prop(loxi.OFObject):
     subtypes = {}
 
@@ -43,7 +49,7 @@ class queue_desc_prop(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -95,10 +101,9 @@ class experimenter(queue_desc_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_st_LL.pack(self.experimenter, self.exp_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -150,10 +155,9 @@ class max_rate(queue_desc_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -161,13 +165,11 @@ class max_rate(queue_desc_prop):
     @staticmethod
     def unpack(reader):
         obj = max_rate()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.rate = reader.read("!H")[0]
-        reader.skip(2)
+        obj.rate = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
@@ -199,10 +201,9 @@ class min_rate(queue_desc_prop):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.type))
+        packed.append(_st_H.pack(self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 2)
+        packed.append(_st_H2x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -210,13 +211,11 @@ class min_rate(queue_desc_prop):
     @staticmethod
     def unpack(reader):
         obj = min_rate()
-        _type = reader.read("!H")[0]
+        (_type, _length) = reader.read_struct(_st_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.rate = reader.read("!H")[0]
-        reader.skip(2)
+        obj.rate = reader.read_struct(_st_H2x)[0]
         return obj
 
     def __eq__(self, other):
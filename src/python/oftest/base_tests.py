@@ -13,13 +13,93 @@ import oftest
 from oftest import config
 import oftest.controller as controller
 import oftest.dataplane as dataplane
+import oftest.testutils as testutils
 import ofp
 
+##@var shared_controller
+# Connected controller parked between tests when controller_reuse is set.
+# Only an idle controller is kept here; a test owns its controller from
+# setUp until tearDown.
+shared_controller = None
+
+def take_shared_controller():
+    """
+    Remove the parked controller and return it if it is still connected
+
+    @returns A Controller, or None
+    """
+    global shared_controller
+    ctrl = shared_controller
+    shared_controller = None
+    if ctrl and not (ctrl.active and ctrl.switch_socket):
+        ctrl.shutdown()
+        ctrl.join()
+        ctrl = None
+    return ctrl
+
+def park_controller(ctrl):
+    """
+    Clean up the switch after a test and keep its controller for the next
+
+    Flows and groups are deleted and a barrier completed first. If that
+    fails the controller is shut down instead. Messages the cleanup caused,
+    like flow_removed, are dropped afterwards.
+    """
+    global shared_controller
+    release_shared_controller()
+    try:
+        ctrl.reset()
+        testutils.delete_all_flows(ctrl, send_barrier=False)
+        if ofp.OFP_VERSION >= 2:
+            testutils.delete_all_groups(ctrl)
+        else:
+            testutils.do_barrier(ctrl)
+    except Exception:
+        logging.warn("Switch cleanup failed, not reusing the connection")
+        ctrl.shutdown()
+        ctrl.join()
+        return
+    ctrl.clear_queue()
+    shared_controller = ctrl
+
+def release_shared_controller():
+    """
+    Shut down the parked controller, if any, freeing the listen port
+    """
+    ctrl = take_shared_controller()
+    if ctrl:
+        ctrl.shutdown()
+        ctrl.join()
+
+def unshare_controller(test):
+    """
+    Make a test that is not derived from BaseTest release the parked
+    controller before its own setUp, since it will usually create its own
+    controllers on the same port
+    """
+    setup = test.setUp
+    def setUp():
+        release_shared_controller()
+        setup()
+    test.setUp = setUp
+
+def pcap_filename(name):
+    """
+    Return the name of a test's packet capture file in the log directory
+    """
+    if config["pcapng"]:
+        return os.path.join(config["log_dir"], name) + ".pcapng"
+    else:
+        return os.path.join(config["log_dir"], name) + ".pcap"
+
 class BaseTest(unittest.TestCase):
     def __str__(self):
         return self.id().replace('.runTest', '')
 
     def setUp(self):
+        # Tests that set up their own controller need the listen port.
+        # SimpleProtocol takes the parked controller before getting here.
+        release_shared_controller()
         oftest.open_logfile(str(self))
         logging.info("** START TEST CASE " + str(self))
 
@@ -29,21 +109,48 @@ class BaseTest(unittest.TestCase):
 class SimpleProtocol(BaseTest):
     """
     Root class for setting up the controller
+
+    With the controller_reuse option the connection is kept open after
+    tearDown and handed to the next test, unless the test sent a role or
+    async config request. Tests can set reuse_controller to False to
+    always start the next test on a fresh connection.
+
+    Only controllers set up by SimpleProtocol.setUp are kept. Subclasses
+    that override setUp to build their own controller go through
+    BaseTest.setUp, which shuts down the parked one, and their controller
+    is shut down after the test.
+
+    @var controller_shareable True if the controller was set up by
+    SimpleProtocol.setUp and so may be handed to the next test
     """
 
+    reuse_controller = True
+    controller_shareable = False
+
     def setUp(self):
+        ctrl = take_shared_controller()
         BaseTest.setUp(self)
 
-        self.controller = controller.Controller(
-            switch=config["switch_ip"],
-            host=config["controller_host"],
-            port=config["controller_port"])
-        self.controller.start()
+        if ctrl:
+            logging.info("Reusing connection to " + str(ctrl.switch_addr))
+            # Drop messages that arrived while the controller was parked
+            ctrl.clear_queue()
+            self.controller = ctrl
+        else:
+            self.controller = controller.Controller(
+                switch=config["switch_ip"],
+                host=config["controller_host"],
+                port=config["controller_port"],
+                use_epoll=config.get("controller_epoll", False),
+                handler_workers=config.get("controller_handler_workers", 0),
+                max_connections=config.get("controller_max_connections", 1))
+            self.controller.start()
 
         try:
             #@todo Add an option to wait for a pkt transaction to ensure version
             # compatibilty?
-            self.controller.connect(timeout=20)
+            if not ctrl:
+                self.controller.connect(timeout=20)
 
             # By default, respond to echo requests
             self.controller.keep_alive = True
@@ -64,6 +171,7 @@ class SimpleProtocol(BaseTest):
             self.controller.kill()
             del self.controller
             raise
+        self.controller_shareable = True
 
     def inheritSetup(self, parent):
         """
@@ -86,8 +194,13 @@ class SimpleProtocol(BaseTest):
         self.supported_actions = parent.supported_actions
         
     def tearDown(self):
-        self.controller.shutdown()
-        self.controller.join()
+        if config.get("controller_reuse", False) and self.reuse_controller and \
+                self.controller_shareable and self.controller.active and self.controller.switch_socket and \
+                not self.controller.session_changed:
+            park_controller(self.controller)
+        else:
+            self.controller.shutdown()
+            self.controller.join()
         del self.controller
         BaseTest.tearDown(self)
 
@@ -99,14 +212,21 @@ class SimpleProtocol(BaseTest):
 class SimpleDataPlane(SimpleProtocol):
     """
     Root class that sets up the controller and dataplane
+
+    @var dataplane_filter Filter expression (see oftest.bpf) used on the
+    dataplane ports during this test instead of the configured one
     """
+
+    dataplane_filter = None
+
     def setUp(self):
         SimpleProtocol.setUp(self)
         self.dataplane = oftest.dataplane_instance
+        if self.dataplane_filter != None:
+            self.dataplane.set_filter(self.dataplane_filter)
         self.dataplane.flush()
         if config["log_dir"] != None:
-            filename = os.path.join(config["log_dir"], str(self)) + ".pcap"
-            self.dataplane.start_pcap(filename)
+            self.dataplane.start_pcap(pcap_filename(str(self)))
 
     def inheritSetup(self, parent):
         """
@@ -120,12 +240,16 @@ class SimpleDataPlane(SimpleProtocol):
     def tearDown(self):
         if config["log_dir"] != None:
             self.dataplane.stop_pcap()
+        self.dataplane.reset_filters()
         SimpleProtocol.tearDown(self)
 
 		
 class EncryptedProtocol(SimpleProtocol):
     """
     """
+
+    reuse_controller = False
+
     def setUp(self):
         BaseTest.setUp(self)
 
@@ -143,7 +267,10 @@ class EncryptedProtocol(SimpleProtocol):
             host=config["controller_host"],
             port=config["controller_port"],
             keyfile=config["keyfile"],
-            certfile=config["certfile"])
+            certfile=config["certfile"],
+            use_epoll=config.get("controller_epoll", False),
+            handler_workers=config.get("controller_handler_workers", 0),
+            max_connections=config.get("controller_max_connections", 1))
         self.controller.start()
 
         try:
@@ -172,17 +299,23 @@ class EncryptedProtocol(SimpleProtocol):
 class DataPlaneOnly(BaseTest):
     """
     Root class that sets up only the dataplane
+
+    @var dataplane_filter See SimpleDataPlane
     """
 
+    dataplane_filter = None
+
     def setUp(self):
         BaseTest.setUp(self)
         self.dataplane = oftest.dataplane_instance
+        if self.dataplane_filter != None:
+            self.dataplane.set_filter(self.dataplane_filter)
         self.dataplane.flush()
         if config["log_dir"] != None:
-            filename = os.path.join(config["log_dir"], str(self)) + ".pcap"
-            self.dataplane.start_pcap(filename)
+            self.dataplane.start_pcap(pcap_filename(str(self)))
 
     def tearDown(self):
         if config["log_dir"] != None:
             self.dataplane.stop_pcap()
+        self.dataplane.reset_filters()
         BaseTest.tearDown(self)
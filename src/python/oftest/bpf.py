@@ -0,0 +1,337 @@
+"""
+Classic BPF filters for dataplane ports
+
+Compiles a subset of the pcap-filter(7) expression language to classic BPF
+programs, which the dataplane attaches to its raw sockets so unwanted
+frames are dropped in the kernel before they reach the packet queues.
+Since the syntax is that of pcap, the same expressions can be handed to
+libpcap for the pypcap port class.
+
+Supported primitives, combined with and/&&, or/||, not/! and parentheses:
+
+    ether src|dst|host MAC      ether broadcast     ether multicast
+    ether proto N               ether[OFF:SIZE] & MASK = N   (or !=)
+    arp  ip  ip6  vlan          ip proto N  ip6 proto N  icmp  icmp6
+    tcp  udp                    [tcp|udp] [src|dst] port N
+
+Unlike pcap, vlan only checks the outer ethertype and does not shift the
+offsets of the primitives that follow it.
+"""
+
+import re
+
+# Instruction classes, sizes, modes and operations from linux/filter.h
+BPF_LD = 0x00
+BPF_LDX = 0x01
+BPF_ALU = 0x04
+BPF_JMP = 0x05
+BPF_RET = 0x06
+BPF_W = 0x00
+BPF_H = 0x08
+BPF_B = 0x10
+BPF_ABS = 0x20
+BPF_IND = 0x40
+BPF_MSH = 0xa0
+BPF_AND = 0x50
+BPF_JEQ = 0x10
+
+SIZES = { 1: BPF_B, 2: BPF_H, 4: BPF_W }
+
+# Length of frame a matching program accepts
+ACCEPT_LEN = 0x40000
+
+ETH_HDR_LEN = 14
+
+##@var DEFAULT_FILTER
+# Drops traffic the hosts on the dataplane links send on their own:
+# IEEE 802.1 link-local frames (STP, LLDP, LACP, 802.1X), IPv6 to
+# multicast MACs (neighbor discovery, MLD, mDNS, DHCPv6) and DHCP, mDNS,
+# LLMNR, NetBIOS and SSDP over IPv4.
+DEFAULT_FILTER = " and ".join([
+    "not (ether[0:4] = 0x0180c200 and ether[4:2] & 0xfff0 = 0)",
+    "not (ip6 and ether[0:2] = 0x3333)",
+    "not (ip and (udp port 67 or udp port 68 or udp port 5353 or "
+    "udp port 5355 or udp port 137 or udp port 138 or udp port 1900))",
+])
+
+TOKEN_RE = re.compile(r"\s*(?:([0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){5})|"
+                      r"(0x[0-9a-fA-F]+|\d+)|([a-z][a-z0-9]*)|(&&|\|\||!=|[()\[\]:&=!]))")
+
+def atom(size, offset, value, mask=None, negate=False, indexed=False):
+    """
+    Compare SIZE bytes at OFFSET, optionally masked, with VALUE
+
+    If indexed is set the offset is relative to the end of the IPv4 header.
+    """
+    return ("atom", size, offset, value, mask, negate, indexed)
+
+def ethertype(value):
+    return atom(2, 12, value)
+
+def mac_atom(offset, mac):
+    octets = [int(x, 16) for x in mac.split(":")]
+    return ("and",
+            atom(4, offset + 2, (octets[2] << 24) | (octets[3] << 16) | (octets[4] << 8) | octets[5]),
+            atom(2, offset, (octets[0] << 8) | octets[1]))
+
+def ip_proto(proto):
+    return ("and", ethertype(0x0800), atom(1, ETH_HDR_LEN + 9, proto))
+
+def ip6_proto(proto):
+    return ("and", ethertype(0x86dd), atom(1, ETH_HDR_LEN + 6, proto))
+
+def port_test(proto, direction, port):
+    """
+    Match TCP or UDP packets, over IPv4 or IPv6, with the given port
+    """
+    offsets = { "src": [0], "dst": [2], None: [0, 2] }[direction]
+
+    v4 = None
+    v6 = None
+    for offset in offsets:
+        t4 = atom(2, ETH_HDR_LEN + offset, port, indexed=True)
+        t6 = atom(2, ETH_HDR_LEN + 40 + offset, port)
+        v4 = v4 and ("or", v4, t4) or t4
+        v6 = v6 and ("or", v6, t6) or t6
+    # Only the first fragment of an IPv4 packet has the ports
+    first_fragment = atom(2, ETH_HDR_LEN + 6, 0, mask=0x1fff)
+    return ("or",
+            ("and", ip_proto(proto), ("and", first_fragment, v4)),
+            ("and", ip6_proto(proto), v6))
+
+class Parser(object):
+    """
+    Recursive descent parser from a filter expression to a tree of
+    ("and", a, b), ("or", a, b), ("not", a) and atom nodes
+    """
+
+    def __init__(self, expr):
+        self.expr = expr
+        self.tokens = []
+        pos = 0
+        expr = expr.strip()
+        while pos < len(expr):
+            m = TOKEN_RE.match(expr, pos)
+            if not m:
+                self.error("unexpected character %r" % expr[pos])
+            self.tokens.append(m.group(m.lastindex))
+            pos = m.end()
+        self.pos = 0
+
+    def error(self, msg):
+        raise ValueError("Bad filter expression %r: %s" % (self.expr, msg))
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None
+
+    def next(self):
+        token = self.peek()
+        if token == None:
+            self.error("unexpected end")
+        self.pos += 1
+        return token
+
+    def expect(self, token):
+        if self.next() != token:
+            self.error("expected %r" % token)
+
+    def number(self):
+        token = self.next()
+        try:
+            return int(token, 0)
+        except ValueError:
+            self.error("expected a number, got %r" % token)
+
+    def mac(self):
+        token = self.next()
+        if not re.match(r"^[0-9a-fA-F]{2}(:[0-9a-fA-F]{2}){5}$", token):
+            self.error("expected a MAC address, got %r" % token)
+        return token
+
+    def parse(self):
+        tree = self.parse_or()
+        if self.peek() != None:
+            self.error("unexpected %r" % self.peek())
+        return tree
+
+    def parse_or(self):
+        tree = self.parse_and()
+        while self.peek() in ("or", "||"):
+            self.next()
+            tree = ("or", tree, self.parse_and())
+        return tree
+
+    def parse_and(self):
+        tree = self.parse_unary()
+        while self.peek() in ("and", "&&"):
+            self.next()
+            tree = ("and", tree, self.parse_unary())
+        return tree
+
+    def parse_unary(self):
+        token = self.next()
+        if token in ("not", "!"):
+            return ("not", self.parse_unary())
+        elif token == "(":
+            tree = self.parse_or()
+            self.expect(")")
+            return tree
+        elif token == "ether":
+            return self.parse_ether()
+        elif token in ("ip", "ip6"):
+            if self.peek() == "proto":
+                self.next()
+                return { "ip": ip_proto, "ip6": ip6_proto }[token](self.number())
+            return ethertype({ "ip": 0x0800, "ip6": 0x86dd }[token])
+        elif token == "arp":
+            return ethertype(0x0806)
+        elif token == "vlan":
+            return ethertype(0x8100)
+        elif token == "icmp":
+            return ip_proto(1)
+        elif token == "icmp6":
+            return ip6_proto(58)
+        elif token in ("tcp", "udp"):
+            proto = { "tcp": 6, "udp": 17 }[token]
+            if self.peek() in ("src", "dst", "port"):
+                return port_test(proto, *self.parse_port())
+            return ("or", ip_proto(proto), ip6_proto(proto))
+        elif token in ("src", "dst", "port"):
+            self.pos -= 1
+            (direction, port) = self.parse_port()
+            return ("or", port_test(6, direction, port), port_test(17, direction, port))
+        else:
+            self.error("unknown primitive %r" % token)
+
+    def parse_port(self):
+        """
+        Parse [src|dst] port N
+        @returns (direction or None, port number)
+        """
+        direction = None
+        if self.peek() in ("src", "dst"):
+            direction = self.next()
+        self.expect("port")
+        return (direction, self.number())
+
+    def parse_ether(self):
+        token = self.next()
+        if token == "proto":
+            return ethertype(self.number())
+        elif token == "src":
+            return mac_atom(6, self.mac())
+        elif token == "dst":
+            return mac_atom(0, self.mac())
+        elif token == "host":
+            mac = self.mac()
+            return ("or", mac_atom(6, mac), mac_atom(0, mac))
+        elif token == "broadcast":
+            return mac_atom(0, "ff:ff:ff:ff:ff:ff")
+        elif token == "multicast":
+            return atom(1, 0, 1, mask=1)
+        elif token == "[":
+            offset = self.number()
+            size = 1
+            if self.peek() == ":":
+                self.next()
+                size = self.number()
+                if size not in SIZES:
+                    self.error("size must be 1, 2 or 4")
+            self.expect("]")
+            mask = None
+            if self.peek() == "&":
+                self.next()
+                mask = self.number()
+            op = self.next()
+            if op not in ("=", "!="):
+                self.error("expected = or !=")
+            return atom(size, offset, self.number(), mask, op == "!=")
+        else:
+            self.error("unknown ether primitive %r" % token)
+
+def parse(expr):
+    """
+    Parse a filter expression
+
+    @returns The expression tree
+    @raises ValueError If the expression is not supported
+    """
+    return Parser(expr).parse()
+
+def generate(tree, on_true, on_false, labels):
+    """
+    Return the instructions for a tree, jumping to label on_true or
+    on_false when its value is known
+
+    Instructions are (code, jt, jf, k) tuples whose jt and jf are labels,
+    and ("label", name) entries mark the jump targets.
+    """
+    kind = tree[0]
+    if kind == "and" or kind == "or":
+        labels.append(None)
+        middle = len(labels)
+        if kind == "and":
+            first = generate(tree[1], middle, on_false, labels)
+        else:
+            first = generate(tree[1], on_true, middle, labels)
+        return first + [("label", middle)] + generate(tree[2], on_true, on_false, labels)
+    elif kind == "not":
+        return generate(tree[1], on_false, on_true, labels)
+    else:
+        (_, size, offset, value, mask, negate, indexed) = tree
+        insns = []
+        if indexed:
+            insns.append((BPF_LDX | BPF_B | BPF_MSH, None, None, ETH_HDR_LEN))
+            insns.append((BPF_LD | SIZES[size] | BPF_IND, None, None, offset))
+        else:
+            insns.append((BPF_LD | SIZES[size] | BPF_ABS, None, None, offset))
+        if mask != None:
+            insns.append((BPF_ALU | BPF_AND, None, None, mask))
+        if negate:
+            insns.append((BPF_JMP | BPF_JEQ, on_false, on_true, value))
+        else:
+            insns.append((BPF_JMP | BPF_JEQ, on_true, on_false, value))
+        return insns
+
+_cache = {}
+
+def compile(expr):
+    """
+    Compile a filter expression to a classic BPF program
+
+    @param expr Filter expression, see the module documentation
+    @returns A list of (code, jt, jf, k) instructions that accepts the
+    frames matching expr
+    @raises ValueError If the expression is not supported
+    """
+    if expr in _cache:
+        return _cache[expr]
+
+    labels = []
+    insns = generate(parse(expr), "accept", "reject", labels)
+    insns += [("label", "accept"), (BPF_RET, None, None, ACCEPT_LEN),
+              ("label", "reject"), (BPF_RET, None, None, 0)]
+
+    # Resolve the labels to relative forward jumps
+    positions = {}
+    program = []
+    for insn in insns:
+        if insn[0] == "label":
+            positions[insn[1]] = len(program)
+        else:
+            program.append(insn)
+    result = []
+    for (pc, (code, jt, jf, k)) in enumerate(program):
+        if jt != None:
+            jt = positions[jt] - pc - 1
+            jf = positions[jf] - pc - 1
+            if jt > 255 or jf > 255:
+                raise ValueError("Filter expression %r is too long" % expr)
+        else:
+            jt = jf = 0
+        result.append((code, jt, jf, k))
+
+    _cache[expr] = result
+    return result
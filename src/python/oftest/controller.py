@@ -28,17 +28,24 @@ on an administrative socket and can shut down the socket might work.
 import ssl
 import sys
 import os
+import copy
 import socket
 import time
 import struct
 import select
+import errno
 import logging
+import Queue
+from collections import deque
+from contextlib import contextmanager
 from threading import Thread
+from threading import current_thread
 from threading import Lock
 from threading import Condition
 
 import ofutils
 import loxi
+import loxi.generic_util
 
 # Configured openflow version
 import ofp as cfg_ofp
@@ -64,7 +71,379 @@ def hex_dump_buffer(src, length=16):
 
 ##@todo Find a better home for these identifiers (controller)
 RCV_SIZE_DEFAULT = 32768
+TX_FLUSH_BYTES = 262144 # Write out corked messages once this much is queued
 LISTEN_QUEUE_SIZE = 1
+OFP_HEADER_LEN = 8
+
+# Message types that change switch state tied to the connection
+SESSION_MSG_TYPES = frozenset(getattr(cfg_ofp, name)
+                              for name in ("OFPT_ROLE_REQUEST", "OFPT_SET_ASYNC")
+                              if hasattr(cfg_ofp, name))
+
+_ofp_length = struct.Struct("!H")
+
+def ofp_frame_len(buf, offset):
+    """
+    Return the length of the OpenFlow message starting at offset in buf
+    """
+    return _ofp_length.unpack_from(buf, offset + 2)[0]
+
+class LazyMessage(object):
+    """
+    Mixin for received messages whose body has not been decoded yet
+
+    Instances are created by lazy_message() with the raw message and the
+    xid from the header. The first access to any other field decodes the
+    body and turns the object into a plain instance of the loxi class, so
+    messages that are dropped or only counted never pay for a full parse.
+    A body that fails to decode (loxi.ProtocolError for a short buffer)
+    raises the same exception at every access; the failure is reported
+    once to the error callback given to lazy_message().
+    """
+
+    def __getattr__(self, name):
+        # Only called for attributes not found normally
+        if name.startswith("__") or "_lazy_raw" not in self.__dict__:
+            raise AttributeError(name)
+        self._lazy_decode()
+        return getattr(self, name)
+
+    def _lazy_decode(self):
+        error = self.__dict__.get("_lazy_error")
+        if error != None:
+            raise error
+        klass = self._lazy_class
+        try:
+            msg = klass.unpack(loxi.generic_util.OFReader(self._lazy_raw))
+        except Exception as e:
+            # Keep the raw bytes so later accesses fail the same way
+            self.__dict__["_lazy_error"] = e
+            on_error = self.__dict__.pop("_lazy_on_error", None)
+            if on_error:
+                on_error(self, e)
+            raise
+        del self.__dict__["_lazy_raw"]
+        self.__dict__.pop("_lazy_on_error", None)
+        self.__dict__.update(msg.__dict__)
+        self.__class__ = klass
+
+    def __eq__(self, other):
+        # Being a subclass of klass, this is also tried first for
+        # "message == lazy", so both orders compare decoded messages
+        self._lazy_decode()
+        if isinstance(other, LazyMessage):
+            other._lazy_decode()
+        return self == other
+
+_lazy_classes = {}
+
+def lazy_message(klass, rawmsg, xid, on_error=None):
+    """
+    Return an undecoded instance of the loxi message class klass
+
+    The object is an instance of a subclass of klass with the same name,
+    so isinstance checks and class-based polling work before decoding.
+
+    @param on_error Optional callback, called with the message and the
+    exception if the body fails to decode
+    """
+    lazy_klass = _lazy_classes.get(klass)
+    if lazy_klass is None:
+        lazy_klass = type(klass.__name__, (LazyMessage, klass),
+                          { "_lazy_class": klass })
+        _lazy_classes[klass] = lazy_klass
+    msg = lazy_klass.__new__(lazy_klass)
+    msg.__dict__["_lazy_raw"] = rawmsg
+    if on_error:
+        msg.__dict__["_lazy_on_error"] = on_error
+    msg.xid = xid
+    return msg
+
+class MessageQueue(object):
+    """
+    Queue of received messages indexed by message class
+
+    Each concrete message class has its own FIFO, bounded at max_pkts, and
+    a global sequence number records arrival order across classes. Taking
+    the oldest message of a class, or the oldest message overall, does not
+    depend on how many other messages are queued.
+
+    Not thread safe; the controller protects it with packets_cv.
+
+    @var expired Dictionary from message class to number of messages
+    discarded because that class's queue was full
+    """
+
+    def __init__(self, max_pkts):
+        self.max_pkts = max_pkts
+        self.queues = {} # class -> deque of (seq, msg, rawmsg)
+        self.order = deque() # (seq, class) in arrival order; may be stale
+        self.seq = 0
+        self.count = 0
+        self.expired = {}
+        self._subclass_cache = {}
+
+    def __len__(self):
+        return self.count
+
+    def __nonzero__(self):
+        return self.count > 0
+
+    def __iter__(self):
+        """
+        Iterate over (msg, rawmsg) pairs in arrival order
+        """
+        entries = [e for q in self.queues.values() for e in q]
+        entries.sort(key=lambda e: e[0])
+        return ((msg, rawmsg) for (seq, msg, rawmsg) in entries)
+
+    def append(self, item):
+        """
+        Enqueue a (msg, rawmsg) pair
+
+        If the queue for the message's class is full its oldest entry is
+        discarded and counted in expired.
+        """
+        (msg, rawmsg) = item
+        klass = type(msg)
+        q = self.queues.get(klass)
+        if q is None:
+            q = self.queues[klass] = deque()
+        if len(q) >= self.max_pkts:
+            q.popleft()
+            self.count -= 1
+            self.expired[klass] = self.expired.get(klass, 0) + 1
+        self.seq += 1
+        q.append((self.seq, msg, rawmsg))
+        self.order.append((self.seq, klass))
+        self.count += 1
+
+        # Entries consumed through get() leave stale markers in order
+        if len(self.order) > 2 * self.count + self.max_pkts:
+            self._rebuild_order()
+
+    def _rebuild_order(self):
+        live = [(e[0], k) for (k, q) in self.queues.items() for e in q]
+        live.sort()
+        self.order = deque(live)
+
+    def _matching(self, klass):
+        """
+        Return the queued concrete classes that are klass or subclasses of it
+        """
+        result = []
+        for k in self.queues:
+            key = (k, klass)
+            match = self._subclass_cache.get(key)
+            if match is None:
+                match = self._subclass_cache[key] = issubclass(k, klass)
+            if match:
+                result.append(k)
+        return result
+
+    def get(self, klass=None):
+        """
+        Remove and return the oldest (msg, rawmsg) that is an instance of
+        klass, or the oldest of any class if klass is None.
+
+        @returns None if there is no such message
+        """
+        if klass is None:
+            while self.order:
+                (seq, k) = self.order.popleft()
+                q = self.queues.get(k)
+                if q and q[0][0] == seq:
+                    return self._take(q)
+            return None
+
+        best = None
+        for k in self._matching(klass):
+            q = self.queues[k]
+            if q and (best is None or q[0][0] < best[0][0]): #pylint: disable=E1136
+                best = q
+        if best is None:
+            return None
+        return self._take(best)
+
+    def _take(self, q):
+        (seq, msg, rawmsg) = q.popleft()
+        self.count -= 1
+        if self.count == 0:
+            self.order.clear()
+        return (msg, rawmsg)
+
+    def pop(self, index=0):
+        """
+        Remove and return the oldest (msg, rawmsg) pair
+
+        Provided for code that treated the queue as a list; only the
+        head of the queue can be popped.
+        """
+        if index != 0:
+            raise ValueError("only the oldest message can be popped")
+        item = self.get()
+        if item is None:
+            raise IndexError("pop from empty message queue")
+        return item
+
+    def clear(self):
+        self.queues = {}
+        self.order.clear()
+        self.count = 0
+
+    def expired_total(self):
+        return sum(self.expired.values())
+
+class Transaction(object):
+    """
+    An outstanding request in the controller's pending-transaction table
+
+    Collects the replies carrying the request's xid. A multipart reply is
+    complete when a part without OFPSF_REPLY_MORE arrives.
+
+    @var xid Transaction ID of the request
+    @var parts List of (msg, rawmsg) replies received so far
+    @var done True once the full reply has been received
+    """
+
+    def __init__(self, xid):
+        self.xid = xid
+        self.parts = []
+        self.done = False
+
+    def add(self, msg, rawmsg, more=False):
+        """
+        Record a reply
+
+        @param more True if this is a multipart reply with more parts to come
+        @returns True if the transaction is complete
+        """
+        self.parts.append((msg, rawmsg))
+        self.done = not more
+        return self.done
+
+    def response(self):
+        """
+        Return the reply as a pair (msg, rawmsg), or (None, None) if the
+        transaction has not completed.
+
+        The parts of a multipart reply are merged into a copy of the first
+        message: its entries are extended with those of the later parts and
+        OFPSF_REPLY_MORE is cleared. rawmsg is the concatenation of the raw
+        parts. If the reply ends with a message of another type, such as an
+        error, that message is returned on its own.
+        """
+        if not self.done:
+            return (None, None)
+        (msg, _) = self.parts[0]
+        (last, lastraw) = self.parts[-1]
+        if len(self.parts) == 1 or type(last) != type(msg):
+            return (last, lastraw)
+        msg = copy.copy(msg)
+        if hasattr(msg, "entries"):
+            entries = []
+            for (part, _) in self.parts:
+                entries.extend(part.entries)
+            msg.entries = entries
+        msg.flags = last.flags
+        return (msg, "".join(rawmsg for (_, rawmsg) in self.parts))
+
+class HandlerPool(object):
+    """
+    Bounded pool of threads that run message handlers
+
+    Each worker serves its own FIFO lane and a message type always maps to
+    the same lane, so handlers for one type run in arrival order while
+    different types proceed in parallel. When a lane is full submit()
+    blocks, which pushes back on the socket reader.
+
+    @var calls Number of handler jobs completed
+    @var latency_total Seconds from submit to completion, summed over calls
+    @var latency_max Largest submit to completion time seen
+    @var depth_max Largest number of jobs waiting in the pool at once
+    """
+
+    def __init__(self, workers, max_depth=1024):
+        self.lanes = [Queue.Queue(max_depth) for i in range(workers)]
+        self.logger = logging.getLogger("controller")
+        self.stopped = False
+        self.lock = Lock()
+        self.calls = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.depth_max = 0
+        self.threads = []
+        for lane in self.lanes:
+            t = Thread(target=self._worker, args=(lane,))
+            t.daemon = True
+            t.start()
+            self.threads.append(t)
+
+    def depth(self):
+        """
+        Return the number of jobs waiting or running
+        """
+        return sum(lane.qsize() for lane in self.lanes)
+
+    def latency_avg(self):
+        """
+        Return the mean submit to completion time in seconds
+        """
+        if not self.calls:
+            return 0.0
+        return self.latency_total / self.calls
+
+    def submit(self, key, fn, *args):
+        """
+        Run fn(*args) on the lane for key
+        """
+        lane = self.lanes[hash(key) % len(self.lanes)]
+        lane.put((time.time(), fn, args))
+        depth = self.depth()
+        if depth > self.depth_max:
+            self.depth_max = depth
+
+    def _worker(self, lane):
+        while True:
+            job = lane.get()
+            if job is None or self.stopped:
+                lane.task_done()
+                return
+            (start, fn, args) = job
+            try:
+                fn(*args)
+            except:
+                self.logger.exception("Message handler failed")
+            latency = time.time() - start
+            with self.lock:
+                self.calls += 1
+                self.latency_total += latency
+                if latency > self.latency_max:
+                    self.latency_max = latency
+            lane.task_done()
+
+    def join(self):
+        """
+        Wait until every submitted job has run
+        """
+        for lane in self.lanes:
+            lane.join()
+
+    def stop(self):
+        """
+        Make the workers exit; jobs still queued are dropped
+        """
+        if self.stopped:
+            return
+        self.stopped = True
+        for lane in self.lanes:
+            try:
+                lane.put_nowait(None)
+            except Queue.Full:
+                pass # The worker sees stopped after its current job
+        for t in self.threads:
+            if t is not current_thread():
+                t.join(1)
 
 class Controller(Thread):
     """
@@ -92,12 +471,31 @@ class Controller(Thread):
     @var host The host to use for connect
     @var port The port to connect on 
     @var packets_total Total number of packets received
-    @var packets_expired Number of packets popped from queue as queue full
+    @var packets_expired Number of packets popped from queue as queue full;
+    see packets.expired for the per message class breakdown
     @var packets_handled Number of packets handled by something
+    @var messages_received Number of OpenFlow messages parsed off the socket
+    @var wakeups Number of times the event loop returned with ready sockets
+    @var use_epoll If true, use an edge-triggered epoll event loop instead
+    of select
+    @var lazy_decode If true, messages whose class is known from the
+    header alone are decoded on first field access (see LazyMessage)
+    @var session_changed Set when a message that changes per-connection
+    switch state (role, async config) has been sent since the last reset
+    @var tx_writes Number of socket writes made for outgoing messages
+    @var handler_pool If not None, the HandlerPool that runs registered
+    handlers off the receive thread
+    @var max_connections Number of switch connections to accept; the first
+    is served by this object, the rest by the entries in connections
+    @var connections Additional connections (other switches or OF 1.3
+    auxiliary channels) in accept order, each a Controller with its own
+    message queue, transactions and counters, served by this event loop
+    @var parent For an entry in connections, the Controller it belongs to
     @var dbg_state Debug indication of state
     """
 
-    def __init__(self, switch=None, host='127.0.0.1', port=6653, max_pkts=1024, keyfile = None, certfile = None):
+    def __init__(self, switch=None, host='127.0.0.1', port=6653, max_pkts=1024, keyfile = None, certfile = None,
+                 use_epoll=False, handler_workers=0, max_connections=1):
         Thread.__init__(self)
         # Socket related
         self.rcv_size = RCV_SIZE_DEFAULT
@@ -117,9 +515,10 @@ class Controller(Thread):
         self.socket_errors = 0
         self.parse_errors = 0
         self.packets_total = 0
-        self.packets_expired = 0
         self.packets_handled = 0
         self.poll_discards = 0
+        self.messages_received = 0
+        self.wakeups = 0
 
         # State
         self.sync = Lock()
@@ -130,7 +529,7 @@ class Controller(Thread):
 
         # OpenFlow message/packet queue
         # Protected by the packets_cv lock / condition variable
-        self.packets = []
+        self.packets = MessageQueue(max_pkts)
         self.packets_cv = Condition()
         self.packet_in_count = 0
 
@@ -147,16 +546,34 @@ class Controller(Thread):
         self.pkt_in_filter_limit = 50 # Count on run of packet ins
         self.pkt_in_dropped = 0 # Total dropped packet ins
         self.transact_to = 15 # Transact timeout default value; add to config
+        self.use_epoll = use_epoll and hasattr(select, "epoll")
+        self.lazy_decode = True # Decode message bodies on first access
+        self.session_changed = False
+
+        # Messages packed while corked, written out by flush(); tx_lock
+        self.tx_queue = []
+        self.tx_queued_bytes = 0
+        self.tx_corked = 0
+        self.tx_writes = 0
+
+        self.handler_pool = None
+        if handler_workers:
+            self.handler_pool = HandlerPool(handler_workers)
+
+        # Additional connections; changed under connect_cv
+        self.max_connections = max_connections
+        self.connections = []
+        self.connection_map = {} # Socket to the Controller serving it
+        self.parent = None
 
         # Transaction and message type waiting variables 
         #   xid_cv: Condition variable (semaphore) for packet waiters
-        #   xid: Transaction ID being waited on
-        #   xid_response: Transaction response message
+        #   transactions: Dictionary from xid to pending Transaction
         self.xid_cv = Condition()
-        self.xid = None
-        self.xid_response = None
+        self.transactions = {}
 
-        self.buffered_input = ""
+        # Reusable receive buffer; holds any partial message between reads
+        self.rxbuf = ofutils.RecvBuffer(4 * RCV_SIZE_DEFAULT, RCV_SIZE_DEFAULT)
 
         # Create listen socket
         if self.passive:
@@ -190,7 +607,38 @@ class Controller(Thread):
 
         return False
 
+    def _message_decode(self, ofp, frame, rawmsg, hdr_type, hdr_xid):
+        """
+        Return the message object for a received frame
+
+        Message types with subtypes (errors, stats, experimenter) are
+        always parsed here since their class depends on the body.
+        """
+        if self.lazy_decode:
+            klass = ofp.message.message.subtypes.get(hdr_type)
+            if klass is not None and "subtypes" not in klass.__dict__:
+                return lazy_message(klass, rawmsg, hdr_xid,
+                                    self._lazy_decode_error)
+        return ofp.message.parse_message(frame)
+
+    def _lazy_decode_error(self, msg, error):
+        """
+        Count a message whose deferred decode failed as a parse error
+        """
+        self.parse_errors += 1
+        self.logger.warn("Could not parse %s message: %s",
+                         type(msg).__name__, str(error))
+
     def _pkt_handle(self, pkt):
+        """
+        Handle a string of data received from the switch
+
+        @param pkt The raw packet (string) which may contain multiple OF msgs
+        """
+        self.rxbuf.feed(pkt)
+        self._rxbuf_handle()
+
+    def _rxbuf_handle(self):
         """
         Check for all packet handling conditions
 
@@ -203,52 +651,50 @@ class Controller(Thread):
 
         an echo request in case keep_alive is true, followed by
         registered message handlers.
-        @param pkt The raw packet (string) which may contain multiple OF msgs
-        """
-
-        # snag any left over data from last read()
-        pkt = self.buffered_input + pkt
-        self.buffered_input = ""
 
-        # Process each of the OF msgs inside the pkt
-        offset = 0
-        while offset < len(pkt):
-            if offset + 8 > len(pkt):
-                break
+        Each complete OF msg in the receive buffer is processed; a trailing
+        partial message is left in place for the next read.
+        """
 
+        for frame in self.rxbuf.frames(OFP_HEADER_LEN, ofp_frame_len):
             # Parse the header to get type
-            hdr_version, hdr_type, hdr_length, hdr_xid = cfg_ofp.message.parse_header(pkt[offset:])
+            hdr_version, hdr_type, hdr_length, hdr_xid = cfg_ofp.message.parse_header(frame)
 
             # Use loxi to resolve to ofp of matching version
             ofp = loxi.protocol(hdr_version)
 
-            # Extract the raw message bytes
-            if (offset + hdr_length) > len(pkt):
-                break
-            rawmsg = pkt[offset : offset + hdr_length]
-            offset += hdr_length
+            # The frame is only valid until the next read; keep a copy of
+            # the raw message bytes for pollers and handlers
+            rawmsg = frame.tobytes()
 
             #if self.filter_packet(rawmsg, hdr):
             #    continue
 
-            msg = ofp.message.parse_message(rawmsg)
+            msg = self._message_decode(ofp, frame, rawmsg, hdr_type, hdr_xid)
             if not msg:
                 self.parse_errors += 1
                 self.logger.warn("Could not parse message")
                 continue
+            self.messages_received += 1
 
             self.logger.debug("Msg in: version %d class %s len %d xid %d",
                               hdr_version, type(msg).__name__, hdr_length, hdr_xid)
 
             with self.sync:
-                # Check if transaction is waiting
-                with self.xid_cv:
-                    if self.xid and hdr_xid == self.xid:
-                        self.logger.debug("Matched expected XID " + str(hdr_xid))
-                        self.xid_response = (msg, rawmsg)
-                        self.xid = None
-                        self.xid_cv.notify()
-                        continue
+                # Check if transaction is waiting. Requests are registered
+                # before they are sent, so the unlocked membership test
+                # cannot miss a reply.
+                if hdr_xid and hdr_xid in self.transactions:
+                    with self.xid_cv:
+                        txn = self.transactions.get(hdr_xid)
+                        if txn:
+                            self.logger.debug("Matched expected XID " + str(hdr_xid))
+                            more = isinstance(msg, ofp.message.stats_reply) and \
+                                msg.flags & ofp.OFPSF_REPLY_MORE
+                            if txn.add(msg, rawmsg, more):
+                                del self.transactions[hdr_xid]
+                                self.xid_cv.notify_all()
+                            continue
 
                 # Check if keep alive is set; if so, respond to echo requests
                 if self.keep_alive:
@@ -294,30 +740,37 @@ class Controller(Thread):
                     self.logger.warn("Received error message: xid=%d type=%s (%d) code=%s (%d)",
                                      hdr_xid, type_str, msg.err_type, code_str, msg.code)
 
-                # Now check for message handlers; preference is given to
-                # handlers for a specific packet
-                handled = False
-                if hdr_type in self.handlers.keys():
-                    handled = self.handlers[hdr_type](self, msg, rawmsg)
-                if not handled and ("all" in self.handlers.keys()):
-                    handled = self.handlers["all"](self, msg, rawmsg)
-
-                if not handled: # Not handled, enqueue
-                    with self.packets_cv:
-                        if len(self.packets) >= self.max_pkts:
-                            self.packets.pop(0)
-                            self.packets_expired += 1
-                        self.packets.append((msg, rawmsg))
-                        self.packets_cv.notify_all()
-                    self.packets_total += 1
+                if self.handler_pool and \
+                        (hdr_type in self.handlers or "all" in self.handlers):
+                    self.handler_pool.submit(hdr_type, self._dispatch,
+                                             hdr_type, msg, rawmsg)
                 else:
-                    self.packets_handled += 1
-                    self.logger.debug("Message handled by callback")
+                    self._dispatch(hdr_type, msg, rawmsg)
 
-        # end of 'while offset < len(pkt)'
-        #   note that if offset = len(pkt), this is
-        #   appends a harmless empty string
-        self.buffered_input += pkt[offset:]
+    def _dispatch(self, hdr_type, msg, rawmsg):
+        """
+        Offer a message to the registered handlers and queue it for
+        polling if none of them handles it
+        """
+        # Preference is given to handlers for a specific packet
+        handled = False
+        handler = self.handlers.get(hdr_type)
+        if handler:
+            handled = handler(self, msg, rawmsg)
+        if not handled:
+            handler = self.handlers.get("all")
+            if handler:
+                handled = handler(self, msg, rawmsg)
+
+        with self.packets_cv:
+            if not handled: # Not handled, enqueue
+                self.packets.append((msg, rawmsg))
+                self.packets_cv.notify_all()
+                self.packets_total += 1
+            else:
+                self.packets_handled += 1
+        if handled:
+            self.logger.debug("Message handled by callback")
 
     def _socket_ready_handle(self, s):
         """
@@ -328,7 +781,8 @@ class Controller(Thread):
         """
 
         if self.passive and s and s == self.listen_socket:
-            if self.switch_socket:
+            if self.switch_socket and \
+                    len(self.connections) + 1 >= self.max_connections:
                 self.logger.warning("Ignoring incoming connection; already connected to switch")
                 (sock, addr) = self.listen_socket.accept()
                 sock.close()
@@ -345,6 +799,9 @@ class Controller(Thread):
 						sock = ssl.wrap_socket(sock, server_side = True, keyfile = self.keyfile, certfile = self.certfile)
 				except ssl.SSLError as err:
 					self.logger.info(err)
+            if self.switch_socket:
+                self._connection_add(sock, addr)
+                return 0
             with self.connect_cv:
                 (self.switch_socket, self.switch_addr) = (sock, addr)
                 self.switch_socket.setsockopt(socket.IPPROTO_TCP,
@@ -353,13 +810,14 @@ class Controller(Thread):
                     self.message_send(cfg_ofp.message.hello())
                 self.connect_cv.notify() # Notify anyone waiting
 
-            # Prevent further connections
-            self.listen_socket.close()
-            self.listen_socket = None
+            if self.max_connections == 1:
+                # Prevent further connections
+                self.listen_socket.close()
+                self.listen_socket = None
         elif s and s == self.switch_socket:
             for idx in range(3): # debug: try a couple of times
                 try:
-                    pkt = self.switch_socket.recv(self.rcv_size)
+                    count = self.rxbuf.recv_into(self.switch_socket)
                 except:
                     self.logger.warning("Error on switch read")
                     return -1
@@ -367,25 +825,94 @@ class Controller(Thread):
                 if not self.active:
                     return 0
       
-                if len(pkt) == 0:
+                if count == 0:
                     self.logger.warning("Zero-length switch read, %d" % idx)
                 else:
                     break
 
-            if len(pkt) == 0: # Still no packet
+            if count == 0: # Still no packet
                 self.logger.warning("Zero-length switch read; closing cxn")
                 self.logger.info(str(self))
                 return -1
 
-            self._pkt_handle(pkt)
+            self._rxbuf_handle()
         elif s and s == self.waker:
             self.waker.wait()
+        elif self.connection_map.get(s):
+            conn = self.connection_map.get(s)
+            if conn and conn._socket_ready_handle(s) == -1:
+                self._connection_remove(conn)
         else:
             self.logger.error("Unknown socket ready: " + str(s))
             return -1
 
         return 0
 
+    def _connection_add(self, sock, addr):
+        """
+        Serve an additional accepted connection from this event loop
+
+        @param sock The connected socket
+        @param addr The peer address
+        """
+        self.logger.info("Additional connection %d from %s",
+                         len(self.connections) + 1, str(addr))
+        conn = Controller(switch=addr[0], port=addr[1], max_pkts=self.max_pkts)
+        conn.parent = self
+        conn.waker = self.waker
+        conn.keep_alive = self.keep_alive
+        conn.initial_hello = self.initial_hello
+        conn.lazy_decode = self.lazy_decode
+        conn.transact_to = self.transact_to
+        conn.switch_addr = addr
+        conn.dbg_state = "running"
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+        with conn.connect_cv:
+            conn.switch_socket = sock
+            if conn.initial_hello:
+                conn.message_send(cfg_ofp.message.hello())
+        with self.connect_cv:
+            self.connections.append(conn)
+            self.connection_map[sock] = conn
+            self.connect_cv.notify_all()
+        return conn
+
+    def _connection_remove(self, conn):
+        """
+        Close an additional connection and stop serving it
+        """
+        with self.connect_cv:
+            if conn in self.connections:
+                self.connections.remove(conn)
+            for (sock, c) in self.connection_map.items():
+                if c is conn:
+                    del self.connection_map[sock]
+            self.connect_cv.notify_all()
+        conn.disconnect()
+
+    def wait_connections(self, count, timeout=-1):
+        """
+        Wait until count switch connections, including the first, are up
+
+        @param count Number of connections to wait for
+        @param timeout Block for up to timeout seconds. Pass -1 for the default.
+        @returns The list of connected Controllers, first connection first,
+        or None on timeout
+        """
+        def ready():
+            conns = self.all_connections()
+            if len(conns) >= count:
+                return conns
+        with self.connect_cv:
+            return ofutils.timed_wait(self.connect_cv, ready, timeout=timeout)
+
+    def all_connections(self):
+        """
+        Return the Controllers for every live connection, this one first
+        """
+        conns = [self] if self.switch_socket else []
+        return conns + [c for c in self.connections if c.switch_socket]
+
     def active_connect(self):
         """
         Actively connect to a switch IP addr
@@ -415,25 +942,12 @@ class Controller(Thread):
         Return list of sockets to select on.
         """
         socs = [self.listen_socket, self.switch_socket, self.waker]
-        return [x for x in socs if x]
+        return [x for x in socs if x] + self.connection_map.keys()
 
-    def run(self):
+    def _select_loop(self):
         """
-        Activity function for class
-
-        Assumes connection to switch already exists.  Listens on
-        switch_socket for messages until an error (or zero len pkt)
-        occurs.
-
-        When there is a message on the socket, check for handlers; queue the
-        packet if no one handles the packet.
-
-        See note for controller describing the limitation of a single
-        connection for now.
+        Event loop using select, re-listing the sockets on every pass
         """
-
-        self.dbg_state = "running"
-
         while self.active:
             try:
                 sel_in, sel_out, sel_err = \
@@ -443,6 +957,9 @@ class Controller(Thread):
                 self.logger.error("Select error, disconnecting")
                 self.disconnect()
 
+            if sel_in or sel_err:
+                self.wakeups += 1
+
             for s in sel_err:
                 self.logger.error("Got socket error on: " + str(s) + ", disconnecting")
                 self.disconnect()
@@ -451,6 +968,148 @@ class Controller(Thread):
                 if self._socket_ready_handle(s) == -1:
                     self.disconnect()
 
+    def _epoll_sync(self, epoll, registered):
+        """
+        Bring the epoll registrations in line with the current sockets
+
+        The waker and listen socket are registered once.  The switch socket
+        is registered edge-triggered when it appears and forgotten when it
+        goes away.  Only identity checks are made on the common path.
+
+        @param epoll The select.epoll object
+        @param registered Dictionary from file descriptor to socket object
+        """
+        current = self.sockets()
+        if len(current) == len(registered) and \
+                all(registered.get(x.fileno()) is x for x in current):
+            return
+
+        for (fd, s) in registered.items():
+            if s not in current:
+                try:
+                    epoll.unregister(fd)
+                except (IOError, OSError, ValueError):
+                    pass # Already closed, which removes it from the set
+                del registered[fd]
+
+        for s in current:
+            fd = s.fileno()
+            if registered.get(fd) is s:
+                continue
+            if fd in registered:
+                # Descriptor number reused by a new socket
+                try:
+                    epoll.unregister(fd)
+                except (IOError, OSError, ValueError):
+                    pass
+            if s is self.switch_socket or s in self.connection_map:
+                epoll.register(fd, select.EPOLLIN | select.EPOLLET)
+            else:
+                epoll.register(fd, select.EPOLLIN)
+            registered[fd] = s
+
+    def _epoll_loop(self):
+        """
+        Event loop using edge-triggered epoll
+
+        The switch socket is drained until it would block on each wakeup,
+        so a burst of messages costs a single pass through the loop.
+        """
+        epoll = select.epoll()
+        registered = {}
+        try:
+            while self.active:
+                self._epoll_sync(epoll, registered)
+                try:
+                    events = epoll.poll(1)
+                except IOError as e:
+                    if e.errno == errno.EINTR:
+                        continue
+                    self.logger.error("Epoll error, disconnecting: %s", e)
+                    self.disconnect()
+                    continue
+
+                if events:
+                    self.wakeups += 1
+
+                for (fd, mask) in events:
+                    s = registered.get(fd)
+                    if s is None:
+                        continue
+                    if s is self.switch_socket:
+                        ret = self._switch_socket_drain()
+                    elif s in self.connection_map:
+                        conn = self.connection_map.get(s)
+                        if conn and conn._switch_socket_drain() == -1:
+                            self._connection_remove(conn)
+                        continue
+                    else:
+                        ret = self._socket_ready_handle(s)
+                    if ret == -1:
+                        self.disconnect()
+        finally:
+            epoll.close()
+
+    def _switch_socket_drain(self):
+        """
+        Read from the switch socket until no more data is available
+
+        Required for edge-triggered notification; a partial read would leave
+        data in the socket with no further wakeup.
+
+        @returns 0 on success, -1 on error or connection close
+        """
+        sock = self.switch_socket
+        while self.active and sock is self.switch_socket:
+            try:
+                if isinstance(sock, ssl.SSLSocket):
+                    # SSL sockets do not accept recv flags; the socket is
+                    # blocking so only read what is known to be available
+                    if sock.pending() == 0 and \
+                            not select.select([sock], [], [], 0)[0]:
+                        return 0
+                    count = self.rxbuf.recv_into(sock)
+                else:
+                    count = self.rxbuf.recv_into(sock, socket.MSG_DONTWAIT)
+            except socket.error as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return 0
+                if e.errno == errno.EINTR:
+                    continue
+                self.logger.warning("Error on switch read: %s", e)
+                return -1
+
+            if count == 0:
+                self.logger.warning("Zero-length switch read; closing cxn")
+                self.logger.info(str(self))
+                return -1
+
+            self._rxbuf_handle()
+
+        return 0
+
+    def run(self):
+        """
+        Activity function for class
+
+        Assumes connection to switch already exists.  Listens on
+        switch_socket for messages until an error (or zero len pkt)
+        occurs.
+
+        When there is a message on the socket, check for handlers; queue the
+        packet if no one handles the packet.
+
+        Additional connections (see max_connections) are served by the
+        same loop.
+        """
+
+        self.dbg_state = "running"
+
+        if self.use_epoll:
+            self._epoll_loop()
+        else:
+            self._select_loop()
+
         # End of main loop
         self.dbg_state = "closing"
         self.logger.info("Exiting controller thread")
@@ -492,12 +1151,17 @@ class Controller(Thread):
         """
         If connected to a switch, disconnect.
         """
+        if self.parent and self in self.parent.connections:
+            # Stop the parent's event loop serving the socket first
+            self.parent._connection_remove(self)
+            return
         if self.switch_socket:
             self.switch_socket.close()
             self.switch_socket = None
             self.switch_addr = None
+            self.rxbuf.clear()
             with self.packets_cv:
-                self.packets = []
+                self.packets.clear()
             with self.connect_cv:
                 self.connect_cv.notifyAll()
 
@@ -518,6 +1182,12 @@ class Controller(Thread):
         Force the controller thread to quit
         """
         self.active = False
+        if self.parent:
+            # Served by the parent's thread; there is no thread to stop
+            self.disconnect()
+            return
+        if self.handler_pool:
+            self.handler_pool.stop()
         self.wakeup()
         self.join()
 
@@ -529,6 +1199,12 @@ class Controller(Thread):
         """
 
         self.active = False
+        if self.handler_pool:
+            self.handler_pool.stop()
+        if self.parent:
+            self.disconnect()
+        for conn in list(self.connections):
+            self._connection_remove(conn)
         try:
             self.switch_socket.shutdown(socket.SHUT_RDWR)
         except:
@@ -557,8 +1233,10 @@ class Controller(Thread):
 
         Only one handler may be registered for a given message type.
 
-        WARNING:  A lock is held during the handler call back, so 
-        the handler should not make any blocking calls
+        WARNING:  Unless the controller was created with handler_workers,
+        a lock is held during the handler call back, so the handler
+        should not make any blocking calls. With handler_workers, handlers
+        run on a pool thread; those for one message type run in order.
 
         @param msg_type The type of message to receive.  May be DEFAULT 
         for all non-handled packets.  The special type, the string "all"
@@ -602,12 +1280,15 @@ class Controller(Thread):
 
         self.logger.debug("Polling for %s", klass.__name__)
 
+        # The reply may be waiting on a corked request
+        self.flush()
+
         # Take the packet from the queue
         def grab():
-            for i, (msg, pkt) in enumerate(self.packets):
-                if klass is None or isinstance(msg, klass):
-                    self.logger.debug("Got %s message", msg.__class__.__name__)
-                    return self.packets.pop(i)
+            ret = self.packets.get(klass)
+            if ret is not None:
+                self.logger.debug("Got %s message", ret[0].__class__.__name__)
+                return ret
             # Not found
             self.logger.debug("%s message not in queue", klass.__name__)
             return None
@@ -627,38 +1308,122 @@ class Controller(Thread):
 
         Send the message in msg and wait for a reply with a matching
         transaction id.  Transactions have the highest priority in
-        received message handling.
+        received message handling.  Multipart replies are reassembled
+        (see Transaction.response).
 
         @param msg The message object to send; must not be a string
         @param timeout The timeout in seconds; if -1 use default.
         """
 
+        txn = self.transact_start(msg)
+        if txn is None:
+            return (None, None)
+        return self.transact_wait(txn, timeout=timeout)
+
+    def transact_multi(self, msgs, timeout=-1):
+        """
+        Run several transactions with the switch concurrently
+
+        All requests are sent before waiting for any reply.
+
+        @param msgs List of message objects to send
+        @param timeout The timeout in seconds for the whole batch; if -1
+        use default.
+        @returns A list of (msg, pkt) replies in the order of msgs, with
+        (None, None) for requests that did not complete
+        """
+
+        txns = [self.transact_start(msg) for msg in msgs]
+        pending = [txn for txn in txns if txn]
+        self.flush()
+
+        with self.xid_cv:
+            ofutils.timed_wait(self.xid_cv,
+                               lambda: all(txn.done for txn in pending) or None,
+                               timeout=timeout)
+            for txn in pending:
+                if not txn.done:
+                    self.transactions.pop(txn.xid, None)
+
+        result = []
+        for txn in txns:
+            if txn is None:
+                result.append((None, None))
+                continue
+            if not txn.done:
+                self.logger.warning("No response for xid " + str(txn.xid))
+            result.append(txn.response())
+        return result
+
+    def transact_start(self, msg, send=True):
+        """
+        Send a request without waiting for the reply
+
+        The request is entered in the pending-transaction table before it
+        is sent so the reply cannot be missed.
+
+        @param msg The message object to send
+        @param send If False only register the transaction; the caller
+        sends msg itself (e.g. with message_send_many)
+        @returns The Transaction to pass to transact_wait, or None if a
+        transaction with the same xid is already outstanding
+        """
+
         if msg.xid == None:
             msg.xid = ofutils.gen_xid()
 
         self.logger.debug("Running transaction %d" % msg.xid)
 
+        txn = Transaction(msg.xid)
         with self.xid_cv:
-            if self.xid:
-                self.logger.error("Can only run one transaction at a time")
-                return (None, None)
+            if msg.xid in self.transactions:
+                self.logger.error("Transaction %d already outstanding" % msg.xid)
+                return None
+            self.transactions[msg.xid] = txn
+
+        if not send:
+            return txn
 
-            self.xid = msg.xid
-            self.xid_response = None
+        try:
             self.message_send(msg)
+        except:
+            with self.xid_cv:
+                self.transactions.pop(msg.xid, None)
+            raise
 
-            self.logger.debug("Waiting for transaction %d" % msg.xid)
-            ofutils.timed_wait(self.xid_cv, lambda: self.xid_response, timeout=timeout)
+        return txn
 
-            if self.xid_response:
-                (resp, pkt) = self.xid_response
-                self.xid_response = None
-            else:
-                (resp, pkt) = (None, None)
+    def transact_cancel(self, txn):
+        """
+        Remove a transaction from the pending-transaction table
+
+        Any later reply with its xid is queued like an unsolicited message.
+        """
+        with self.xid_cv:
+            if self.transactions.get(txn.xid) is txn:
+                del self.transactions[txn.xid]
+
+    def transact_wait(self, txn, timeout=-1):
+        """
+        Wait for the reply to a transaction started with transact_start
+
+        @param txn The Transaction returned by transact_start
+        @param timeout The timeout in seconds; if -1 use default.
+        @returns The pair (msg, pkt), or (None, None) on timeout
+        """
+
+        self.logger.debug("Waiting for transaction %d" % txn.xid)
+        self.flush()
+
+        with self.xid_cv:
+            ofutils.timed_wait(self.xid_cv, lambda: txn.done or None,
+                               timeout=timeout)
+            if not txn.done:
+                self.transactions.pop(txn.xid, None)
 
-        if resp is None:
-            self.logger.warning("No response for xid " + str(self.xid))
-        return (resp, pkt)
+        if not txn.done:
+            self.logger.warning("No response for xid " + str(txn.xid))
+        return txn.response()
 
     def message_send(self, msg):
         """
@@ -674,29 +1439,150 @@ class Controller(Thread):
 
         if msg.xid == None:
             msg.xid = ofutils.gen_xid()
+        if msg.type in SESSION_MSG_TYPES:
+            self.session_changed = True
 
         outpkt = msg.pack()
 
         self.logger.debug("Msg out: version %d class %s len %d xid %d",
                           msg.version, type(msg).__name__, len(outpkt), msg.xid)
-        if self.keyfile and self.certfile:
-			with self.tx_lock:
-				self.switch_socket.sendall(outpkt)
-        else:
-            with self.tx_lock:
-                if self.switch_socket.sendall(outpkt) is not None:
-                    raise AssertionError("failed to send message to switch")
+        self._tx(outpkt)
 
         return 0 # for backwards compatibility
 
+    def message_send_many(self, msgs):
+        """
+        Send several messages to the switch with a single write
+
+        @param msgs List of OpenFlow message objects
+        """
+
+        if not self.switch_socket:
+            raise Exception("no socket")
+
+        chunks = []
+        for msg in msgs:
+            if msg.xid == None:
+                msg.xid = ofutils.gen_xid()
+            if msg.type in SESSION_MSG_TYPES:
+                self.session_changed = True
+            chunks.append(msg.pack())
+        outpkt = "".join(chunks)
+
+        self.logger.debug("Msgs out: %d messages len %d", len(chunks), len(outpkt))
+        self._tx(outpkt)
+
+        return 0
+
+    def _tx(self, data):
+        """
+        Write data to the switch, or queue it if sends are corked
+
+        Messages sent from the controller thread itself (echo replies)
+        are never held back by a cork.
+        """
+        with self.tx_lock:
+            if self.tx_corked and current_thread() is not self:
+                self.tx_queue.append(data)
+                self.tx_queued_bytes += len(data)
+                if self.tx_queued_bytes < TX_FLUSH_BYTES:
+                    return
+                data = ""
+            self._tx_write(data)
+
+    def _tx_write(self, data):
+        """
+        Write queued data followed by data. Call with tx_lock held.
+        """
+        if self.tx_queue:
+            self.tx_queue.append(data)
+            data = "".join(self.tx_queue)
+            self.tx_queue = []
+            self.tx_queued_bytes = 0
+        if not data:
+            return
+        if not self.switch_socket:
+            raise Exception("no socket")
+        self.tx_writes += 1
+        # sendall raises on failure; SSL sockets return a byte count
+        self.switch_socket.sendall(data)
+
+    def flush(self):
+        """
+        Write out any messages queued while sends were corked
+        """
+        if self.tx_queue:
+            with self.tx_lock:
+                self._tx_write("")
+
+    def cork(self):
+        """
+        Queue sent messages instead of writing each one to the socket
+
+        Queued messages go out in as few writes as possible on flush(),
+        uncork(), or any transaction, barrier or poll. Corks nest.
+        """
+        with self.tx_lock:
+            self.tx_corked += 1
+
+    def uncork(self):
+        """
+        Undo one cork(); the last one flushes the queued messages
+        """
+        with self.tx_lock:
+            self.tx_corked -= 1
+            if not self.tx_corked:
+                self._tx_write("")
+
+    @contextmanager
+    def corked(self):
+        """
+        Context manager that corks sends for the duration of a block:
+
+        with ctrl.corked():
+            for msg in flow_mods:
+                ctrl.message_send(msg)
+        """
+        self.cork()
+        try:
+            yield
+        finally:
+            self.uncork()
+
+    def reset(self):
+        """
+        Return a connected controller to its just-connected state
+
+        Used to hand one switch connection to several tests in turn. Drops
+        queued messages, registered handlers and pending transactions. The
+        connection itself and any state on the switch are left alone.
+        """
+        with self.sync:
+            self.handlers = {}
+            self.filter_packet_in = False
+            self.pkt_in_run = 0
+        if self.handler_pool:
+            # Messages still in the pool must not reach the next user
+            self.handler_pool.join()
+        with self.xid_cv:
+            self.transactions = {}
+            self.xid_cv.notify_all()
+        with self.packets_cv:
+            self.packets.clear()
+        with self.tx_lock:
+            self.tx_corked = 0
+            self._tx_write("")
+        self.transact_to = 15
+        self.session_changed = False
+
     def clear_queue(self):
         """
         Clear the input queue and report the number of messages
         that were in it
         """
-        enqueued_pkt_count = len(self.packets)
         with self.packets_cv:
-            self.packets = []
+            enqueued_pkt_count = len(self.packets)
+            self.packets.clear()
         return enqueued_pkt_count
 
     def __str__(self):
@@ -704,9 +1590,22 @@ class Controller(Thread):
         string += "  state           " + self.dbg_state + "\n"
         string += "  switch_addr     " + str(self.switch_addr) + "\n"
         string += "  pending pkts    " + str(len(self.packets)) + "\n"
+        string += "  pending xids    " + str(len(self.transactions)) + "\n"
         string += "  total pkts      " + str(self.packets_total) + "\n"
         string += "  expired pkts    " + str(self.packets_expired) + "\n"
+        for (klass, count) in sorted(self.packets.expired.items(),
+                                     key=lambda e: e[0].__name__):
+            string += "    %-13s " % klass.__name__ + str(count) + "\n"
         string += "  handled pkts    " + str(self.packets_handled) + "\n"
+        string += "  msgs received   " + str(self.messages_received) + "\n"
+        string += "  wakeups         " + str(self.wakeups) + "\n"
+        string += "  wakeups/msg     " + str(self.wakeups_per_message()) + "\n"
+        string += "  tx writes       " + str(self.tx_writes) + "\n"
+        if self.handler_pool:
+            pool = self.handler_pool
+            string += "  handler queue   %d (max %d)\n" % (pool.depth(), pool.depth_max)
+            string += "  handler latency %.6f avg %.6f max\n" % \
+                (pool.latency_avg(), pool.latency_max)
         string += "  poll discards   " + str(self.poll_discards) + "\n"
         string += "  parse errors    " + str(self.parse_errors) + "\n"
         string += "  sock errrors    " + str(self.socket_errors) + "\n"
@@ -715,10 +1614,31 @@ class Controller(Thread):
         string += "  host            " + str(self.host) + "\n"
         string += "  port            " + str(self.port) + "\n"
         string += "  keep_alive      " + str(self.keep_alive) + "\n"
+        string += "  use_epoll       " + str(self.use_epoll) + "\n"
+        if self.max_connections > 1:
+            string += "  connections     %d of %d\n" % \
+                (len(self.all_connections()), self.max_connections)
         string += "  pkt_in_run      " + str(self.pkt_in_run) + "\n"
         string += "  pkt_in_dropped  " + str(self.pkt_in_dropped) + "\n"
         return string
 
+    @property
+    def packets_expired(self):
+        """
+        Total number of messages discarded because their queue was full
+        """
+        return self.packets.expired_total()
+
+    def wakeups_per_message(self):
+        """
+        Return the ratio of event loop wakeups to messages received
+
+        A value well below 1.0 means messages are being batched per wakeup.
+        """
+        if not self.messages_received:
+            return 0.0
+        return float(self.wakeups) / self.messages_received
+
     def show(self):
         print str(self)
 
@@ -16,16 +16,22 @@ for filters should include a callback or a counter
 
 import sys
 import os
+import errno
 import socket
 import time
+import struct
+import mmap
 import select
 import logging
+import heapq
+from collections import deque
 from threading import Thread
 from threading import Lock
 from threading import Condition
 import ofutils
 import netutils
-from pcap_writer import PcapWriter
+import bpf
+from pcap_writer import PcapWriter, PcapngWriter, AsyncWriter, Timestamp
 
 have_pypcap = False
 try:
@@ -36,6 +42,10 @@ try:
 except:
     pass
 
+# Received packets are indexed by this many leading bytes, the minimum
+# Ethernet frame size that match_exp_pkt pads short expected packets to
+MATCH_KEY_LEN = 60
+
 def match_exp_pkt(exp_pkt, pkt):
     """
     Compare the string value of pkt with the string value of exp_pkt,
@@ -50,6 +60,95 @@ def match_exp_pkt(exp_pkt, pkt):
     return e == p
 
 
+class PacketQueue(object):
+    """
+    Bounded FIFO of (seq, packet, timestamp) received on one port
+
+    Packets are also indexed by their first MATCH_KEY_LEN bytes so that
+    find() can locate an expected packet without comparing it against every
+    queued packet. Packets only ever leave from the front of the queue,
+    which is also the front of their index entry.
+    """
+
+    def __init__(self, maxlen):
+        self.queue = deque()
+        self.maxlen = maxlen
+        self.index = {} # packet[:MATCH_KEY_LEN] -> deque of queue entries
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __iter__(self):
+        return iter(self.queue)
+
+    def __getitem__(self, i):
+        return self.queue[i]
+
+    def append(self, entry):
+        """
+        Add a (seq, packet, timestamp) entry
+
+        @returns True if the oldest entry was discarded to make room
+        """
+        dropped = len(self.queue) >= self.maxlen
+        if dropped:
+            self.popleft()
+        self.queue.append(entry)
+        key = entry[1][:MATCH_KEY_LEN]
+        entries = self.index.get(key)
+        if entries is None:
+            entries = self.index[key] = deque()
+        entries.append(entry)
+        return dropped
+
+    def popleft(self):
+        entry = self.queue.popleft()
+        key = entry[1][:MATCH_KEY_LEN]
+        entries = self.index[key]
+        entries.popleft()
+        if not entries:
+            del self.index[key]
+        return entry
+
+    def clear(self):
+        self.queue.clear()
+        self.index.clear()
+
+    def find(self, exp_pkt):
+        """
+        Return the oldest entry matching exp_pkt (a string) as defined by
+        match_exp_pkt, or None
+        """
+        if len(exp_pkt) >= MATCH_KEY_LEN:
+            for entry in self.index.get(exp_pkt[:MATCH_KEY_LEN], ()):
+                if entry[1] == exp_pkt:
+                    return entry
+            return None
+
+        # A short expected packet matches any packet it is a prefix of.
+        # Unpadded and zero padded copies are found in the index; copies
+        # with other padding need a scan, which can stop at the oldest
+        # indexed copy.
+        best = None
+        for key in (exp_pkt, exp_pkt.ljust(MATCH_KEY_LEN, "\x00")):
+            entries = self.index.get(key)
+            if entries and (best is None or entries[0][0] < best[0]): #pylint: disable=E1136
+                best = entries[0]
+        length = len(exp_pkt)
+        for entry in self.queue:
+            if best is not None and entry[0] >= best[0]:
+                break
+            if entry[1][:length] == exp_pkt:
+                return entry
+        return best
+
+    def discard_until(self, seq):
+        """
+        Remove entries older than seq
+        """
+        while self.queue and self.queue[0][0] < seq:
+            self.popleft()
+
 class DataPlanePort:
     """
     Uses raw sockets to capture and send packets on a network interface.
@@ -58,6 +157,8 @@ class DataPlanePort:
     RCV_SIZE_DEFAULT = 4096
     ETH_P_ALL = 0x03
     RCV_TIMEOUT = 10000
+    # Most packets taken from the socket by one recv_batch call
+    RCV_BATCH = 32
 
     def __init__(self, interface_name, port_number):
         """
@@ -69,6 +170,8 @@ class DataPlanePort:
         self.socket.bind((interface_name, 0))
         netutils.set_promisc(self.socket, interface_name)
         self.socket.settimeout(self.RCV_TIMEOUT)
+        # Created by the first recv_batch call, False without recvmmsg
+        self.rx_vector = None
 
     def __del__(self):
         if self.socket:
@@ -88,6 +191,27 @@ class DataPlanePort:
         pkt = self.socket.recv(self.RCV_SIZE_DEFAULT)
         return (pkt, time.time())
 
+    def recv_batch(self):
+        """
+        Receive up to RCV_BATCH packets with a single recvmmsg(2) call.
+        Must only be called when the socket is readable.
+        @retval List of (packet data, timestamp)
+        """
+        if self.rx_vector == None:
+            self.rx_vector = netutils.have_recvmmsg() and \
+                netutils.ReceiveVector(self.RCV_BATCH, self.RCV_SIZE_DEFAULT)
+        if not self.rx_vector:
+            return [self.recv()]
+        timestamp = time.time()
+        return [(pkt, timestamp) for pkt in self.rx_vector.recv(self.socket)] #pylint: disable=E1101
+
+    def rx_dropped(self):
+        """
+        Return the number of packets the kernel dropped since the last call
+        because the socket's receive buffer was full.
+        """
+        return netutils.get_packet_drops(self.socket)
+
     def send(self, packet):
         """
         Send a packet out this port.
@@ -96,6 +220,14 @@ class DataPlanePort:
         """
         return self.socket.send(packet)
 
+    def send_batch(self, vector, start, count):
+        """
+        Send frames start to start + count of a netutils.MessageVector
+        with a single sendmmsg(2) call.
+        @retval The number of frames sent
+        """
+        return vector.send(self.socket, start, count)
+
     def down(self):
         """
         Bring the physical link down.
@@ -108,6 +240,17 @@ class DataPlanePort:
         """
         os.system("ifconfig up %s" % self.interface_name)
 
+    def set_filter(self, expr):
+        """
+        Drop frames not matching a filter expression in the kernel
+        @param expr Expression as described in oftest.bpf, or None to
+        receive every frame
+        """
+        if expr:
+            netutils.attach_filter(self.socket, bpf.compile(expr))
+        else:
+            netutils.detach_filter(self.socket)
+
 
 class DataPlanePortPcap:
     """
@@ -137,6 +280,235 @@ class DataPlanePortPcap:
     def up(self):
         pass
 
+    def set_filter(self, expr):
+        self.pcap.setfilter(expr or "")
+
+class DataPlanePortTpacket:
+    """
+    Alternate port implementation that receives through a memory mapped
+    TPACKET_V3 ring (PACKET_RX_RING) on a raw socket.
+
+    The kernel fills whole blocks of frames and hands each block over at
+    once, so recv_batch() harvests every ready frame after a single wakeup
+    without a syscall per frame. Timestamps are taken by the kernel when
+    the frame is received, and VLAN tags stripped by the NIC are put back
+    from the frame metadata.
+
+    Select it with config["dataplane"]["portclass"], as the eth-tpacket
+    platform does.
+    """
+
+    ETH_P_ALL = 0x03
+    BLOCK_SIZE = 1 << 18
+    BLOCK_NR = 16
+    FRAME_SIZE = 2048
+    # Milliseconds before the kernel hands over a partially filled block
+    BLOCK_TIMEOUT = 1
+
+    # tpacket_block_desc.hdr.bh1: block_status, num_pkts, offset_to_first_pkt
+    BLOCK_HDR = struct.Struct("=III")
+    BLOCK_HDR_OFFSET = 8
+    # tpacket3_hdr up to hv1.tp_vlan_tpid
+    FRAME_HDR = struct.Struct("=IIIIIIHHIIH")
+    STATUS = struct.Struct("=I")
+
+    def __init__(self, interface_name, port_number):
+        """
+        @param interface_name The name of the physical interface like eth1
+        """
+        self.interface_name = interface_name
+        self.ring = None
+        self.socket = socket.socket(socket.AF_PACKET, socket.SOCK_RAW,
+                                    socket.htons(self.ETH_P_ALL))
+        self.socket.setsockopt(netutils.SOL_PACKET, netutils.PACKET_VERSION,
+                               netutils.TPACKET_V3)
+        req = struct.pack("=7I", self.BLOCK_SIZE, self.BLOCK_NR,
+                          self.FRAME_SIZE,
+                          self.BLOCK_SIZE * self.BLOCK_NR / self.FRAME_SIZE,
+                          self.BLOCK_TIMEOUT, 0, 0)
+        self.socket.setsockopt(netutils.SOL_PACKET, netutils.PACKET_RX_RING, req)
+        self.ring = mmap.mmap(self.socket.fileno(),
+                              self.BLOCK_SIZE * self.BLOCK_NR,
+                              mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        self.block = 0
+        self.pending = deque()
+        self.socket.bind((interface_name, 0))
+        netutils.set_promisc(self.socket, interface_name)
+
+    def __del__(self):
+        if self.ring:
+            self.ring.close()
+        if self.socket:
+            self.socket.close()
+
+    def fileno(self):
+        """
+        Return an integer file descriptor that can be passed to select(2).
+        """
+        return self.socket.fileno()
+
+    def recv_batch(self):
+        """
+        Receive every packet available on this port without blocking.
+        @retval List of (packet data, timestamp)
+        """
+        pkts = list(self.pending)
+        self.pending.clear()
+        ring = self.ring
+        while True:
+            base = self.block * self.BLOCK_SIZE
+            (status, num_pkts, offset) = \
+                self.BLOCK_HDR.unpack_from(ring, base + self.BLOCK_HDR_OFFSET)
+            if not status & netutils.TP_STATUS_USER:
+                break
+            offset += base
+            for i in xrange(num_pkts):
+                (next_offset, sec, nsec, snaplen, _, status, mac, _, _,
+                 vlan_tci, vlan_tpid) = self.FRAME_HDR.unpack_from(ring, offset)
+                start = offset + mac
+                pkt = ring[start:start + snaplen]
+                if status & netutils.TP_STATUS_VLAN_VALID:
+                    if not status & netutils.TP_STATUS_VLAN_TPID_VALID:
+                        vlan_tpid = 0x8100
+                    pkt = pkt[:12] + struct.pack("!HH", vlan_tpid, vlan_tci) + pkt[12:]
+                pkts.append((pkt, Timestamp(sec, nsec)))
+                offset += next_offset
+            # Return the block to the kernel
+            self.STATUS.pack_into(ring, base + self.BLOCK_HDR_OFFSET,
+                                  netutils.TP_STATUS_KERNEL)
+            self.block = (self.block + 1) % self.BLOCK_NR
+        return pkts
+
+    def recv(self):
+        """
+        Receive a packet from this port.
+        @retval (packet data, timestamp), or (None, None) if no packet is
+        ready
+        """
+        if not self.pending:
+            self.pending.extend(self.recv_batch())
+        if not self.pending:
+            return (None, None)
+        return self.pending.popleft()
+
+    def rx_dropped(self):
+        """
+        Return the number of packets the kernel dropped since the last call
+        because the ring was full.
+        """
+        return netutils.get_packet_drops(self.socket)
+
+    def send(self, packet):
+        """
+        Send a packet out this port.
+        @param packet The packet data to send to the port
+        @retval The number of bytes sent
+        """
+        return self.socket.send(packet)
+
+    def send_batch(self, vector, start, count):
+        """
+        Send frames start to start + count of a netutils.MessageVector
+        with a single sendmmsg(2) call.
+        @retval The number of frames sent
+        """
+        return vector.send(self.socket, start, count)
+
+    def down(self):
+        """
+        Bring the physical link down.
+        """
+        os.system("ifconfig down %s" % self.interface_name)
+
+    def up(self):
+        """
+        Bring the physical link up.
+        """
+        os.system("ifconfig up %s" % self.interface_name)
+
+    def set_filter(self, expr):
+        """
+        Drop frames not matching a filter expression in the kernel
+        @param expr Expression as described in oftest.bpf, or None to
+        receive every frame
+        """
+        if expr:
+            netutils.attach_filter(self.socket, bpf.compile(expr))
+        else:
+            netutils.detach_filter(self.socket)
+
+class BurstStats(object):
+    """
+    Result of DataPlane.send_burst
+
+    @var frames Number of frames sent
+    @var bytes Number of bytes sent
+    @var dropped Number of frames the port did not accept
+    @var tx_dropped Increase of the interface's tx_dropped counter, or None
+    if it is not available
+    @var elapsed Seconds from the start of the burst to the last send
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+        self.dropped = 0
+        self.tx_dropped = None
+        self.elapsed = 0.0
+
+    @property
+    def pps(self):
+        """Achieved frames per second"""
+        return self.elapsed and self.frames / self.elapsed or 0.0
+
+    @property
+    def bps(self):
+        """Achieved bits per second"""
+        return self.elapsed and self.bytes * 8 / self.elapsed or 0.0
+
+    def __str__(self):
+        return "%d frames, %d bytes in %.3fs (%.0f pps, %.0f bps), %d dropped" % \
+            (self.frames, self.bytes, self.elapsed, self.pps, self.bps, self.dropped)
+
+def tx_dropped(interface_name):
+    """
+    Read an interface's tx_dropped counter, or None if it is not available
+    """
+    try:
+        with open("/sys/class/net/%s/statistics/tx_dropped" % interface_name) as f:
+            return int(f.read())
+    except (IOError, ValueError):
+        return None
+
+class RxStats(object):
+    """
+    Receive counters of a dataplane port, see DataPlane.rx_stats
+
+    @var packets Number of packets received
+    @var bytes Number of bytes received
+    @var pps Packets per second received over the last RATE_INTERVAL
+    @var drops Number of packets discarded because the port's queue was full
+    @var kernel_drops Number of packets the kernel dropped because the
+    socket was not read fast enough, or None if the port can't tell
+    """
+
+    def __init__(self):
+        self.packets = 0
+        self.bytes = 0
+        self.pps = 0.0
+        self.drops = 0
+        self.kernel_drops = None
+
+    def copy(self):
+        stats = RxStats()
+        stats.__dict__.update(self.__dict__)
+        return stats
+
+    def __str__(self):
+        return "%d packets, %d bytes (%.0f pps), %d dropped from queue, %s dropped by kernel" % \
+            (self.packets, self.bytes, self.pps, self.drops,
+             self.kernel_drops == None and "unknown" or self.kernel_drops)
+
 class DataPlane(Thread):
     """
     This class provides methods to send and receive packets on the dataplane.
@@ -147,6 +519,8 @@ class DataPlane(Thread):
     """
 
     MAX_QUEUE_LEN = 100
+    # Seconds over which the receive rate of each port is measured
+    RATE_INTERVAL = 1.0
 
     def __init__(self, config=None):
         Thread.__init__(self)
@@ -154,15 +528,36 @@ class DataPlane(Thread):
         # dict from port number to port object
         self.ports = {}
 
-        # dict from port number to list of (timestamp, packet)
+        # dict from port number to interface name
+        self.interface_names = {}
+
+        # dict from port number to PacketQueue
         self.packet_queues = {}
 
+        # (seq, port number) for every queued packet in arrival order.
+        # Entries for packets that were dequeued from a single port or
+        # dropped are skipped lazily by oldest_port_number.
+        self.packet_order = deque()
+        self.packet_seq = 0
+
+        # dict from port number to number of packets discarded because
+        # the port's queue was full
+        self.drops = {}
+
+        # dict from port number to RxStats, without drops, and the packet
+        # count of each port when its rate was last measured
+        self.rx_counters = {}
+        self.rate_packets = {}
+        self.rate_time = time.time()
+
         # cvar serves double duty as a regular top level lock and
         # as a condition variable
         self.cvar = Condition()
 
         # Used to wake up the event loop from another thread
         self.waker = ofutils.EventDescriptor()
+        # Incremented when self.ports changes
+        self.port_generation = 0
         self.killed = False
 
         self.logger = logging.getLogger("dataplane")
@@ -173,6 +568,18 @@ class DataPlane(Thread):
         else:
             self.config = config; 
 
+        self.max_queue_len = self.config.get("dataplane_queue_len") or \
+            self.MAX_QUEUE_LEN
+
+        # Filter expression for ports without a test-specific filter;
+        # None means bpf.DEFAULT_FILTER and "" no filter
+        self.default_filter = self.config.get("dataplane_filter")
+        if self.default_filter == None:
+            self.default_filter = bpf.DEFAULT_FILTER
+
+        # dict from port number to the filter expression set on the port
+        self.filters = {}
+
         ############################################################
         #
         # The platform/config can provide a custom DataPlanePort class
@@ -196,7 +603,17 @@ class DataPlane(Thread):
     def run(self):
         """
         Activity function for class
+
+        Waits with epoll where available, whose cost does not grow with the
+        number of ports as select's does.
         """
+        if hasattr(select, "epoll"):
+            self._epoll_loop()
+        else:
+            self._select_loop()
+        self.logger.info("Thread exit")
+
+    def _select_loop(self):
         while not self.killed:
             sockets = [self.waker] + self.ports.values()
             try:
@@ -205,29 +622,129 @@ class DataPlane(Thread):
                 print sys.exc_info()
                 self.logger.error("Select error, exiting")
                 break
+            self._receive(sel_in)
+
+    def _epoll_sync(self, epoll, registered):
+        """
+        Bring the epoll registrations in line with the waker and the ports
+
+        Ports that were replaced are unregistered and forgotten, so their
+        sockets can be closed.
+
+        @param epoll The select.epoll object
+        @param registered Dictionary from file descriptor to port object
+        """
+        current = dict([(x.fileno(), x) for x in [self.waker] + self.ports.values()])
+        for (fd, port) in registered.items():
+            if current.get(fd) is not port:
+                try:
+                    epoll.unregister(fd)
+                except (IOError, OSError, ValueError):
+                    pass # Already closed, which removes it from the set
+                del registered[fd]
+        for (fd, port) in current.items():
+            if fd not in registered:
+                epoll.register(fd, select.EPOLLIN)
+                registered[fd] = port
 
-            with self.cvar:
-                for port in sel_in:
-                    if port == self.waker:
-                        self.waker.wait()
+    def _epoll_loop(self):
+        epoll = select.epoll()
+        registered = {}
+        generation = None
+        try:
+            while not self.killed:
+                if generation != self.port_generation:
+                    generation = self.port_generation
+                    self._epoll_sync(epoll, registered)
+                try:
+                    events = epoll.poll(1)
+                except IOError as e:
+                    if e.errno == errno.EINTR:
                         continue
-                    else:
-                        # Enqueue packet
-                        pkt, timestamp = port.recv()
-                        port_number = port._port_number
+                    self.logger.error("Epoll error, exiting: %s", e)
+                    break
+                self._receive([registered[fd] for (fd, mask) in events])
+        finally:
+            epoll.close()
+
+    def _receive(self, ready):
+        """
+        Read the packets waiting on the ready ports and queue them
+
+        The ports are read without holding cvar. It is then taken once to
+        queue the packets from every port, and the waiters are woken once.
+
+        @param ready List of port objects that are readable, which may
+        include the waker
+        """
+        batches = []
+        for port in ready:
+            if port is self.waker:
+                self.waker.wait()
+                continue
+            # Ports with a recv_batch method return several packets at once
+            if hasattr(port, "recv_batch"):
+                pkts = port.recv_batch()
+            else:
+                pkts = [port.recv()]
+            if pkts:
+                batches.append((port._port_number, pkts))
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        pcap_writer = self.pcap_writer
+        now = time.time()
+        with self.cvar:
+            for (port_number, pkts) in batches:
+                counters = self.rx_counters[port_number]
+                counters.packets += len(pkts)
+                for (pkt, timestamp) in pkts:
+                    if debug:
                         self.logger.debug("Pkt len %d in on port %d",
                                           len(pkt), port_number)
-                        if self.pcap_writer:
-                            self.pcap_writer.write(pkt, timestamp, port_number)
-                        queue = self.packet_queues[port_number]
-                        if len(queue) >= self.MAX_QUEUE_LEN:
-                            # Queue full, throw away oldest
-                            queue.pop(0)
-                            self.logger.debug("Discarding oldest packet to make room")
-                        queue.append((pkt, timestamp))
+                    counters.bytes += len(pkt)
+                    if pcap_writer:
+                        pcap_writer.write(pkt, timestamp, port_number)
+                    self._enqueue(port_number, pkt, timestamp)
+            if now - self.rate_time >= self.RATE_INTERVAL:
+                self._update_rates(now)
+            if batches:
                 self.cvar.notify_all()
 
-        self.logger.info("Thread exit")
+    def _update_rates(self, now):
+        """
+        Measure the receive rate of every port. Must be called with cvar held.
+        """
+        elapsed = now - self.rate_time
+        for (port_number, counters) in self.rx_counters.items():
+            counters.pps = (counters.packets - self.rate_packets[port_number]) / elapsed
+            self.rate_packets[port_number] = counters.packets
+        self.rate_time = now
+
+    def _enqueue(self, port_number, pkt, timestamp):
+        """
+        Queue a received packet. Must be called with cvar held.
+        """
+        self.packet_seq += 1
+        if self.packet_queues[port_number].append((self.packet_seq, pkt, timestamp)):
+            # Queue full, the oldest packet was thrown away
+            self.drops[port_number] += 1
+            self.logger.debug("Discarding oldest packet to make room")
+        self.packet_order.append((self.packet_seq, port_number))
+
+        # Bound the stale entries left behind by drops and per-port polls
+        if len(self.packet_order) > 2 * self.max_queue_len * len(self.packet_queues):
+            self._rebuild_order()
+
+    def _rebuild_order(self):
+        """
+        Recreate packet_order from the live packets in the port queues
+        """
+        def entries(port_number, queue):
+            for e in queue:
+                yield (e[0], port_number)
+        self.packet_order = deque(heapq.merge(
+            *[entries(port_number, queue)
+              for (port_number, queue) in self.packet_queues.items()]))
 
     def port_add(self, interface_name, port_number):
         """
@@ -236,9 +753,18 @@ class DataPlane(Thread):
         @param port_number The port number used to refer to the port
         Stashes the port number on the created port object.
         """
-        self.ports[port_number] = self.dppclass(interface_name, port_number)
-        self.ports[port_number]._port_number = port_number
-        self.packet_queues[port_number] = []
+        port = self.dppclass(interface_name, port_number)
+        port._port_number = port_number
+        self.interface_names[port_number] = interface_name
+        with self.cvar:
+            self.packet_queues[port_number] = PacketQueue(self.max_queue_len)
+            self.drops[port_number] = 0
+            self.rx_counters[port_number] = RxStats()
+            self.rate_packets[port_number] = 0
+        # Only visible to the event loop once its queue exists
+        self.ports[port_number] = port
+        self.port_generation += 1
+        self._set_port_filter(port_number, self.default_filter)
         # Need to wake up event loop to change the sockets being selected on.
         self.waker.notify()
 
@@ -258,18 +784,135 @@ class DataPlane(Thread):
                      (bytes, len(packet)))
         return bytes
 
+    def send_burst(self, port_number, frames, pps=None, duration=None,
+                   batch=64):
+        """
+        Send a burst of frames to the given port
+
+        Without a duration each frame is sent once, in order. With a
+        duration the frames are sent repeatedly, starting over after the
+        last one, until that many seconds have passed.
+
+        Frames go out up to batch at a time, with one sendmmsg(2) call for
+        ports that have a send_batch method. With pps, a token bucket paces them to
+        that rate; otherwise they are sent as fast as the port takes them.
+        Frames the port refuses are counted as dropped, not retried.
+
+        @param port_number The port to send the frames to
+        @param frames List of raw packet data
+        @param pps Frames per second, or None for no limit
+        @param duration Seconds to send for, or None to send each frame once
+        @param batch Most frames handed to the port at once
+        @returns A BurstStats
+        """
+        port = self.ports[port_number]
+        interface_name = self.interface_names[port_number]
+        stats = BurstStats()
+        if not frames:
+            return stats
+
+        if duration != None:
+            # Repeat the frames so every batch can be sent with one call
+            frames = frames * ((batch + len(frames) - 1) // len(frames))
+            total = None
+        else:
+            total = len(frames)
+
+        if hasattr(port, "send_batch") and netutils.have_sendmmsg():
+            vector = netutils.MessageVector(frames)
+            def send(start, count):
+                try:
+                    return port.send_batch(vector, start, count)
+                except socket.error as e:
+                    if e.errno != errno.EAGAIN:
+                        return 0
+                # The socket buffer is full, give it a moment to drain
+                select.select([], [port], [], 0.01)
+                try:
+                    return port.send_batch(vector, start, count)
+                except socket.error:
+                    return 0
+        else:
+            def send(start, count):
+                sent = 0
+                for frame in frames[start:start + count]:
+                    try:
+                        if port.send(frame) != len(frame):
+                            break
+                    except socket.error:
+                        break
+                    sent += 1
+                return sent
+
+        self.logger.debug("Sending burst of %s frames to port %d%s",
+                          total or "repeated", port_number,
+                          pps and " at %d pps" % pps or "")
+        dropped_before = tx_dropped(interface_name)
+        pcap_writer = self.pcap_writer
+        start_time = last = time.time()
+        end_time = duration != None and start_time + duration or None
+        # The bucket holds 10ms worth of frames, so a short stall of this
+        # thread is made up for rather than lowering the rate
+        capacity = pps and max(batch, pps * 0.01)
+        tokens = 0.0
+        attempted = 0
+        pos = 0
+        now = start_time
+        while total == None or attempted < total:
+            if end_time != None and now >= end_time:
+                break
+            if pps:
+                tokens = min(tokens + (now - last) * pps, capacity)
+                last = now
+                if tokens < 1:
+                    # Sleep long enough to send several frames per wakeup
+                    time.sleep(max((1 - tokens) / pps,
+                                   min(batch / 2.0 / pps, 0.001)))
+                    now = time.time()
+                    continue
+                count = min(int(tokens), batch)
+            else:
+                count = batch
+            count = min(count, len(frames) - pos)
+            if total != None:
+                count = min(count, total - attempted)
+
+            sent = send(pos, count)
+            now = time.time()
+            for frame in frames[pos:pos + sent]:
+                stats.bytes += len(frame)
+                if pcap_writer:
+                    pcap_writer.write(frame, now, port_number)
+            stats.frames += sent
+            if sent == 0:
+                # Skip a frame the port refuses so the burst makes progress
+                stats.dropped += 1
+                sent = 1
+            attempted += sent
+            tokens -= sent
+            pos = (pos + sent) % len(frames)
+
+        stats.elapsed = now - start_time
+        dropped_after = tx_dropped(interface_name)
+        if dropped_before != None and dropped_after != None:
+            stats.tx_dropped = dropped_after - dropped_before
+        self.logger.debug("Burst to port %d: %s", port_number, stats)
+        return stats
+
     def oldest_port_number(self):
         """
         Returns the port number with the oldest packet, or
         None if no packets are queued.
         """
-        min_port_number = None
-        min_time = float('inf')
-        for (port_number, queue) in self.packet_queues.items():
-            if queue and queue[0][1] < min_time:
-                min_time = queue[0][1]
-                min_port_number = port_number
-        return min_port_number
+        order = self.packet_order
+        while order:
+            (seq, port_number) = order[0]
+            queue = self.packet_queues.get(port_number)
+            if queue and queue[0][0] == seq:
+                return port_number
+            # Already dequeued or dropped
+            order.popleft()
+        return None
 
     # Dequeues and yields packets in the order they were received.
     # Yields (port number, packet, received time).
@@ -288,7 +931,7 @@ class DataPlane(Thread):
                 self.logger.debug("Out of packets on port %d", rcv_port_number)
                 break
 
-            pkt, time = queue.pop(0)
+            _, pkt, time = queue.popleft()
             yield (rcv_port_number, pkt, time)
 
     def poll(self, port_number=None, timeout=-1, exp_pkt=None):
@@ -315,13 +958,16 @@ class DataPlane(Thread):
         if exp_pkt and not port_number:
             self.logger.warn("Dataplane poll with exp_pkt but no port number")
 
+        if exp_pkt:
+            exp_pkt = str(exp_pkt)
+
         # Retrieve the packet. Returns (port number, packet, time).
         def grab():
             self.logger.debug("Grabbing packet")
+            if exp_pkt:
+                return self._grab_match(port_number, exp_pkt)
             for (rcv_port_number, pkt, time) in self.packets(port_number):
-                self.logger.debug("Checking packet from port %d", rcv_port_number)
-                if not exp_pkt or match_exp_pkt(exp_pkt, pkt):
-                    return (rcv_port_number, pkt, time)
+                return (rcv_port_number, pkt, time)
             self.logger.debug("Did not find packet")
             return None
 
@@ -334,6 +980,98 @@ class DataPlane(Thread):
             self.logger.debug("Poll time out, no packet from " + str(port_number))
             return (None, None, None)
 
+    def _grab_match(self, port_number, exp_pkt):
+        """
+        Dequeue the oldest packet matching exp_pkt, discarding the packets
+        received before it on the searched ports, or all packets on those
+        ports if there is no match. Must be called with cvar held.
+
+        @param port_number Port to search, or None for all ports
+        @param exp_pkt Expected packet as a string
+        @returns (port number, packet, time) or None
+        """
+        if port_number:
+            port_numbers = [port_number]
+        else:
+            port_numbers = self.packet_queues.keys()
+
+        match = None
+        for rcv_port_number in port_numbers:
+            entry = self.packet_queues[rcv_port_number].find(exp_pkt)
+            if entry and (match is None or entry[0] < match[1][0]): #pylint: disable=E1136
+                match = (rcv_port_number, entry)
+
+        if match is None:
+            self.logger.debug("Did not find packet")
+            for rcv_port_number in port_numbers:
+                self.packet_queues[rcv_port_number].clear()
+            return None
+
+        (rcv_port_number, (seq, pkt, time)) = match
+        for n in port_numbers:
+            self.packet_queues[n].discard_until(seq)
+        self.packet_queues[rcv_port_number].popleft()
+        return (rcv_port_number, pkt, time)
+
+    def poll_many(self, expectations, timeout=-1):
+        """
+        Poll several ports for expected packets at once
+
+        Each expectation is resolved as by poll(port_number, exp_pkt=...),
+        but all of them share a single wait.
+
+        @param expectations List of (port_number, exp_pkt) pairs. A port
+        may appear more than once to expect several packets.
+        @param timeout If positive, block until every expectation is met or
+        for this many seconds
+        @return List holding, for each expectation, the received packet or
+        None if it was not received
+        """
+        exps = [(port_number, str(exp_pkt)) for (port_number, exp_pkt) in expectations]
+        results = [None] * len(exps)
+
+        def grab():
+            for (i, (port_number, exp_pkt)) in enumerate(exps):
+                if results[i] is None:
+                    ret = self._grab_match(port_number, exp_pkt)
+                    if ret:
+                        results[i] = ret[1]
+            if None in results:
+                return None
+            return results
+
+        with self.cvar:
+            ofutils.timed_wait(self.cvar, grab, timeout=timeout)
+
+        return results
+
+    def rx_stats(self, port_number=None):
+        """
+        Return the receive counters of one or all ports
+
+        @param port_number Port to get the counters of, or None for all ports
+        @returns An RxStats, or if port_number is None a dict from port
+        number to RxStats
+        """
+        if port_number == None:
+            return dict([(x, self.rx_stats(x)) for x in self.ports.keys()])
+
+        port = self.ports[port_number]
+        with self.cvar:
+            stats = self.rx_counters[port_number].copy()
+            stats.drops = self.drops[port_number]
+            if hasattr(port, "rx_dropped"):
+                # Reading the kernel's counter resets it
+                try:
+                    dropped = port.rx_dropped()
+                except socket.error:
+                    dropped = None
+                if dropped != None:
+                    counters = self.rx_counters[port_number]
+                    counters.kernel_drops = (counters.kernel_drops or 0) + dropped
+                    stats.kernel_drops = counters.kernel_drops
+        return stats
+
     def kill(self):
         """
         Stop the dataplane thread.
@@ -341,6 +1079,8 @@ class DataPlane(Thread):
         self.killed = True
         self.waker.notify()
         self.join()
+        for (port_number, stats) in sorted(self.rx_stats().items()):
+            self.logger.debug("Port %d received %s", port_number, stats)
         # Explicitly release ports to ensure we don't run out of sockets
         # even if someone keeps holding a reference to the dataplane.
         del self.ports
@@ -357,12 +1097,54 @@ class DataPlane(Thread):
         """
         Drop any queued packets.
         """
-        for port_number in self.packet_queues.keys():
-            self.packet_queues[port_number] = []
+        for queue in self.packet_queues.values():
+            queue.clear()
+        self.packet_order.clear()
+
+    def _set_port_filter(self, port_number, expr):
+        port = self.ports[port_number]
+        if hasattr(port, "set_filter"):
+            port.set_filter(expr)
+        self.filters[port_number] = expr
+
+    def set_filter(self, expr, port_number=None):
+        """
+        Set the filter expression that selects which frames are received
+        @param expr Expression as described in oftest.bpf, or "" to
+        receive every frame
+        @param port_number Port to set the filter on, or None for all ports
+        """
+        if expr:
+            # Reject a bad expression before changing any port
+            bpf.compile(expr)
+        if port_number == None:
+            port_numbers = self.ports.keys()
+        else:
+            port_numbers = [port_number]
+        for port_number in port_numbers:
+            self._set_port_filter(port_number, expr)
+
+    def reset_filters(self):
+        """
+        Set the default filter again on ports that have another one
+        """
+        for (port_number, expr) in self.filters.items():
+            if expr != self.default_filter:
+                self._set_port_filter(port_number, self.default_filter)
 
     def start_pcap(self, filename):
+        """
+        Start capturing the packets sent and received to a file
+
+        The file is written on a background thread. It is in pcapng format
+        if config["pcapng"] is set, else in pcap format.
+        """
         assert(self.pcap_writer == None)
-        self.pcap_writer = PcapWriter(filename)
+        if self.config.get("pcapng"):
+            writer = PcapngWriter(filename, self.interface_names)
+        else:
+            writer = PcapWriter(filename)
+        self.pcap_writer = AsyncWriter(writer)
 
     def stop_pcap(self):
         if self.pcap_writer:
@@ -0,0 +1,564 @@
+"""
+Test discovery index
+
+Finding the tests in a test directory used to mean importing every module
+in it, even when a single test was run. Instead, each module's source is
+scanned for its imports and classes: the bases, the testutils decorators
+(group, nonstandard, disabled, version) and the docstrings. The scans are
+kept in an index file and only redone for files whose mtime and size, or
+failing that content hash, changed.
+
+The classes are recreated from the scans as empty stand-ins with the same
+bases and decorators, so test annotations are inherited just as they are
+by the real classes. Only the modules holding selected tests are then
+imported.
+
+A module the scan cannot follow (classes defined conditionally, unknown
+decorators, computed bases) is imported to find its tests, as before.
+"""
+
+import __builtin__
+import ast
+import fnmatch
+import hashlib
+import imp
+import json
+import logging
+import os
+import sys
+import types
+
+import oftest.testutils as testutils
+
+INDEX_VERSION = 1
+
+# Testutils decorators called with an argument and applied directly
+DECORATOR_FACTORIES = (testutils.group, testutils.version)
+DECORATORS = (testutils.nonstandard, testutils.disabled)
+
+# Class attributes set by the decorators
+ANNOTATIONS = ("_groups", "_nonstandard", "_disabled", "_versions")
+
+class Unsupported(Exception):
+    """
+    Raised when a module has to be imported to find its tests
+    """
+    pass
+
+class ModuleRef(object):
+    """
+    Name bound by an import statement; resolved when used
+    """
+    def __init__(self, name):
+        self.name = name
+
+class ImportedName(object):
+    """
+    Name imported from a module that has not been imported yet
+    """
+    def __init__(self, module, attr):
+        self.module = module
+        self.attr = attr
+
+class IndexedModule(types.ModuleType):
+    """
+    Stand-in for a test module, holding the classes recreated from its scan
+
+    @var path Source file of the module
+    """
+    def __init__(self, name, path, namespace):
+        types.ModuleType.__init__(self, name) #pylint: disable=E1101
+        self.__dict__.update(namespace)
+        self.path = path
+
+# Value of a name whose value a scan does not need, like a function
+OPAQUE = object()
+
+def _run_test(self):
+    pass
+
+def _dotted(node):
+    """
+    Return the dotted name of a Name or Attribute chain, or None
+    """
+    names = []
+    while isinstance(node, ast.Attribute):
+        names.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    names.append(node.id)
+    return ".".join(reversed(names))
+
+def _literal(node, what):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise Unsupported("%s is not a literal" % what)
+
+def _is_main_guard(node):
+    """
+    Return True for 'if __name__ == "__main__":'
+    """
+    return isinstance(node, ast.If) and isinstance(node.test, ast.Compare) and \
+        _dotted(node.test.left) == "__name__" and \
+        len(node.test.comparators) == 1 and \
+        isinstance(node.test.comparators[0], ast.Str) and \
+        node.test.comparators[0].s == "__main__"
+
+def _scan_class(node):
+    bases = []
+    for base in node.bases:
+        name = _dotted(base)
+        if name is None:
+            raise Unsupported("class %s has a computed base" % node.name)
+        bases.append(name)
+
+    decorators = []
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Call):
+            name = _dotted(decorator.func)
+            if decorator.keywords or decorator.starargs or decorator.kwargs:
+                name = None
+            args = [_literal(x, "decorator argument") for x in decorator.args]
+        else:
+            name = _dotted(decorator)
+            args = None
+        if name is None:
+            raise Unsupported("class %s has a computed decorator" % node.name)
+        decorators.append([name, args])
+
+    attrs = {}
+    has_run_test = False
+    for stmt in node.body:
+        if isinstance(stmt, ast.FunctionDef) and stmt.name == "runTest":
+            has_run_test = True
+        elif isinstance(stmt, ast.Assign):
+            for target in stmt.targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                if target.id == "runTest":
+                    has_run_test = True
+                elif target.id in ANNOTATIONS:
+                    attrs[target.id] = _literal(stmt.value, target.id)
+                elif target.id == "__metaclass__":
+                    raise Unsupported("class %s has a metaclass" % node.name)
+
+    return ["class", node.name, bases, decorators,
+            ast.get_docstring(node, clean=False), attrs, has_run_test]
+
+def _scan_stmt(node):
+    """
+    Return the records for a module level statement
+    """
+    if isinstance(node, ast.Import):
+        records = []
+        for alias in node.names:
+            if alias.asname:
+                records.append(["import", alias.asname, alias.name])
+            else:
+                top = alias.name.split(".")[0]
+                records.append(["import", top, top])
+        return records
+    elif isinstance(node, ast.ImportFrom):
+        if node.level:
+            raise Unsupported("relative import")
+        if node.names[0].name == "*":
+            return [["from", node.module, None]]
+        return [["from", node.module,
+                 [[x.name, x.asname or x.name] for x in node.names]]]
+    elif isinstance(node, ast.ClassDef):
+        return [_scan_class(node)]
+    elif isinstance(node, ast.FunctionDef):
+        return [["bind", node.name, None]]
+    elif isinstance(node, (ast.Assign, ast.AugAssign)):
+        targets = getattr(node, "targets", None) or [node.target]
+        records = []
+        for target in targets:
+            if isinstance(target, ast.Name):
+                if target.id == "__all__":
+                    records.append(["bind", "__all__", None])
+                    records.append(["all", _literal(node.value, "__all__")])
+                elif isinstance(node, ast.Assign):
+                    records.append(["bind", target.id, _dotted(node.value)])
+                else:
+                    records.append(["bind", target.id, None])
+            elif isinstance(target, ast.Attribute):
+                if target.attr in ANNOTATIONS or target.attr == "runTest":
+                    raise Unsupported("%s assigned outside a class" % target.attr)
+            else:
+                for name in ast.walk(target):
+                    if isinstance(name, ast.Name) and isinstance(name.ctx, ast.Store):
+                        records.append(["bind", name.id, None])
+        return records
+    elif isinstance(node, ast.Delete):
+        return [["del", x.id] for x in node.targets if isinstance(x, ast.Name)]
+    elif isinstance(node, ast.Exec):
+        raise Unsupported("exec statement")
+    elif isinstance(node, (ast.If, ast.For, ast.While, ast.TryExcept,
+                           ast.TryFinally, ast.With)):
+        if _is_main_guard(node):
+            return []
+        records = []
+        for child in ast.walk(node):
+            if isinstance(child, (ast.ClassDef, ast.Exec)):
+                raise Unsupported("%s inside a %s statement" %
+                                  (type(child).__name__, type(node).__name__))
+            elif isinstance(child, (ast.Import, ast.ImportFrom)):
+                # Optional imports, as in "try: import x except ImportError:"
+                for record in _scan_stmt(child):
+                    if record[0] == "import":
+                        records.append(["import_if", record[1], record[2]])
+                    elif record[2] is None:
+                        raise Unsupported("import * inside a %s statement" %
+                                          type(node).__name__)
+                    else:
+                        records.extend(["import_if", local, record[1]]
+                                       for (attr, local) in record[2]) #pylint: disable=E1133
+            elif isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+                records.append(["bind", child.id, None])
+            elif isinstance(child, ast.FunctionDef):
+                records.append(["bind", child.name, None])
+        return records
+    return []
+
+def scan_source(source, filename="<unknown>"):
+    """
+    Scan the source of a module
+
+    @param source Module source
+    @param filename Name of the source file, for error messages
+    @returns A dictionary with the module docstring ("doc") and the
+    records of the module level statements that bind names ("body"), or
+    with the reason the module has to be imported ("unsupported")
+    """
+    try:
+        tree = ast.parse(source, filename)
+    except SyntaxError as e:
+        return {"unsupported": "syntax error: %s" % e}
+    body = []
+    try:
+        for node in tree.body:
+            body.extend(_scan_stmt(node))
+    except Unsupported as e:
+        return {"unsupported": str(e)}
+    return {"doc": ast.get_docstring(tree, clean=False), "body": body}
+
+def _str(value):
+    """
+    Convert a unicode string read from the JSON index back to str
+    """
+    if isinstance(value, unicode):
+        return value.encode("utf-8")
+    return value
+
+class TestIndex(object):
+    """
+    Scans of module sources, keyed by source path
+
+    @var path The index file, or None to keep the index in memory only
+    @var entries Dictionary from source path to a dictionary with the
+    file's "mtime", "size", "sha1" and "scan"
+    @var dirty True if entries changed since the index was read
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION:
+                    self.entries = data["entries"]
+            except (IOError, ValueError, KeyError) as e:
+                logging.warning("Ignoring test index %s: %s", path, e)
+
+    def scan(self, filename):
+        """
+        Return the scan of a source file, from the index if it is current
+
+        @param filename Path of the source file
+        """
+        filename = os.path.abspath(filename)
+        st = os.stat(filename)
+        entry = self.entries.get(filename)
+        if entry and entry["mtime"] == st.st_mtime and entry["size"] == st.st_size:
+            return entry["scan"]
+
+        with open(filename) as f:
+            source = f.read()
+        sha1 = hashlib.sha1(source).hexdigest()
+        if not entry or entry["sha1"] != sha1:
+            entry = { "sha1": sha1, "scan": scan_source(source, filename) }
+        entry["mtime"] = st.st_mtime
+        entry["size"] = st.st_size
+        self.entries[filename] = entry
+        self.dirty = True
+        return entry["scan"]
+
+    def save(self):
+        """
+        Write the index file if it changed
+        """
+        if not self.path or not self.dirty:
+            return
+        tmp = "%s.%d" % (self.path, os.getpid())
+        try:
+            with open(tmp, "w") as f:
+                json.dump({ "version": INDEX_VERSION, "entries": self.entries }, f)
+            os.rename(tmp, self.path)
+            self.dirty = False
+        except (IOError, OSError, ValueError) as e:
+            logging.warning("Could not write test index %s: %s", self.path, e)
+
+class Discovery(object):
+    """
+    Recreates test module namespaces from their scans
+
+    Modules outside the test directory are not scanned. Those already
+    imported are used as they are, and the others are imported only when
+    a class in a test module needs a value from them, such as a base
+    class. Names imported from them are otherwise assumed not to be
+    tests.
+
+    @var index TestIndex holding the scans
+    @var test_files Dictionary from test module name to source path
+    @var namespaces Dictionary from test module name to the recreated
+    namespace, or to the Unsupported exception raised building it
+    @var pending Dictionary from test module name to the modules it
+    star-imports that have not been imported yet
+    """
+
+    def __init__(self, index, test_files):
+        self.index = index
+        self.test_files = test_files
+        self.namespaces = {}
+        self.pending = {}
+
+    def module(self, name):
+        """
+        Return the recreated namespace dictionary of a test module, the
+        module if it has been imported, or None
+
+        @param name Absolute module name
+        """
+        if sys.modules.get(name) is not None:
+            return sys.modules[name]
+        if name not in self.test_files:
+            return None
+        if name in self.namespaces:
+            if isinstance(self.namespaces[name], Unsupported):
+                raise self.namespaces[name]
+            return self.namespaces[name]
+
+        scan = self.index.scan(self.test_files[name])
+        # Like sys.modules, holds the partly built namespace so that
+        # circular imports see the names bound so far
+        namespace = self.namespaces[name] = {}
+        self.pending[name] = []
+        try:
+            if "unsupported" in scan:
+                raise Unsupported(scan["unsupported"])
+            self._execute(namespace, name, scan)
+        except Unsupported as e:
+            self.namespaces[name] = e
+            raise
+        return namespace
+
+    def _import(self, name):
+        """
+        Import a module from outside the test directory
+        """
+        try:
+            __import__(name)
+        except ImportError as e:
+            raise Unsupported("importing %s: %s" % (name, e))
+        return sys.modules[name]
+
+    def _attribute(self, value, attr):
+        if isinstance(value, ImportedName):
+            value = self._attribute(ModuleRef(value.module), value.attr)
+        if isinstance(value, ModuleRef):
+            mod = self.module(value.name)
+            if mod is None:
+                mod = self._import(value.name)
+            if isinstance(mod, dict):
+                if attr not in mod:
+                    raise Unsupported("%s has no attribute %s" % (value.name, attr))
+                return mod[attr]
+            if attr in vars(mod):
+                return vars(mod)[attr]
+            if sys.modules.get(value.name + "." + attr) is not None:
+                return ModuleRef(value.name + "." + attr)
+            # Attributes computed on access, or submodules not imported
+            return OPAQUE
+        elif value is OPAQUE:
+            return OPAQUE
+        return getattr(value, attr, OPAQUE)
+
+    def _resolve(self, modname, namespace, dotted):
+        """
+        Return the value of a dotted name, importing modules as needed
+        """
+        parts = dotted.split(".")
+        if parts[0] in namespace:
+            value = namespace[parts[0]]
+        elif hasattr(__builtin__, parts[0]):
+            value = getattr(__builtin__, parts[0])
+        else:
+            for star in self.pending[modname]:
+                if parts[0] in vars(self._import(star)):
+                    value = vars(sys.modules[star])[parts[0]]
+                    break
+            else:
+                raise Unsupported("name %s is not defined" % parts[0])
+        if isinstance(value, ImportedName):
+            value = self._attribute(ModuleRef(value.module), value.attr)
+        for attr in parts[1:]:
+            value = self._attribute(value, attr)
+        return value
+
+    def _star(self, modname, name):
+        """
+        Return the names and values imported by 'from name import *'
+        """
+        mod = self.module(name)
+        if mod is None:
+            self.pending[modname].append(name)
+            return {}
+        if isinstance(mod, dict):
+            self.pending[modname].extend(self.pending[name])
+            namespace = mod
+        else:
+            namespace = vars(mod)
+        names = namespace.get("__all__")
+        if names is None:
+            names = [x for x in namespace if not x.startswith("_")]
+        return dict((x, namespace[x]) for x in names if x in namespace)
+
+    def _class(self, modname, namespace, record):
+        (_, name, bases, decorators, doc, attrs, has_run_test) = record
+        bases = tuple(self._resolve(modname, namespace, x) for x in bases)
+        for base in bases:
+            if not isinstance(base, (type, types.ClassType)):
+                raise Unsupported("base of class %s is not a class" % name)
+        attrs = dict(attrs, __module__=modname, __doc__=_str(doc))
+        if has_run_test:
+            attrs["runTest"] = _run_test
+        if all(isinstance(x, types.ClassType) for x in bases):
+            metaclass = types.ClassType
+        else:
+            metaclass = type
+        try:
+            cls = metaclass(str(name), bases, attrs)
+        except TypeError as e:
+            raise Unsupported("class %s: %s" % (name, e))
+
+        for (decorator, args) in reversed(decorators):
+            fn = self._resolve(modname, namespace, decorator)
+            try:
+                if args is not None and fn in DECORATOR_FACTORIES:
+                    cls = fn(*[_str(x) for x in args])(cls)
+                elif args is None and fn in DECORATORS:
+                    cls = fn(cls)
+                else:
+                    raise Unsupported("class %s has decorator %s" % (name, decorator))
+            except (TypeError, ValueError) as e:
+                raise Unsupported("class %s: %s" % (name, e))
+        return cls
+
+    def _execute(self, namespace, name, scan):
+        namespace.update(__name__=name, __doc__=_str(scan["doc"]),
+                         __file__=self.test_files[name])
+        for record in scan["body"]:
+            kind = record[0]
+            if kind == "import":
+                namespace[record[1]] = ModuleRef(record[2])
+            elif kind == "from":
+                if record[2] is None:
+                    namespace.update(self._star(name, record[1]))
+                else:
+                    for (attr, local) in record[2]:
+                        if self.module(record[1]) is None:
+                            namespace[local] = ImportedName(record[1], attr)
+                        else:
+                            namespace[local] = self._attribute(ModuleRef(record[1]), attr)
+            elif kind == "import_if":
+                # The name may not be bound; a conditional import of a
+                # test module could hide its tests
+                if record[2].split(".")[0] in self.test_files:
+                    raise Unsupported("conditional import of %s" % record[2])
+                namespace[record[1]] = OPAQUE
+            elif kind == "class":
+                namespace[record[1]] = self._class(name, namespace, record)
+            elif kind == "bind":
+                if record[2] is None:
+                    namespace[record[1]] = OPAQUE
+                else:
+                    namespace[record[1]] = self._resolve(name, namespace, record[2])
+            elif kind == "all":
+                namespace["__all__"] = record[1]
+            elif kind == "del":
+                namespace.pop(record[1], None)
+
+def load_module(modname, root):
+    """
+    Import a test module from the root directory
+    """
+    if sys.modules.has_key(modname):
+        return sys.modules[modname]
+    try:
+        return imp.load_module(modname, *imp.find_module(modname, [root]))
+    except:
+        logging.warning("Could not import file " + modname + ".py")
+        raise
+
+def find_test_modules(test_dir, index=None):
+    """
+    Find the modules in a test directory
+
+    @param test_dir Directory searched recursively for test modules
+    @param index TestIndex to scan the modules with, or None to import
+    every module
+    @returns A list of (module name, module) pairs in directory order,
+    with an IndexedModule for each module whose tests were found from the
+    index
+    """
+    walk = []
+    for root, dirs, filenames in os.walk(test_dir):
+        for filename in fnmatch.filter(filenames, '[!.]*.py'):
+            modname = os.path.splitext(os.path.basename(filename))[0]
+            walk.append((modname, os.path.join(root, filename)))
+    test_files = dict(walk)
+
+    result = {}
+    if index is not None:
+        discovery = Discovery(index, test_files)
+        for (modname, path) in walk:
+            try:
+                namespace = discovery.module(modname)
+            except Unsupported as e:
+                logging.debug("Importing test module %s: %s", modname, e)
+                continue
+            if isinstance(namespace, dict):
+                result[modname] = IndexedModule(modname, path, namespace)
+        index.save()
+
+    for (modname, path) in walk:
+        if modname not in result:
+            result[modname] = load_module(modname, os.path.dirname(path))
+
+    # Test modules imported by those modules no longer need a stand-in
+    for (modname, path) in walk:
+        if sys.modules.get(modname) is not None:
+            result[modname] = sys.modules[modname]
+
+    return [(modname, result[modname]) for (modname, path) in walk]
+
+def import_module(mod):
+    """
+    Import the module an IndexedModule stands in for
+    """
+    return load_module(mod.__name__, os.path.dirname(mod.path))
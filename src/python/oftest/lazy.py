@@ -0,0 +1,87 @@
+"""
+Deferred imports
+
+oft is often started once per test, so the time spent importing modules
+that are never used in a run adds up. The modules here stand in for a
+module whose attributes are imported the first time they are used.
+"""
+
+import os
+import sys
+import types
+
+class LazyModule(types.ModuleType):
+    """
+    Module whose attributes are loaded on first access
+
+    Subclasses implement _load, which returns the value of an attribute
+    or raises AttributeError. Loaded values are cached in the module.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = self._load(name)
+        setattr(self, name, value)
+        return value
+
+    def _load(self, name):
+        raise AttributeError(name)
+
+class LazyProtocol(LazyModule):
+    """
+    Stand-in for a loxi protocol package such as loxi.of13
+
+    The package __init__ imports every submodule, including the large
+    message module, and copies in the names from const and common. Here
+    a submodule is imported when it is first used, and constants only
+    need the const module.
+
+    @var __path__ The protocol package directory
+    """
+
+    def __init__(self, name, path):
+        LazyModule.__init__(self, name)
+        self.__path__ = [path]
+        self.__file__ = os.path.join(path, "__init__.py")
+        self.__package__ = name
+
+    def _load(self, name):
+        if self._submodule_exists(name):
+            __import__(self.__name__ + "." + name)
+            return sys.modules[self.__name__ + "." + name]
+        if name == "ProtocolError":
+            import loxi
+            return loxi.ProtocolError
+        if not name.startswith("_"):
+            # No name is defined in both const and common, so looking in
+            # the cheap const module first matches the package __init__
+            for modname in ("const", "common"):
+                if name in vars(getattr(self, modname)):
+                    return vars(getattr(self, modname))[name]
+        raise AttributeError("'%s' has no attribute '%s'" % (self.__name__, name))
+
+    def _submodule_exists(self, name):
+        path = os.path.join(self.__path__[0], name)
+        return os.path.exists(path + ".py") or os.path.exists(path + ".pyc")
+
+def protocol(ver):
+    """
+    Return the loxi protocol module for the given wire version
+
+    Like loxi.protocol, except that the submodules are imported on first
+    use. If the protocol package has already been imported it is
+    returned as is.
+
+    @param ver OpenFlow wire version
+    """
+    import loxi
+    if ver not in loxi.version_names:
+        raise ValueError
+    short = "of" + loxi.version_names[ver].replace(".", "")
+    name = "loxi." + short
+    if name not in sys.modules:
+        path = os.path.join(os.path.dirname(loxi.__file__), short)
+        sys.modules[name] = LazyProtocol(name, path)
+        setattr(loxi, short, sys.modules[name])
+    return sys.modules[name]
@@ -22,6 +22,8 @@ Network utilities for the OpenFlow test framework
 ##                                                                         ##
 #############################################################################
 
+import os
+import errno
 import socket
 from fcntl import ioctl
 import struct
@@ -38,10 +40,24 @@ SIOCGIFINDEX   = 0x8933          # name -> if_index mapping
 PACKET_ADD_MEMBERSHIP  = 1
 PACKET_DROP_MEMBERSHIP = 2
 PACKET_MR_PROMISC      = 1
+PACKET_RX_RING         = 5
+PACKET_STATISTICS      = 6
+PACKET_VERSION         = 10
+
+# From linux/if_packet.h
+TPACKET_V3             = 2
+TP_STATUS_KERNEL       = 0
+TP_STATUS_USER         = 1
+TP_STATUS_VLAN_VALID   = 0x10
+TP_STATUS_VLAN_TPID_VALID = 0x40
 
 # From bits/socket.h
 SOL_PACKET = 263
 
+# From asm-generic/socket.h
+SO_ATTACH_FILTER = 26
+SO_DETACH_FILTER = 27
+
 def get_if(iff,cmd):
   s=socket.socket()
   ifreq = ioctl(s, cmd, struct.pack("16s16x",iff))
@@ -59,3 +75,183 @@ def set_promisc(s,iff,val=1):
       cmd = PACKET_DROP_MEMBERSHIP
   s.setsockopt(SOL_PACKET, cmd, mreq)
 
+
+def get_packet_drops(s):
+  """
+  Return the number of packets a packet socket dropped because its receive
+  buffer or ring was full, since the previous call
+  """
+  # struct tpacket_stats, which reading also resets
+  (packets, drops) = struct.unpack("II", s.getsockopt(SOL_PACKET, PACKET_STATISTICS, 8))
+  return drops
+
+def attach_filter(s, program):
+  """
+  Attach a classic BPF program to a socket, replacing any attached one
+  @param program List of (code, jt, jf, k) instructions, see oftest.bpf
+  """
+  import ctypes
+  insns = ctypes.create_string_buffer("".join([struct.pack("HBBI", *x) for x in program]))
+  fprog = struct.pack("HP", len(program), ctypes.addressof(insns))
+  s.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+
+def detach_filter(s):
+  """
+  Remove the BPF program attached to a socket, if any
+  """
+  try:
+    s.setsockopt(socket.SOL_SOCKET, SO_DETACH_FILTER, 0)
+  except socket.error:
+    pass
+
+###########################################################################
+##                                                                         ##
+## Batched transmit and receive with sendmmsg(2) and recvmmsg(2)           ##
+##                                                                         ##
+###########################################################################
+
+# From bits/socket.h
+MSG_DONTWAIT = 0x40
+
+# ctypes and the C library are loaded on first use, since importing
+# ctypes noticeably slows down oft's startup
+_libc = None
+_iovec = None
+_mmsghdr = None
+
+def have_sendmmsg():
+  """
+  Return whether the C library provides sendmmsg(2)
+  """
+  return _load_libc() and hasattr(_libc, "sendmmsg")
+
+def have_recvmmsg():
+  """
+  Return whether the C library provides recvmmsg(2)
+  """
+  return _load_libc() and hasattr(_libc, "recvmmsg")
+
+def _load_libc():
+  global _libc, _iovec, _mmsghdr
+  if _libc != None:
+    return bool(_libc)
+
+  import ctypes
+  import ctypes.util
+
+  class iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_char_p),
+                ("iov_len", ctypes.c_size_t)]
+
+  class msghdr(ctypes.Structure):
+    _fields_ = [("msg_name", ctypes.c_void_p),
+                ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.c_void_p),
+                ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p),
+                ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+  class mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", msghdr),
+                ("msg_len", ctypes.c_uint)]
+
+  (_iovec, _mmsghdr) = (iovec, mmsghdr)
+  try:
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+  except OSError:
+    _libc = False
+    return False
+  if hasattr(libc, "sendmmsg"):
+    libc.sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p,
+                              ctypes.c_uint, ctypes.c_int]
+  if hasattr(libc, "recvmmsg"):
+    libc.recvmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p,
+                              ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+  _libc = libc
+  return True
+
+class MessageVector(object):
+  """
+  Frames prepared once so that any run of them can be sent on a bound or
+  connected socket with a single sendmmsg(2) call
+
+  have_sendmmsg() must have returned True. The frames are not copied; the
+  vector keeps references to them.
+  """
+
+  def __init__(self, frames):
+    import ctypes
+    self.frames = frames
+    self.iovs = (_iovec * len(frames))()
+    self.msgs = (_mmsghdr * len(frames))()
+    iov_base = ctypes.addressof(self.iovs)
+    for (i, frame) in enumerate(frames):
+      self.iovs[i].iov_base = frame
+      self.iovs[i].iov_len = len(frame)
+      self.msgs[i].msg_hdr.msg_iov = iov_base + i * ctypes.sizeof(_iovec)
+      self.msgs[i].msg_hdr.msg_iovlen = 1
+    self.base = ctypes.addressof(self.msgs)
+    self.msg_size = ctypes.sizeof(_mmsghdr)
+    self.get_errno = ctypes.get_errno
+
+  def __len__(self):
+    return len(self.frames)
+
+  def send(self, sock, start, count):
+    """
+    Send frames[start:start + count]
+    @param sock Socket to send on, which may be non-blocking
+    @returns The number of frames sent, which may be fewer than count
+    @raises socket.error If not even the first frame could be sent
+    """
+    sent = _libc.sendmmsg(sock.fileno(), self.base + start * self.msg_size, #pylint: disable=E1101
+                          count, 0)
+    if sent < 0:
+      err = self.get_errno()
+      raise socket.error(err, os.strerror(err))
+    return sent
+
+class ReceiveVector(object):
+  """
+  Buffers for receiving up to count frames of at most size bytes with a
+  single recvmmsg(2) call
+
+  have_recvmmsg() must have returned True. Longer frames are truncated to
+  size bytes, as with recv.
+  """
+
+  def __init__(self, count, size):
+    import ctypes
+    self.count = count
+    self.size = size
+    self.buf = ctypes.create_string_buffer(count * size)
+    self.iovs = (_iovec * count)()
+    self.msgs = (_mmsghdr * count)()
+    self.buf_base = ctypes.addressof(self.buf)
+    iov_base = ctypes.addressof(self.iovs)
+    for i in xrange(count):
+      self.iovs[i].iov_base = self.buf_base + i * size
+      self.iovs[i].iov_len = size
+      self.msgs[i].msg_hdr.msg_iov = iov_base + i * ctypes.sizeof(_iovec)
+      self.msgs[i].msg_hdr.msg_iovlen = 1
+    self.base = ctypes.addressof(self.msgs)
+    self.string_at = ctypes.string_at
+    self.get_errno = ctypes.get_errno
+
+  def recv(self, sock):
+    """
+    Receive the frames waiting on a socket without blocking
+    @returns List of up to count frames, empty if none were waiting
+    @raises socket.error On errors other than EAGAIN
+    """
+    received = _libc.recvmmsg(sock.fileno(), self.base, self.count, #pylint: disable=E1101
+                              MSG_DONTWAIT, None)
+    if received < 0:
+      err = self.get_errno()
+      if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+        return []
+      raise socket.error(err, os.strerror(err))
+    msgs = self.msgs
+    return [self.string_at(self.buf_base + i * self.size, msgs[i].msg_len)
+            for i in xrange(received)]
@@ -7,7 +7,11 @@ import random
 import time
 import os
 import fcntl
+import errno
+import socket
 import logging
+import itertools
+from collections import deque
 
 default_timeout = None # set by oft
 default_negative_timeout = None # set by oft
@@ -62,3 +66,182 @@ class EventDescriptor():
 
     def fileno(self):
         return self.pipe_rd
+
+class RecvBuffer(object):
+    """
+    Reusable receive buffer for framed stream protocols.
+
+    Data is read with recv_into straight into a preallocated bytearray and
+    complete frames are handed out as memoryview slices of it, so no string
+    concatenation or slicing happens per read or per frame. Only the
+    trailing partial frame is ever moved, back to the start of the buffer,
+    when the free space runs low.
+
+    Frames yielded by frames() are only valid until the next call to
+    recv_into() or feed(); copy them (e.g. with tobytes()) to keep them.
+    """
+
+    def __init__(self, size=65536, min_read=4096):
+        """
+        @param size Initial buffer size in bytes
+        @param min_read Compact the buffer before reading if less than
+        this many bytes are free at the end
+        """
+        self.buf = bytearray(size)
+        self.view = memoryview(self.buf)
+        self.min_read = min_read
+        self.start = 0 # First unconsumed byte
+        self.end = 0 # End of valid data
+        self.need = 0 # Total length of the partial frame at start, if known
+
+    def __len__(self):
+        return self.end - self.start
+
+    def _make_room(self, count):
+        """
+        Ensure at least count bytes are free at the end of the buffer
+        """
+        pending = self.end - self.start
+        if pending == 0:
+            self.start = self.end = 0
+        if len(self.buf) - self.end >= count:
+            return
+
+        size = len(self.buf)
+        while size - pending < count:
+            size *= 2
+
+        if size != len(self.buf):
+            # Exported memoryviews prevent resizing in place
+            buf = bytearray(size)
+            buf[0:pending] = self.view[self.start:self.end].tobytes()
+            self.buf = buf
+            self.view = memoryview(buf)
+        elif pending:
+            self.buf[0:pending] = self.buf[self.start:self.end]
+        self.start, self.end = 0, pending
+
+    def recv_into(self, sock, flags=0):
+        """
+        Read whatever is available from sock into the buffer
+
+        @param sock The socket to read from
+        @param flags Flags passed to the socket's recv_into
+        @returns The number of bytes read, 0 on end of stream
+        """
+        self._make_room(max(self.min_read, self.need - (self.end - self.start)))
+        if flags:
+            count = sock.recv_into(self.view[self.end:], 0, flags)
+        else:
+            count = sock.recv_into(self.view[self.end:])
+        self.end += count
+        return count
+
+    def feed(self, data):
+        """
+        Append a string of already received data to the buffer
+        """
+        self._make_room(len(data))
+        self.buf[self.end:self.end+len(data)] = data
+        self.end += len(data)
+
+    def frames(self, hdr_len, frame_len):
+        """
+        Yield each complete frame in the buffer as a memoryview
+
+        Frames are consumed as they are yielded.
+
+        @param hdr_len Number of bytes needed to determine a frame's length
+        @param frame_len Function taking (buf, offset) and returning the
+        total length of the frame starting at offset
+        """
+        while self.end - self.start >= hdr_len:
+            length = max(frame_len(self.buf, self.start), hdr_len)
+            if self.start + length > self.end:
+                self.need = length
+                return
+            self.need = 0
+            frame = self.view[self.start:self.start+length]
+            self.start += length
+            yield frame
+        if self.start == self.end:
+            self.start = self.end = 0
+
+    def clear(self):
+        """
+        Discard any buffered data
+        """
+        self.start = self.end = self.need = 0
+
+class SendQueue(object):
+    """
+    Queue of frames waiting to be written to a non-blocking stream socket
+
+    flush() writes queued frames together, up to chunk bytes per send(2)
+    call, until the queue is empty or the socket is full. When a write
+    stops part way through, the written bytes are dropped from the head of
+    the queue and the rest, which may span several frames, goes out first
+    on the next flush(). The queue length counts frames, including one
+    that has been partly written.
+    """
+
+    def __init__(self, max_frames, chunk=65536):
+        """
+        @param max_frames Most frames to keep queued
+        @param chunk Most bytes to write with one send(2) call
+        """
+        self.max_frames = max_frames
+        self.chunk = chunk
+        self.queue = deque()
+        self.offset = 0 # Bytes of the first frame already written
+
+    def __len__(self):
+        return len(self.queue)
+
+    def append(self, frame):
+        """
+        Queue a frame unless the queue is full
+
+        @returns True if the frame was queued
+        """
+        if len(self.queue) >= self.max_frames:
+            return False
+        self.queue.append(frame)
+        return True
+
+    def flush(self, sock):
+        """
+        Write queued frames until the queue is empty or sock is full
+
+        @param sock The non-blocking socket to write to
+        @returns The number of bytes written
+        @raises socket.error For errors other than a full socket
+        """
+        written = 0
+        queue = self.queue
+        while queue:
+            head = self.offset and queue[0][self.offset:] or queue[0]
+            data = [head]
+            size = len(head)
+            for frame in itertools.islice(queue, 1, None):
+                if size + len(frame) > self.chunk:
+                    break
+                data.append(frame)
+                size += len(frame)
+            data = len(data) == 1 and head or "".join(data)
+            try:
+                count = sock.send(data)
+            except socket.error as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                    return written
+                raise
+            written += count
+            # Drop the frames written in full and note how much of the
+            # next one went out
+            sent = self.offset + count
+            while queue and sent >= len(queue[0]):
+                sent -= len(queue.popleft())
+            self.offset = sent
+            if count < len(data):
+                break
+        return written
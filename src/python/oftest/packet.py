@@ -3,33 +3,74 @@
 # Copyright (c) 2012, 2013 Big Switch Networks, Inc.
 """
 Wrap scapy to satisfy pylint
+
+Importing scapy is a large part of oft's startup time, so it is imported
+the first time one of the layers below is used rather than when this
+module is imported.
 """
 from oftest import config
+from oftest.lazy import LazyModule
 import sys
 
-try:
-    import scapy.config
-    import scapy.route
-    import scapy.layers.l2
-    import scapy.layers.inet
+def scapy_layers():
+    """
+    Import scapy and return a dictionary from layer name to layer class
+    """
+    try:
+        import scapy.config
+        import scapy.route
+        import scapy.layers.l2
+        import scapy.layers.inet
+        if not config["disable_ipv6"]:
+            import scapy.route6
+            import scapy.layers.inet6
+    except ImportError:
+        sys.exit("Need to install scapy for packet parsing")
+
+    layers = {
+        "Ether": scapy.layers.l2.Ether,
+        "LLC": scapy.layers.l2.LLC,
+        "SNAP": scapy.layers.l2.SNAP,
+        "Dot1Q": scapy.layers.l2.Dot1Q,
+        "IP": scapy.layers.inet.IP,
+        "IPOption": scapy.layers.inet.IPOption,
+        "ARP": scapy.layers.inet.ARP,
+        "TCP": scapy.layers.inet.TCP,
+        "UDP": scapy.layers.inet.UDP,
+        "ICMP": scapy.layers.inet.ICMP,
+    }
+
     if not config["disable_ipv6"]:
-        import scapy.route6
-        import scapy.layers.inet6
-except ImportError:
-    sys.exit("Need to install scapy for packet parsing")
-
-Ether = scapy.layers.l2.Ether
-LLC = scapy.layers.l2.LLC
-SNAP = scapy.layers.l2.SNAP
-Dot1Q = scapy.layers.l2.Dot1Q
-IP = scapy.layers.inet.IP
-IPOption = scapy.layers.inet.IPOption
-ARP = scapy.layers.inet.ARP
-TCP = scapy.layers.inet.TCP
-UDP = scapy.layers.inet.UDP
-ICMP = scapy.layers.inet.ICMP
-
-if not config["disable_ipv6"]:
-    IPv6 = scapy.layers.inet6.IPv6
-    ICMPv6Unknown = scapy.layers.inet6.ICMPv6Unknown
-    ICMPv6EchoRequest = scapy.layers.inet6.ICMPv6EchoRequest
+        layers["IPv6"] = scapy.layers.inet6.IPv6
+        layers["ICMPv6Unknown"] = scapy.layers.inet6.ICMPv6Unknown
+        layers["ICMPv6EchoRequest"] = scapy.layers.inet6.ICMPv6EchoRequest
+
+    return layers
+
+if False:
+    # Never run. The layers are set by LazyPacketModule on first use, so
+    # pylint needs these imports to know this module has them.
+    from scapy.layers.l2 import Ether, LLC, SNAP, Dot1Q
+    from scapy.layers.inet import IP, IPOption, ARP, TCP, UDP, ICMP
+    from scapy.layers.inet6 import IPv6, ICMPv6Unknown, ICMPv6EchoRequest
+
+class LazyPacketModule(LazyModule):
+    """
+    This module, with the layers imported on first access
+    """
+
+    def _load(self, name):
+        if not self.__dict__.get("_layers_loaded"):
+            self.__dict__.update(scapy_layers())
+            self._layers_loaded = True
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError("'%s' has no attribute '%s'" % (self.__name__, name))
+
+_module = LazyPacketModule(__name__, __doc__)
+_module.__dict__.update((k, v) for (k, v) in globals().items()
+                        if k not in ("__name__", "__doc__"))
+# Keep this module referenced; Python 2 clears the globals of a module
+# when it is freed
+_module._module = sys.modules[__name__]
+sys.modules[__name__] = _module
@@ -0,0 +1,316 @@
+"""
+Packet templates
+
+Building a packet with scapy costs far more than the handful of bytes
+that differ between two packets of the same shape. A template holds the
+bytes of one shape (builder, length, VLAN tag present, ...) as built by
+scapy the first time it is asked for, plus the offset of every field the
+builder takes as an argument. Later requests for the same shape copy the
+template, patch the fields that differ and update the IP and L4
+checksums covering them incrementally (RFC 1624), so the result is
+byte-identical to str(builder(**kwargs)).
+
+Builders and arguments without a layout here (IP options, a forced IHL,
+unknown builders, values scapy would have to resolve or truncate) are
+built with scapy.
+"""
+
+import re
+import socket
+import struct
+import sys
+
+MAX_TEMPLATES = 256
+
+class PacketTemplate(object):
+    """
+    Raw bytes of one packet shape and the layout of its variable fields
+
+    @var data The packet bytes as built by scapy
+    @var fields Dictionary from argument name to (offset, encode, checksums);
+    encode turns the argument into the field bytes and checksums lists
+    the offsets of the checksums covering the field
+    """
+
+    def __init__(self, data, fields):
+        self.data = data
+        self.fields = fields
+
+    def build(self, values):
+        """
+        Return the packet bytes with the given field values
+
+        @param values Dictionary from argument name to value
+        """
+        buf = bytearray(self.data)
+        for (name, value) in values.iteritems():
+            (offset, encode, checksums) = self.fields[name]
+            new = encode(value)
+            end = offset + len(new)
+            if buf[offset:end] == new:
+                continue
+            # Checksums are over 16 bit words; every layer starts on one
+            start = offset & ~1
+            stop = (end + 1) & ~1
+            old = buf[start:stop]
+            buf[offset:end] = new
+            for csum_offset in checksums:
+                csum_update(buf, csum_offset, old, buf[start:stop])
+        return str(buf)
+
+def csum_update(buf, offset, old, new):
+    """
+    Update the checksum at offset for a change from old to new
+
+    @param buf Packet bytearray, modified in place
+    @param offset Offset of the 16 bit checksum in buf
+    @param old Replaced bytes, an even number starting on a word boundary
+    @param new Replacement bytes, same length
+
+    Like scapy, a zero UDP checksum is left as zero rather than sent as
+    0xffff.
+    """
+    total = ~((buf[offset] << 8) | buf[offset + 1]) & 0xffff
+    for i in xrange(0, len(old), 2):
+        total += ~((old[i] << 8) | old[i + 1]) & 0xffff
+        total += (new[i] << 8) | new[i + 1]
+    while total >> 16:
+        total = (total & 0xffff) + (total >> 16)
+    csum = ~total & 0xffff
+    buf[offset] = csum >> 8
+    buf[offset + 1] = csum & 0xff
+
+_MAC_RE = re.compile(r"^[0-9a-fA-F]{1,2}(:[0-9a-fA-F]{1,2}){5}$")
+_IPV4_RE = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+
+def _mac(value):
+    if not _MAC_RE.match(value):
+        raise ValueError("Unsupported MAC address %r" % value)
+    return "".join(chr(int(x, 16)) for x in value.split(":"))
+
+def _ipv4(value):
+    if not _IPV4_RE.match(value):
+        raise ValueError("Unsupported IPv4 address %r" % value)
+    return socket.inet_aton(value)
+
+def _ipv6(value):
+    return socket.inet_pton(socket.AF_INET6, value)
+
+def _u8(value):
+    return struct.pack("!B", value)
+
+def _u16(value):
+    return struct.pack("!H", value)
+
+def _u32(value):
+    return struct.pack("!L", value)
+
+def _bits(value, width):
+    if not 0 <= value < (1 << width):
+        raise ValueError("Value %r does not fit in %d bits" % (value, width))
+    return value
+
+def _vlan_tci(pcp, cfi, vid):
+    return (_bits(pcp, 3) << 13) | (_bits(cfi, 1) << 12) | _bits(vid, 12)
+
+def _eth_layout(fields):
+    fields["eth_dst"] = (0, _mac, ())
+    fields["eth_src"] = (6, _mac, ())
+
+def _ipv4_layout(fields, l3, pseudo):
+    """
+    @param pseudo Checksums covering the addresses through a pseudo header
+    """
+    ip_csum = [l3 + 10]
+    both = ip_csum + pseudo
+    fields["ip_tos"] = (l3 + 1, _u8, ip_csum)
+    fields["ip_id"] = (l3 + 4, _u16, ip_csum)
+    fields["ip_ttl"] = (l3 + 8, _u8, ip_csum)
+    fields["ip_src"] = (l3 + 12, _ipv4, both)
+    fields["ip_dst"] = (l3 + 16, _ipv4, both)
+
+def _ipv6_layout(fields, l3, pseudo):
+    fields["ipv6_word"] = (l3, _u32, ())
+    fields["ipv6_hlim"] = (l3 + 7, _u8, ())
+    fields["ipv6_src"] = (l3 + 8, _ipv6, pseudo)
+    fields["ipv6_dst"] = (l3 + 24, _ipv6, pseudo)
+
+def _vlan(values, args, enable, cfi):
+    """
+    Add the VLAN tag to values if present; return the L3 offset
+    """
+    if not enable:
+        return 14
+    values["vlan_tci"] = _vlan_tci(args["vlan_pcp"], cfi, args["vlan_vid"])
+    return 18
+
+def _copy(values, args, names):
+    for name in names:
+        values[name] = args[name]
+
+def _ipv4_l4(args, l4_names, l4_csum):
+    """
+    Shape and values for the IPv4 TCP and UDP builders
+    """
+    if args["ip_ihl"] is not None or args["ip_options"]:
+        return None
+    values = {}
+    enable = args["dl_vlan_enable"]
+    l3 = _vlan(values, args, enable, args["dl_vlan_cfi"])
+    _copy(values, args, ["eth_dst", "eth_src", "ip_tos", "ip_ttl",
+                         "ip_src", "ip_dst"])
+    values.update((x, args[x]) for x in l4_names)
+    def layout(fields):
+        csum = [l3 + 20 + l4_csum]
+        _ipv4_layout(fields, l3, csum)
+        fields[l4_names[0]] = (l3 + 20, _u16, csum)
+        fields[l4_names[1]] = (l3 + 22, _u16, csum)
+    return (bool(enable),), values, layout
+
+def _tcp(args):
+    spec = _ipv4_l4(args, ["tcp_sport", "tcp_dport"], 16)
+    if spec:
+        shape, values, layout = spec
+        spec = (shape + (args["tcp_flags"],), values, layout)
+    return spec
+
+def _udp(args):
+    return _ipv4_l4(args, ["udp_sport", "udp_dport"], 6)
+
+def _icmp(args):
+    if not isinstance(args["icmp_data"], str):
+        return None
+    values = {}
+    enable = args["dl_vlan_enable"]
+    l3 = _vlan(values, args, enable, 0)
+    _copy(values, args, ["eth_dst", "eth_src", "ip_tos", "ip_ttl", "ip_id",
+                         "ip_src", "ip_dst", "icmp_code"])
+    def layout(fields):
+        # ICMP has no pseudo header
+        _ipv4_layout(fields, l3, [])
+        l4 = l3 + 20
+        fields["icmp_code"] = (l4 + 1, _u8, [l4 + 2])
+    # The ICMP type selects the scapy header layout
+    shape = (bool(enable), args["icmp_type"], args["icmp_data"])
+    return shape, values, layout
+
+def _ipv6_l4(args, l4_names, l4_csum):
+    """
+    Shape and values for the IPv6 builders
+    """
+    values = {}
+    enable = bool(args["dl_vlan_enable"] or args["vlan_vid"] or args["vlan_pcp"])
+    l3 = _vlan(values, args, enable, 0)
+    _copy(values, args, ["eth_dst", "eth_src", "ipv6_src", "ipv6_dst"])
+    values["ipv6_hlim"] = args["ipv6_hlim"]
+    values["ipv6_word"] = (6 << 28) | (_bits(args["ipv6_tc"], 8) << 20) | \
+        _bits(args["ipv6_fl"], 20)
+    values.update((x, args[x]) for x in l4_names)
+    def layout(fields):
+        l4 = l3 + 40
+        csum = [l4 + l4_csum]
+        _ipv6_layout(fields, l3, csum)
+        encode = _u8 if l4_names[0] == "icmp_type" else _u16
+        fields[l4_names[0]] = (l4, encode, csum)
+        fields[l4_names[1]] = (l4 + len(encode(0)), encode, csum)
+    return (enable,), values, layout
+
+def _tcpv6(args):
+    shape, values, layout = _ipv6_l4(args, ["tcp_sport", "tcp_dport"], 16)
+    return shape + (args["tcp_flags"],), values, layout
+
+def _udpv6(args):
+    return _ipv6_l4(args, ["udp_sport", "udp_dport"], 6)
+
+def _icmpv6(args):
+    return _ipv6_l4(args, ["icmp_type", "icmp_code"], 2)
+
+def _arp(args):
+    values = {}
+    enable = bool(args["vlan_vid"] or args["vlan_pcp"])
+    l3 = _vlan(values, args, enable, 0)
+    _copy(values, args, ["eth_dst", "eth_src", "arp_op", "hw_snd", "ip_snd",
+                         "hw_tgt", "ip_tgt"])
+    def layout(fields):
+        fields["arp_op"] = (l3 + 6, _u16, ())
+        fields["hw_snd"] = (l3 + 8, _mac, ())
+        fields["ip_snd"] = (l3 + 14, _ipv4, ())
+        fields["hw_tgt"] = (l3 + 18, _mac, ())
+        fields["ip_tgt"] = (l3 + 24, _ipv4, ())
+    return (enable,), values, layout
+
+def _eth(args):
+    values = {}
+    _copy(values, args, ["eth_dst", "eth_src", "eth_type"])
+    def layout(fields):
+        fields["eth_type"] = (12, _u16, ())
+    return (), values, layout
+
+# Builder name to a function returning (shape, values, layout) or None
+_SPECS = {
+    "simple_tcp_packet": _tcp,
+    "simple_udp_packet": _udp,
+    "simple_icmp_packet": _icmp,
+    "simple_tcpv6_packet": _tcpv6,
+    "simple_udpv6_packet": _udpv6,
+    "simple_icmpv6_packet": _icmpv6,
+    "simple_arp_packet": _arp,
+    "simple_eth_packet": _eth,
+}
+
+_defaults = {}
+_templates = {}
+
+def _builder_defaults(builder):
+    defaults = _defaults.get(builder)
+    if defaults is None:
+        import inspect # Slow to import, and only needed here
+        argspec = inspect.getargspec(builder)
+        names = argspec.args[len(argspec.args) - len(argspec.defaults or ()):]
+        defaults = dict(zip(names, argspec.defaults or ()))
+        _defaults[builder] = defaults
+    return defaults
+
+def packet_bytes(builder, **kwargs):
+    """
+    Return str(builder(**kwargs)), from a cached template when possible
+
+    @param builder One of the testutils.simple_*_packet functions, or any
+    function returning a scapy packet
+    @param kwargs Keyword arguments for builder
+    """
+    spec = _SPECS.get(builder.__name__)
+    if spec is None:
+        return str(builder(**kwargs))
+
+    try:
+        args = dict(_builder_defaults(builder))
+        args.update(kwargs)
+        shape, values, layout = spec(args)
+    except (KeyError, TypeError, ValueError):
+        spec = None
+    if spec is None:
+        return str(builder(**kwargs))
+
+    key = (builder, args["pktlen"],
+           getattr(sys.modules.get(builder.__module__), "MINSIZE", 0)) + shape
+    try:
+        template = _templates.get(key)
+    except TypeError: # Unhashable argument
+        return str(builder(**kwargs))
+
+    if template is None:
+        data = str(builder(**kwargs))
+        fields = {}
+        _eth_layout(fields)
+        fields["vlan_tci"] = (14, _u16, ())
+        layout(fields)
+        if len(_templates) >= MAX_TEMPLATES:
+            _templates.clear()
+        _templates[key] = PacketTemplate(data, fields)
+        return data
+
+    try:
+        return template.build(values)
+    except (TypeError, ValueError, struct.error, socket.error):
+        return str(builder(**kwargs))
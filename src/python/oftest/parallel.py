@@ -0,0 +1,293 @@
+"""
+Parallel test execution
+
+oft --jobs N splits the dataplane ports into N disjoint groups and runs one
+oft worker process per group. Each worker gets its own controller port (or
+switch, if several switch IPs are given), log directory and xUnit directory.
+Workers must not share a switch, since tests clear and inspect the whole flow
+table: either give one switch IP per job, or have a different switch connect
+to each job's controller port.
+Tests are assigned to the workers longest first using the durations recorded
+by earlier runs, and the workers' xUnit results are merged when they finish.
+
+A worker is the same oft command line plus --job-spec FILE, where FILE holds
+the configuration the worker overrides and the tests it runs.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+##@var DEFAULT_DURATION
+# Estimated duration in seconds of a test when no test has been timed yet
+DEFAULT_DURATION = 1.0
+
+def split_ports(port_map, jobs):
+    """
+    Split a port map into disjoint groups of consecutive ports
+
+    @param port_map Dictionary from OpenFlow port numbers to interfaces
+    @param jobs Number of groups
+    @returns A list of jobs lists of OpenFlow port numbers
+    """
+    ports = sorted(port_map)
+    if len(ports) < jobs:
+        raise ValueError("%d ports can not be split between %d jobs" %
+                         (len(ports), jobs))
+    (size, extra) = divmod(len(ports), jobs)
+    groups = []
+    start = 0
+    for i in range(jobs):
+        end = start + size + (i < extra and 1 or 0)
+        groups.append(ports[start:end])
+        start = end
+    return groups
+
+def schedule(tests, timings, jobs):
+    """
+    Assign tests to jobs, longest first, each to the least loaded job
+
+    Tests that have not been timed are assumed to take the mean of the
+    recorded durations.
+
+    @param tests List of test names
+    @param timings Dictionary from test names to durations in seconds
+    @param jobs Number of jobs
+    @returns A list of jobs lists of test names, longest first
+    """
+    known = [timings[x] for x in tests if x in timings]
+    default = known and sum(known) / len(known) or DEFAULT_DURATION
+    estimate = dict((x, timings.get(x, default)) for x in tests)
+
+    queues = [[] for i in range(jobs)]
+    loads = [0.0] * jobs
+    for test in sorted(tests, key=lambda x: (-estimate[x], x)):
+        i = loads.index(min(loads))
+        queues[i].append(test)
+        loads[i] += estimate[test]
+    return queues
+
+def load_timings(path):
+    """
+    Read recorded test durations
+
+    @param path Timings file, which need not exist
+    @returns A dictionary from test names to durations in seconds
+    """
+    try:
+        with open(path) as f:
+            return dict((str(k), v) for (k, v) in json.load(f).items())
+    except (IOError, ValueError):
+        return {}
+
+def save_timings(path, timings):
+    """
+    Record test durations, keeping those of tests that were not run
+
+    @param path Timings file
+    @param timings Dictionary from test names to durations in seconds
+    """
+    merged = load_timings(path)
+    merged.update(timings)
+    tmp = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        with open(tmp, "w") as f:
+            json.dump(merged, f, indent=1, sort_keys=True)
+        os.rename(tmp, path)
+    except (IOError, OSError) as e:
+        logging.warning("Could not save test timings to %s: %s", path, e)
+
+class TimedSuite(unittest.TestSuite):
+    """
+    Test suite that records how long each of its tests takes
+
+    The tests are timed from the result's startTest to its stopTest, so
+    they run exactly as in a plain TestSuite, class and module fixtures
+    included.
+
+    @var timings Dictionary from test names to durations in seconds
+    @var names Dictionary from the id of each test to its name
+    """
+
+    def __init__(self, timings):
+        unittest.TestSuite.__init__(self)
+        self.timings = timings
+        self.names = {}
+
+    def add_timed(self, test, name):
+        """
+        Add a test whose duration is recorded under name
+        """
+        self.names[id(test)] = name
+        self.addTest(test)
+
+    def run(self, result, debug=False):
+        started = {}
+        (start_test, stop_test) = (result.startTest, result.stopTest)
+
+        def startTest(test):
+            started[id(test)] = time.time()
+            start_test(test)
+
+        def stopTest(test):
+            stop_test(test)
+            start = started.pop(id(test), None)
+            if start != None and id(test) in self.names:
+                self.timings[self.names[id(test)]] = time.time() - start
+
+        (result.startTest, result.stopTest) = (startTest, stopTest)
+        try:
+            return unittest.TestSuite.run(self, result, debug)
+        finally:
+            (result.startTest, result.stopTest) = (start_test, stop_test)
+
+def merge_xunit(paths, output):
+    """
+    Merge xUnit result files into one file
+
+    @param paths xUnit files, each with a testsuite or testsuites root
+    @param output Merged file, with a testsuites root
+    """
+    root = ET.Element("testsuites")
+    for path in paths:
+        suite = ET.parse(path).getroot()
+        if suite.tag == "testsuites":
+            root.extend(list(suite))
+        else:
+            root.append(suite)
+    ET.ElementTree(root).write(output, encoding="UTF-8")
+
+def job_path(config, job, suffix):
+    """
+    Name a file belonging to a job next to the main log
+
+    @param config The oft configuration dictionary
+    @param job Job number
+    @param suffix Appended to the name, e.g. ".out"
+    """
+    if config["log_dir"] != None:
+        return os.path.join(config["log_dir"], "job%d%s" % (job, suffix))
+    else:
+        return "%s-job%d%s" % (os.path.splitext(config["log_file"])[0], job, suffix)
+
+def job_config(config, job, ports):
+    """
+    Configuration a job overrides
+
+    @param config The oft configuration dictionary
+    @param job Job number
+    @param ports OpenFlow port numbers of the job
+    @returns A dictionary of configuration values
+    """
+    result = {
+        "jobs": 1,
+        "ports": ",".join(str(x) for x in ports),
+        "test_spec": "",
+        "test_file": None,
+        "timings_file": job_path(config, job, ".timings"),
+        "xunit_dir": os.path.join(config["xunit_dir"], "job%d" % job),
+    }
+
+    if config["log_dir"] != None:
+        result["log_dir"] = job_path(config, job, "")
+    else:
+        result["log_file"] = job_path(config, job, ".log")
+
+    switch_ips = (config["switch_ip"] or "").split(",")
+    if len(switch_ips) > 1:
+        # One switch per job, each at the configured port
+        result["switch_ip"] = switch_ips[job]
+    else:
+        result["controller_port"] = config["controller_port"] + job
+
+    return result
+
+def load_job_spec(path):
+    """
+    Read the job spec a worker was started with
+
+    @param path Job spec file written by run_jobs
+    @returns A tuple of (configuration overrides, list of test names)
+    """
+    def plain(value):
+        if isinstance(value, unicode):
+            return str(value)
+        return value
+
+    with open(path) as f:
+        spec = json.load(f)
+    overrides = dict((str(k), plain(v)) for (k, v) in spec["config"].items())
+    return (overrides, [str(x) for x in spec["tests"]])
+
+def run_jobs(config, tests, argv):
+    """
+    Run tests in parallel worker processes
+
+    @param config The oft configuration dictionary, with the port map set
+    @param tests List of test names to run
+    @param argv The oft command line, which each worker is started with
+    @returns 0 if every worker succeeded, else 1
+    """
+    jobs = config["jobs"]
+    switch_ips = (config["switch_ip"] or "").split(",")
+    if len(switch_ips) == 1 and switch_ips[0]:
+        raise ValueError("--jobs needs one switch IP per job; with one switch "
+                         "the jobs would share its flow table")
+    if len(switch_ips) > 1 and len(switch_ips) < jobs:
+        raise ValueError("%d switch IPs given for %d jobs" % (len(switch_ips), jobs))
+    if len(switch_ips) == 1:
+        logging.warning("Jobs listen on controller ports %d to %d; each port must "
+                        "be served by a different switch, or the jobs will share "
+                        "flow tables and packet-ins",
+                        config["controller_port"], config["controller_port"] + jobs - 1)
+    port_groups = split_ports(config["port_map"], jobs)
+    queues = schedule(tests, load_timings(config["timings_file"]), jobs)
+
+    workers = []
+    for job in range(jobs):
+        if not queues[job]:
+            continue
+        spec = {"config": job_config(config, job, port_groups[job]),
+                "tests": queues[job]}
+        spec_path = job_path(config, job, ".json")
+        with open(spec_path, "w") as f:
+            json.dump(spec, f, indent=1)
+        out_path = job_path(config, job, ".out")
+        logging.info("Job %d: ports %s, %d tests, output in %s",
+                     job, spec["config"]["ports"], len(queues[job]), out_path)
+        with open(out_path, "w") as out:
+            proc = subprocess.Popen([sys.executable] + argv + ["--job-spec", spec_path],
+                                    stdout=out, stderr=subprocess.STDOUT)
+        workers.append((job, spec, proc, out_path))
+
+    status = 0
+    timings = {}
+    xunit_files = []
+    for (job, spec, proc, out_path) in workers:
+        code = proc.wait()
+        if code != 0:
+            status = 1
+            logging.error("Job %d failed with status %d, see %s", job, code, out_path)
+            print("Job %d failed, see %s" % (job, out_path))
+        timings.update(load_timings(spec["config"]["timings_file"]))
+        xunit_dir = spec["config"]["xunit_dir"]
+        if config["xunit"] and os.path.isdir(xunit_dir):
+            xunit_files += [os.path.join(xunit_dir, x) for x in sorted(os.listdir(xunit_dir))
+                            if x.endswith(".xml")]
+
+    save_timings(config["timings_file"], timings)
+
+    if config["xunit"]:
+        merge_xunit(xunit_files, os.path.join(config["xunit_dir"], "TEST-oft.xml"))
+        for (job, spec, proc, out_path) in workers:
+            shutil.rmtree(spec["config"]["xunit_dir"], ignore_errors=True)
+
+    print("Ran %d tests in %d jobs: %s" % (len(tests), len(workers),
+                                          status and "FAILED" or "OK"))
+    return status
@@ -4,6 +4,7 @@ Utility parsing functions
 
 import sys
 import socket
+import struct
 import packet as scapy
 
 def parse_mac(mac_str):
@@ -73,6 +74,156 @@ def packet_type_classify(ether):
         arp = None
     return (dot1q, ip, tcp, udp, icmp, arp)
 
+def _scapy_decodes(cls, fields):
+    """
+    Return True if scapy may decode the payload of a cls layer with the
+    given field values as a further layer
+    """
+    for (fval, payload_cls) in cls.payload_guess:
+        # Fields not given are assumed to match
+        if all(fields.get(k, v) == v for (k, v) in fval.iteritems()):
+            return True
+    return False
+
+_icmp_min_len = {}
+
+def _icmp_header_len(cls, icmp_type):
+    """
+    Length of the fixed header scapy dissects for an ICMP or ICMPv6 type
+
+    A shorter payload is left undecoded (Raw) by scapy.
+    """
+    key = (cls, icmp_type)
+    if key not in _icmp_min_len:
+        if cls is scapy.ICMP:
+            _icmp_min_len[key] = len(str(scapy.ICMP(type=icmp_type)))
+        else:
+            import scapy.layers.inet6 as inet6
+            name = inet6.icmp6typescls.get(icmp_type, "ICMPv6Unknown")
+            _icmp_min_len[key] = len(str(getattr(inet6, name)()))
+    return _icmp_min_len[key]
+
+_ether = struct.Struct("!6s6sH")
+_dot1q = struct.Struct("!HH")
+_ipv4 = struct.Struct("!BBHHHBBHLL")
+_ipv6 = struct.Struct("!LHBB16s16s")
+_ports = struct.Struct("!HH")
+_arp = struct.Struct("!6s4s6s4s")
+
+def raw_packet_layers(data):
+    """
+    Decode the headers of an Ethernet frame without scapy
+
+    Walks Ethernet, 802.1Q tags, IPv4, IPv6, TCP, UDP, ICMP, ICMPv6 and ARP
+    headers straight from the bytes, stopping where scapy would stop
+    decoding. Frames that scapy would decode differently (802.3 length
+    fields, truncated headers, IPv4 options, IPv6 extension headers, layers
+    bound to other scapy classes) are left to scapy.
+
+    @param data The frame as a string
+    @return List of (name, fields) tuples in header order, or None if the
+    frame needs scapy. The fields are, by name:
+      ether: (dst, src, type)
+      dot1q: (prio, vlan, type)
+      ip: (proto, tos, src, dst)
+      ipv6: (nh, tc, src, dst, fl)
+      tcp, udp: (sport, dport)
+      icmp, icmpv6: (type, code)
+      arp: (op, hwsrc, psrc, hwdst, pdst)
+    MAC addresses are lists of integers as from parse_mac, IPv4 addresses
+    integers as from parse_ip and IPv6 addresses 16 byte strings.
+    """
+    end = len(data)
+    if end < _ether.size:
+        return None
+    (dst, src, eth_type) = _ether.unpack_from(data)
+    if eth_type <= 1500:
+        return None # 802.3 frame
+    layers = [("ether", (map(ord, dst), map(ord, src), eth_type))]
+    offset = _ether.size
+
+    while eth_type == 0x8100:
+        if end - offset < _dot1q.size:
+            return None
+        (tci, eth_type) = _dot1q.unpack_from(data, offset)
+        if eth_type <= 1500:
+            return None
+        layers.append(("dot1q", (tci >> 13, tci & 0xfff, eth_type)))
+        offset += _dot1q.size
+
+    if eth_type == 0x0800:
+        if end - offset < _ipv4.size:
+            return None
+        (ver_ihl, tos, length, ident, frag, ttl, proto, csum, ip_src, ip_dst) = \
+            _ipv4.unpack_from(data, offset)
+        if ver_ihl != 0x45 or length < 20:
+            return None
+        layers.append(("ip", (proto, tos, ip_src, ip_dst)))
+        offset += 20
+        end = min(end, offset - 20 + length)
+        frag &= 0x1fff
+        if frag or proto not in (1, 6, 17):
+            if _scapy_decodes(scapy.IP, { "frag": frag, "proto": proto }):
+                return None
+            return layers
+    elif eth_type == 0x86dd:
+        if end - offset < _ipv6.size:
+            return None
+        (ver_tc_fl, length, proto, hlim, ip_src, ip_dst) = \
+            _ipv6.unpack_from(data, offset)
+        if ver_tc_fl >> 28 != 6:
+            return None
+        layers.append(("ipv6", (proto, (ver_tc_fl >> 20) & 0xff, ip_src, ip_dst,
+                                ver_tc_fl & 0xfffff)))
+        offset += _ipv6.size
+        end = min(end, offset + length)
+        if proto == 58:
+            proto = 1
+        elif proto == 59:
+            return layers # No next header
+        elif proto not in (6, 17):
+            return None # Possibly an extension header
+    elif eth_type == 0x0806:
+        if end - offset < 8 + _arp.size:
+            return None
+        op = _ports.unpack_from(data, offset + 4)[1]
+        (hwsrc, psrc, hwdst, pdst) = _arp.unpack_from(data, offset + 8)
+        layers.append(("arp", (op, map(ord, hwsrc), struct.unpack("!L", psrc)[0],
+                               map(ord, hwdst), struct.unpack("!L", pdst)[0])))
+        return layers
+    elif _scapy_decodes(scapy.Ether, { "type": eth_type }):
+        return None
+    else:
+        return layers
+
+    # TCP, UDP, ICMP or ICMPv6 over IP
+    if proto == 6:
+        if end - offset < 20:
+            return None
+        fields = _ports.unpack_from(data, offset)
+        if _scapy_decodes(scapy.TCP, { "sport": fields[0], "dport": fields[1] }):
+            return None
+        layers.append(("tcp", fields))
+    elif proto == 17:
+        if end - offset < 8:
+            return None
+        fields = _ports.unpack_from(data, offset)
+        if _scapy_decodes(scapy.UDP, { "sport": fields[0], "dport": fields[1] }):
+            return None
+        layers.append(("udp", fields))
+    else:
+        if end - offset < 4:
+            return None
+        icmp_type = ord(data[offset])
+        if layers[-1][0] == "ip":
+            (name, cls) = ("icmp", scapy.ICMP)
+        else:
+            (name, cls) = ("icmpv6", getattr(scapy, "ICMPv6Unknown", None))
+        if cls and end - offset < _icmp_header_len(cls, icmp_type):
+            return None
+        layers.append((name, (icmp_type, ord(data[offset + 1]))))
+    return layers
+
 def packet_to_flow_match(packet):
     """
     Create a flow match that matches packet with the given wildcards
@@ -101,6 +252,9 @@ def packet_to_flow_match_v1(packet):
     import loxi.of10 as ofp
 
     if type(packet) == type(""):
+        layers = raw_packet_layers(packet)
+        if layers is not None:
+            return raw_layers_to_flow_match_v1(layers, ofp)
         ether = scapy.Ether(packet)
     else:
         ether = packet
@@ -169,6 +323,58 @@ def packet_to_flow_match_v1(packet):
 
     return match
 
+def raw_layers_to_flow_match_v1(layers, ofp):
+    """
+    OpenFlow 1.0 match from the output of raw_packet_layers
+
+    Gives the same match as packet_to_flow_match_v1 does through scapy,
+    including taking the first header of each kind anywhere in the frame.
+    """
+    found = {}
+    for (name, fields) in layers:
+        found.setdefault(name, fields)
+
+    match = ofp.match()
+    match.wildcards = ofp.OFPFW_ALL
+    (match.eth_dst, match.eth_src, match.eth_type) = found["ether"]
+    match.wildcards &= ~(ofp.OFPFW_DL_DST | ofp.OFPFW_DL_SRC | ofp.OFPFW_DL_TYPE)
+
+    if "dot1q" in found:
+        (match.vlan_pcp, match.vlan_vid, match.eth_type) = found["dot1q"]
+    else:
+        match.vlan_vid = ofp.OFP_VLAN_NONE
+        match.vlan_pcp = 0
+    match.wildcards &= ~(ofp.OFPFW_DL_VLAN | ofp.OFPFW_DL_VLAN_PCP)
+
+    if "ip" in found:
+        (proto, match.ip_dscp, match.ipv4_src, match.ipv4_dst) = found["ip"]
+        match.wildcards &= ~(ofp.OFPFW_NW_SRC_MASK | ofp.OFPFW_NW_DST_MASK |
+                             ofp.OFPFW_NW_TOS)
+
+    ports = None
+    if "tcp" in found:
+        match.ip_proto = 6
+        ports = found["tcp"]
+    elif "udp" in found:
+        match.ip_proto = 17
+        ports = found["udp"]
+    if ports:
+        match.wildcards &= ~ofp.OFPFW_NW_PROTO
+        (match.tcp_src, match.tcp_dst) = ports
+        match.wildcards &= ~(ofp.OFPFW_TP_SRC | ofp.OFPFW_TP_DST)
+
+    if "icmp" in found:
+        match.ip_proto = 1
+        (match.tcp_src, match.tcp_dst) = found["icmp"]
+        match.wildcards &= ~ofp.OFPFW_NW_PROTO
+
+    if "arp" in found:
+        (match.ip_proto, hwsrc, match.ipv4_src, hwdst, match.ipv4_dst) = found["arp"]
+        match.wildcards &= ~(ofp.OFPFW_NW_PROTO | ofp.OFPFW_NW_SRC_MASK |
+                             ofp.OFPFW_NW_DST_MASK)
+
+    return match
+
 def packet_to_flow_match_v3(packet):
     """
     OpenFlow 1.2 implementation of packet_to_flow_match
@@ -276,10 +482,78 @@ def packet_to_flow_match_oxm(packet, ofp):
         match.oxm_list.append(ofp.oxm.icmpv6_code(layer.code))
 
     if type(packet) == type(""):
+        layers = raw_packet_layers(packet)
+        if layers is not None:
+            return raw_layers_to_flow_match_oxm(layers, ofp)
         ether = scapy.Ether(packet)
     else:
         ether = packet
 
     match = ofp.match()
-    parse_ether_layer(packet, match)
+    parse_ether_layer(ether, match)
+    return match
+
+def raw_layers_to_flow_match_oxm(layers, ofp):
+    """
+    OXM match from the output of raw_packet_layers
+
+    Gives the same OXM list as packet_to_flow_match_oxm does through scapy,
+    following the headers in order from the Ethernet header.
+    """
+    match = ofp.match()
+    oxms = match.oxm_list
+    (dst, src, eth_type) = layers[0][1]
+    oxms.append(ofp.oxm.eth_dst(dst))
+    oxms.append(ofp.oxm.eth_src(src))
+
+    rest = layers[1:] + [(None, None)]
+    if rest[0][0] == "dot1q":
+        (prio, vlan, eth_type) = rest.pop(0)[1]
+        oxms.append(ofp.oxm.eth_type(eth_type))
+        oxms.append(ofp.oxm.vlan_vid(ofp.OFPVID_PRESENT|vlan))
+        oxms.append(ofp.oxm.vlan_pcp(prio))
+    else:
+        oxms.append(ofp.oxm.eth_type(eth_type))
+        oxms.append(ofp.oxm.vlan_vid(ofp.OFP_VLAN_NONE))
+
+    (name, fields) = rest[0]
+    if name == "ip":
+        (proto, tos, ip_src, ip_dst) = fields
+        oxms.append(ofp.oxm.ip_proto(proto))
+        oxms.append(ofp.oxm.ip_dscp(tos >> 2))
+        oxms.append(ofp.oxm.ip_ecn(tos & 3))
+        oxms.append(ofp.oxm.ipv4_src(ip_src))
+        oxms.append(ofp.oxm.ipv4_dst(ip_dst))
+    elif name == "ipv6":
+        (proto, tc, ip_src, ip_dst, fl) = fields
+        oxms.append(ofp.oxm.ip_proto(proto))
+        oxms.append(ofp.oxm.ip_dscp(tc >> 2))
+        oxms.append(ofp.oxm.ip_ecn(tc & 3))
+        oxms.append(ofp.oxm.ipv6_src(ip_src))
+        oxms.append(ofp.oxm.ipv6_dst(ip_dst))
+        oxms.append(ofp.oxm.ipv6_flabel(fl))
+    elif name == "arp":
+        (op, hwsrc, psrc, hwdst, pdst) = fields
+        oxms.append(ofp.oxm.arp_op(op))
+        oxms.append(ofp.oxm.arp_spa(psrc))
+        oxms.append(ofp.oxm.arp_tpa(pdst))
+        oxms.append(ofp.oxm.arp_sha(hwsrc))
+        oxms.append(ofp.oxm.arp_tha(hwdst))
+        return match
+    else:
+        return match
+
+    (name, fields) = rest[1]
+    if name == "tcp":
+        oxms.append(ofp.oxm.tcp_src(fields[0]))
+        oxms.append(ofp.oxm.tcp_dst(fields[1]))
+    elif name == "udp":
+        oxms.append(ofp.oxm.udp_src(fields[0]))
+        oxms.append(ofp.oxm.udp_dst(fields[1]))
+    elif name == "icmp":
+        oxms.append(ofp.oxm.icmpv4_type(fields[0]))
+        oxms.append(ofp.oxm.icmpv4_code(fields[1]))
+    elif name == "icmpv6":
+        oxms.append(ofp.oxm.icmpv6_type(fields[0]))
+        oxms.append(ofp.oxm.icmpv6_code(fields[1]))
     return match
@@ -1,20 +1,69 @@
 """
 Pcap file writer
+
+PcapWriter writes classic pcap files, recording each packet's OpenFlow port
+in a PPI header. PcapngWriter writes pcapng files with an interface
+description block per OpenFlow port and nanosecond timestamps. Either can be
+wrapped in an AsyncWriter so the dataplane thread never waits for the disk.
 """
 
 import struct
+import select
+import logging
+import threading
+from collections import deque
+import ofutils
 
 PcapHeader = struct.Struct("<LHHLLLL")
 PcapPktHeader = struct.Struct("<LLLL")
 PPIPktHeader = struct.Struct("<BBHL")
 PPIAggregateField = struct.Struct("<HHL")
+# PcapPktHeader, PPIPktHeader and PPIAggregateField in one
+PcapPPIHeader = struct.Struct("<LLLLBBHLHHL")
+
+PcapngBlockHeader = struct.Struct("<LL")
+PcapngSectionHeader = struct.Struct("<LLLHHqL")
+PcapngInterfaceHeader = struct.Struct("<LLHHL")
+PcapngPacketHeader = struct.Struct("<LLLLLLL")
+PcapngOption = struct.Struct("<HH")
+PcapngLength = struct.Struct("<L")
+
+PCAPNG_SHB = 0x0A0D0D0A
+PCAPNG_IDB = 1
+PCAPNG_EPB = 6
+PCAPNG_OPT_ENDOFOPT = 0
+PCAPNG_OPT_IF_NAME = 2
+PCAPNG_OPT_IF_DESCRIPTION = 3
+PCAPNG_OPT_IF_TSRESOL = 9
+LINKTYPE_ETHERNET = 1
+
+# Buffer size of the capture files
+BUFFER_SIZE = 1 << 20
+
+class Timestamp(float):
+    """
+    Time in seconds that also keeps the exact nanoseconds it was made from
+
+    Ports that get nanosecond timestamps from the kernel return these so
+    pcapng files keep the precision a float loses.
+    """
+
+    __slots__ = ("ns",)
+
+    def __new__(cls, sec, nsec):
+        self = float.__new__(cls, sec + nsec * 1e-9)
+        self.ns = sec * 1000000000 + nsec
+        return self
+
+def _pad(data):
+    return data + "\0" * (-len(data) % 4)
 
 class PcapWriter(object):
     def __init__(self, filename):
         """
         Open a pcap file
         """
-        self.stream = file(filename, 'w')
+        self.stream = open(filename, 'wb', BUFFER_SIZE)
 
         self.stream.write(PcapHeader.pack(
             0xa1b2c3d4, # magic
@@ -26,33 +75,181 @@ class PcapWriter(object):
             192 # PPI linktype
         ))
 
-    def write(self, data, timestamp, port):
+    def encode(self, data, timestamp, port):
         """
-        Write a packet to a pcap file
+        Return a packet record
 
         'data' should be a string containing the packet data.
         'timestamp' should be a float.
         'port' should be an integer port number.
         """
         ppi_len = PPIPktHeader.size + PPIAggregateField.size
-        self.stream.write(PcapPktHeader.pack(
+        return PcapPPIHeader.pack(
             int(timestamp), # timestamp seconds
             int((timestamp - int(timestamp)) * 10**6), # timestamp microseconds
             len(data) + ppi_len, # truncated length
-            len(data) + ppi_len # un-truncated length
-        ))
-        self.stream.write(PPIPktHeader.pack(
-            0, # version
-            0, # flags
-            ppi_len, # length
+            len(data) + ppi_len, # un-truncated length
+            0, # PPI version
+            0, # PPI flags
+            ppi_len, # PPI length
             1, # ethernet dlt
-        ))
-        self.stream.write(PPIAggregateField.pack(8, PPIAggregateField.size - 4, port))
-        self.stream.write(data)
+            8, # aggregate field type
+            PPIAggregateField.size - 4, # aggregate field length
+            port) + data
+
+    def write(self, data, timestamp, port):
+        """
+        Write a packet to a pcap file
+
+        See encode for the arguments.
+        """
+        self.stream.write(self.encode(data, timestamp, port))
+
+    def write_many(self, packets):
+        """
+        Write a list of (data, timestamp, port) packets in one call
+        """
+        self.stream.write("".join([self.encode(*x) for x in packets]))
 
     def close(self):
         self.stream.close()
 
+class PcapngWriter(PcapWriter):
+    def __init__(self, filename, port_names={}):
+        """
+        Open a pcapng file
+
+        An interface description block is written for each OpenFlow port
+        before its first packet.
+
+        @param port_names Dictionary from OpenFlow port numbers to
+        interface names
+        """
+        self.stream = open(filename, 'wb', BUFFER_SIZE)
+        self.port_names = port_names
+        # dict from OpenFlow port number to interface ID
+        self.interfaces = {}
+
+        self.stream.write(PcapngSectionHeader.pack(
+            PCAPNG_SHB, # block type
+            PcapngSectionHeader.size, # block length
+            0x1A2B3C4D, # byte-order magic
+            1, # major
+            0, # minor
+            -1, # section length, unspecified
+            PcapngSectionHeader.size # block length
+        ))
+
+    def _option(self, code, value):
+        return PcapngOption.pack(code, len(value)) + _pad(value)
+
+    def _interface(self, port):
+        """
+        Return an interface description block for a port
+        """
+        options = "".join([
+            self._option(PCAPNG_OPT_IF_NAME, self.port_names.get(port, "port%d" % port)),
+            self._option(PCAPNG_OPT_IF_DESCRIPTION, "OpenFlow port %d" % port),
+            self._option(PCAPNG_OPT_IF_TSRESOL, "\x09"), # nanoseconds
+            PcapngOption.pack(PCAPNG_OPT_ENDOFOPT, 0),
+        ])
+        length = PcapngInterfaceHeader.size + len(options) + PcapngLength.size
+        self.interfaces[port] = len(self.interfaces)
+        return PcapngInterfaceHeader.pack(
+            PCAPNG_IDB, # block type
+            length, # block length
+            LINKTYPE_ETHERNET, # link type
+            0, # reserved
+            0 # snapshot length, unlimited
+        ) + options + PcapngLength.pack(length)
+
+    def encode(self, data, timestamp, port):
+        """
+        Return an enhanced packet block, preceded by an interface
+        description block if this is the port's first packet
+
+        'data' should be a string containing the packet data.
+        'timestamp' should be a float or a Timestamp.
+        'port' should be an integer port number.
+        """
+        ns = getattr(timestamp, "ns", None)
+        if ns == None:
+            ns = int(timestamp * 1e9)
+        interface = self.interfaces.get(port)
+        if interface == None:
+            prefix = self._interface(port)
+            interface = self.interfaces[port]
+        else:
+            prefix = ""
+        length = PcapngPacketHeader.size + len(data) + (-len(data) % 4) + \
+            PcapngLength.size
+        return prefix + PcapngPacketHeader.pack(
+            PCAPNG_EPB, # block type
+            length, # block length
+            interface, # interface ID
+            ns >> 32, # timestamp high
+            ns & 0xffffffff, # timestamp low
+            len(data), # captured length
+            len(data) # original length
+        ) + _pad(data) + PcapngLength.pack(length)
+
+class AsyncWriter(threading.Thread):
+    """
+    Write packets to a PcapWriter or PcapngWriter on a background thread
+
+    write() only appends to a deque, which needs no lock, so the caller
+    never waits for encoding or disk IO. The thread wakes up every
+    interval seconds, or when the queue reaches high_water packets, and
+    writes everything queued in one call.
+    """
+
+    def __init__(self, writer, interval=0.05, high_water=1024):
+        threading.Thread.__init__(self, name="pcap writer")
+        self.daemon = True
+        self.writer = writer
+        self.interval = interval
+        self.high_water = high_water
+        self.queue = deque()
+        self.waker = ofutils.EventDescriptor()
+        self.stopping = False
+        self.start()
+
+    def write(self, data, timestamp, port):
+        """
+        Queue a packet to be written
+
+        See PcapWriter.encode for the arguments.
+        """
+        self.queue.append((data, timestamp, port))
+        if len(self.queue) == self.high_water:
+            self.waker.notify()
+
+    def _drain(self):
+        queue = self.queue
+        packets = [queue.popleft() for i in xrange(len(queue))]
+        if packets:
+            try:
+                self.writer.write_many(packets)
+            except (IOError, ValueError) as e:
+                logging.error("Failed to write %d packets to pcap: %s",
+                              len(packets), e)
+
+    def run(self):
+        while not self.stopping:
+            if select.select([self.waker], [], [], self.interval)[0]:
+                self.waker.wait()
+            self._drain()
+        self._drain()
+
+    def close(self):
+        """
+        Write the queued packets and close the file
+        """
+        self.stopping = True
+        self.waker.notify()
+        self.join()
+        self.writer.close()
+
 if __name__ == "__main__":
     import time
     print("Writing test pcap to test.pcap")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import loxi.of13
+import oftest
+oftest.config.setdefault("disable_ipv6", False)
+sys.modules.setdefault("ofp", loxi.of13)
+import base_tests
+
+class Reply(object):
+    version = 4
+
+class FakeController(object):
+    def __init__(self):
+        self.active = True
+        self.switch_socket = object()
+        self.switch_addr = ("127.0.0.1", 6653)
+        self.session_changed = False
+        self.shut_down = False
+        self.packets = []
+
+    def reset(self):
+        self.packets = []
+
+    def clear_queue(self):
+        self.packets = []
+
+    def transact(self, msg):
+        return (Reply(), None)
+
+    def shutdown(self):
+        self.shut_down = True
+        self.active = False
+
+    def join(self):
+        pass
+
+def own_controller_test():
+    """
+    Return a test that builds its own controller, like the connection
+    setup tests. Defined here so the test loader does not run it.
+    """
+    class OwnController(base_tests.SimpleProtocol):
+        def setUp(self):
+            base_tests.BaseTest.setUp(self)
+            self.controller = FakeController()
+
+        def runTest(self):
+            pass
+    return OwnController()
+
+def simple_protocol_test():
+    """
+    Return a SimpleProtocol test, which the test loader does not run
+    """
+    class Simple(base_tests.SimpleProtocol):
+        def runTest(self):
+            pass
+    return Simple()
+
+class TestControllerReuse(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.saved_config = oftest.config.copy()
+        oftest.config.update({ "controller_reuse": True, "log_dir": None,
+                               "log_file": os.path.join(self.dir, "oft.log") })
+        self.parked = []
+        self.park_controller = base_tests.park_controller
+        base_tests.park_controller = self.parked.append
+
+    def tearDown(self):
+        base_tests.park_controller = self.park_controller
+        base_tests.shared_controller = None
+        oftest.config.clear()
+        oftest.config.update(self.saved_config)
+        shutil.rmtree(self.dir)
+
+    def test_own_controller(self):
+        shared = FakeController()
+        base_tests.shared_controller = shared
+        test = own_controller_test()
+        test.setUp()
+        self.assertTrue(shared.shut_down)
+        self.assertEquals(base_tests.shared_controller, None)
+
+        ctrl = test.controller
+        test.tearDown()
+        self.assertTrue(ctrl.shut_down)
+        self.assertEquals(self.parked, [])
+
+    def test_reused_queue_cleared(self):
+        base_tests.park_controller = self.park_controller
+        testutils = base_tests.testutils
+        saved = (testutils.delete_all_flows, testutils.delete_all_groups)
+        def delete_all_flows(ctrl, send_barrier=True):
+            ctrl.packets.append("flow_removed")
+        testutils.delete_all_flows = delete_all_flows
+        testutils.delete_all_groups = lambda ctrl: None
+        try:
+            ctrl = FakeController()
+            base_tests.park_controller(ctrl)
+        finally:
+            (testutils.delete_all_flows, testutils.delete_all_groups) = saved
+        self.assertEquals(ctrl.packets, [])
+        self.assertTrue(base_tests.shared_controller is ctrl)
+
+        # Arrives while parked
+        ctrl.packets.append("packet_in")
+        test = simple_protocol_test()
+        test.setUp()
+        self.assertTrue(test.controller is ctrl)
+        self.assertEquals(ctrl.packets, [])
+
+    def test_shareable_controller(self):
+        test = own_controller_test()
+        test.controller = ctrl = FakeController()
+        test.controller_shareable = True
+        test.tearDown()
+        self.assertFalse(ctrl.shut_down)
+        self.assertEquals(self.parked, [ctrl])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
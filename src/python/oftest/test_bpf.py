@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+import struct
+import unittest
+import bpf
+
+def run(program, frame):
+    """
+    Interpret the subset of classic BPF that bpf.compile emits
+    """
+    a = x = 0
+    pc = 0
+    while True:
+        (code, jt, jf, k) = program[pc]
+        pc += 1
+        if code == bpf.BPF_RET:
+            return k
+        elif code == bpf.BPF_LDX | bpf.BPF_B | bpf.BPF_MSH:
+            x = (ord(frame[k]) & 0xf) * 4
+        elif code & 0x07 == bpf.BPF_LD:
+            size = { bpf.BPF_B: 1, bpf.BPF_H: 2, bpf.BPF_W: 4 }[code & 0x18]
+            offset = k
+            if code & 0xe0 == bpf.BPF_IND:
+                offset += x
+            if offset + size > len(frame):
+                return 0
+            a = struct.unpack("!" + { 1: "B", 2: "H", 4: "L" }[size],
+                              frame[offset:offset + size])[0]
+        elif code == bpf.BPF_ALU | bpf.BPF_AND:
+            a &= k
+        elif code == bpf.BPF_JMP | bpf.BPF_JEQ:
+            if a == k:
+                pc += jt
+            else:
+                pc += jf
+        else:
+            raise AssertionError("unexpected instruction %#x" % code)
+
+def mac(s):
+    return s.replace(":", "").decode("hex")
+
+def eth(dst, ethertype, payload="", src="02:02:02:02:02:02"):
+    return mac(dst) + mac(src) + struct.pack("!H", ethertype) + payload
+
+def ipv4(proto, payload, ihl=5, frag=0):
+    return struct.pack("!BBHHHBBH4s4s", 0x40 | ihl, 0, 20 + len(payload), 0, frag,
+                       64, proto, 0, "\x0a\x00\x00\x01", "\x0a\x00\x00\x02") + \
+        "\x00" * (ihl * 4 - 20) + payload
+
+def ipv6(next_header, payload):
+    return struct.pack("!LHBB16s16s", 0x60000000, len(payload), next_header, 64,
+                       "\x00" * 16, "\x00" * 16) + payload
+
+def l4(sport, dport):
+    return struct.pack("!HH", sport, dport) + "\x00" * 16
+
+UDP_V4 = eth("00:01:02:03:04:05", 0x0800, ipv4(17, l4(1234, 80)))
+UDP_V4_OPTIONS = eth("00:01:02:03:04:05", 0x0800, ipv4(17, l4(1234, 80), ihl=7))
+DHCP = eth("ff:ff:ff:ff:ff:ff", 0x0800, ipv4(17, l4(68, 67)))
+DHCP_FRAGMENT = eth("ff:ff:ff:ff:ff:ff", 0x0800, ipv4(17, l4(68, 67), frag=10))
+TCP_V6 = eth("00:01:02:03:04:05", 0x86dd, ipv6(6, l4(1234, 80)))
+NEIGHBOR_SOLICIT = eth("33:33:ff:00:00:01", 0x86dd, ipv6(58, "\x87" + "\x00" * 23))
+LLDP = eth("01:80:c2:00:00:0e", 0x88cc, "\x00" * 40)
+LLDP_UNICAST = eth("00:01:01:01:01:02", 0x88cc, "\x00" * 40)
+ARP = eth("ff:ff:ff:ff:ff:ff", 0x0806, "\x00" * 28)
+
+class TestCompile(unittest.TestCase):
+    def matches(self, expr, frame):
+        return run(bpf.compile(expr), frame) != 0
+
+    def test_default_filter(self):
+        dropped = [DHCP, NEIGHBOR_SOLICIT, LLDP]
+        kept = [UDP_V4, UDP_V4_OPTIONS, TCP_V6, LLDP_UNICAST, ARP, DHCP_FRAGMENT]
+        self.assertEquals([self.matches(bpf.DEFAULT_FILTER, x) for x in dropped],
+                          [False] * len(dropped))
+        self.assertEquals([self.matches(bpf.DEFAULT_FILTER, x) for x in kept],
+                          [True] * len(kept))
+
+    def test_primitives(self):
+        cases = [
+            ("arp", ARP, True),
+            ("ip", ARP, False),
+            ("ether proto 0x88cc", LLDP_UNICAST, True),
+            ("ether dst 01:80:c2:00:00:0e", LLDP, True),
+            ("ether src 02:02:02:02:02:02", LLDP, True),
+            ("ether host 01:80:c2:00:00:0f", LLDP, False),
+            ("ether broadcast", ARP, True),
+            ("ether multicast", UDP_V4, False),
+            ("ether multicast", NEIGHBOR_SOLICIT, True),
+            ("ether[12:2] != 0x0800", ARP, True),
+            ("ether[14] & 0xf0 = 0x40", UDP_V4, True),
+            ("udp dst port 80", UDP_V4_OPTIONS, True),
+            ("udp src port 80", UDP_V4_OPTIONS, False),
+            ("tcp port 80", UDP_V4, False),
+            ("port 80", TCP_V6, True),
+            ("ip6 proto 58", NEIGHBOR_SOLICIT, True),
+            ("icmp6 && !ether broadcast", NEIGHBOR_SOLICIT, True),
+            ("not (arp or ip) and ip6", TCP_V6, True),
+            ("udp or tcp", ARP, False),
+        ]
+        for (expr, frame, expected) in cases:
+            self.assertEquals(self.matches(expr, frame), expected, expr)
+
+    def test_errors(self):
+        for expr in ["", "ether", "ether src 1.2.3.4", "ip and", "(arp", "arp )",
+                     "ether[0:3] = 1", "host 10.0.0.1", "arp $"]:
+            self.assertRaises(ValueError, bpf.compile, expr)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
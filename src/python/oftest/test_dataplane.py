@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+import sys
+import socket
+import struct
+import time
+import unittest
+import dataplane
+
+class FakePort(object):
+    """
+    Port that never receives anything on its own
+    """
+    def __init__(self, interface_name, port_number):
+        (self.socket, self.peer) = socket.socketpair()
+
+    def fileno(self):
+        return self.socket.fileno()
+
+class DatagramPort(FakePort):
+    """
+    Port whose sends arrive as datagrams on peer
+    """
+    def __init__(self, interface_name, port_number):
+        (self.socket, self.peer) = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.socket.setblocking(0)
+
+    send_batch = dataplane.DataPlanePort.send_batch.im_func
+
+class StreamPort(FakePort):
+    """
+    Port that frames what it sends, like the OVS dummy port
+    """
+    def send(self, packet):
+        self.socket.sendall(struct.pack("!H", len(packet)) + packet)
+        return len(packet)
+
+class BatchPort(DatagramPort):
+    """
+    Datagram port that receives like DataPlanePort
+    """
+    RCV_SIZE_DEFAULT = 100
+    RCV_BATCH = 4
+    rx_vector = None
+    recv = dataplane.DataPlanePort.recv.im_func
+    recv_batch = dataplane.DataPlanePort.recv_batch.im_func
+
+class ListPort(object):
+    """
+    Port without a socket that records what is sent to it
+    """
+    def __init__(self, interface_name, port_number):
+        (self.rx, self.peer) = socket.socketpair()
+        self.sent = []
+
+    def fileno(self):
+        return self.rx.fileno()
+
+    def send(self, packet):
+        self.sent.append(packet)
+        return len(packet)
+
+class TestDataPlaneQueues(unittest.TestCase):
+    def setUp(self):
+        config = { "dataplane": { "portclass": FakePort },
+                   "dataplane_queue_len": 3 }
+        self.dp = dataplane.DataPlane(config)
+        for port_number in [1, 2, 3]:
+            self.dp.port_add("veth%d" % port_number, port_number)
+
+    def tearDown(self):
+        self.dp.kill()
+
+    def enqueue(self, port_number, pkt):
+        with self.dp.cvar:
+            self.dp._enqueue(port_number, pkt, 0.0)
+
+    def test_oldest_across_ports(self):
+        for (port_number, pkt) in [(2, "a"), (1, "b"), (3, "c"), (2, "d")]:
+            self.enqueue(port_number, pkt)
+        result = [(port_number, pkt) for (port_number, pkt, t) in self.dp.packets()]
+        self.assertEquals(result, [(2, "a"), (1, "b"), (3, "c"), (2, "d")])
+        self.assertEquals(self.dp.oldest_port_number(), None)
+
+    def test_single_port_poll(self):
+        for (port_number, pkt) in [(1, "a"), (2, "b"), (1, "c"), (3, "d")]:
+            self.enqueue(port_number, pkt)
+        self.assertEquals(self.dp.poll(port_number=1, timeout=0)[1], "a")
+        self.assertEquals(self.dp.poll(port_number=1, timeout=0)[1], "c")
+        self.assertEquals(self.dp.poll(timeout=0)[:2], (2, "b"))
+        self.assertEquals(self.dp.poll(timeout=0)[:2], (3, "d"))
+        self.assertEquals(self.dp.poll(timeout=0), (None, None, None))
+
+    def test_drops(self):
+        for i in range(5):
+            self.enqueue(1, str(i))
+        self.enqueue(2, "x")
+        self.assertEquals(self.dp.drops, { 1: 2, 2: 0, 3: 0 })
+        result = [pkt for (port_number, pkt, t) in self.dp.packets()]
+        self.assertEquals(result, ["2", "3", "4", "x"])
+
+    def test_order_bounded(self):
+        for i in range(100):
+            self.enqueue(1, str(i))
+            self.assertEquals(self.dp.poll(port_number=1, timeout=0)[1], str(i))
+        self.enqueue(2, "x")
+        self.assertTrue(len(self.dp.packet_order) <= 2 * 3 * 3 + 1)
+        self.assertEquals(self.dp.poll(timeout=0)[:2], (2, "x"))
+
+    def test_flush(self):
+        self.enqueue(1, "a")
+        self.enqueue(2, "b")
+        self.dp.flush()
+        self.assertEquals(self.dp.poll(timeout=0), (None, None, None))
+
+class TestExpectedPacketMatch(unittest.TestCase):
+    def setUp(self):
+        config = { "dataplane": { "portclass": FakePort } }
+        self.dp = dataplane.DataPlane(config)
+        for port_number in [1, 2, 3]:
+            self.dp.port_add("veth%d" % port_number, port_number)
+
+    def tearDown(self):
+        self.dp.kill()
+
+    def enqueue(self, port_number, pkt):
+        with self.dp.cvar:
+            self.dp._enqueue(port_number, pkt, 0.0)
+
+    def test_find(self):
+        q = dataplane.PacketQueue(10)
+        long_pkt = "L" * 100
+        short_pkt = "s" * 20
+        q.append((1, "x" * 64, 0.0))
+        q.append((2, long_pkt, 0.0))
+        q.append((3, short_pkt + "\x00" * 40, 0.0))
+        q.append((4, short_pkt + "\xff" * 40, 0.0))
+        self.assertEquals(q.find(long_pkt)[0], 2)
+        self.assertEquals(q.find(long_pkt[:99]), None)
+        self.assertEquals(q.find(short_pkt)[0], 3)
+        q.popleft()
+        q.popleft()
+        q.popleft()
+        self.assertEquals(q.find(short_pkt)[0], 4)
+        self.assertEquals(q.find("t" * 20), None)
+        for entry in [(5, short_pkt, 0.0), (6, short_pkt + "\x00" * 40, 0.0)]:
+            q.append(entry)
+        q.popleft()
+        self.assertEquals(q.find(short_pkt)[0], 5)
+        q.clear()
+        self.assertEquals(q.index, {})
+
+    def test_find_oldest_padding(self):
+        q = dataplane.PacketQueue(10)
+        exp_pkt = "e" * 42
+        q.append((1, "x" * 60, 0.0))
+        q.append((2, exp_pkt + "\xaa" * 18, 0.0))
+        q.append((3, exp_pkt + "\x00" * 18, 0.0))
+        self.assertEquals(q.find(exp_pkt)[0], 2)
+        self.assertEquals([q.find(x * 42) for x in "eyz"],
+                          [q[1], None, None])
+
+    def test_poll_discards_until_match(self):
+        pkt = "p" * 64
+        for (port_number, p) in [(1, "a" * 64), (2, "b" * 64), (1, pkt), (1, "c" * 64)]:
+            self.enqueue(port_number, p)
+        self.assertEquals(self.dp.poll(port_number=1, exp_pkt=pkt, timeout=0)[:2], (1, pkt))
+        self.assertEquals(self.dp.poll(timeout=0)[:2], (2, "b" * 64))
+        self.assertEquals(self.dp.poll(timeout=0)[:2], (1, "c" * 64))
+        self.enqueue(1, "d" * 64)
+        self.assertEquals(self.dp.poll(port_number=1, exp_pkt=pkt, timeout=0), (None, None, None))
+        self.assertEquals(self.dp.poll(timeout=0), (None, None, None))
+
+    def test_poll_many(self):
+        pkt = "p" * 64
+        for (port_number, p) in [(1, pkt), (3, "x" * 64), (2, pkt), (3, pkt), (3, pkt)]:
+            self.enqueue(port_number, p)
+        result = self.dp.poll_many([(1, pkt), (3, pkt), (3, pkt)], timeout=0)
+        self.assertEquals(result, [pkt, pkt, pkt])
+        self.assertEquals(self.dp.poll(timeout=0)[:2], (2, pkt))
+        result = self.dp.poll_many([(1, pkt), (2, pkt)], timeout=0)
+        self.assertEquals(result, [None, None])
+        self.assertEquals(self.dp.poll_many([], timeout=0), [])
+
+class FilterPort(FakePort):
+    """
+    Port that records the filters set on it
+    """
+    def __init__(self, interface_name, port_number):
+        FakePort.__init__(self, interface_name, port_number)
+        self.filters = []
+
+    def set_filter(self, expr):
+        self.filters.append(expr)
+
+class TestFilters(unittest.TestCase):
+    def setUp(self):
+        config = { "dataplane": { "portclass": FilterPort },
+                   "dataplane_filter": "not arp" }
+        self.dp = dataplane.DataPlane(config)
+        for port_number in [1, 2]:
+            self.dp.port_add("veth%d" % port_number, port_number)
+
+    def tearDown(self):
+        self.dp.kill()
+
+    def test_set_and_reset(self):
+        self.dp.set_filter("ip", port_number=2)
+        self.assertRaises(ValueError, self.dp.set_filter, "bogus")
+        self.dp.reset_filters()
+        self.dp.set_filter("")
+        self.assertEquals(self.dp.ports[1].filters, ["not arp", ""])
+        self.assertEquals(self.dp.ports[2].filters, ["not arp", "ip", "not arp", ""])
+
+class TestSendBurst(unittest.TestCase):
+    def tearDown(self):
+        self.dp.kill()
+
+    def make_dataplane(self, portclass):
+        self.dp = dataplane.DataPlane({ "dataplane": { "portclass": portclass } })
+        self.dp.port_add("veth1", 1)
+        return self.dp.ports[1]
+
+    def test_sendmmsg(self):
+        port = self.make_dataplane(DatagramPort)
+        frames = ["frame%d" % i for i in range(8)]
+        stats = self.dp.send_burst(1, frames, batch=3)
+        self.assertEquals((stats.frames, stats.dropped), (8, 0))
+        self.assertEquals(stats.bytes, sum(len(x) for x in frames))
+        self.assertEquals([port.peer.recv(100) for x in frames], frames)
+
+    def test_port_send(self):
+        port = self.make_dataplane(StreamPort)
+        self.dp.send(1, "AAAA")
+        stats = self.dp.send_burst(1, ["BBBB", "CCCC"])
+        self.assertEquals(stats.frames, 2)
+        self.assertEquals(port.peer.recv(100),
+                          "\x00\x04AAAA\x00\x04BBBB\x00\x04CCCC")
+
+    def test_dropped(self):
+        port = self.make_dataplane(DatagramPort)
+        port.peer.close()
+        stats = self.dp.send_burst(1, ["a", "b", "c"])
+        self.assertEquals((stats.frames, stats.dropped), (0, 3))
+
+    def test_paced(self):
+        port = self.make_dataplane(ListPort)
+        stats = self.dp.send_burst(1, ["a", "b", "c"], pps=1000, duration=0.2)
+        self.assertTrue(150 <= stats.frames <= 210, stats)
+        self.assertTrue(800 <= stats.pps <= 1050, stats)
+        self.assertEquals(port.sent[:4], ["a", "b", "c", "a"])
+        self.assertEquals(len(port.sent), stats.frames)
+
+class TestReceive(unittest.TestCase):
+    def setUp(self):
+        config = { "dataplane": { "portclass": BatchPort },
+                   "dataplane_queue_len": 8 }
+        self.dp = dataplane.DataPlane(config)
+        for port_number in range(1, 41):
+            self.dp.port_add("veth%d" % port_number, port_number)
+
+    def tearDown(self):
+        self.dp.kill()
+
+    def test_many_ports(self):
+        for port_number in range(1, 41):
+            self.dp.ports[port_number].peer.send("pkt%d" % port_number)
+        for port_number in [40, 1, 23]:
+            (rcv_port, pkt, t) = self.dp.poll(port_number, timeout=2)
+            self.assertEquals((rcv_port, pkt), (port_number, "pkt%d" % port_number))
+
+    def test_batches(self):
+        peer = self.dp.ports[5].peer
+        for i in range(10):
+            peer.send("pkt%d" % i)
+        deadline = time.time() + 2
+        while self.dp.rx_stats(5).packets < 10 and time.time() < deadline:
+            time.sleep(0.01)
+        result = [self.dp.poll(5, timeout=2)[1] for i in range(8)]
+        self.assertEquals(result, ["pkt%d" % i for i in range(2, 10)])
+
+        stats = self.dp.rx_stats(5)
+        self.assertEquals((stats.packets, stats.bytes, stats.drops), (10, 40, 2))
+        self.assertEquals(stats.kernel_drops, None)
+        self.assertEquals(self.dp.rx_stats()[6].packets, 0)
+
+    def test_replace_port(self):
+        old_port = self.dp.ports[40]
+        old_port.peer.send("old")
+        self.assertEquals(self.dp.poll(40, timeout=2)[1], "old")
+        self.dp.port_add("veth40", 40)
+        port = self.dp.ports[40]
+        port.peer.send("new")
+        self.assertEquals(self.dp.poll(40, timeout=2)[1], "new")
+        self.assertEquals(sys.getrefcount(old_port), 2)
+
+    def test_rates(self):
+        with self.dp.cvar:
+            self.dp.rx_counters[1].packets += 30
+            self.dp.rate_time -= 2
+            self.dp._update_rates(self.dp.rate_time + 2)
+            self.dp.rx_counters[1].packets += 5
+        self.assertEquals(self.dp.rx_stats(1).pps, 15.0)
+        self.assertEquals(self.dp.rx_stats(2).pps, 0.0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import loxi.of13
+# testutils expects oft to have selected the configured protocol module
+sys.modules.setdefault("ofp", loxi.of13)
+import discovery
+
+MODULE_A = '''
+"""Module A"""
+import unittest
+import oftest.base_tests as base_tests
+from oftest.testutils import *
+
+class Base(unittest.TestCase):
+    """Not a test"""
+
+@group("smoke")
+@nonstandard
+class Simple(base_tests.SimpleProtocol):
+    """Simple test"""
+    def runTest(self):
+        pass
+
+class Derived(Base):
+    def runTest(self):
+        pass
+
+@disabled
+@version("1.3+")
+class Off(Derived):
+    """Disabled"""
+
+if __name__ == "__main__":
+    class Main(Base):
+        pass
+'''
+
+MODULE_B = '''
+import disc_a
+from disc_a import Derived
+from oftest.testutils import group
+
+Alias = disc_a.Simple
+
+@group("extra")
+class FromOther(disc_a.Simple):
+    pass
+'''
+
+MODULE_C = '''
+import unittest
+if True:
+    class Conditional(unittest.TestCase):
+        def runTest(self):
+            pass
+'''
+
+def annotations(mod):
+    tests = {}
+    for (name, value) in vars(mod).items():
+        if type(value) == type and issubclass(value, unittest.TestCase) and \
+                hasattr(value, "runTest"):
+            tests[name] = (sorted(getattr(value, "_groups", [])),
+                           getattr(value, "_nonstandard", False),
+                           getattr(value, "_disabled", False),
+                           sorted(getattr(value, "_versions", [])),
+                           value.__doc__)
+    return (mod.__doc__, tests)
+
+class TestDiscovery(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        for (name, source) in [("disc_a", MODULE_A), ("disc_b", MODULE_B),
+                               ("disc_c", MODULE_C)]:
+            with open(os.path.join(self.dir, name + ".py"), "w") as f:
+                f.write(source)
+        self.index_path = os.path.join(self.dir, ".oft-index")
+        sys.path.insert(0, self.dir)
+
+    def tearDown(self):
+        sys.path.remove(self.dir)
+        for name in ["disc_a", "disc_b", "disc_c"]:
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.dir)
+
+    def test_stand_ins(self):
+        index = discovery.TestIndex(self.index_path)
+        modules = dict(discovery.find_test_modules(self.dir, index))
+        self.assertTrue(isinstance(modules["disc_a"], discovery.IndexedModule))
+        self.assertTrue(isinstance(modules["disc_b"], discovery.IndexedModule))
+        # Classes defined conditionally need the module to be imported
+        self.assertFalse(isinstance(modules["disc_c"], discovery.IndexedModule))
+        self.assertFalse("disc_a" in sys.modules)
+        indexed = dict((k, annotations(v)) for (k, v) in modules.items())
+        self.assertEquals(sorted(indexed["disc_a"][1]), ["Derived", "Off", "Simple"])
+        self.assertEquals(sorted(indexed["disc_b"][1]),
+                          ["Alias", "Derived", "FromOther"])
+
+        # The stand-ins carry the same annotations as the real classes,
+        # including the group FromOther adds to the list it shares with Simple
+        real = [discovery.import_module(modules[x]) for x in ["disc_a", "disc_b"]]
+        imported = dict((x.__name__, annotations(x)) for x in real)
+        self.assertEquals(imported["disc_a"][1]["Simple"][0], ["extra", "smoke"])
+        self.assertEquals(imported["disc_a"], indexed["disc_a"])
+        self.assertEquals(imported["disc_b"], indexed["disc_b"])
+
+    def test_index_file(self):
+        index = discovery.TestIndex(self.index_path)
+        discovery.find_test_modules(self.dir, index)
+        self.assertTrue(os.path.exists(self.index_path))
+
+        index = discovery.TestIndex(self.index_path)
+        path = os.path.join(self.dir, "disc_a.py")
+        scan = index.scan(path)
+        self.assertEquals(scan["doc"], "Module A")
+        self.assertFalse(index.dirty)
+        self.assertTrue("unsupported" in index.scan(os.path.join(self.dir, "disc_c.py")))
+
+        # A new mtime with the same content keeps the scan
+        os.utime(path, (0, 0))
+        self.assertTrue(index.scan(path) is scan)
+        self.assertTrue(index.dirty)
+
+        with open(path, "a") as f:
+            f.write("\nclass Added(Base):\n    def runTest(self):\n        pass\n")
+        self.assertEquals(index.scan(path)["body"][-1][1], "Added")
+
+    def test_scan_source(self):
+        scan = discovery.scan_source("class A(make_base()):\n    pass\n")
+        self.assertEquals(scan, {"unsupported": "class A has a computed base"})
+        scan = discovery.scan_source("@group(name)\nclass A(object):\n    pass\n")
+        self.assertEquals(scan, {"unsupported": "decorator argument is not a literal"})
+        scan = discovery.scan_source("try:\n    import json\nexcept ImportError:\n    json = None\n")
+        self.assertEquals(scan["body"], [["import_if", "json", "json"], ["bind", "json", None]])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+import os
+import subprocess
+import sys
+import unittest
+import lazy
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def fresh_modules(script):
+    """
+    Run script in a new interpreter and return the modules it imported
+    """
+    script = "import sys\n" + script + "\nprint ' '.join(sys.modules)\n"
+    out = subprocess.check_output([sys.executable, "-c", script], cwd=SRC_DIR)
+    return set(out.split())
+
+class TestImportBudget(unittest.TestCase):
+    def test_testutils(self):
+        modules = fresh_modules("""
+from oftest import config
+config["disable_ipv6"] = False
+import oftest.lazy
+sys.modules["ofp"] = oftest.lazy.protocol(4)
+import oftest.testutils
+import oftest.base_tests
+""")
+        self.assertTrue("oftest.testutils" in modules)
+        self.assertTrue("loxi.of13.const" in modules)
+        for name in ["scapy.layers.inet", "scapy.layers.inet6", "scapy.route6",
+                     "loxi.of13.message", "loxi.of13.common", "inspect"]:
+            self.assertFalse(name in modules, name + " was imported")
+
+    def test_first_use(self):
+        modules = fresh_modules("""
+from oftest import config
+config["disable_ipv6"] = True
+import oftest.packet as scapy
+assert "scapy.layers.inet" not in sys.modules
+assert str(scapy.Ether()/scapy.IP())
+assert not hasattr(scapy, "IPv6")
+""")
+        self.assertTrue("scapy.layers.inet" in modules)
+
+class TestLazyProtocol(unittest.TestCase):
+    def test_names(self):
+        import loxi.of10
+        ofp = lazy.protocol(1)
+        # An already imported protocol package is returned as is
+        self.assertTrue(ofp is loxi.of10)
+
+        modules = fresh_modules("""
+import oftest.lazy, loxi
+ofp = oftest.lazy.protocol(4)
+assert ofp.OFPT_HELLO == 0
+assert "loxi.of13.message" not in sys.modules
+assert ofp.ProtocolError is loxi.ProtocolError
+assert ofp.match is ofp.common.match
+assert ofp.message.hello(xid=1).pack() == "\\x04\\x00\\x00\\x08\\x00\\x00\\x00\\x01"
+import loxi.of13, loxi.of13.oxm
+assert loxi.of13 is ofp and loxi.of13.oxm is ofp.oxm
+assert not hasattr(ofp, "no_such_name")
+""")
+        self.assertTrue("loxi.of13.message" in modules)
+        self.assertRaises(ValueError, lazy.protocol, 99)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+import unittest
+import errno
+import socket
+import struct
+import ofutils
+
+def frame_len(buf, offset):
+    return struct.unpack_from("!H", buf, offset + 2)[0]
+
+def make_frame(payload):
+    return struct.pack("!BBH", 4, 0, len(payload) + 4) + payload
+
+class TestRecvBuffer(unittest.TestCase):
+    def test_complete_frames(self):
+        rb = ofutils.RecvBuffer(64, 16)
+        rb.feed(make_frame("abcd") + make_frame("ef"))
+        frames = [f.tobytes() for f in rb.frames(4, frame_len)]
+        self.assertEquals(frames, [make_frame("abcd"), make_frame("ef")])
+        self.assertEquals(len(rb), 0)
+
+    def test_partial_frame(self):
+        rb = ofutils.RecvBuffer(64, 16)
+        data = make_frame("0123456789")
+        rb.feed(data[:3])
+        self.assertEquals(list(rb.frames(4, frame_len)), [])
+        rb.feed(data[3:9])
+        self.assertEquals(list(rb.frames(4, frame_len)), [])
+        rb.feed(data[9:])
+        self.assertEquals([f.tobytes() for f in rb.frames(4, frame_len)], [data])
+
+    def test_grow(self):
+        rb = ofutils.RecvBuffer(16, 4)
+        data = make_frame("x" * 100)
+        for i in range(0, len(data), 7):
+            rb.feed(data[i:i+7])
+        self.assertEquals([f.tobytes() for f in rb.frames(4, frame_len)], [data])
+
+    def test_recv_into(self):
+        rb = ofutils.RecvBuffer(32, 8)
+        a, b = socket.socketpair()
+        try:
+            data = "".join(make_frame(str(i) * i) for i in range(1, 20))
+            a.sendall(data)
+            result = []
+            received = 0
+            while received < len(data):
+                received += rb.recv_into(b)
+                result.extend(f.tobytes() for f in rb.frames(4, frame_len))
+            self.assertEquals("".join(result), data)
+        finally:
+            a.close()
+            b.close()
+
+class ShortSocket(object):
+    """
+    Socket that accepts the given number of bytes per send call, with 0
+    meaning the socket is full
+    """
+    def __init__(self, counts):
+        self.counts = counts
+        self.data = ""
+
+    def send(self, data):
+        count = self.counts.pop(0)
+        if count == 0:
+            raise socket.error(errno.EAGAIN, "Resource temporarily unavailable")
+        self.data += data[:count]
+        return min(count, len(data))
+
+class TestSendQueue(unittest.TestCase):
+    def setUp(self):
+        (self.a, self.b) = socket.socketpair()
+        self.a.setblocking(0)
+        self.b.setblocking(0)
+
+    def tearDown(self):
+        self.a.close()
+        self.b.close()
+
+    def drain(self):
+        data = ""
+        while True:
+            try:
+                data += self.b.recv(1 << 20)
+            except socket.error:
+                return data
+
+    def test_chunks(self):
+        q = ofutils.SendQueue(10, chunk=10)
+        for frame in ["aaaa", "bbbb", "cccc", "dddddddddddd"]:
+            self.assertTrue(q.append(frame))
+        self.assertEquals(q.flush(self.a), 24)
+        self.assertEquals(len(q), 0)
+        self.assertEquals(self.drain(), "aaaabbbbccccdddddddddddd")
+
+    def test_max_frames(self):
+        q = ofutils.SendQueue(2)
+        self.assertTrue(q.append("a"))
+        self.assertTrue(q.append("b"))
+        self.assertFalse(q.append("c"))
+        self.assertEquals(len(q), 2)
+
+    def test_partial_send(self):
+        frames = [make_frame(str(i % 10) * (i % 700)) for i in range(3000)]
+        q = ofutils.SendQueue(len(frames), chunk=5000)
+        for frame in frames:
+            q.append(frame)
+        q.flush(self.a)
+        # The socket filled up
+        self.assertTrue(0 < len(q) < len(frames))
+
+        data = ""
+        while len(q):
+            data += self.drain()
+            # Frames still queued, counting the partly written one
+            rb = ofutils.RecvBuffer()
+            rb.feed(data)
+            complete = len(list(rb.frames(4, frame_len)))
+            self.assertEquals(len(q), len(frames) - complete)
+            q.flush(self.a)
+        data += self.drain()
+        self.assertEquals(data, "".join(frames))
+
+    def test_remainder_spans_frames(self):
+        sock = ShortSocket([7, 0, 3, 0, 100])
+        q = ofutils.SendQueue(10)
+        for frame in ["abcd", "ef", "ghij", "kl"]:
+            q.append(frame)
+        # "abcd" and "ef" written, "g" of the third frame
+        self.assertEquals(q.flush(sock), 7)
+        self.assertEquals(len(q), 2)
+        self.assertEquals(q.offset, 1)
+        self.assertEquals(q.flush(sock), 0)
+        self.assertEquals(q.flush(sock), 3)
+        self.assertEquals(len(q), 1)
+        self.assertEquals(q.offset, 0)
+        self.assertEquals(q.flush(sock), 0)
+        self.assertEquals(q.flush(sock), 2)
+        self.assertEquals(len(q), 0)
+        self.assertEquals(sock.data, "abcdefghijkl")
+
+    def test_error(self):
+        q = ofutils.SendQueue(10)
+        q.append("abc")
+        self.b.close()
+        self.assertRaises(socket.error, q.flush, self.a)
+        self.assertEquals(len(q), 1)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+import os
+import imp
+import shutil
+import socket
+import struct
+import tempfile
+import time
+import unittest
+
+PLATFORM = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "..", "..", "..", "platforms", "ovs-dummy.py")
+ovs_dummy = imp.load_source("ovs_dummy", PLATFORM)
+
+def frame(payload):
+    return struct.pack(">H", len(payload)) + payload
+
+class TestOVSDummyPort(unittest.TestCase):
+    """
+    Runs the port against a Unix socket standing in for an OVS dummy netdev
+    """
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.run_dir = ovs_dummy.RUN_DIR
+        ovs_dummy.RUN_DIR = self.dir
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(os.path.join(self.dir, "p1"))
+        listener.listen(1)
+        self.port = ovs_dummy.DataPlanePortOVSDummy("p1", 1, max_pkts=4000)
+        (self.peer, _) = listener.accept()
+        listener.close()
+
+    def tearDown(self):
+        ovs_dummy.RUN_DIR = self.run_dir
+        self.port.socket.close()
+        self.peer.close()
+        shutil.rmtree(self.dir)
+
+    def receive(self, count):
+        pkts = []
+        deadline = time.time() + 5
+        while len(pkts) < count and time.time() < deadline:
+            pkts += [pkt for (pkt, _) in self.port.recv_batch()]
+        return pkts
+
+    def test_split_frames(self):
+        pkts = ["pkt%d" % i + "x" * (i * 37 % 300) for i in range(200)]
+        data = "".join(frame(pkt) for pkt in pkts)
+        # Pieces that split both length headers and payloads
+        for i in range(0, len(data), 333):
+            self.peer.sendall(data[i:i+333]) #pylint: disable=E1101
+            time.sleep(0.001)
+        self.assertEquals(self.receive(len(pkts)), pkts)
+        self.assertEquals(self.port.recv(), (None, None))
+
+    def test_recv(self):
+        self.peer.sendall(frame("a") + frame("bc") + frame("d")[:1]) #pylint: disable=E1101
+        time.sleep(0.01)
+        self.assertEquals(self.port.recv()[0], "a")
+        self.assertEquals(self.port.recv()[0], "bc")
+        self.assertEquals(self.port.recv(), (None, None))
+
+    def test_partial_sends(self):
+        pkts = ["pkt%d" % i + "y" * (i % 1000) for i in range(3000)]
+        for pkt in pkts:
+            self.assertEquals(self.port.send(pkt), len(pkt))
+        # The peer has not read, so the socket filled up
+        self.assertTrue(len(self.port.txq) > 0)
+
+        self.peer.setblocking(0) #pylint: disable=E1101
+        data = ""
+        while len(self.port.txq):
+            try:
+                data += self.peer.recv(1 << 20) #pylint: disable=E1101
+            except socket.error:
+                pass
+            if self.port.send("tail"):
+                pkts.append("tail")
+        self.peer.settimeout(1) #pylint: disable=E1101
+        expected = "".join(frame(pkt) for pkt in pkts)
+        while len(data) < len(expected):
+            data += self.peer.recv(1 << 20) #pylint: disable=E1101
+        self.assertEquals(data, expected)
+
+    def test_queue_limit(self):
+        port = self.port
+        port.txq.max_frames = 2
+        # Nothing can be written until the peer reads
+        port.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        sent = 0
+        while port.send("z" * 1000):
+            sent += 1
+            self.assertTrue(sent < 10000)
+        self.assertEquals(len(port.txq), 2)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
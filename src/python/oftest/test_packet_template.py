@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+import sys
+import random
+import unittest
+import loxi.of13
+import oftest
+oftest.config.setdefault("disable_ipv6", False)
+sys.modules.setdefault("ofp", loxi.of13)
+import testutils
+import packet_template
+
+def random_mac(rng):
+    return ":".join("%02x" % rng.randint(0, 255) for i in range(6))
+
+def random_ipv4(rng):
+    return ".".join(str(rng.randint(0, 255)) for i in range(4))
+
+def random_ipv6(rng):
+    return ":".join("%x" % rng.randint(0, 0xffff) for i in range(8))
+
+class TestPacketTemplate(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def check(self, builder, variants, **shape):
+        for i in range(variants):
+            kwargs = dict(shape)
+            for (name, value) in self.fields(builder).items():
+                if self.rng.random() < 0.5:
+                    kwargs[name] = value()
+            self.assertEquals(testutils.packet_bytes(builder, **kwargs),
+                              str(builder(**kwargs)), repr(kwargs))
+
+    def fields(self, builder):
+        rng = self.rng
+        fields = {
+            "eth_dst": lambda: random_mac(rng),
+            "eth_src": lambda: random_mac(rng),
+            "vlan_vid": lambda: rng.randint(0, 4095),
+            "vlan_pcp": lambda: rng.randint(0, 7),
+        }
+        args = packet_template._builder_defaults(builder)
+        for name in ["ip_src", "ip_dst", "ip_snd", "ip_tgt"]:
+            fields[name] = lambda: random_ipv4(rng)
+        for name in ["ipv6_src", "ipv6_dst"]:
+            fields[name] = lambda: random_ipv6(rng)
+        for name in ["hw_snd", "hw_tgt"]:
+            fields[name] = lambda: random_mac(rng)
+        for name in ["ip_tos", "ip_ttl", "ipv6_tc", "ipv6_hlim",
+                     "icmp_type", "icmp_code"]:
+            fields[name] = lambda: rng.randint(0, 255)
+        for name in ["tcp_sport", "tcp_dport", "udp_sport", "udp_dport",
+                     "ip_id", "eth_type"]:
+            fields[name] = lambda: rng.randint(0, 0xffff)
+        fields["dl_vlan_cfi"] = lambda: rng.randint(0, 1)
+        fields["ipv6_fl"] = lambda: rng.randint(0, 0xfffff)
+        fields["arp_op"] = lambda: rng.randint(1, 2)
+        return dict((k, v) for (k, v) in fields.items() if k in args)
+
+    def test_ipv4(self):
+        for builder in [testutils.simple_tcp_packet, testutils.simple_udp_packet,
+                        testutils.simple_icmp_packet]:
+            self.check(builder, 200)
+            self.check(builder, 200, dl_vlan_enable=True)
+            self.check(builder, 50, pktlen=61)
+
+    def test_ipv6(self):
+        for builder in [testutils.simple_tcpv6_packet, testutils.simple_udpv6_packet,
+                        testutils.simple_icmpv6_packet]:
+            self.check(builder, 200)
+            self.check(builder, 200, dl_vlan_enable=True)
+
+    def test_other(self):
+        self.check(testutils.simple_arp_packet, 200)
+        self.check(testutils.simple_eth_packet, 100)
+
+    def test_udp_zero_checksum(self):
+        # With the checksum for source port 0 as the source port the sum
+        # becomes zero; scapy sends that as a zero checksum
+        data = str(testutils.simple_udp_packet(udp_sport=0))
+        sport = (ord(data[40]) << 8) | ord(data[41])
+        testutils.packet_bytes(testutils.simple_udp_packet, udp_sport=0)
+        data = testutils.packet_bytes(testutils.simple_udp_packet, udp_sport=sport)
+        self.assertEquals(data, str(testutils.simple_udp_packet(udp_sport=sport)))
+        self.assertEquals(testutils.packet_bytes(testutils.simple_udp_packet, udp_sport=1),
+                          str(testutils.simple_udp_packet(udp_sport=1)))
+
+    def test_fallback(self):
+        for kwargs in [dict(ip_options=[testutils.scapy.IPOption('\x94\x04\x00\x00')]),
+                       dict(ip_ihl=6), dict(dl_vlan_enable=True, vlan_vid=5000),
+                       dict(ip_src="127.1")]:
+            self.assertEquals(testutils.packet_bytes(testutils.simple_tcp_packet, **kwargs),
+                              str(testutils.simple_tcp_packet(**kwargs)))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+import os
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+import parallel
+
+class Passing(unittest.TestCase):
+    def runTest(self):
+        pass
+
+def fixture_test(calls):
+    """
+    Return a test with class fixtures that records its calls in calls.
+    Defined here so the test loader does not run it.
+    """
+    class Fixture(unittest.TestCase):
+        @classmethod
+        def setUpClass(cls):
+            calls.append("setUpClass")
+
+        @classmethod
+        def tearDownClass(cls):
+            calls.append("tearDownClass")
+
+        def runTest(self):
+            calls.append("runTest")
+    return Fixture()
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_split_ports(self):
+        port_map = dict((x, "eth%d" % x) for x in [7, 1, 3, 5, 9])
+        self.assertEquals(parallel.split_ports(port_map, 2), [[1, 3, 5], [7, 9]])
+        self.assertEquals(parallel.split_ports(port_map, 5), [[1], [3], [5], [7], [9]])
+        self.assertRaises(ValueError, parallel.split_ports, port_map, 6)
+
+    def test_schedule(self):
+        timings = {"a": 5.0, "b": 3.0, "c": 3.0, "d": 1.0}
+        self.assertEquals(parallel.schedule(["d", "c", "b", "a"], timings, 2),
+                          [["a", "d"], ["b", "c"]])
+        # Untimed tests are assumed to take the mean of the timed ones
+        self.assertEquals(parallel.schedule(["a", "d", "new"], timings, 2),
+                          [["a"], ["new", "d"]])
+        self.assertEquals(parallel.schedule(["x", "y", "z"], {}, 2),
+                          [["x", "z"], ["y"]])
+
+    def test_timings(self):
+        path = os.path.join(self.dir, "timings")
+        self.assertEquals(parallel.load_timings(path), {})
+        parallel.save_timings(path, {"a": 1.0, "b": 2.0})
+        parallel.save_timings(path, {"b": 3.0})
+        self.assertEquals(parallel.load_timings(path), {"a": 1.0, "b": 3.0})
+
+    def test_timed_suite(self):
+        timings = {}
+        calls = []
+        suite = parallel.TimedSuite(timings)
+        suite.add_timed(Passing(), "mod.Passing")
+        suite.add_timed(fixture_test(calls), "other.Fixture")
+        result = unittest.TestResult()
+        suite.run(result)
+        self.assertTrue(result.wasSuccessful())
+        self.assertEquals(result.testsRun, 2)
+        self.assertEquals(calls, ["setUpClass", "runTest", "tearDownClass"])
+        self.assertEquals(sorted(timings.keys()), ["mod.Passing", "other.Fixture"])
+        # The result's own methods are put back
+        self.assertEquals(result.startTest, unittest.TestResult.startTest.__get__(result))
+
+    def test_merge_xunit(self):
+        paths = []
+        for name in ["a", "b"]:
+            paths.append(os.path.join(self.dir, name + ".xml"))
+            with open(paths[-1], "w") as f:
+                f.write('<testsuite name="%s"><testcase name="t" /></testsuite>' % name)
+        output = os.path.join(self.dir, "merged.xml")
+        parallel.merge_xunit(paths, output)
+        root = ET.parse(output).getroot()
+        self.assertEquals(root.tag, "testsuites")
+        self.assertEquals([x.get("name") for x in root], ["a", "b"])
+
+    def test_job_config(self):
+        config = {"log_dir": None, "log_file": "oft.log", "xunit_dir": "xunit",
+                  "switch_ip": None, "controller_port": 6653}
+        job = parallel.job_config(config, 1, [3, 4])
+        self.assertEquals(job["ports"], "3,4")
+        self.assertEquals(job["controller_port"], 6654)
+        self.assertEquals(job["log_file"], "oft-job1.log")
+        self.assertEquals(job["xunit_dir"], os.path.join("xunit", "job1"))
+
+        config.update(log_dir="logs", switch_ip="10.0.0.1,10.0.0.2")
+        job = parallel.job_config(config, 1, [3, 4])
+        self.assertEquals(job["switch_ip"], "10.0.0.2")
+        self.assertFalse("controller_port" in job)
+        self.assertEquals(job["log_dir"], os.path.join("logs", "job1"))
+
+    def test_shared_switch(self):
+        config = {"jobs": 2, "switch_ip": "10.0.0.1", "port_map": {1: "eth1", 2: "eth2"}}
+        self.assertRaises(ValueError, parallel.run_jobs, config, ["a", "b"], [])
+        config["switch_ip"] = "10.0.0.1,10.0.0.2,10.0.0.3"
+        config["jobs"] = 4
+        self.assertRaises(ValueError, parallel.run_jobs, config, ["a", "b"], [])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
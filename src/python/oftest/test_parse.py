@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 import unittest
+import oftest
+oftest.config.setdefault("disable_ipv6", False)
 import parse
 import packet as scapy
 
@@ -174,6 +176,87 @@ class TestPacketToFlowMatchV3(unittest.TestCase):
         result = parse.packet_to_flow_match_v3(pkt).oxm_list
         self.assertEquals([x.show() for x in expected], [x.show() for x in result])
 
+def raw_corpus():
+    """
+    Frames covering the headers raw_packet_layers walks and the cases it
+    leaves to scapy
+    """
+    eth = scapy.Ether(dst='00:01:02:03:04:05', src='00:06:07:08:09:0a')
+    ip = scapy.IP(src='192.168.0.1', dst='10.0.0.2', tos=0xb9, ttl=3)
+    ipv6 = scapy.IPv6(src='2001:db8::1', dst='2001:db8::2', tc=0x47, fl=0x12345)
+    l4s = [scapy.TCP(sport=1234, dport=80), scapy.UDP(sport=53, dport=4789),
+           scapy.ICMP(type=8, code=0), scapy.ICMP(type=3, code=1)/ip/scapy.TCP()]
+    tags = [[], [scapy.Dot1Q(vlan=50, prio=5)],
+            [scapy.Dot1Q(vlan=10, prio=1, id=1), scapy.Dot1Q(vlan=20, prio=2)]]
+    frames = []
+    for tag in tags:
+        l2 = eth
+        for t in tag:
+            l2 = l2/t
+        for l4 in l4s:
+            frames.append(l2/ip/l4/("D" * 10))
+        frames.append(l2/ip/scapy.IP(src="1.2.3.4")/scapy.TCP(sport=7))
+        frames.append(l2/scapy.IP(frag=20, proto=6)/("x" * 20))
+        frames.append(l2/scapy.IP(flags=1)/scapy.TCP())
+        frames.append(l2/scapy.IP(options=[scapy.IPOption('\x94\x04\x00\x00')])/scapy.TCP())
+        frames.append(l2/scapy.IP(proto=47)/("\x00" * 30))
+        frames.append(l2/scapy.IP(proto=99)/("\x00" * 30))
+        frames.append(l2/ipv6/scapy.TCP(sport=22, dport=2222))
+        frames.append(l2/ipv6/scapy.UDP(sport=5, dport=6))
+        frames.append(l2/ipv6/scapy.ICMPv6Unknown(type=128, code=0))
+        frames.append(l2/ipv6/scapy.ICMPv6EchoRequest())
+        frames.append(l2/scapy.IPv6(nh=59))
+        frames.append(l2/scapy.IPv6(nh=0)/("\x06\x00" + "\x00" * 6)/scapy.TCP())
+        frames.append(l2/scapy.ARP(op=2, hwsrc='00:00:00:00:00:01', psrc='1.1.1.1',
+                                  hwdst='00:00:00:00:00:02', pdst='2.2.2.2'))
+    frames.append(scapy.Ether(type=0x8847)/"\x00\x01\x41\x40"/ip/scapy.TCP())
+    frames.append(scapy.Ether(type=0x88a8)/scapy.Dot1Q(vlan=3)/ip/scapy.TCP())
+    frames.append(scapy.Ether(type=0x88cc)/("\x00" * 30))
+    frames.append(scapy.Ether(type=0x0801)/("\x11" * 20))
+    frames.append(scapy.Ether(type=100)/("\x00" * 100))
+    data = [str(x) for x in frames]
+    # Truncated headers
+    for frame in list(data[:20]):
+        for cut in [13, 17, 20, 30, 36, 40, 45]:
+            data.append(frame[:cut])
+    return data
+
+class TestRawPacketToFlowMatch(unittest.TestCase):
+    """
+    The raw bytes path must give the same match as the scapy path
+    """
+    def outcome(self, fn, show):
+        try:
+            return show(fn())
+        except Exception as e:
+            return type(e)
+
+    def check(self, fn, show):
+        for data in raw_corpus():
+            expected = self.outcome(lambda: fn(scapy.Ether(data)), show)
+            result = self.outcome(lambda: fn(data), show)
+            self.assertEquals(expected, result, repr(data))
+
+    def test_v1(self):
+        self.check(parse.packet_to_flow_match_v1, lambda m: m.show())
+
+    def test_oxm(self):
+        for fn in [parse.packet_to_flow_match_v3, parse.packet_to_flow_match_v4,
+                   parse.packet_to_flow_match_v5]:
+            self.check(fn, lambda m: [x.show() for x in m.oxm_list])
+
+    def test_common_frames_decoded(self):
+        eth = scapy.Ether()
+        for pkt in [eth/scapy.IP()/scapy.TCP(sport=1234, dport=80),
+                    eth/scapy.Dot1Q(vlan=2)/scapy.IP()/scapy.UDP(),
+                    eth/scapy.IP()/scapy.ICMP(),
+                    eth/scapy.IPv6()/scapy.TCP(),
+                    eth/scapy.ARP(),
+                    scapy.Ether(type=0x88cc)/("\x00" * 46)]:
+            self.assertNotEquals(parse.raw_packet_layers(str(pkt)), None, repr(pkt))
+        layers = parse.raw_packet_layers(str(eth/scapy.IP()/scapy.TCP(sport=1234, dport=80)))
+        self.assertEquals([name for (name, fields) in layers], ["ether", "ip", "tcp"])
+        self.assertEquals(layers[2][1], (1234, 80))
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import pcap_writer
+
+def pcapng_blocks(data):
+    offset = 0
+    while offset < len(data):
+        (block_type, length) = struct.unpack_from("<LL", data, offset)
+        (trailer,) = struct.unpack_from("<L", data, offset + length - 4)
+        assert trailer == length
+        yield (block_type, data[offset + 8:offset + length - 4])
+        offset += length
+
+class TestPcapWriter(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, "test.pcap")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def read(self):
+        with open(self.filename, "rb") as f:
+            return f.read()
+
+    def test_pcap(self):
+        writer = pcap_writer.PcapWriter(self.filename)
+        writer.write("abcde", 10.5, 3)
+        writer.write_many([("fg", 11.25, 4)])
+        writer.close()
+
+        data = self.read()
+        offset = pcap_writer.PcapHeader.size
+        self.assertEquals(pcap_writer.PcapHeader.unpack_from(data)[6], 192)
+        records = []
+        while offset < len(data):
+            fields = pcap_writer.PcapPPIHeader.unpack_from(data, offset)
+            offset += pcap_writer.PcapPktHeader.size + fields[2]
+            records.append((fields[0], fields[1], fields[10], data[offset - fields[2] + 16:offset]))
+        self.assertEquals(records, [(10, 500000, 3, "abcde"), (11, 250000, 4, "fg")])
+
+    def test_pcapng(self):
+        writer = pcap_writer.PcapngWriter(self.filename, {1: "veth1"})
+        writer.write("abcde", pcap_writer.Timestamp(1500000000, 123456789), 1)
+        writer.write("fg", 1500000001.5, 2)
+        writer.write("hij", 1500000002.0, 1)
+        writer.close()
+
+        blocks = list(pcapng_blocks(self.read()))
+        self.assertEquals([x[0] for x in blocks], [0x0A0D0D0A, 1, 6, 1, 6, 6])
+        self.assertTrue("veth1" in blocks[1][1])
+        self.assertTrue("port2" in blocks[3][1])
+
+        packets = []
+        for (block_type, body) in blocks:
+            if block_type == 6:
+                (interface, high, low, caplen, length) = struct.unpack_from("<LLLLL", body)
+                packets.append((interface, (high << 32) | low, body[20:20 + caplen]))
+        self.assertEquals(packets, [(0, 1500000000123456789, "abcde"),
+                                    (1, 1500000001500000000, "fg"),
+                                    (0, 1500000002000000000, "hij")])
+
+    def test_async(self):
+        writer = pcap_writer.AsyncWriter(pcap_writer.PcapngWriter(self.filename),
+                                         interval=10, high_water=100)
+        for i in range(250):
+            writer.write(struct.pack("!L", i), 1.0, 1)
+        writer.close()
+
+        data = [body[20:24] for (block_type, body) in pcapng_blocks(self.read())
+                if block_type == 6]
+        self.assertEquals(data, [struct.pack("!L", i) for i in range(250)])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+import sys
+import socket
+import threading
+import time
+import unittest
+import loxi.of13
+import oftest
+oftest.config.setdefault("disable_ipv6", False)
+sys.modules.setdefault("ofp", loxi.of13)
+import testutils
+import controller
+
+class FakeController(object):
+    def __init__(self):
+        self.packets_cv = threading.Condition()
+        self.packets_total = 0
+
+    def deliver(self):
+        with self.packets_cv:
+            self.packets_total += 1
+            self.packets_cv.notify_all()
+
+class FakeSwitchController(object):
+    """
+    Stands in for the controller and switch under a FlowBatch
+
+    Flow mods whose xid is in reject get an error as soon as they are
+    sent. Barriers are answered when waited for, unless barrier_reply is
+    false, in which case the wait times out. Sends fail if send_fails is
+    set.
+    """
+    def __init__(self):
+        self.transactions = {}
+        self.writes = []
+        self.reject = set()
+        self.barrier_reply = True
+        self.send_fails = False
+        self.outstanding = 0
+        self.outstanding_max = 0
+        self.next_xid = 1
+
+    def transact_start(self, msg, send=True):
+        if msg.xid == None:
+            msg.xid = self.next_xid
+            self.next_xid += 1
+        if msg.xid in self.transactions:
+            return None
+        txn = controller.Transaction(msg.xid)
+        self.transactions[msg.xid] = txn
+        return txn
+
+    def message_send_many(self, msgs):
+        if self.send_fails:
+            raise socket.error("Broken pipe")
+        self.writes.append([type(msg).__name__ for msg in msgs])
+        for msg in msgs:
+            if msg.xid in self.reject:
+                err = loxi.of13.message.flow_mod_failed_error_msg(xid=msg.xid)
+                self.transactions.pop(msg.xid).add(err, err.pack())
+            elif isinstance(msg, loxi.of13.message.barrier_request):
+                self.outstanding += 1
+        self.outstanding_max = max(self.outstanding, self.outstanding_max)
+
+    def transact_wait(self, txn, timeout=-1):
+        self.outstanding -= 1
+        del self.transactions[txn.xid]
+        if self.barrier_reply:
+            reply = loxi.of13.message.barrier_reply(xid=txn.xid)
+            txn.add(reply, reply.pack())
+        return txn.response()
+
+    def transact_cancel(self, txn):
+        if self.transactions.get(txn.xid) is txn:
+            del self.transactions[txn.xid]
+
+class Stat(object):
+    def __init__(self, packet_count, byte_count):
+        self.packet_count = packet_count
+        self.byte_count = byte_count
+
+class TestWaitUntil(unittest.TestCase):
+    def test_backoff(self):
+        calls = []
+        def predicate():
+            calls.append(time.time())
+            return len(calls) == 5 and "done"
+        self.assertEquals(testutils.wait_until(predicate, timeout=5, interval=0.01,
+                                               backoff=2.0), "done")
+        delays = [b - a for (a, b) in zip(calls, calls[1:])]
+        self.assertTrue(delays[-1] > delays[0] * 4)
+
+    def test_timeout(self):
+        start = time.time()
+        self.assertEquals(testutils.wait_until(lambda: 0, timeout=0.1), 0)
+        self.assertTrue(0.1 <= time.time() - start < 1)
+
+    def test_message_wakes(self):
+        ctrl = FakeController()
+        calls = []
+        def predicate():
+            calls.append(None)
+            return len(calls) > 1
+        timer = threading.Timer(0.1, ctrl.deliver)
+        timer.start()
+        start = time.time()
+        self.assertTrue(testutils.wait_until(predicate, timeout=5, interval=5,
+                                             controller=ctrl))
+        self.assertTrue(time.time() - start < 1)
+        timer.join()
+
+    def test_stats_increased(self):
+        stats = [[Stat(1, 100), Stat(1, 100)], [Stat(3, 300), Stat(1, 100)]]
+        initial = [Stat(1, 100), Stat(1, 100)]
+        predicate = testutils.stats_increased(lambda: stats.pop(0), initial,
+                                              packet_count=2, byte_count=None)
+        self.assertEquals(predicate(), None)
+        grown = predicate()
+        self.assertEquals([x.packet_count for x in grown], [3, 1])
+        self.assertTrue(predicate.stats is grown)
+
+        # Counters begin at 0 without initial entries
+        predicate = testutils.stats_increased(lambda: [Stat(2, 200)], packet_count=2)
+        self.assertTrue(predicate())
+        predicate = testutils.stats_increased(lambda: [], packet_count=0)
+        self.assertTrue(predicate())
+
+    def test_verify_flow_stats(self):
+        # The counters keep growing; only the entries the wait ended on
+        # show the expected increase
+        stats = [[Stat(1, 100)], [Stat(3, 300)], [Stat(5, 500)]]
+        get_flow_stats = testutils.get_flow_stats
+        testutils.get_flow_stats = lambda test, match, table_id=None: stats.pop(0)
+        try:
+            testutils.verify_flow_stats(self, None, initial=[Stat(1, 100)],
+                                        pkts=2, bytes=200)
+        finally:
+            testutils.get_flow_stats = get_flow_stats
+        self.assertEquals(len(stats), 1)
+
+class TestFlowBatch(unittest.TestCase):
+    def setUp(self):
+        self.ctrl = FakeSwitchController()
+
+    def test_barrier_spacing(self):
+        batch = testutils.FlowBatch(self.ctrl, barrier_every=3, window=2)
+        for i in range(7):
+            batch.add(loxi.of13.message.flow_add())
+        self.assertEquals(batch.finish(), [])
+        self.assertEquals(self.ctrl.writes,
+                          [["flow_add"] * 3 + ["barrier_request"],
+                           ["flow_add"] * 3 + ["barrier_request"],
+                           ["flow_add", "barrier_request"]])
+        self.assertEquals(self.ctrl.transactions, {})
+
+    def test_window(self):
+        batch = testutils.FlowBatch(self.ctrl, barrier_every=1, window=2)
+        for i in range(6):
+            batch.add(loxi.of13.message.flow_add())
+            self.assertTrue(len(batch.inflight) <= 2)
+        batch.finish()
+        self.assertEquals(len(self.ctrl.writes), 6)
+        self.assertEquals(self.ctrl.outstanding_max, 2)
+
+    def test_error_matched_by_xid(self):
+        msgs = [loxi.of13.message.flow_add(xid=100 + i) for i in range(5)]
+        self.ctrl.reject.add(102)
+        batch = testutils.FlowBatch(self.ctrl, barrier_every=2, window=1)
+        for msg in msgs:
+            batch.add(msg)
+        errors = batch.finish()
+        self.assertEquals(len(errors), 1)
+        (msg, err) = errors[0]
+        self.assertTrue(msg is msgs[2])
+        self.assertEquals(err.xid, 102)
+        self.assertTrue(isinstance(err, loxi.of13.message.flow_mod_failed_error_msg))
+        self.assertEquals(self.ctrl.transactions, {})
+
+    def test_barrier_timeout(self):
+        self.ctrl.barrier_reply = False
+        batch = testutils.FlowBatch(self.ctrl, barrier_every=2, window=2)
+        for i in range(5):
+            batch.add(loxi.of13.message.flow_add())
+        self.assertRaises(AssertionError, batch.finish)
+        self.assertEquals(self.ctrl.transactions, {})
+        self.assertEquals(batch.inflight, [])
+        self.assertEquals(batch.chunk, [])
+
+    def test_send_failure(self):
+        self.ctrl.send_fails = True
+        batch = testutils.FlowBatch(self.ctrl, barrier_every=2)
+        batch.add(loxi.of13.message.flow_add())
+        self.assertRaises(socket.error, batch.add, loxi.of13.message.flow_add())
+        self.assertEquals(self.ctrl.transactions, {})
+        self.assertEquals(batch.inflight, [])
+        self.assertEquals(batch.chunk, [])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
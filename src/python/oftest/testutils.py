@@ -11,6 +11,7 @@ import oftest.controller
 import oftest.dataplane
 import oftest.parse
 import oftest.ofutils
+import oftest.packet_template
 import ofp
 
 global skipped_test_count
@@ -443,6 +444,20 @@ def simple_eth_packet(pktlen=60,
 
     return pkt
 
+def packet_bytes(builder, **kwargs):
+    """
+    Return the raw bytes of builder(**kwargs)
+
+    Equivalent to str(builder(**kwargs)) for the simple_*_packet builders
+    above, but packets differing only in addresses, ports, VLAN tag or
+    other header fields are patched from a cached template instead of
+    being rebuilt with scapy. Use it where only the bytes are needed.
+
+    @param builder Packet builder such as simple_tcp_packet
+    @param kwargs Keyword arguments for builder
+    """
+    return oftest.packet_template.packet_bytes(builder, **kwargs)
+
 def qinq_tcp_packet(pktlen=100, 
                     eth_dst='00:01:02:03:04:05',
                     eth_src='00:06:07:08:09:0a',
@@ -511,6 +526,111 @@ def do_barrier(ctrl, timeout=-1):
     # We'll trust the transaction processing in the controller that xid matched
     return 0 # for backwards compatibility
 
+class FlowBatch(object):
+    """
+    Pipelined bulk flow programming
+
+    Flow mods are packed into a single write per chunk of barrier_every
+    messages, each chunk followed by a barrier. Up to window chunks may be
+    outstanding before waiting for the oldest barrier reply. Every flow
+    mod is registered as a transaction, so an error message from the
+    switch is matched to the offending flow by xid.
+
+    Usage:
+        batch = FlowBatch(self.controller)
+        for request in requests:
+            batch.add(request)
+        errors = batch.finish()
+
+    @var errors List of (flow_mod, error_msg) pairs for rejected flows
+    """
+
+    def __init__(self, ctrl, barrier_every=256, window=4, timeout=-1):
+        """
+        @param ctrl The controller object for the test
+        @param barrier_every Number of flow mods per barrier
+        @param window Maximum number of unacknowledged barriers
+        @param timeout Timeout for each barrier reply; -1 for the default
+        """
+        self.ctrl = ctrl
+        self.barrier_every = barrier_every
+        self.window = window
+        self.timeout = timeout
+        self.chunk = [] # (msg, Transaction) not yet sent
+        self.inflight = [] # (barrier Transaction, chunk) sent, oldest first
+        self.errors = []
+        self.count = 0
+
+    def add(self, msg):
+        """
+        Queue a flow mod (or any message acknowledged by a barrier)
+        """
+        txn = self.ctrl.transact_start(msg, send=False)
+        if txn is None:
+            raise AssertionError("duplicate xid %d in flow batch" % msg.xid)
+        self.chunk.append((msg, txn))
+        self.count += 1
+        if len(self.chunk) >= self.barrier_every:
+            self.flush()
+
+    def flush(self):
+        """
+        Send the queued flow mods followed by a barrier
+        """
+        if not self.chunk:
+            return
+        while len(self.inflight) >= self.window:
+            self._retire()
+        barrier = ofp.message.barrier_request()
+        barrier_txn = self.ctrl.transact_start(barrier, send=False)
+        chunk, self.chunk = self.chunk, []
+        self.inflight.append((barrier_txn, chunk))
+        try:
+            self.ctrl.message_send_many([msg for (msg, _) in chunk] + [barrier])
+        except:
+            self._cancel()
+            raise
+
+    def _retire(self):
+        """
+        Wait for the oldest outstanding barrier and collect errors
+        """
+        (barrier_txn, chunk) = self.inflight.pop(0)
+        (reply, _) = self.ctrl.transact_wait(barrier_txn, timeout=self.timeout)
+        for (msg, txn) in chunk:
+            if txn.done:
+                (err, _) = txn.response()
+                logging.debug("Flow mod xid %d rejected", msg.xid)
+                self.errors.append((msg, err))
+            else:
+                self.ctrl.transact_cancel(txn)
+        if reply is None:
+            self._cancel()
+            raise AssertionError("barrier failed")
+
+    def _cancel(self):
+        for (barrier_txn, chunk) in self.inflight:
+            self.ctrl.transact_cancel(barrier_txn)
+            for (_, txn) in chunk:
+                self.ctrl.transact_cancel(txn)
+        for (_, txn) in self.chunk:
+            self.ctrl.transact_cancel(txn)
+        self.inflight = []
+        self.chunk = []
+
+    def finish(self):
+        """
+        Send any queued flow mods and wait for all barriers
+
+        @returns The list of (flow_mod, error_msg) pairs
+        """
+        self.flush()
+        while self.inflight:
+            self._retire()
+        logging.info("Flow batch: %d messages, %d errors",
+                     self.count, len(self.errors))
+        return self.errors
+
 def port_config_get(controller, port_no):
     """
     Get a port's configuration
@@ -532,7 +652,6 @@ def port_config_get(controller, port_no):
         ports = reply.ports
     else:
         request = ofp.message.port_desc_stats_request()
-        # TODO do multipart correctly
         reply, _ = controller.transact(request)
         if reply is None:
             logging.warn("Port desc stats request failed")
@@ -817,11 +936,14 @@ def flow_match_test_port_pair(parent, ing_port, egr_ports, wildcards=None,
                        str(egr_ports))
     logging.debug("  WC: " + hex(wildcards) + " vlan: " + str(vlan_vid))
     if pkt is None:
-        pkt = simple_tcp_packet(dl_vlan_enable=(vlan_vid >= 0), vlan_vid=vlan_vid)
+        pkt = packet_bytes(simple_tcp_packet, dl_vlan_enable=(vlan_vid >= 0),
+                           vlan_vid=vlan_vid)
     if exp_pkt is None:
         exp_pkt = pkt
 
-    request = flow_msg_create(parent, pkt, ing_port=ing_port, 
+    # The match is parsed from the bytes that are sent
+    pkt_data = str(pkt)
+    request = flow_msg_create(parent, pkt_data, ing_port=ing_port, 
                               wildcards=wildcards, egr_ports=egr_ports,
                               action_list=action_list)
 
@@ -829,7 +951,7 @@ def flow_match_test_port_pair(parent, ing_port, egr_ports, wildcards=None,
 
     logging.debug("Send packet: " + str(ing_port) + " to " + 
                         str(egr_ports))
-    parent.dataplane.send(ing_port, str(pkt))
+    parent.dataplane.send(ing_port, pkt_data)
 
     exp_ports = [ing_port if port == ofp.OFPP_IN_PORT else port for port in egr_ports]
     verify_packets(parent, exp_pkt, exp_ports)
@@ -847,7 +969,8 @@ def flow_match_test_pktout(parent, ing_port, egr_ports,
     """
 
     if pkt is None:
-        pkt = simple_tcp_packet(dl_vlan_enable=(vlan_vid >= 0), vlan_vid=vlan_vid)
+        pkt = packet_bytes(simple_tcp_packet, dl_vlan_enable=(vlan_vid >= 0),
+                           vlan_vid=vlan_vid)
     if exp_pkt is None:
         exp_pkt = pkt
 
@@ -914,6 +1037,10 @@ def flow_match_test(parent, port_map, wildcards=None, vlan_vid=-1, pkt=None,
     """
     if wildcards is None:
         wildcards = required_wildcards(parent)
+    if pkt is None:
+        # Built once for all the port pairs
+        pkt = packet_bytes(simple_tcp_packet, dl_vlan_enable=(vlan_vid >= 0),
+                           vlan_vid=vlan_vid)
     of_ports = port_map.keys()
     of_ports.sort()
     parent.assertTrue(len(of_ports) > 1, "Not enough ports for test")
@@ -1320,18 +1447,24 @@ def get_stats(test, req):
     """
     Retrieve a list of stats entries. Handles OFPSF_REPLY_MORE.
     """
+    return get_stats_multi(test, [req])[0]
+
+def get_stats_multi(test, reqs):
+    """
+    Retrieve the stats entries for several requests at once.
+
+    The requests are pipelined; the controller reassembles multipart
+    replies by xid.
+
+    @returns A list with the list of entries for each request
+    """
     msgtype = ofp.OFPT_STATS_REPLY
-    more_flag = ofp.OFPSF_REPLY_MORE
-    stats = []
-    reply, _ = test.controller.transact(req)
-    test.assertTrue(reply is not None, "No response to stats request")
-    test.assertEquals(reply.type, msgtype, "Response had unexpected message type")
-    stats.extend(reply.entries)
-    while reply.flags & more_flag != 0:
-        reply, pkt = test.controller.poll(exp_msg=msgtype)
+    result = []
+    for (reply, _) in test.controller.transact_multi(reqs):
         test.assertTrue(reply is not None, "No response to stats request")
-        stats.extend(reply.entries)
-    return stats
+        test.assertEquals(reply.type, msgtype, "Response had unexpected message type")
+        result.append(reply.entries)
+    return result
 
 def get_flow_stats(test, match, table_id=None,
                    out_port=None, out_group=None,
@@ -1380,6 +1513,175 @@ def get_queue_stats(test, port_no, queue_id):
     req = ofp.message.queue_stats_request(port_no=port_no, queue_id=queue_id)
     return get_stats(test, req)
 
+def wait_until(predicate, timeout=None, backoff=2.0, interval=0.01,
+               max_interval=0.5, controller=None):
+    """
+    Call predicate until it returns a true value or the timeout expires
+
+    The delay between calls starts at interval and is multiplied by backoff
+    after each call, up to max_interval. If a controller is given, a
+    message from the switch (e.g. port_status or flow_removed) ends the
+    delay early so the predicate is checked again at once.
+
+    @param predicate Function taking no arguments
+    @param timeout Seconds to wait, defaults to ofutils.default_timeout
+    @param backoff Factor the delay grows by after each call
+    @param interval First delay in seconds
+    @param max_interval Largest delay in seconds
+    @param controller Controller whose messages end a delay early
+    @returns The last value returned by predicate
+    """
+
+    if timeout == None:
+        timeout = oftest.ofutils.default_timeout
+    end_time = time.time() + timeout
+
+    while True:
+        if controller != None:
+            seen = controller.packets_total
+        value = predicate()
+        if value:
+            return value
+
+        remaining = end_time - time.time()
+        if remaining <= 0:
+            logging.debug("Condition not met after %.2fs", timeout)
+            return value
+
+        delay = min(interval, remaining)
+        if controller == None:
+            time.sleep(delay)
+        else:
+            with controller.packets_cv:
+                if controller.packets_total == seen:
+                    controller.packets_cv.wait(delay)
+        interval = min(interval * backoff, max_interval)
+
+def stats_increased(fetch, initial=None, **increases):
+    """
+    Make a wait_until predicate that is true once stats counters have grown
+
+    Each counter is summed over the stats entries. Counters whose increase
+    is None are not checked. The predicate returns the fetched list of
+    stats entries once the counters have grown (True if the list is
+    empty), else None. The entries fetched last are also kept in its stats
+    attribute, for checks after a timeout.
+
+    @param fetch Function returning the current list of stats entries
+    @param initial List of stats entries the increases are measured from,
+    or None if the counters begin at 0
+    @param increases Minimum increase of each counter, by field name
+    """
+
+    increases = dict((k, v) for (k, v) in increases.items() if v != None)
+
+    def total(stats, field):
+        return sum(getattr(stat, field) for stat in stats)
+
+    before = dict((k, total(initial or [], k)) for k in increases)
+
+    def predicate():
+        stats = predicate.stats = fetch()
+        if all(total(stats, k) - before[k] >= v for (k, v) in increases.items()):
+            return stats or True
+        return None
+
+    predicate.stats = []
+    return predicate
+
+def flow_stats_increased(test, match, table_id=None, initial=None,
+                         pkts=None, bytes=None):
+    """
+    Make a wait_until predicate that is true once flow counters have grown
+
+    The arguments are the same as for verify_flow_stats.
+    """
+    return stats_increased(lambda: get_flow_stats(test, match, table_id=table_id),
+                           initial, packet_count=pkts, byte_count=bytes)
+
+def port_stats_increased(test, port, initial=None,
+                         tx_pkts=None, rx_pkts=None,
+                         tx_bytes=None, rx_bytes=None):
+    """
+    Make a wait_until predicate that is true once port counters have grown
+
+    The arguments are the same as for verify_port_stats.
+    """
+    return stats_increased(lambda: get_port_stats(test, port), initial,
+                           tx_packets=tx_pkts, rx_packets=rx_pkts,
+                           tx_bytes=tx_bytes, rx_bytes=rx_bytes)
+
+def queue_stats_increased(test, port_no, queue_id, initial=None,
+                          pkts=None, bytes=None):
+    """
+    Make a wait_until predicate that is true once queue counters have grown
+
+    The arguments are the same as for verify_queue_stats.
+    """
+    return stats_increased(lambda: get_queue_stats(test, port_no, queue_id),
+                           initial, tx_packets=pkts, tx_bytes=bytes)
+
+def group_stats_increased(test, group_id, initial=None, pkts=None, bytes=None):
+    """
+    Make a wait_until predicate that is true once group counters have grown
+
+    @param test Instance of base_tests.SimpleProtocol
+    @param group_id Group to check
+    @param initial List of group stats entries the increases are measured
+    from, or None
+    @param pkts Minimum increase of the packet count, or None
+    @param bytes Minimum increase of the byte count, or None
+    """
+    req = ofp.message.group_stats_request(group_id=group_id)
+    return stats_increased(lambda: get_stats(test, req), initial,
+                           packet_count=pkts, byte_count=bytes)
+
+def port_state_is(test, port_no, mask, state):
+    """
+    Make a wait_until predicate that is true once a port's state matches
+
+    Pass test.controller to wait_until so a port_status message wakes it.
+
+    @param test Instance of base_tests.SimpleProtocol
+    @param port_no OpenFlow port number
+    @param mask OFPPS_* bits to compare
+    @param state Expected value of those bits
+    """
+
+    def predicate():
+        if ofp.OFP_VERSION <= 3:
+            reply, _ = test.controller.transact(ofp.message.features_request())
+            ports = reply and reply.ports or []
+        else:
+            ports = get_stats(test, ofp.message.port_desc_stats_request())
+        return any(port.port_no == port_no and port.state & mask == state
+                   for port in ports)
+
+    return predicate
+
+def flow_removed_received(test, match=None, reason=None):
+    """
+    Make a wait_until predicate that returns a matching flow_removed message
+
+    flow_removed messages that do not match are discarded. Pass
+    test.controller to wait_until so the message wakes it.
+
+    @param test Instance of base_tests.SimpleProtocol
+    @param match Expected match, or None for any
+    @param reason One of OFPRR_* to expect, or None for any
+    """
+
+    def predicate():
+        while True:
+            msg, _ = test.controller.poll(ofp.OFPT_FLOW_REMOVED, timeout=0)
+            if msg == None:
+                return None
+            if (match == None or msg.match == match) and \
+               (reason == None or msg.reason == reason):
+                return msg
+
+    return predicate
+
 def verify_flow_stats(test, match, table_id=0xff,
                       initial=[],
                       pkts=None, bytes=None):
@@ -1401,16 +1703,12 @@ def verify_flow_stats(test, match, table_id=0xff,
     pkts_before, bytes_before = accumulate(initial)
 
     # Wait 10s for counters to update
-    pkt_diff = byte_diff = None
-    for i in range(0, 100):
-        stats = get_flow_stats(test, match, table_id=table_id)
-        pkts_after, bytes_after = accumulate(stats)
-        pkt_diff = pkts_after - pkts_before
-        byte_diff = bytes_after - bytes_before
-        if (pkts == None or pkt_diff >= pkts) and \
-           (bytes == None or byte_diff >= bytes):
-            break
-        time.sleep(0.1)
+    increased = flow_stats_increased(test, match, table_id, initial, pkts, bytes)
+    wait_until(increased, timeout=10)
+    stats = increased.stats
+    pkts_after, bytes_after = accumulate(stats)
+    pkt_diff = pkts_after - pkts_before
+    byte_diff = bytes_after - bytes_before
 
     if pkts != None:
         test.assertEquals(pkt_diff, pkts, "Flow packet counter not updated properly (expected increase of %d, got increase of %d)" % (pkts, pkt_diff))
@@ -1443,20 +1741,16 @@ def verify_port_stats(test, port,
         tx_bytes_before, rx_bytes_before = accumulate(initial)
 
     # Wait 10s for counters to update
-    for i in range(0, 100):
-        stats = get_port_stats(test, port)
-        tx_pkts_after, rx_pkts_after, \
-            tx_bytes_after, rx_bytes_after = accumulate(stats)
-        tx_pkts_diff = tx_pkts_after - tx_pkts_before
-        rx_pkts_diff = rx_pkts_after - rx_pkts_before
-        tx_bytes_diff = tx_bytes_after - tx_bytes_before
-        rx_bytes_diff = rx_bytes_after - rx_bytes_before
-        if (tx_pkts == None or tx_pkts == tx_pkts_diff) and \
-           (rx_pkts == None or rx_pkts == rx_pkts_diff) and \
-           (tx_bytes == None or tx_bytes <= tx_bytes_diff) and \
-           (rx_bytes == None or rx_bytes <= rx_bytes_diff):
-            break
-        time.sleep(0.1)
+    increased = port_stats_increased(test, port, initial,
+                                     tx_pkts, rx_pkts, tx_bytes, rx_bytes)
+    wait_until(increased, timeout=10)
+    stats = increased.stats
+    tx_pkts_after, rx_pkts_after, \
+        tx_bytes_after, rx_bytes_after = accumulate(stats)
+    tx_pkts_diff = tx_pkts_after - tx_pkts_before
+    rx_pkts_diff = rx_pkts_after - rx_pkts_before
+    tx_bytes_diff = tx_bytes_after - tx_bytes_before
+    rx_bytes_diff = rx_bytes_after - rx_bytes_before
 
     if (tx_pkts != None):
         test.assertEqual(tx_pkts,tx_pkts_diff,"Port TX packet counter is not updated correctly (expected increase of %d, got increase of %d)" % (tx_pkts, tx_pkts_diff))
@@ -1489,16 +1783,12 @@ def verify_queue_stats(test, port_no, queue_id,
     pkts_before, bytes_before = accumulate(initial)
 
     # Wait 10s for counters to update
-    pkt_diff = byte_diff = None
-    for i in range(0, 100):
-        stats = get_queue_stats(test, port_no, queue_id)
-        pkts_after, bytes_after = accumulate(stats)
-        pkt_diff = pkts_after - pkts_before
-        byte_diff = bytes_after - bytes_before
-        if (pkts == None or pkt_diff >= pkts) and \
-           (bytes == None or byte_diff >= bytes):
-            break
-        time.sleep(0.1)
+    increased = queue_stats_increased(test, port_no, queue_id, initial, pkts, bytes)
+    wait_until(increased, timeout=10)
+    stats = increased.stats
+    pkts_after, bytes_after = accumulate(stats)
+    pkt_diff = pkts_after - pkts_before
+    byte_diff = bytes_after - bytes_before
 
     if pkts != None:
         test.assertEquals(pkt_diff, pkts, "Queue packet counter not updated properly (expected increase of %d, got increase of %d)" % (pkts, pkt_diff))
@@ -1677,11 +1967,21 @@ def verify_packets(test, pkt, ofports):
     verify_no_packet, and verify_no_other_packets functions directly.
     """
     pkt = str(pkt)
-    for ofport in openflow_ports():
-        if ofport in ofports:
-            verify_packet(test, pkt, ofport)
-        else:
-            verify_no_packet(test, pkt, ofport)
+    yes_ports = [ofport for ofport in openflow_ports() if ofport in ofports]
+    no_ports = [ofport for ofport in openflow_ports() if ofport not in ofports]
+
+    logging.debug("Checking for pkt on ports %r", yes_ports)
+    received = test.dataplane.poll_many([(ofport, pkt) for ofport in yes_ports])
+    for (ofport, rcv_pkt) in zip(yes_ports, received):
+        test.assertTrue(rcv_pkt != None, "Did not receive pkt on %r" % ofport)
+
+    logging.debug("Negative check for pkt on ports %r", no_ports)
+    received = test.dataplane.poll_many(
+        [(ofport, pkt) for ofport in no_ports],
+        timeout=oftest.ofutils.default_negative_timeout)
+    for (ofport, rcv_pkt) in zip(no_ports, received):
+        test.assertTrue(rcv_pkt == None, "Received packet on %r" % ofport)
+
     verify_no_other_packets(test)
 
 def verify_no_errors(ctrl):
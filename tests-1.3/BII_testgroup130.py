@@ -113,7 +113,7 @@ class Testcase_130_250_Action_set_order(base_tests.SimpleDataPlane):
         logging.info("Sending packet, expecting output to port %d", out_port)
         self.dataplane.send(in_port, pktstr)
         #verify_packets(self, pktstr, [out_port])
-        exp_pkt = str(simple_tcp_packet(eth_src = '00:07:06:05:04:03'))
+        exp_pkt = packet_bytes(simple_tcp_packet, eth_src = '00:07:06:05:04:03')
         verify_packet(self, exp_pkt, out_port)
 		
 		
@@ -119,7 +119,7 @@ class Testcase_200_30_basic_ECHO_REQUEST(base_tests.SimpleDataPlane):
 
         timeout = 5
         port1, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         self.dataplane.send(port1, pkt)
         logging.info("Sending a dataplane packet")
         verify_packets(self, pkt, [])
@@ -222,8 +222,8 @@ class Testcase_230_50_ActionHeaderMaxLenMax(base_tests.SimpleDataPlane):
             rv = self.controller.message_send(req)
             self.assertTrue(rv != -1, "Failed to insert flow")
 
-            pkt = simple_tcp_packet()
-            self.dataplane.send(in_port, str(pkt))
+            pkt = packet_bytes(simple_tcp_packet)
+            self.dataplane.send(in_port, pkt)
             logging.info("Sending a dataplane packet")
             rv, _ = self.controller.poll(exp_msg=ofp.const.OFPT_PACKET_IN)
             self.assertIsNotNone(rv, "Did not receive packet in message")
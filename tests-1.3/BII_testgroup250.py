@@ -106,7 +106,7 @@ class Testcase_250_70_SwitchConfigMaxBytes(base_tests.SimpleDataPlane):
         self.assertEqual(reply.miss_send_len, 128 , "Default miss_send_len is incorrect.")
 
         port1, = openflow_ports(1)
-        pkt = str(simple_tcp_packet(pktlen=200))
+        pkt = packet_bytes(simple_tcp_packet, pktlen=200)
         self.dataplane.send(port1, pkt)
         logging.info("Sending a dataplane packet")
         verify_packets(self, pkt, [])
@@ -152,7 +152,7 @@ class Testcase_250_140_SwitchConfigMissSendLen(base_tests.SimpleDataPlane):
         do_barrier(self.controller)
 
         port1, = openflow_ports(1)
-        pkt = str(simple_tcp_packet(pktlen=1500))
+        pkt = packet_bytes(simple_tcp_packet, pktlen=1500)
         
         miss_send_len_list=[0,0xffe5,0xffff]
         for miss_send_len in miss_send_len_list:
@@ -70,7 +70,7 @@ class Testcase_260_40_FlowmodCookies(base_tests.SimpleDataPlane):
         logging.info("Sending flowmod 1")
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to insert flow 1")
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         logging.info("Sending a packet to match on port %s.", in_port1)
         self.dataplane.send(in_port1, pkt)
         verify_packet(self, pkt, out_port)
@@ -190,7 +190,7 @@ class Testcase_260_50_FlowmodCookieMask(base_tests.SimpleDataPlane):
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to delete flows")
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         logging.info("Sending a packet to match on port %s.", in_port1)
         self.dataplane.send(in_port1, pkt)
         verify_no_packet(self, pkt, out_port)
@@ -638,7 +638,7 @@ class Testcase_260_190_FlowmodIdleTimeout(base_tests.SimpleDataPlane):
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to insert flow")
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         logging.info("Sending dataplane packet")
         self.dataplane.send(in_port, pkt)
         verify_packet(self, pkt, out_port)
@@ -680,7 +680,7 @@ class Testcase_260_200_FlowmodHardTimeout(base_tests.SimpleDataPlane):
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to insert flow")
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         logging.info("Sending dataplane packet")
         self.dataplane.send(in_port, pkt)
         verify_packet(self, pkt, out_port)
@@ -751,7 +751,7 @@ class Testcase_260_230_FlowmodHard_IdleTimeout(base_tests.SimpleDataPlane):
         self.assertTrue(rv != -1, "Failed to insert flow")
         
         sleep(2)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         logging.info("Sending dataplane packet within idle_timeout")
         self.dataplane.send(in_port, pkt)
         logging.info("Sending Multipart msgs")
@@ -779,7 +779,7 @@ class Testcase_260_230_FlowmodHard_IdleTimeout(base_tests.SimpleDataPlane):
         self.assertTrue(rv != -1, "Failed to insert flow")
 
         for i in range(5):
-            pkt = str(simple_tcp_packet())
+            pkt = packet_bytes(simple_tcp_packet)
             logging.info("Sending dataplane packets")
             sleep(1)
             self.dataplane.send(in_port, pkt)
@@ -824,7 +824,7 @@ class Testcase_260_240_FlowmodTimeoutBoth0(base_tests.SimpleDataPlane):
         self.assertTrue(rv != -1, "Failed to insert flow")
 
         for i in range(6):
-            pkt = str(simple_tcp_packet())
+            pkt = packet_bytes(simple_tcp_packet)
             logging.info("Sending dataplane packets")
             self.dataplane.send(in_port, pkt)
             verify_packet_in(self,pkt,in_port,ofp.OFPR_ACTION,self.controller)
@@ -878,7 +878,7 @@ class Testcase_260_250_FlowmodPriority(base_tests.SimpleDataPlane):
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to insert flow")
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         logging.info("Sending dataplane packets")
         self.dataplane.send(in_port, pkt)
         verify_packet(self, pkt, out_port2)
@@ -953,7 +953,7 @@ class Testcase_260_270_FlowmodBufferID(base_tests.SimpleDataPlane):
         self.assertTrue(rv != -1, "Failed to insert flow")
 
         timeout = 5
-        pkt = str(simple_tcp_packet(pktlen=512))
+        pkt = packet_bytes(simple_tcp_packet, pktlen=512)
         self.dataplane.send(port1, pkt)
         logging.info("Sending a dataplane packet")
         rv, raw=self.controller.poll(exp_msg=ofp.const.OFPT_PACKET_IN, timeout=timeout)
@@ -1011,7 +1011,7 @@ class Testcase_260_280_FlowmodBufferIDIgnored(base_tests.SimpleDataPlane):
         self.assertTrue(rv != -1, "Failed to insert flow")
 
         timeout = 5
-        pkt = str(simple_tcp_packet(pktlen=512))
+        pkt = packet_bytes(simple_tcp_packet, pktlen=512)
         self.dataplane.send(port1, pkt)
         logging.info("Sending a dataplane packet")
         rv, raw=self.controller.poll(exp_msg=ofp.const.OFPT_PACKET_IN, timeout=timeout)
@@ -1130,7 +1130,7 @@ class Testcase_260_320_FlowmodModifyStrict(base_tests.SimpleDataPlane):
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to insert flow 1")
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         self.dataplane.send(in_port, pkt)
         logging.info("Sending a dataplane packet")
         verify_packet(self, pkt, out_port1)
@@ -1247,7 +1247,7 @@ class Testcase_260_380_FlowmodPacketCount(base_tests.SimpleDataPlane):
         self.assertTrue(rv != -1, "Failed to insert flow")
 
         for i in range(10):
-            pkt = str(simple_tcp_packet(pktlen=200))
+            pkt = packet_bytes(simple_tcp_packet, pktlen=200)
             self.dataplane.send(in_port, pkt)
 
         time.sleep(2)
@@ -1288,7 +1288,7 @@ class Testcase_260_390_FlowmodByteCount(base_tests.SimpleDataPlane):
         self.assertTrue(rv != -1, "Failed to insert flow")
 
         for i in range(10):
-            pkt = str(simple_tcp_packet(pktlen=200))
+            pkt = packet_bytes(simple_tcp_packet, pktlen=200)
             self.dataplane.send(in_port, pkt)
 
         time.sleep(2)
@@ -1328,7 +1328,7 @@ class Testcase_260_400_FlowmodNoCounts(Testcase_260_380_FlowmodPacketCount):
         self.assertTrue(rv != -1, "Failed to insert flow")
 
         for i in range(10):
-            pkt = str(simple_tcp_packet(pktlen=200))
+            pkt = packet_bytes(simple_tcp_packet, pktlen=200)
             self.dataplane.send(in_port, pkt)
 
         time.sleep(2)
@@ -231,7 +231,7 @@ class Testcase_310_80_MultipartFlowStatsOutport(base_tests.SimpleDataPlane):
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to insert flow 3")
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         logging.info("Sending a packet to match on port %s.", port1)
         self.dataplane.send(port1, pkt)
         verify_packet(self, pkt, port3)
@@ -972,7 +972,7 @@ class Testcase_310_310_MultipartAggStatsPacketCount(base_tests.SimpleDataPlane):
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to insert flow")
 
-        pkt= str(simple_tcp_packet())        
+        pkt= packet_bytes(simple_tcp_packet)        
         for i in range(5):
             logging.info("Sending a dataplane packet")
             self.dataplane.send(in_port,pkt)
@@ -1013,7 +1013,7 @@ class Testcase_310_320_MultipartAggStatsByteCount(base_tests.SimpleDataPlane):
         rv = self.controller.message_send(req)
         self.assertTrue(rv != -1, "Failed to insert flow")
 
-        pkt= str(simple_tcp_packet())        
+        pkt= packet_bytes(simple_tcp_packet)        
         for i in range(5):
             logging.info("Sending a dataplane packet")
             self.dataplane.send(in_port,pkt)
@@ -172,13 +172,13 @@ class Testcase_320_40_MultipartTableStatsLookupCount(base_tests.SimpleDataPlane)
         nonmatch_pkt_no=10
 
         for i in range(match_pkt_no):
-        	pkt = str(simple_tcp_packet())
+        	pkt = packet_bytes(simple_tcp_packet)
         	self.dataplane.send(in_port, pkt)
         	verify_packet(self, pkt, out_port)
         	logging.info("Sending matching dataplane packets")
 
         for i in range(nonmatch_pkt_no):
-        	pkt = str(simple_tcp_packet())
+        	pkt = packet_bytes(simple_tcp_packet)
         	self.dataplane.send(no_port, pkt)
         	verify_no_packet(self, pkt, out_port)
         	logging.info("Sending non-matching dataplane packets")
@@ -187,8 +187,7 @@ class Testcase_320_40_MultipartTableStatsLookupCount(base_tests.SimpleDataPlane)
         logging.info("Sending table stats request")
         stats = get_stats(self, request)
         lookup_curr=stats[0].lookup_count
-        
-        time.sleep(2)
+
         self.assertEqual(lookup_curr-lookup_orig, match_pkt_no+nonmatch_pkt_no, "Table stats lookup count is not correct")
 
         logging.info("Table stats lookup count is correct")
@@ -235,13 +234,13 @@ class Testcase_320_50_MultipartTableStatsMatchedCount(base_tests.SimpleDataPlane
         nonmatch_pkt_no=10
 
         for i in range(match_pkt_no):
-        	pkt = str(simple_tcp_packet())
+        	pkt = packet_bytes(simple_tcp_packet)
         	self.dataplane.send(in_port, pkt)
         	verify_packet(self, pkt, out_port)
         	logging.info("Sending matching dataplane packets")
 
         for i in range(nonmatch_pkt_no):
-        	pkt = str(simple_tcp_packet())
+        	pkt = packet_bytes(simple_tcp_packet)
         	self.dataplane.send(no_port, pkt)
         	verify_no_packet(self, pkt, out_port)
         	logging.info("Sending non-matching dataplane packets")
@@ -250,8 +249,7 @@ class Testcase_320_50_MultipartTableStatsMatchedCount(base_tests.SimpleDataPlane
         logging.info("Sending table stats request")
         stats = get_stats(self, request)
         matched_curr=stats[0].matched_count
-        
-        time.sleep(2)
+
         self.assertEqual(matched_curr-matched_orig, match_pkt_no, "Table stats matched count is not correct")
 
         logging.info("Table stats matched count is correct")
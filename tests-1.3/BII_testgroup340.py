@@ -106,11 +106,11 @@ class Testcase_340_50_MultipartPortStatsRxPackets(base_tests.SimpleDataPlane):
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(port))
         init_rx_pkt = stats[0].rx_packets
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         for i in range(pkt_no):
             self.dataplane.send(port,pkt)
 
-        time.sleep(2)
+        wait_until(port_stats_increased(self, port, stats, rx_pkts=pkt_no))
         request = ofp.message.port_stats_request(port_no=port)
         stats = get_stats(self, request)
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(port))
@@ -154,11 +154,11 @@ class Testcase_340_60_MultipartPortStatsTxPackets(base_tests.SimpleDataPlane):
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(out_port))
         init_tx_pkt = stats[0].tx_packets
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         for i in range(pkt_no):
             self.dataplane.send(in_port,pkt)
 
-        time.sleep(2)
+        wait_until(port_stats_increased(self, out_port, stats, tx_pkts=pkt_no))
         request = ofp.message.port_stats_request(port_no=out_port)
         stats = get_stats(self, request)
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(out_port))
@@ -191,11 +191,11 @@ class Testcase_340_70_MultipartPortStatsRxBytes(base_tests.SimpleDataPlane):
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(port))
         init_rx_bytes = stats[0].rx_bytes
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         for i in range(pkt_no):
             self.dataplane.send(port,pkt)
 
-        time.sleep(2)
+        wait_until(port_stats_increased(self, port, stats, rx_bytes=pkt_no*100))
         request = ofp.message.port_stats_request(port_no=port)
         stats = get_stats(self, request)
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(port))
@@ -239,11 +239,11 @@ class Testcase_340_80_MultipartPortStatsTxBytes(base_tests.SimpleDataPlane):
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(out_port))
         init_tx_bytes = stats[0].tx_bytes
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         for i in range(pkt_no):
             self.dataplane.send(in_port,pkt)
 
-        time.sleep(2)
+        wait_until(port_stats_increased(self, out_port, stats, tx_bytes=pkt_no*100))
         request = ofp.message.port_stats_request(port_no=out_port)
         stats = get_stats(self, request)
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(out_port))
@@ -284,7 +284,7 @@ class Testcase_340_90_MultipartPortStatsRxDropped(base_tests.SimpleDataPlane):
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(port))
         init_rx_dropped = stats[0].rx_dropped
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         for i in range(pkt_no):
             self.dataplane.send(port,pkt)
 
@@ -343,7 +343,7 @@ class Testcase_340_100_MultipartPortStatsTxDropped(base_tests.SimpleDataPlane):
         self.assertEqual(len(stats), 1, "Port %d is not reported in port stats" %(port))
         init_tx_dropped = stats[0].tx_dropped
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         for i in range(pkt_no):
             self.dataplane.send(in_port,pkt)
 
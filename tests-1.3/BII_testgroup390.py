@@ -344,8 +344,8 @@ class Testcase_390_100_packet_out_actions(base_tests.SimpleDataPlane):
         actions = [ofp.action.set_field(ofp.oxm.ipv4_src(0xc0a80105)), ofp.action.output(out_port1),ofp.action.group(group_id = 1)]
         request = ofp.message.packet_out(in_port = in_port, data = str(pkt), buffer_id = ofp.OFP_NO_BUFFER, actions = actions)
         self.controller.message_send(request)
-        verify_packet(self, str(simple_tcp_packet(ip_src = '192.168.1.5')), out_port)
-        verify_no_packet(self, str(simple_tcp_packet(ip_src = '192.168.1.5')), no_port)
+        verify_packet(self, packet_bytes(simple_tcp_packet, ip_src = '192.168.1.5'), out_port)
+        verify_no_packet(self, packet_bytes(simple_tcp_packet, ip_src = '192.168.1.5'), no_port)
         reply, _ = self.controller.poll(exp_msg = ofp.OFPT_ERROR, timeout = 3)
         self.assertIsNone(reply, "Received an error")
         
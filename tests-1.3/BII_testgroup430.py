@@ -347,7 +347,7 @@ class Testcase_430_160_BufferEmpty(base_tests.SimpleDataPlane):
         logging.info("Installing a flow action output to controller")
         self.controller.message_send(req)
         verify_no_errors(self.controller)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         logging.info("Sending a matching packet")
         self.dataplane.send(port_a,pkt)
         res, _ = self.controller.poll(exp_msg=ofp.const.OFPT_PACKET_IN)
@@ -509,7 +509,7 @@ class Testcase_430_250_InvalidActionType(base_tests.SimpleDataPlane):
         delete_all_flows(self.controller)
         InvalidActionType=30
         port_a, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         act = ofp.action.output(port=port_a,max_len=128)
         act.type = InvalidActionType
         msg = ofp.message.packet_out(
@@ -542,7 +542,7 @@ class Testcase_430_260_InvalidActionLen(base_tests.SimpleDataPlane):
         delete_all_flows(self.controller)
         InvalidActionLength=14
         port_a, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         act = ofp.action.output(port=port_a,max_len=128, length=InvalidActionLength)
         msg = ofp.message.packet_out(
                 in_port=ofp.OFPP_CONTROLLER,
@@ -574,7 +574,7 @@ class Testcase_430_270_BadActionBadExperimenter(base_tests.SimpleDataPlane):
         delete_all_flows(self.controller)
         InvalidExperimenter=0x10111011
         port_a, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         act = ofp.action.experimenter()
         act.experimenter = InvalidExperimenter
         msg = ofp.message.packet_out(
@@ -607,7 +607,7 @@ class Testcase_430_280_BadActionBadExperimenterType(base_tests.SimpleDataPlane):
         delete_all_flows(self.controller)
         InvalidExperimenterType=0xff00
         port_a, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         act = ofp.action.experimenter()
         act.type = InvalidExperimenterType
         msg = ofp.message.packet_out(
@@ -831,7 +831,7 @@ class Testcase_430_530_BadActionData(base_tests.SimpleDataPlane):
         delete_all_flows(self.controller)
         port_a, = openflow_ports(1)
         InvalidType = 0xff00
-        data = str(simple_tcp_packet())
+        data = packet_bytes(simple_tcp_packet)
         act = ofp.action.experimenter()
         act.type = InvalidType
         msg = ofp.message.packet_out(
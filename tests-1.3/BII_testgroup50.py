@@ -89,7 +89,7 @@ class Testcase_50_20_TableMissPacketIn(base_tests.SimpleDataPlane):
 
         timeout = 5
         port1, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         self.dataplane.send(port1, pkt)
         logging.info("Sending a dataplane packet")
         verify_packets(self, pkt, [])
@@ -136,7 +136,7 @@ class Testcase_50_30_TableMissPacketInReason(base_tests.SimpleDataPlane):
 
         timeout = 5
         port1, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         self.dataplane.send(port1, pkt)
         logging.info("Sending a dataplane packet")
         verify_packets(self, pkt, [])
@@ -183,7 +183,7 @@ class Testcase_50_40_TableMissClearActions(base_tests.SimpleDataPlane):
 
         timeout = 5
         port1, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         self.dataplane.send(port1, pkt)
         logging.info("Sending a dataplane packet")
         verify_packets(self, pkt, [])
@@ -208,7 +208,7 @@ class Testcase_50_60_TableMissExpire(base_tests.SimpleDataPlane):
         rv = delete_all_flows(self.controller)
         self.assertEqual(rv, 0, "Failed to delete all flows")
         port1, = openflow_ports(1)
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
         request = ofp.message.features_request()
         (reply, pkt)= self.controller.transact(request)
         self.assertIsNotNone(reply, "Did not receive Features Reply Message")
@@ -1360,7 +1360,7 @@ class Switch:
                 break                   # No more responses expected
         return (n > 0)
 
-    def flow_add(self, flow_cfg, overlapf = False):
+    def flow_add_msg(self, flow_cfg, overlapf = False):
         flow_mod_msg = ofp.message.flow_add()
         flow_mod_msg.buffer_id   = 0xffffffff
         flow_cfg.to_flow_mod_msg(flow_mod_msg)
@@ -1368,6 +1368,10 @@ class Switch:
             flow_mod_msg.flags = flow_mod_msg.flags | ofp.OFPFF_CHECK_OVERLAP
         if flow_cfg.send_rem:
             flow_mod_msg.flags = flow_mod_msg.flags | ofp.OFPFF_SEND_FLOW_REM
+        return flow_mod_msg
+
+    def flow_add(self, flow_cfg, overlapf = False):
+        flow_mod_msg = self.flow_add_msg(flow_cfg, overlapf)
         flow_mod_msg.xid = random.randrange(1,0xffffffff)
         logging.info("Sending flow_mod(add), xid=%d"
                         % (flow_mod_msg.xid)
@@ -1375,6 +1379,18 @@ class Switch:
         self.controller.message_send(flow_mod_msg)
         return True
 
+    def flow_add_batch(self, flow_cfgs):
+        # Pipelined adds for large tables; errors for the flows are
+        # matched by xid and recorded as if the error handler had run
+        batch = FlowBatch(self.controller)
+        for fc in flow_cfgs:
+            logging.info("Adding flow:")
+            logging.info(str(fc));
+            batch.add(self.flow_add_msg(fc))
+        for (flow_mod_msg, err) in batch.finish():
+            self.error_handler(self.controller, err, None)
+        return True
+
     def flow_mod(self, flow_cfg, strictf):
         if strictf:
             flow_mod_msg = ofp.message.flow_modify_strict()
@@ -1623,10 +1639,8 @@ class Flow_Add_5(base_tests.SimpleProtocol):
         # Send flow table to switch
 
         logging.info("Sending flow adds to switch")
-        for fc in ft.values():          # Randomizes order of sending
-            logging.info("Adding flow:")
-            logging.info(str(fc));
-            self.assertTrue(sw.flow_add(fc), "Failed to add flow")
+        # Randomizes order of sending
+        self.assertTrue(sw.flow_add_batch(ft.values()), "Failed to add flows")
 
         # Do barrier, to make sure all flows are in
 
@@ -1836,10 +1850,8 @@ class Flow_Add_6(base_tests.SimpleProtocol):
         # Send flow table to switch
 
         logging.info("Sending flow adds to switch")
-        for fc in ft.values():          # Randomizes order of sending
-            logging.info("Adding flow:")
-            logging.info(str(fc));
-            self.assertTrue(sw.flow_add(fc), "Failed to add flow")
+        # Randomizes order of sending
+        self.assertTrue(sw.flow_add_batch(ft.values()), "Failed to add flows")
 
         # Do barrier, to make sure all flows are in
 
@@ -2334,10 +2346,8 @@ class Flow_Mod_2(base_tests.SimpleProtocol):
         # Send flow table to switch
 
         logging.info("Sending flow adds to switch")
-        for fc in ft.values():          # Randomizes order of sending
-            logging.info("Adding flow:")
-            logging.info(str(fc));
-            self.assertTrue(sw.flow_add(fc), "Failed to add flow")
+        # Randomizes order of sending
+        self.assertTrue(sw.flow_add_batch(ft.values()), "Failed to add flows")
 
         # Do barrier, to make sure all flows are in
 
@@ -2814,10 +2824,8 @@ class Flow_Del_2(base_tests.SimpleProtocol):
         # Send flow table to switch
 
         logging.info("Sending flow adds to switch")
-        for fc in ft.values():          # Randomizes order of sending
-            logging.info("Adding flow:")
-            logging.info(str(fc));
-            self.assertTrue(sw.flow_add(fc), "Failed to add flow")
+        # Randomizes order of sending
+        self.assertTrue(sw.flow_add_batch(ft.values()), "Failed to add flows")
 
         # Do barrier, to make sure all flows are in
 
@@ -32,7 +32,7 @@ class DataplaneLatency(base_tests.SimpleDataPlane):
 
         delete_all_flows(self.controller)
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
 
         request = ofp.message.flow_add(
             match=ofp.match(wildcards=ofp.OFPFW_ALL),
@@ -75,7 +75,7 @@ class PktinLatency(base_tests.SimpleDataPlane):
 
         delete_all_flows(self.controller)
 
-        pkt = str(simple_tcp_packet())
+        pkt = packet_bytes(simple_tcp_packet)
 
         request = ofp.message.flow_add(
             match=ofp.match(wildcards=ofp.OFPFW_ALL),
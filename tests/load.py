@@ -125,9 +125,9 @@ class PacketInLoad(base_tests.SimpleDataPlane):
                (simple_eth_packet(pktlen=40), "tiny Ethernet packet")]:
 
                logging.info("PKT IN test with %s, port %s" % (pt, of_port))
-               for count in range(100):
-                   out_count += 1
-                   self.dataplane.send(of_port, str(pkt))
+               stats = self.dataplane.send_burst(of_port, [str(pkt)] * 100)
+               logging.info("Sent %s" % stats)
+               out_count += stats.frames
         while True:
             (response, raw) = self.controller.poll(ofp.OFPT_PACKET_IN)
             if not response:
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Controller receive path benchmark
+
+Starts a Controller listening on loopback, connects a fake switch to it and
+streams small OpenFlow messages at it as fast as possible. Reports the
+steady-state number of messages per second the controller thread parses
+and dispatches.
+
+Example:
+    tools/benchmarks/controller_rx.py --count 500000 --epoll
+"""
+
+import sys
+import os
+import socket
+import time
+import threading
+import argparse
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "src", "python"))
+
+import loxi
+import loxi.of13 as ofp
+sys.modules["ofp"] = ofp
+
+import oftest.ofutils
+import oftest.controller
+
+def main():
+    parser = argparse.ArgumentParser(description="Controller receive benchmark")
+    parser.add_argument("--count", type=int, default=200000,
+                        help="Number of messages to send")
+    parser.add_argument("--port", type=int, default=16633,
+                        help="Loopback port to listen on")
+    parser.add_argument("--epoll", action="store_true",
+                        help="Use the epoll event loop")
+    parser.add_argument("--packet-in-only", action="store_true",
+                        help="Send only packet-ins instead of a mix of messages")
+    parser.add_argument("--min-rate", type=float, default=100000,
+                        help="Exit non-zero if the rate (msgs/s) is below this")
+    args = parser.parse_args()
+
+    oftest.ofutils.default_timeout = 10
+
+    # Mix of packet-ins and small multipart replies
+    msgs = [ofp.message.packet_in(xid=1, buffer_id=0xffffffff, data="\x00" * 64),
+            ofp.message.echo_reply(xid=2),
+            ofp.message.port_stats_reply(xid=3, entries=[ofp.port_stats_entry(port_no=1)])]
+    if args.packet_in_only:
+        msgs = msgs[:1]
+    chunk = "".join(m.pack() for m in msgs) * 100
+    per_chunk = len(msgs) * 100
+    chunks = max(1, args.count / per_chunk)
+    total = chunks * per_chunk
+
+    received = [0]
+    done = threading.Event()
+    def handler(controller, msg, rawmsg):
+        received[0] += 1
+        if received[0] == total:
+            done.set()
+        return True
+
+    ctrl = oftest.controller.Controller(host="127.0.0.1", port=args.port,
+                                        use_epoll=args.epoll)
+    ctrl.initial_hello = False
+    ctrl.register("all", handler)
+    ctrl.start()
+
+    sock = socket.create_connection(("127.0.0.1", args.port))
+    if not ctrl.connect(timeout=5):
+        print("Controller did not accept the connection")
+        sys.exit(1)
+
+    start = time.time()
+    for i in xrange(chunks):
+        sock.sendall(chunk)
+    done.wait(60)
+    elapsed = time.time() - start
+
+    ctrl.kill()
+    sock.close()
+
+    rate = received[0] / elapsed
+    print("%d msgs in %.3fs: %.0f msgs/s, %.4f wakeups/msg" %
+          (received[0], elapsed, rate, ctrl.wakeups_per_message()))
+    if received[0] != total or rate < args.min_rate:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Controller transmit path benchmark
+
+Starts a Controller listening on loopback, connects a fake switch that
+discards everything but barriers, and sends flow_adds followed by a barrier.
+Reports flow_adds per second and socket writes per message, with one write
+per message or with sends corked.
+
+Example:
+    tools/benchmarks/controller_tx.py --count 50000 --cork
+"""
+
+import sys
+import os
+import socket
+import time
+import threading
+import argparse
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "src", "python"))
+
+import loxi
+import loxi.of13 as ofp
+sys.modules["ofp"] = ofp
+
+import oftest.ofutils
+import oftest.controller
+
+def fake_switch(sock):
+    """
+    Read messages and answer barrier requests
+    """
+    rxbuf = oftest.ofutils.RecvBuffer()
+    while rxbuf.recv_into(sock):
+        for frame in rxbuf.frames(oftest.controller.OFP_HEADER_LEN,
+                                  oftest.controller.ofp_frame_len):
+            if ord(frame[1]) == ofp.OFPT_BARRIER_REQUEST:
+                xid = ofp.message.parse_header(frame.tobytes())[3]
+                sock.sendall(ofp.message.barrier_reply(xid=xid).pack())
+
+def main():
+    parser = argparse.ArgumentParser(description="Controller transmit benchmark")
+    parser.add_argument("--count", type=int, default=50000,
+                        help="Number of flow_adds to send")
+    parser.add_argument("--port", type=int, default=16634,
+                        help="Loopback port to listen on")
+    parser.add_argument("--cork", action="store_true",
+                        help="Cork sends so they are coalesced into few writes")
+    args = parser.parse_args()
+
+    oftest.ofutils.default_timeout = 30
+
+    ctrl = oftest.controller.Controller(host="127.0.0.1", port=args.port)
+    ctrl.initial_hello = False
+    ctrl.start()
+
+    sock = socket.create_connection(("127.0.0.1", args.port))
+    if not ctrl.connect(timeout=5):
+        print("Controller did not accept the connection")
+        sys.exit(1)
+    switch = threading.Thread(target=fake_switch, args=(sock,))
+    switch.daemon = True
+    switch.start()
+
+    msgs = [ofp.message.flow_add(xid=i + 1, priority=i & 0xffff,
+                                 buffer_id=ofp.OFP_NO_BUFFER)
+            for i in xrange(args.count)]
+
+    start = time.time()
+    if args.cork:
+        ctrl.cork()
+    for msg in msgs:
+        ctrl.message_send(msg)
+    reply, _ = ctrl.transact(ofp.message.barrier_request())
+    if args.cork:
+        ctrl.uncork()
+    elapsed = time.time() - start
+
+    writes = ctrl.tx_writes
+    ctrl.kill()
+    sock.close()
+
+    if reply is None:
+        print("Barrier failed")
+        sys.exit(1)
+    print("%d flow_adds in %.3fs: %.0f msgs/s, %.4f writes/msg" %
+          (args.count, elapsed, args.count / elapsed,
+           float(writes) / (args.count + 1)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Dataplane receive benchmark
+
+Adds several dataplane ports on one interface, so that every frame sent
+on it is received by all of them, and floods the interface with small
+frames from a child process for a fixed time. Reports the receive rate and
+drops of each port. Needs root for the raw sockets.
+
+Example:
+    sudo tools/benchmarks/dataplane_rx.py --interface veth1 --ports 64
+"""
+
+import sys
+import os
+import time
+import signal
+import socket
+import argparse
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "src", "python"))
+
+import oftest.dataplane
+import oftest.netutils
+
+def flood(interface, size, pps):
+    """
+    Send frames on interface until killed, at most pps a second
+    """
+    s = socket.socket(socket.AF_PACKET, socket.SOCK_RAW)
+    s.bind((interface, 0))
+    # Locally administered source address and an experimental ethertype
+    frames = ["\xff" * 6 + "\x02" * 6 + "\x88\xb5" + ("%04d" % i).ljust(size - 14, "x")
+              for i in range(64)]
+    vector = oftest.netutils.have_sendmmsg() and oftest.netutils.MessageVector(frames)
+    sent = 0
+    start = time.time()
+    while True:
+        if pps and sent > (time.time() - start) * pps:
+            time.sleep(0.001)
+            continue
+        try:
+            if vector:
+                sent += vector.send(s, 0, len(frames))
+            else:
+                for frame in frames:
+                    sent += s.send(frame) and 1
+        except socket.error:
+            pass
+
+def main():
+    parser = argparse.ArgumentParser(description="Dataplane receive benchmark")
+    parser.add_argument("--interface", default="lo",
+                        help="Interface to receive on")
+    parser.add_argument("--ports", type=int, default=16,
+                        help="Number of dataplane ports on the interface")
+    parser.add_argument("--duration", type=float, default=3.0,
+                        help="Seconds to send for")
+    parser.add_argument("--size", type=int, default=64,
+                        help="Frame size in bytes")
+    parser.add_argument("--pps", type=int, default=None,
+                        help="Limit the sender to this rate")
+    args = parser.parse_args()
+
+    config = { "dataplane": { "portclass": oftest.dataplane.DataPlanePort },
+               "dataplane_filter": "" }
+    dp = oftest.dataplane.DataPlane(config)
+    for port_number in range(1, args.ports + 1):
+        dp.port_add(args.interface, port_number)
+
+    pid = os.fork()
+    if pid == 0:
+        flood(args.interface, args.size, args.pps)
+        os._exit(0)
+
+    start = time.time()
+    dp.rx_stats()
+    time.sleep(args.duration)
+    elapsed = time.time() - start
+    os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+
+    total = 0
+    for (port_number, stats) in sorted(dp.rx_stats().items()):
+        total += stats.packets
+        print("port %3d: %8.0f pps, %d dropped from queue, %s dropped by kernel" %
+              (port_number, stats.packets / elapsed, stats.drops, stats.kernel_drops))
+    print("total:    %8.0f pps" % (total / elapsed))
+    dp.kill()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Dataplane transmit benchmark
+
+Sends small frames out of an interface for a fixed time, first one
+DataPlane.send call per frame and then with DataPlane.send_burst, and
+reports the frames per second of each. Needs root for the raw socket.
+
+Example:
+    sudo tools/benchmarks/dataplane_tx.py --interface veth1 --pps 100000
+"""
+
+import sys
+import os
+import time
+import argparse
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "src", "python"))
+
+import oftest.dataplane
+
+def main():
+    parser = argparse.ArgumentParser(description="Dataplane transmit benchmark")
+    parser.add_argument("--interface", default="lo",
+                        help="Interface to send on")
+    parser.add_argument("--duration", type=float, default=2.0,
+                        help="Seconds to send for with each method")
+    parser.add_argument("--size", type=int, default=64,
+                        help="Frame size in bytes")
+    parser.add_argument("--pps", type=int, default=None,
+                        help="Also run a burst paced to this rate")
+    args = parser.parse_args()
+
+    config = { "dataplane": { "portclass": oftest.dataplane.DataPlanePort } }
+    dp = oftest.dataplane.DataPlane(config)
+    dp.port_add(args.interface, 1)
+    # Locally administered source address and an experimental ethertype
+    frames = ["\xff" * 6 + "\x02" * 6 + "\x88\xb5" + ("%04d" % i).ljust(args.size - 14, "x")
+              for i in range(16)]
+
+    count = 0
+    start = time.time()
+    end = start + args.duration
+    while time.time() < end:
+        dp.send(1, frames[count % len(frames)])
+        count += 1
+    print("send:        %8.0f pps" % (count / (time.time() - start)))
+
+    stats = dp.send_burst(1, frames, duration=args.duration)
+    print("send_burst:  %8.0f pps, %d dropped" % (stats.pps, stats.dropped))
+
+    if args.pps:
+        stats = dp.send_burst(1, frames, pps=args.pps, duration=args.duration)
+        print("paced burst: %8.0f pps of %d, %d dropped" %
+              (stats.pps, args.pps, stats.dropped))
+
+    dp.kill()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+packet_to_flow_match benchmark
+
+Converts the same set of frames to OpenFlow matches through scapy
+(decoding each frame with scapy.Ether) and through the raw bytes parser,
+and reports matches per second for each.
+
+Example:
+    tools/benchmarks/flow_match.py --count 5000 --version 1.3
+"""
+
+import sys
+import os
+import time
+import argparse
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "src", "python"))
+
+import oftest
+oftest.config["disable_ipv6"] = False
+import oftest.packet as scapy
+import oftest.parse as parse
+
+CONVERTERS = {
+    "1.0": parse.packet_to_flow_match_v1,
+    "1.2": parse.packet_to_flow_match_v3,
+    "1.3": parse.packet_to_flow_match_v4,
+    "1.4": parse.packet_to_flow_match_v5,
+}
+
+def frames(count):
+    result = []
+    for i in xrange(count):
+        pkt = scapy.Ether(dst="00:01:02:03:04:05", src="00:06:07:08:09:0a")
+        if i % 2:
+            pkt /= scapy.Dot1Q(vlan=i % 4096)
+        pkt /= scapy.IP(src="10.0.%d.%d" % ((i >> 8) & 0xff, i & 0xff), dst="10.1.0.1")
+        if i % 3:
+            pkt /= scapy.TCP(sport=1024 + i % 60000, dport=80)
+        else:
+            pkt /= scapy.UDP(sport=1024 + i % 60000, dport=53)
+        result.append(str(pkt))
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="packet_to_flow_match benchmark")
+    parser.add_argument("--count", type=int, default=5000,
+                        help="Number of frames to convert")
+    parser.add_argument("--version", default="1.3", choices=sorted(CONVERTERS),
+                        help="OpenFlow version of the match")
+    args = parser.parse_args()
+
+    convert = CONVERTERS[args.version]
+    data = frames(args.count)
+
+    start = time.time()
+    for frame in data:
+        convert(scapy.Ether(frame))
+    scapy_rate = args.count / (time.time() - start)
+
+    start = time.time()
+    for frame in data:
+        convert(frame)
+    raw_rate = args.count / (time.time() - start)
+
+    print("scapy: %.0f matches/s" % scapy_rate)
+    print("raw:   %.0f matches/s (%.1fx)" % (raw_rate, raw_rate / scapy_rate))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+LOXI pack/unpack round-trip benchmark
+
+Packs and unpacks a default instance of every message class in each of the
+OpenFlow 1.0 - 1.4 modules and reports round trips per second per version.
+
+Example:
+    tools/benchmarks/loxi_codec.py --iterations 20
+"""
+
+import sys
+import os
+import time
+import argparse
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "src", "python"))
+
+import loxi
+import loxi.generic_util
+
+def message_samples(ofp):
+    """
+    Return a list of (class, packed) for every message class that round trips
+    """
+    samples = []
+    for name in sorted(dir(ofp.message)):
+        cls = getattr(ofp.message, name)
+        if not isinstance(cls, type) or not issubclass(cls, ofp.message.message):
+            continue
+        try:
+            packed = cls(xid=1).pack()
+            cls.unpack(loxi.generic_util.OFReader(packed))
+        except Exception:
+            # Abstract superclasses
+            continue
+        samples.append((cls, packed))
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description="LOXI codec benchmark")
+    parser.add_argument("--iterations", type=int, default=20,
+                        help="Passes over all message classes per version")
+    args = parser.parse_args()
+
+    total_count = 0
+    total_time = 0.0
+    for version in sorted(loxi.version_names):
+        ofp = loxi.protocol(version)
+        samples = message_samples(ofp)
+        objs = [(cls, cls.unpack(loxi.generic_util.OFReader(packed)))
+                for (cls, packed) in samples]
+        start = time.time()
+        for i in xrange(args.iterations):
+            for (cls, obj) in objs:
+                cls.unpack(loxi.generic_util.OFReader(obj.pack()))
+        elapsed = time.time() - start
+        count = args.iterations * len(objs)
+        total_count += count
+        total_time += elapsed
+        print("OpenFlow %s: %4d classes, %8.0f round trips/s" %
+              (loxi.version_names[version], len(objs), count / elapsed))
+    print("Total: %.0f round trips/s" % (total_count / total_time))
+
+if __name__ == "__main__":
+    main()
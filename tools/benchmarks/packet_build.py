@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Packet builder benchmark
+
+Builds TCP packets with varying addresses and ports, once with
+str(simple_tcp_packet(...)) and once with packet_bytes(), and reports
+packets per second for each.
+
+Example:
+    tools/benchmarks/packet_build.py --count 20000
+"""
+
+import sys
+import os
+import time
+import argparse
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "src", "python"))
+
+import loxi.of13 as ofp
+sys.modules["ofp"] = ofp
+
+import oftest
+oftest.config["disable_ipv6"] = False
+import oftest.testutils as testutils
+
+def variants(count):
+    for i in xrange(count):
+        yield dict(ip_src="10.0.%d.%d" % ((i >> 8) & 0xff, i & 0xff),
+                   tcp_sport=1024 + i % 60000,
+                   dl_vlan_enable=True, vlan_vid=i % 4096)
+
+def main():
+    parser = argparse.ArgumentParser(description="Packet builder benchmark")
+    parser.add_argument("--count", type=int, default=20000,
+                        help="Number of packets to build")
+    args = parser.parse_args()
+
+    start = time.time()
+    for kwargs in variants(args.count):
+        str(testutils.simple_tcp_packet(**kwargs))
+    scapy_rate = args.count / (time.time() - start)
+
+    start = time.time()
+    for kwargs in variants(args.count):
+        testutils.packet_bytes(testutils.simple_tcp_packet, **kwargs)
+    template_rate = args.count / (time.time() - start)
+
+    print("scapy:    %.0f pkts/s" % scapy_rate)
+    print("template: %.0f pkts/s (%.1fx)" % (template_rate, template_rate / scapy_rate))
+
+if __name__ == "__main__":
+    main()
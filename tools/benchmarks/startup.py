@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+oft startup benchmark
+
+Times importing the oftest framework modules and running `oft --list` in
+fresh interpreters, and fails if the best time of either is over its
+budget. CI runs oft once per test, so this time is paid for every test.
+
+Example:
+    tools/benchmarks/startup.py --runs 5 -- -V 1.0
+"""
+
+import sys
+import os
+import time
+import argparse
+import subprocess
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..")
+
+IMPORT_SCRIPT = """
+import sys
+sys.path.insert(0, %r)
+from oftest import config
+config["disable_ipv6"] = False
+import oftest.lazy
+sys.modules["ofp"] = oftest.lazy.protocol(4)
+import oftest.testutils
+import oftest.base_tests
+""" % os.path.join(ROOT_DIR, "src", "python")
+
+def best_time(cmd, runs):
+    """
+    Return the shortest wall clock time of runs executions of cmd
+    """
+    best = None
+    with open(os.devnull, "w") as devnull:
+        for i in range(runs):
+            start = time.time()
+            subprocess.check_call(cmd, stdout=devnull, stderr=devnull, cwd=ROOT_DIR)
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="oft startup benchmark")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Number of runs of each command; the best is reported")
+    parser.add_argument("--import-budget", type=float, default=150,
+                        help="Budget for importing the framework, in ms")
+    parser.add_argument("--list-budget", type=float, default=1000,
+                        help="Budget for oft --list, in ms")
+    parser.add_argument("oft_args", nargs="*",
+                        help="Extra arguments for oft --list")
+    args = parser.parse_args()
+
+    results = [
+        ("import", best_time([sys.executable, "-c", IMPORT_SCRIPT], args.runs),
+         args.import_budget),
+        ("oft --list", best_time([sys.executable, os.path.join(ROOT_DIR, "oft"),
+                                  "--list"] + args.oft_args, args.runs),
+         args.list_budget),
+    ]
+
+    over = False
+    for (name, elapsed, budget) in results:
+        ms = elapsed * 1000
+        status = "ok"
+        if ms > budget:
+            status = "OVER BUDGET"
+            over = True
+        print("%-12s %6.0f ms (budget %.0f ms) %s" % (name, ms, budget, status))
+
+    if over:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+"""
+Precompile the struct codecs of the generated LOXI python modules
+
+The LOXI templates emit one struct.pack call per field in pack() and one
+OFReader.read call per field in unpack(). This script rewrites each run of
+consecutive fixed-size fields (and padding) into a single call on a
+module-level precompiled struct.Struct:
+
+    packed.append(struct.pack("!L", self.xid))
+    packed.append(struct.pack("!Q", self.cookie))
+    packed.append('\\x00' * 2)
+
+becomes
+
+    packed.append(_st_LQ2x.pack(self.xid, self.cookie))
+
+and
+
+    obj.xid = reader.read("!L")[0]
+    obj.cookie = reader.read("!Q")[0]
+    reader.skip(2)
+
+becomes
+
+    (obj.xid, obj.cookie) = reader.read_struct(_st_LQ2x)
+
+Length placeholders are left as their own list element and the indices in
+the "packed[N] = ..." fixups are renumbered. Methods whose packed list is
+touched from nested blocks are left alone.
+
+Run it again after regenerating pyloxi:
+
+    tools/loxi-struct-codecs.py src/python/loxi/of1*/*.py
+
+The rewrite is idempotent.
+"""
+
+import re
+import struct
+import sys
+
+PACK_FIELD = re.compile(r'^        packed\.append\(struct\.pack\("!(\w+)", (self\.\w+|\d+)\)\)$')
+PACK_PAD = re.compile(r"^        packed\.append\('\\x00' \* (\d+)\)$")
+PACK_PLACEHOLDER = re.compile(r'^(        packed\.append\(struct\.pack\("!\w+", 0\)\) # placeholder for \w+ at index )(\d+)$')
+PACK_FIXUP = re.compile(r'^(        packed\[)(\d+)(\] = .*)$')
+PACK_APPEND = re.compile(r'^        packed\.append\(')
+
+UNPACK_FIELD = re.compile(r'^        ((?:obj\.)?\w+) = reader\.read\("!(\w+)"\)\[0\]$')
+UNPACK_SKIP = re.compile(r'^        reader\.skip\((\d+)\)$')
+UNPACK_ASSERT = re.compile(r'^        assert\(_\w+ == [^()]+\)$')
+
+HEADER = "# Precompiled struct codecs (see tools/loxi-struct-codecs.py)\n"
+
+def single_value(fmt):
+    """
+    Return True if the struct format packs exactly one value
+    """
+    try:
+        st = struct.Struct("!" + fmt)
+    except struct.error:
+        return False
+    return len(st.unpack("\x00" * st.size)) == 1
+
+def struct_name(fmt):
+    return "_st_" + fmt
+
+class Rewriter(object):
+    def __init__(self):
+        self.formats = set()
+
+    def flush_pack_run(self, run, out):
+        """
+        Emit one append for a run of (fmt, expr) fields
+        """
+        if all(expr is None for (fmt, expr) in run):
+            total = sum(int(fmt[:-1]) for (fmt, expr) in run)
+            out.append("        packed.append('\\x00' * %d)\n" % total)
+            return
+        fmt = "".join(f for (f, expr) in run)
+        self.formats.add(fmt)
+        args = ", ".join(expr for (f, expr) in run if expr is not None)
+        out.append("        packed.append(%s.pack(%s))\n" % (struct_name(fmt), args))
+
+    def rewrite_pack(self, body):
+        """
+        Rewrite the lines of a pack() method body
+        """
+        nested = [l for l in body if l.startswith("         ") and "packed" in l]
+        if nested:
+            return body
+
+        out = []
+        run = []
+        index_map = {} # old list index -> new list index, for unmerged appends
+        old_index = 0
+        new_index = 0
+        for line in body:
+            stripped = line.rstrip("\n")
+            m = PACK_FIELD.match(stripped)
+            if m and single_value(m.group(1)):
+                run.append((m.group(1), m.group(2)))
+                old_index += 1
+                continue
+            m = PACK_PAD.match(stripped)
+            if m:
+                run.append((m.group(1) + "x", None))
+                old_index += 1
+                continue
+
+            if run:
+                self.flush_pack_run(run, out)
+                new_index += 1
+                run = []
+
+            m = PACK_PLACEHOLDER.match(stripped)
+            if m:
+                out.append((m.group(1) + "%d\n", int(m.group(2))))
+            else:
+                out.append(line)
+            if PACK_APPEND.match(stripped):
+                index_map[old_index] = new_index
+                old_index += 1
+                new_index += 1
+
+        if run:
+            self.flush_pack_run(run, out)
+
+        # Renumber placeholders and fixups
+        result = []
+        for line in out:
+            if isinstance(line, tuple):
+                (text, index) = line
+                result.append(text % index_map[index])
+                continue
+            m = PACK_FIXUP.match(line.rstrip("\n"))
+            if m:
+                # Fixups only ever target placeholders, which are not merged
+                line = "%s%d%s\n" % (m.group(1), index_map[int(m.group(2))], m.group(3))
+            result.append(line)
+        return result
+
+    def flush_unpack_run(self, run, asserts, out):
+        fmt = "".join(f for (f, target) in run)
+        targets = [target for (f, target) in run if target is not None]
+        if not targets:
+            out.append("        reader.skip(%d)\n" % struct.calcsize("!" + fmt))
+        else:
+            self.formats.add(fmt)
+            if len(targets) == 1:
+                out.append("        %s = reader.read_struct(%s)[0]\n" % (targets[0], struct_name(fmt)))
+            else:
+                out.append("        (%s) = reader.read_struct(%s)\n" % (", ".join(targets), struct_name(fmt)))
+        out.extend(asserts)
+
+    def rewrite_unpack(self, body):
+        """
+        Rewrite the lines of an unpack() method body
+        """
+        out = []
+        run = []
+        asserts = []
+        for line in body:
+            stripped = line.rstrip("\n")
+            m = UNPACK_FIELD.match(stripped)
+            if m and single_value(m.group(2)):
+                run.append((m.group(2), m.group(1)))
+                continue
+            m = UNPACK_SKIP.match(stripped)
+            if m:
+                run.append((m.group(1) + "x", None))
+                continue
+            if run and UNPACK_ASSERT.match(stripped):
+                asserts.append(line)
+                continue
+            if run:
+                self.flush_unpack_run(run, asserts, out)
+                run = []
+                asserts = []
+            out.append(line)
+        if run:
+            self.flush_unpack_run(run, asserts, out)
+        return out
+
+    def rewrite(self, lines):
+        out = []
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            out.append(line)
+            i += 1
+            if line == "    def pack(self):\n":
+                kind = "pack"
+            elif line == "    def unpack(reader):\n":
+                kind = "unpack"
+            else:
+                continue
+            body = []
+            while i < len(lines) and lines[i].startswith("        "):
+                body.append(lines[i])
+                i += 1
+            if kind == "pack":
+                out.extend(self.rewrite_pack(body))
+            else:
+                out.extend(self.rewrite_unpack(body))
+        return out
+
+def add_header(lines, formats):
+    """
+    Insert (or replace) the block of module-level Struct definitions after
+    the imports
+    """
+    if HEADER in lines:
+        start = lines.index(HEADER)
+        end = start + 1
+        while end < len(lines) and lines[end].startswith("_st_"):
+            end += 1
+        del lines[start:end + 1]
+
+    last_import = max(i for (i, l) in enumerate(lines) if l.startswith("import "))
+    block = [HEADER]
+    for fmt in sorted(formats):
+        block.append('%s = struct.Struct("!%s")\n' % (struct_name(fmt), fmt))
+    block.append("\n")
+    lines[last_import + 2:last_import + 2] = block
+
+def main(filenames):
+    for filename in filenames:
+        with open(filename) as f:
+            lines = f.readlines()
+        if "    def pack(self):\n" not in lines:
+            continue
+        rewriter = Rewriter()
+        lines = rewriter.rewrite(lines)
+        # Formats already in use from an earlier run
+        for l in lines:
+            m = re.search(r'\b_st_(\w+)\.pack\(|read_struct\(_st_(\w+)\)', l)
+            if m:
+                rewriter.formats.add(m.group(1) or m.group(2))
+        if rewriter.formats:
+            add_header(lines, rewriter.formats)
+        with open(filename, "w") as f:
+            f.writelines(lines)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])